@@ -9,11 +9,20 @@ from .gemini_client import GeminiClient
 from .gpt_client import GPTClient
 from .claude_client import ClaudeClient
 from .azure_client import AzureDocumentClient
+from .retry_policy import RetryPolicy, RetryBudget
+from .rate_limiter import RateLimiter, RateLimiterRegistry, get_rate_limiter_registry
+from .response_cache import ResponseCache
 
 __all__ = [
     'BaseLLMClient',
     'GeminiClient',
     'GPTClient',
     'ClaudeClient',
-    'AzureDocumentClient'
+    'AzureDocumentClient',
+    'RetryPolicy',
+    'RetryBudget',
+    'RateLimiter',
+    'RateLimiterRegistry',
+    'get_rate_limiter_registry',
+    'ResponseCache'
 ]
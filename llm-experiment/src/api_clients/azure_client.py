@@ -5,10 +5,13 @@ Microsoft Azure Document Intelligence を使用してPDFからデータを抽出
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 from .base_client import BaseLLMClient
+from .rate_limiter import RateLimiterRegistry
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +23,18 @@ class AzureDocumentClient(BaseLLMClient):
     Azure Document Intelligence を使用してPDFから構造化データを抽出します。
     """
 
+    provider = "azure"
+
     def __init__(
         self,
         api_key: str,
         endpoint: str,
         model_name: str = "prebuilt-document",
         timeout: int = 60,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Azure Document クライアントの初期化
@@ -37,8 +45,14 @@ class AzureDocumentClient(BaseLLMClient):
             model_name: 使用するモデル名（prebuilt-document, prebuilt-layout など）
             timeout: タイムアウト（秒）
             max_retries: 最大リトライ回数
+            retry_policy: リトライ方針
+            rate_limiter: レート制限のレジストリ
+            response_cache: 抽出結果のキャッシュ
         """
-        super().__init__(api_key, model_name, timeout, max_retries)
+        super().__init__(
+            api_key, model_name, timeout, max_retries,
+            retry_policy, rate_limiter, response_cache
+        )
         self.endpoint = endpoint
 
         # TODO: Azure SDK の初期化
@@ -50,6 +64,7 @@ class AzureDocumentClient(BaseLLMClient):
         #     credential=AzureKeyCredential(self.api_key)
         # )
 
+
         logger.info(f"AzureDocumentClient 初期化: {endpoint}")
 
     def extract_data_from_pdf(
@@ -5,12 +5,19 @@ LLMクライアントの基底クラス
 共通機能（リトライ、タイムアウト、レスポンスタイム計測など）を提供する。
 """
 
+import asyncio
+import threading
 import time
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from ..utils.stage_timer import record_span
+from .rate_limiter import RateLimiterRegistry, get_rate_limiter_registry
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,12 +29,18 @@ class BaseLLMClient(ABC):
     extract_data_from_pdfメソッドを実装する必要があります。
     """
 
+    # レート制限設定のキー（config/rate_limits.json のプロバイダー名）
+    provider: str = ""
+
     def __init__(
         self,
         api_key: str,
         model_name: str,
         timeout: int = 60,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         基底クライアントの初期化
@@ -36,20 +49,54 @@ class BaseLLMClient(ABC):
             api_key: APIキー
             model_name: モデル名
             timeout: タイムアウト（秒）
-            max_retries: 最大リトライ回数
+            max_retries: 最大リトライ回数（retry_policy未指定時の試行回数）
+            retry_policy: リトライ方針（複数クライアントで予算を共有する場合に指定）
+            rate_limiter: レート制限のレジストリ（未指定の場合はプロセス共有のものを使用）
+            response_cache: 抽出結果のキャッシュ（Noneの場合はキャッシュしない）
         """
         self.api_key = api_key
         self.model_name = model_name
         self.timeout = timeout
-        self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries)
+        self.max_retries = self.retry_policy.max_attempts
+        self.rate_limiter = rate_limiter or get_rate_limiter_registry()
+        self.response_cache = response_cache
+
+        # キャッシュキーに含めるレンダリング設定（DPI・フォーマット・品質など）
+        self.render_params: Dict[str, Any] = {}
 
-        # レスポンス情報
-        self._last_response_time: Optional[float] = None
-        self._last_input_tokens: Optional[int] = None
-        self._last_output_tokens: Optional[int] = None
+        # レスポンス情報（スレッドごとに保持し、同時に実行したリクエストの値が混ざらないようにする）
+        self._usage = threading.local()
 
         logger.info(f"{self.__class__.__name__} 初期化完了: model={model_name}")
 
+    @property
+    def _last_response_time(self) -> Optional[float]:
+        """このスレッドの最後のリクエストのレスポンスタイム"""
+        return getattr(self._usage, 'response_time', None)
+
+    @_last_response_time.setter
+    def _last_response_time(self, value: Optional[float]) -> None:
+        self._usage.response_time = value
+
+    @property
+    def _last_input_tokens(self) -> Optional[int]:
+        """このスレッドの最後のリクエストの入力トークン数"""
+        return getattr(self._usage, 'input_tokens', None)
+
+    @_last_input_tokens.setter
+    def _last_input_tokens(self, value: Optional[int]) -> None:
+        self._usage.input_tokens = value
+
+    @property
+    def _last_output_tokens(self) -> Optional[int]:
+        """このスレッドの最後のリクエストの出力トークン数"""
+        return getattr(self._usage, 'output_tokens', None)
+
+    @_last_output_tokens.setter
+    def _last_output_tokens(self, value: Optional[int]) -> None:
+        self._usage.output_tokens = value
+
     @abstractmethod
     def extract_data_from_pdf(
         self,
@@ -70,14 +117,219 @@ class BaseLLMClient(ABC):
             {
                 'extracted_data': Dict,  # 抽出されたJSON
                 'success': bool,         # 成功したか
-                'error_message': str     # エラーメッセージ（失敗時）
+                'error_message': str,    # エラーメッセージ（失敗時）
+                'raw_response': str      # 生のレスポンステキスト（任意、キャッシュに保存される）
             }
         """
         pass
 
+    async def extract_data_from_pdf_async(
+        self,
+        pdf_path: str,
+        system_prompt: str,
+        schema: Dict
+    ) -> Dict[str, Any]:
+        """
+        PDFからデータを抽出する（非同期版）
+
+        プロバイダーの非同期SDKで実装する場合はオーバーライドする。
+        オーバーライドしないクライアントでは、同期版をスレッドで実行する。
+        現在はどのクライアント（GPT・Claude・Gemini・Azure）も同期版が未実装のため、
+        非同期SDKでのオーバーライドもなく、リクエストごとにスレッドを1つ使用する暫定の実装になっている。
+
+        1つのクライアントで複数のリクエストを同時に実行するため、
+        トークン使用量・レスポンスタイムはインスタンス属性ではなく戻り値の'tokens'・'response_time'で返す。
+        オーバーライドする場合は、_measure_time_asyncの実行時間と_report_token_usageの戻り値を
+        結果に含めること（同期版を実行する場合は、実行したスレッドで記録された値を取得する）。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            抽出結果の辞書:
+            {
+                'extracted_data': Dict,    # 抽出されたJSON
+                'success': bool,           # 成功したか
+                'error_message': str,      # エラーメッセージ（失敗時）
+                'tokens': Dict[str, int],  # トークン使用量
+                'response_time': float     # レスポンスタイム（秒）
+            }
+        """
+        return await asyncio.to_thread(
+            self._extract_with_usage,
+            pdf_path,
+            system_prompt,
+            schema
+        )
+
+    def _extract_with_usage(
+        self,
+        pdf_path: str,
+        system_prompt: str,
+        schema: Dict
+    ) -> Dict[str, Any]:
+        """
+        同期版で抽出し、同じスレッドで記録されたトークン使用量・レスポンスタイムを結果に含める
+
+        Args:
+            pdf_path: PDFファイルのパス
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            抽出結果の辞書（extract_data_from_pdfの戻り値 + 'tokens', 'response_time'）
+        """
+        result = self.extract_data_from_pdf(pdf_path, system_prompt, schema)
+        result.setdefault('tokens', self.get_token_usage())
+        result.setdefault('response_time', self.get_response_time())
+        return result
+
+    def extract_data_from_pdf_cached(
+        self,
+        pdf_path: str,
+        system_prompt: str,
+        schema: Dict
+    ) -> Dict[str, Any]:
+        """
+        レスポンスキャッシュを使用してPDFからデータを抽出する
+
+        同じモデル・PDF・プロンプト・スキーマ・レンダリング設定の抽出結果がキャッシュにあれば、
+        APIを呼ばずにそれを返す。成功した結果のみキャッシュする。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            抽出結果の辞書（extract_data_from_pdfの戻り値 + 'tokens', 'cached'）
+        """
+        if self.response_cache is None:
+            return self.extract_data_from_pdf(pdf_path, system_prompt, schema)
+
+        cache_key = self._get_response_cache_key(pdf_path, system_prompt, schema)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            result = self._restore_cached_result(cached)
+            self._last_input_tokens = result['tokens']['input_tokens']
+            self._last_output_tokens = result['tokens']['output_tokens']
+            self._last_response_time = result['response_time']
+            return result
+
+        result = self.extract_data_from_pdf(pdf_path, system_prompt, schema)
+        result.setdefault('tokens', self.get_token_usage())
+        self._store_cached_result(cache_key, result)
+        result['cached'] = False
+        return result
+
+    async def extract_data_from_pdf_cached_async(
+        self,
+        pdf_path: str,
+        system_prompt: str,
+        schema: Dict
+    ) -> Dict[str, Any]:
+        """
+        レスポンスキャッシュを使用してPDFからデータを抽出する（非同期版）
+
+        Args:
+            pdf_path: PDFファイルのパス
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            抽出結果の辞書（extract_data_from_pdf_asyncの戻り値 + 'cached'）
+        """
+        if self.response_cache is None:
+            return await self.extract_data_from_pdf_async(pdf_path, system_prompt, schema)
+
+        cache_key = await asyncio.to_thread(
+            self._get_response_cache_key, pdf_path, system_prompt, schema
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return self._restore_cached_result(cached)
+
+        result = await self.extract_data_from_pdf_async(pdf_path, system_prompt, schema)
+        self._store_cached_result(cache_key, result)
+        result['cached'] = False
+        return result
+
+    def _get_response_cache_key(
+        self,
+        pdf_path: str,
+        system_prompt: str,
+        schema: Dict
+    ) -> str:
+        """
+        レスポンスキャッシュのキーを計算する
+
+        Args:
+            pdf_path: PDFファイルのパス
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            キャッシュキー
+        """
+        from ..processors.pdf_processor import compute_file_hash
+
+        return ResponseCache.make_key(
+            self.model_name,
+            compute_file_hash(pdf_path),
+            system_prompt,
+            schema,
+            self.render_params
+        )
+
+    def _restore_cached_result(self, cached: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        キャッシュの内容から抽出結果の辞書を作成する
+
+        非同期版からも呼ばれるため、スレッドごとのトークン使用量・レスポンスタイムは更新しない。
+
+        Args:
+            cached: ResponseCache.getの戻り値
+
+        Returns:
+            抽出結果の辞書
+        """
+        logger.info(f"レスポンスキャッシュを使用: {self.model_name}")
+
+        return {
+            'extracted_data': cached['extracted_data'],
+            'success': True,
+            'error_message': None,
+            'raw_response': cached['raw_response'],
+            'tokens': cached['tokens'],
+            'response_time': cached['response_time'],
+            'cached': True
+        }
+
+    def _store_cached_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """
+        成功した抽出結果をキャッシュに保存する
+
+        Args:
+            cache_key: キャッシュキー
+            result: 抽出結果の辞書
+        """
+        if not result.get('success'):
+            return
+
+        self.response_cache.put(
+            cache_key,
+            self.model_name,
+            result['extracted_data'],
+            result.get('tokens') or self.get_token_usage(),
+            raw_response=result.get('raw_response'),
+            response_time=result.get('response_time', self.get_response_time())
+        )
+
     def get_response_time(self) -> Optional[float]:
         """
-        最後のリクエストのレスポンスタイムを取得
+        このスレッドで最後に実行したリクエストのレスポンスタイムを取得
 
         Returns:
             レスポンスタイム（秒）
@@ -86,7 +338,7 @@ class BaseLLMClient(ABC):
 
     def get_token_usage(self) -> Dict[str, int]:
         """
-        最後のリクエストのトークン使用量を取得
+        このスレッドで最後に実行したリクエストのトークン使用量を取得
 
         Returns:
             トークン使用量の辞書
@@ -100,14 +352,22 @@ class BaseLLMClient(ABC):
         self,
         func,
         *args,
+        estimated_tokens: int = 0,
         **kwargs
     ) -> Any:
         """
-        指数バックオフでリトライを行う
+        リトライ方針に従ってリトライを行う
+
+        リトライ可能なエラー（レート制限、タイムアウト、サーバーエラーなど）のみ再試行し、
+        待機時間はRetry-Afterヘッダー、またはジッター付きバックオフで決定する。
+        各試行の前にレート制限の実行枠を確保し、プロバイダーがレート制限で受け付けなかった試行
+        （429など）の実行枠は返却する。
+        関数の実行時間（レート制限・リトライの待機を除く）はnetworkステージとして計測する。
 
         Args:
             func: 実行する関数
             *args: 関数の引数
+            estimated_tokens: 推定トークン数（入力+出力、トークン数/分の制限に使用）
             **kwargs: 関数のキーワード引数
 
         Returns:
@@ -116,26 +376,114 @@ class BaseLLMClient(ABC):
         Raises:
             最後に発生した例外
         """
-        last_exception = None
-
-        for attempt in range(self.max_retries):
+        def rate_limited(*call_args, **call_kwargs):
+            self.rate_limiter.acquire(self.provider, self.model_name, estimated_tokens)
             try:
-                return func(*args, **kwargs)
+                with record_span("network"):
+                    return func(*call_args, **call_kwargs)
+            except Exception as e:
+                self._release_throttled(e, estimated_tokens)
+                raise
 
+        return self.retry_policy.execute(rate_limited, *args, **kwargs)
+
+    async def _retry_with_backoff_async(
+        self,
+        func,
+        *args,
+        estimated_tokens: int = 0,
+        **kwargs
+    ) -> Any:
+        """
+        リトライ方針に従ってコルーチン関数をリトライする（非同期版）
+
+        リトライ・レート制限の待機はasyncio.sleepで行い、イベントループを塞がない。
+        プロバイダーがレート制限で受け付けなかった試行の実行枠は返却する。
+        関数の実行時間（レート制限・リトライの待機を除く）はnetworkステージとして計測する。
+
+        Args:
+            func: 実行するコルーチン関数
+            *args: 関数の引数
+            estimated_tokens: 推定トークン数（入力+出力、トークン数/分の制限に使用）
+            **kwargs: 関数のキーワード引数
+
+        Returns:
+            関数の実行結果
+
+        Raises:
+            最後に発生した例外
+        """
+        async def rate_limited(*call_args, **call_kwargs):
+            await self.rate_limiter.acquire_async(self.provider, self.model_name, estimated_tokens)
+            try:
+                with record_span("network"):
+                    return await func(*call_args, **call_kwargs)
             except Exception as e:
-                last_exception = e
-                wait_time = 2 ** attempt  # 指数バックオフ: 1, 2, 4秒
+                self._release_throttled(e, estimated_tokens)
+                raise
+
+        return await self.retry_policy.execute_async(rate_limited, *args, **kwargs)
 
-                if attempt < self.max_retries - 1:
-                    logger.warning(
-                        f"リトライ {attempt + 1}/{self.max_retries}: "
-                        f"{str(e)} ({wait_time}秒後に再試行)"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"最大リトライ回数に達しました: {str(e)}")
+    def _release_throttled(self, error: Exception, estimated_tokens: int) -> None:
+        """
+        プロバイダーがレート制限で受け付けなかった試行の実行枠をレート制限に返却する
+
+        スロットリング中のリトライでローカルのバケットを使い切ると、同じプロバイダーの
+        無関係なリクエストまで待たされるため。リトライの待機はRetry-Afterなどで行われる。
+
+        Args:
+            error: 試行で発生した例外
+            estimated_tokens: 実行枠の確保に使用した推定トークン数
+        """
+        if self.retry_policy.is_throttled(error):
+            self.rate_limiter.release(self.provider, self.model_name, estimated_tokens)
+
+    def _record_token_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        estimated_tokens: int = 0
+    ) -> None:
+        """
+        トークン使用量を記録し、レート制限に実際の使用量を反映する
+
+        Args:
+            input_tokens: 入力トークン数
+            output_tokens: 出力トークン数
+            estimated_tokens: _retry_with_backoffに渡した推定トークン数
+        """
+        self._last_input_tokens = input_tokens
+        self._last_output_tokens = output_tokens
+
+        self._report_token_usage(input_tokens, output_tokens, estimated_tokens)
+
+    def _report_token_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        estimated_tokens: int = 0
+    ) -> Dict[str, int]:
+        """
+        レート制限に実際のトークン使用量を反映する（スレッドごとの使用量は更新しない）
+
+        非同期版では、戻り値を抽出結果の'tokens'として返す。
+
+        Args:
+            input_tokens: 入力トークン数
+            output_tokens: 出力トークン数
+            estimated_tokens: _retry_with_backoff_asyncに渡した推定トークン数
+
+        Returns:
+            トークン使用量の辞書
+        """
+        self.rate_limiter.record_usage(
+            self.provider,
+            self.model_name,
+            estimated_tokens,
+            input_tokens + output_tokens
+        )
 
-        raise last_exception
+        return {'input_tokens': input_tokens, 'output_tokens': output_tokens}
 
     def _measure_time(self, func, *args, **kwargs) -> tuple:
         """
@@ -156,9 +504,30 @@ class BaseLLMClient(ABC):
         self._last_response_time = elapsed_time
         return result, elapsed_time
 
+    async def _measure_time_async(self, func, *args, **kwargs) -> tuple:
+        """
+        コルーチン関数の実行時間を計測する（非同期版）
+
+        イベントループのスレッドでは複数のリクエストが同時に実行されるため、
+        スレッドごとのレスポンスタイムは更新しない。実行時間は抽出結果の'response_time'として返すこと。
+
+        Args:
+            func: 実行するコルーチン関数
+            *args: 関数の引数
+            **kwargs: 関数のキーワード引数
+
+        Returns:
+            (実行結果, 実行時間)
+        """
+        start_time = time.time()
+        result = await func(*args, **kwargs)
+        elapsed_time = time.time() - start_time
+
+        return result, elapsed_time
+
     def _extract_json_from_response(self, response_text: str) -> Optional[Dict]:
         """
-        レスポンステキストからJSONを抽出する
+        レスポンステキストからJSONを抽出する（parseステージとして計測する）
 
         Args:
             response_text: レスポンステキスト
@@ -169,30 +538,31 @@ class BaseLLMClient(ABC):
         import json
         import re
 
-        # JSONブロックを探す（```json ... ``` 形式）
-        json_match = re.search(r'```json\s*\n(.*?)\n```', response_text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
+        with record_span("parse"):
+            # JSONブロックを探す（```json ... ``` 形式）
+            json_match = re.search(r'```json\s*\n(.*?)\n```', response_text, re.DOTALL)
+            if json_match:
+                try:
+                    return json.loads(json_match.group(1))
+                except json.JSONDecodeError:
+                    pass
 
-        # 直接JSONとしてパースを試みる
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            pass
-
-        # { } で囲まれた部分を探す
-        brace_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if brace_match:
+            # 直接JSONとしてパースを試みる
             try:
-                return json.loads(brace_match.group(0))
+                return json.loads(response_text)
             except json.JSONDecodeError:
                 pass
 
-        logger.warning("レスポンスからJSONを抽出できませんでした")
-        return None
+            # { } で囲まれた部分を探す
+            brace_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+            if brace_match:
+                try:
+                    return json.loads(brace_match.group(0))
+                except json.JSONDecodeError:
+                    pass
+
+            logger.warning("レスポンスからJSONを抽出できませんでした")
+            return None
 
     def _validate_api_key(self) -> bool:
         """
@@ -5,10 +5,14 @@ Anthropic Claude API を使用してPDFからデータを抽出するクライ
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from ..processors.encoded_page import EncodedPage
 from .base_client import BaseLLMClient
+from .rate_limiter import RateLimiterRegistry
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +24,17 @@ class ClaudeClient(BaseLLMClient):
     Claude 3 Opus/Sonnet モデルを使用してPDFから構造化データを抽出します。
     """
 
+    provider = "anthropic"
+
     def __init__(
         self,
         api_key: str,
         model_name: str = "claude-3-5-sonnet-20241022",
         timeout: int = 60,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Claude クライアントの初期化
@@ -35,12 +44,19 @@ class ClaudeClient(BaseLLMClient):
             model_name: 使用するモデル名（claude-3-5-sonnet-20241022, claude-3-opus-20240229 など）
             timeout: タイムアウト（秒）
             max_retries: 最大リトライ回数
+            retry_policy: リトライ方針
+            rate_limiter: レート制限のレジストリ
+            response_cache: 抽出結果のキャッシュ
         """
-        super().__init__(api_key, model_name, timeout, max_retries)
+        super().__init__(
+            api_key, model_name, timeout, max_retries,
+            retry_policy, rate_limiter, response_cache
+        )
 
         # TODO: Anthropic SDK の初期化
         # from anthropic import Anthropic
-        # self.client = Anthropic(api_key=self.api_key, timeout=self.timeout)
+        # ※リトライはretry_policyで行うため、SDK側のリトライは無効にする
+        # self.client = Anthropic(api_key=self.api_key, timeout=self.timeout, max_retries=0)
 
         logger.info(f"ClaudeClient 初期化: {model_name}")
 
@@ -78,10 +94,10 @@ class ClaudeClient(BaseLLMClient):
             # TODO: PDFを画像に変換
             # from src.processors import ImageConverter
             # converter = ImageConverter()
-            # base64_images = converter.pdf_to_base64_images(pdf_path)
+            # pages = converter.pdf_to_encoded_pages(pdf_path)
 
             # TODO: メッセージの構築
-            # messages = self._build_messages(schema, base64_images)
+            # messages = self._build_messages(schema, pages)
 
             # TODO: Claude API の呼び出し（リトライ付き）
             # response, response_time = self._measure_time(
@@ -96,14 +112,17 @@ class ClaudeClient(BaseLLMClient):
             # extracted_json = self._extract_json_from_response(response_text)
 
             # TODO: トークン使用量の記録
-            # self._last_input_tokens = response.usage.input_tokens
-            # self._last_output_tokens = response.usage.output_tokens
+            # self._record_token_usage(
+            #     response.usage.input_tokens,
+            #     response.usage.output_tokens
+            # )
 
             # TODO: 結果を返す
             # return {
             #     'extracted_data': extracted_json,
             #     'success': True,
-            #     'error_message': None
+            #     'error_message': None,
+            #     'raw_response': response_text
             # }
 
             # 実装例のためのプレースホルダー
@@ -120,13 +139,13 @@ class ClaudeClient(BaseLLMClient):
                 'error_message': str(e)
             }
 
-    def _build_messages(self, schema: Dict, images: List[str]) -> List[Dict]:
+    def _build_messages(self, schema: Dict, images: List[EncodedPage]) -> List[Dict]:
         """
         APIに送信するメッセージを構築する
 
         Args:
             schema: JSONスキーマ
-            images: Base64エンコードされた画像のリスト
+            images: エンコード済みページ（EncodedPage）のリスト
 
         Returns:
             メッセージのリスト
@@ -146,13 +165,13 @@ class ClaudeClient(BaseLLMClient):
         # ]
         #
         # # 画像を追加
-        # for img_b64 in images:
+        # for page in images:
         #     content.append({
         #         "type": "image",
         #         "source": {
         #             "type": "base64",
-        #             "media_type": "image/jpeg",
-        #             "data": img_b64
+        #             "media_type": page.mime_type,
+        #             "data": page.to_base64()
         #         }
         #     })
         #
@@ -5,10 +5,14 @@ Google Gemini API を使用してPDFからデータを抽出するクライア
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from ..processors.encoded_page import EncodedPage
 from .base_client import BaseLLMClient
+from .rate_limiter import RateLimiterRegistry
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +24,17 @@ class GeminiClient(BaseLLMClient):
     Google Gemini Pro/Flash モデルを使用してPDFから構造化データを抽出します。
     """
 
+    provider = "gemini"
+
     def __init__(
         self,
         api_key: str,
         model_name: str = "gemini-2.0-flash-exp",
         timeout: int = 60,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Gemini クライアントの初期化
@@ -35,8 +44,14 @@ class GeminiClient(BaseLLMClient):
             model_name: 使用するモデル名（gemini-2.0-flash-exp, gemini-1.5-pro など）
             timeout: タイムアウト（秒）
             max_retries: 最大リトライ回数
+            retry_policy: リトライ方針
+            rate_limiter: レート制限のレジストリ
+            response_cache: 抽出結果のキャッシュ
         """
-        super().__init__(api_key, model_name, timeout, max_retries)
+        super().__init__(
+            api_key, model_name, timeout, max_retries,
+            retry_policy, rate_limiter, response_cache
+        )
 
         # TODO: Gemini SDK の初期化
         # import google.generativeai as genai
@@ -79,7 +94,7 @@ class GeminiClient(BaseLLMClient):
             # TODO: PDFを画像に変換
             # from src.processors import ImageConverter
             # converter = ImageConverter()
-            # base64_images = converter.pdf_to_base64_images(pdf_path)
+            # pages = converter.pdf_to_encoded_pages(pdf_path)
 
             # TODO: プロンプトの構築
             # prompt = self._build_prompt(system_prompt, schema)
@@ -89,21 +104,24 @@ class GeminiClient(BaseLLMClient):
             #     self._retry_with_backoff,
             #     self._call_gemini_api,
             #     prompt,
-            #     base64_images
+            #     pages
             # )
 
             # TODO: レスポンスからJSONを抽出
             # extracted_json = self._extract_json_from_response(result.text)
 
             # TODO: トークン使用量の記録
-            # self._last_input_tokens = result.usage_metadata.prompt_token_count
-            # self._last_output_tokens = result.usage_metadata.candidates_token_count
+            # self._record_token_usage(
+            #     result.usage_metadata.prompt_token_count,
+            #     result.usage_metadata.candidates_token_count
+            # )
 
             # TODO: 結果を返す
             # return {
             #     'extracted_data': extracted_json,
             #     'success': True,
-            #     'error_message': None
+            #     'error_message': None,
+            #     'raw_response': result.text
             # }
 
             # 実装例のためのプレースホルダー
@@ -147,33 +165,25 @@ class GeminiClient(BaseLLMClient):
 
         raise NotImplementedError("_build_prompt() を実装してください")
 
-    def _call_gemini_api(self, prompt: str, images: List[str]) -> Any:
+    def _call_gemini_api(self, prompt: str, images: List[EncodedPage]) -> Any:
         """
         Gemini API を呼び出す
 
         Args:
             prompt: プロンプトテキスト
-            images: Base64エンコードされた画像のリスト
+            images: エンコード済みページ（EncodedPage）のリスト
 
         Returns:
             APIレスポンス
         """
         # TODO: Gemini API の実際の呼び出しを実装
         # 例:
-        # import PIL.Image
-        # import io
-        # import base64
-        #
-        # # Base64画像をPIL Imageに変換
-        # pil_images = []
-        # for img_b64 in images:
-        #     img_data = base64.b64decode(img_b64)
-        #     pil_img = PIL.Image.open(io.BytesIO(img_data))
-        #     pil_images.append(pil_img)
+        # # エンコード済みのバイト列をそのままBlobとして渡す（デコード・再エンコードしない）
+        # blobs = [{'mime_type': page.mime_type, 'data': page.data} for page in images]
         #
         # # APIコール
         # response = self.model.generate_content(
-        #     [prompt] + pil_images,
+        #     [prompt] + blobs,
         #     generation_config={
         #         'temperature': 0.1,
         #         'max_output_tokens': 4096,
@@ -5,10 +5,14 @@ OpenAI GPT-4o API を使用してPDFからデータを抽出するクライア
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from ..processors.encoded_page import EncodedPage
 from .base_client import BaseLLMClient
+from .rate_limiter import RateLimiterRegistry
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +24,17 @@ class GPTClient(BaseLLMClient):
     GPT-4o モデルを使用してPDFから構造化データを抽出します。
     """
 
+    provider = "openai"
+
     def __init__(
         self,
         api_key: str,
         model_name: str = "gpt-4o",
         timeout: int = 60,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         GPT クライアントの初期化
@@ -35,12 +44,19 @@ class GPTClient(BaseLLMClient):
             model_name: 使用するモデル名（gpt-4o, gpt-4o-mini など）
             timeout: タイムアウト（秒）
             max_retries: 最大リトライ回数
+            retry_policy: リトライ方針
+            rate_limiter: レート制限のレジストリ
+            response_cache: 抽出結果のキャッシュ
         """
-        super().__init__(api_key, model_name, timeout, max_retries)
+        super().__init__(
+            api_key, model_name, timeout, max_retries,
+            retry_policy, rate_limiter, response_cache
+        )
 
         # TODO: OpenAI SDK の初期化
         # from openai import OpenAI
-        # self.client = OpenAI(api_key=self.api_key, timeout=self.timeout)
+        # ※リトライはretry_policyで行うため、SDK側のリトライは無効にする
+        # self.client = OpenAI(api_key=self.api_key, timeout=self.timeout, max_retries=0)
 
         logger.info(f"GPTClient 初期化: {model_name}")
 
@@ -78,10 +94,10 @@ class GPTClient(BaseLLMClient):
             # TODO: PDFを画像に変換
             # from src.processors import ImageConverter
             # converter = ImageConverter()
-            # base64_images = converter.pdf_to_base64_images(pdf_path)
+            # pages = converter.pdf_to_encoded_pages(pdf_path)
 
             # TODO: メッセージの構築
-            # messages = self._build_messages(system_prompt, schema, base64_images)
+            # messages = self._build_messages(system_prompt, schema, pages)
 
             # TODO: OpenAI API の呼び出し（リトライ付き）
             # response, response_time = self._measure_time(
@@ -95,14 +111,17 @@ class GPTClient(BaseLLMClient):
             # extracted_json = self._extract_json_from_response(response_text)
 
             # TODO: トークン使用量の記録
-            # self._last_input_tokens = response.usage.prompt_tokens
-            # self._last_output_tokens = response.usage.completion_tokens
+            # self._record_token_usage(
+            #     response.usage.prompt_tokens,
+            #     response.usage.completion_tokens
+            # )
 
             # TODO: 結果を返す
             # return {
             #     'extracted_data': extracted_json,
             #     'success': True,
-            #     'error_message': None
+            #     'error_message': None,
+            #     'raw_response': response_text
             # }
 
             # 実装例のためのプレースホルダー
@@ -123,7 +142,7 @@ class GPTClient(BaseLLMClient):
         self,
         system_prompt: str,
         schema: Dict,
-        images: List[str]
+        images: List[EncodedPage]
     ) -> List[Dict]:
         """
         APIに送信するメッセージを構築する
@@ -131,7 +150,7 @@ class GPTClient(BaseLLMClient):
         Args:
             system_prompt: システムプロンプト
             schema: JSONスキーマ
-            images: Base64エンコードされた画像のリスト
+            images: エンコード済みページ（EncodedPage）のリスト
 
         Returns:
             メッセージのリスト
@@ -158,11 +177,11 @@ class GPTClient(BaseLLMClient):
         # ]
         #
         # # 画像を追加
-        # for img_b64 in images:
+        # for page in images:
         #     messages[1]["content"].append({
         #         "type": "image_url",
         #         "image_url": {
-        #             "url": f"data:image/jpeg;base64,{img_b64}"
+        #             "url": page.to_data_url()
         #         }
         #     })
         #
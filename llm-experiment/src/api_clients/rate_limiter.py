@@ -0,0 +1,384 @@
+"""
+レート制限モジュール
+
+プロバイダー・モデルごとのリクエスト数/分とトークン数/分を、トークンバケットで制限する。
+レジストリはプロセス内で共有されるため、すべてのクライアントインスタンスと
+ワーカースレッドが同じバケットから消費する。
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    トークンバケット
+
+    消費量を先に差し引き（残量はマイナスになり得る）、不足分が補充されるまで待機する。
+    予約順に待機時間が決まるため、スレッド間で公平に配分される。
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        TokenBucketの初期化
+
+        Args:
+            capacity: バケットの容量（最大バースト量）
+            refill_per_second: 1秒あたりの補充量
+
+        Raises:
+            ValueError: 設定値が不正な場合
+        """
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError(
+                f"容量と補充量は正の値を指定してください: "
+                f"capacity={capacity}, refill_per_second={refill_per_second}"
+            )
+
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """
+        指定量を予約し、利用可能になるまでの待機時間を返す
+
+        Args:
+            amount: 消費量（容量を超える場合は容量に切り詰める）
+
+        Returns:
+            待機時間（秒）
+        """
+        amount = min(float(amount), self.capacity)
+
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def adjust(self, delta: float) -> None:
+        """
+        残量を補正する（予約量と実際の消費量の差分を反映する）
+
+        Args:
+            delta: 残量に加える量（返却は正、追加消費は負）
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + delta)
+
+    def get_available(self) -> float:
+        """
+        現在の残量を取得する
+
+        Returns:
+            残量（予約済みの不足分がある場合はマイナス）
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        """経過時間に応じて補充する（ロック取得済みで呼ぶこと）"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+
+
+class RateLimiter:
+    """リクエスト数/分とトークン数/分を制限するクラス"""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        name: str = ""
+    ):
+        """
+        RateLimiterの初期化
+
+        Args:
+            requests_per_minute: 1分あたりの最大リクエスト数（Noneの場合は制限なし）
+            tokens_per_minute: 1分あたりの最大トークン数（Noneの場合は制限なし）
+            name: ログ表示用の名前
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.name = name
+
+        self._request_bucket = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60)
+            if requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+            if tokens_per_minute else None
+        )
+
+    def reserve(self, tokens: int = 0) -> float:
+        """
+        リクエスト1回分と推定トークン数を予約する
+
+        Args:
+            tokens: 推定トークン数（入力+出力）
+
+        Returns:
+            待機時間（秒）
+        """
+        wait_time = 0.0
+
+        if self._request_bucket is not None:
+            wait_time = max(wait_time, self._request_bucket.reserve(1))
+        if self._token_bucket is not None and tokens > 0:
+            wait_time = max(wait_time, self._token_bucket.reserve(tokens))
+
+        return wait_time
+
+    def record_usage(self, reserved_tokens: int, actual_tokens: int) -> None:
+        """
+        実際のトークン使用量を反映する
+
+        Args:
+            reserved_tokens: 予約時の推定トークン数
+            actual_tokens: 実際のトークン数
+        """
+        if self._token_bucket is not None and actual_tokens != reserved_tokens:
+            self._token_bucket.adjust(reserved_tokens - actual_tokens)
+
+    def release(self, tokens: int = 0) -> None:
+        """
+        予約したリクエスト1回分と推定トークン数を返却する（プロバイダーが受け付けなかった場合）
+
+        Args:
+            tokens: 予約時の推定トークン数
+        """
+        if self._request_bucket is not None:
+            self._request_bucket.adjust(1)
+        if self._token_bucket is not None and tokens > 0:
+            self._token_bucket.adjust(min(float(tokens), self._token_bucket.capacity))
+
+
+class RateLimiterRegistry:
+    """
+    プロバイダー・モデルごとのRateLimiterを管理するクラス
+
+    設定形式（config/rate_limits.json）:
+    {
+        "openai": {
+            "requests_per_minute": 500,
+            "tokens_per_minute": 30000,
+            "models": {
+                "gpt-4o": {"requests_per_minute": 100}
+            }
+        }
+    }
+
+    プロバイダーの制限はそのプロバイダーの全モデルで共有され、
+    モデルの制限はそれに加えてモデル単位で適用される。
+    """
+
+    def __init__(self, limits: Optional[Dict] = None):
+        """
+        RateLimiterRegistryの初期化
+
+        Args:
+            limits: レート制限の設定
+        """
+        self._lock = threading.Lock()
+        self._limits: Dict = {}
+        self._limiters: Dict[Tuple[str, Optional[str]], RateLimiter] = {}
+
+        # 統計情報
+        self.wait_count = 0
+        self.total_wait_seconds = 0.0
+
+        if limits:
+            self.configure(limits)
+
+    def configure(self, limits: Dict) -> None:
+        """
+        レート制限の設定を反映する（既存のバケットは破棄される）
+
+        Args:
+            limits: レート制限の設定
+        """
+        with self._lock:
+            self._limits = {
+                provider: settings for provider, settings in limits.items()
+                if isinstance(settings, dict)
+            }
+            self._limiters.clear()
+
+        logger.info(f"レート制限を設定しました: {list(self._limits.keys())}")
+
+    def get_limiters(self, provider: str, model_name: str) -> List[RateLimiter]:
+        """
+        リクエストに適用するRateLimiterを取得する
+
+        Args:
+            provider: プロバイダー名（openai, anthropic, gemini, azure）
+            model_name: モデル名
+
+        Returns:
+            RateLimiterのリスト（制限がない場合は空）
+        """
+        with self._lock:
+            settings = self._limits.get(provider)
+            if not settings:
+                return []
+
+            limiters = []
+            candidates = [
+                ((provider, None), settings),
+                ((provider, model_name), settings.get('models', {}).get(model_name))
+            ]
+
+            for key, config in candidates:
+                if not config:
+                    continue
+                if not (config.get('requests_per_minute') or config.get('tokens_per_minute')):
+                    continue
+
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = RateLimiter(
+                        requests_per_minute=config.get('requests_per_minute'),
+                        tokens_per_minute=config.get('tokens_per_minute'),
+                        name='/'.join(part for part in key if part)
+                    )
+                    self._limiters[key] = limiter
+                limiters.append(limiter)
+
+            return limiters
+
+    def acquire(self, provider: str, model_name: str, tokens: int = 0) -> float:
+        """
+        リクエストの実行枠を確保する（必要に応じて待機する）
+
+        Args:
+            provider: プロバイダー名
+            model_name: モデル名
+            tokens: 推定トークン数（入力+出力）
+
+        Returns:
+            待機した時間（秒）
+        """
+        wait_time = self._reserve(provider, model_name, tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self, provider: str, model_name: str, tokens: int = 0) -> float:
+        """
+        リクエストの実行枠を確保する（待機中もイベントループを塞がない）
+
+        Args:
+            provider: プロバイダー名
+            model_name: モデル名
+            tokens: 推定トークン数（入力+出力）
+
+        Returns:
+            待機した時間（秒）
+        """
+        wait_time = self._reserve(provider, model_name, tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def _reserve(self, provider: str, model_name: str, tokens: int) -> float:
+        """
+        適用されるすべての制限で予約し、待機時間を返す
+
+        Args:
+            provider: プロバイダー名
+            model_name: モデル名
+            tokens: 推定トークン数
+
+        Returns:
+            待機時間（秒）
+        """
+        wait_time = 0.0
+        for limiter in self.get_limiters(provider, model_name):
+            wait_time = max(wait_time, limiter.reserve(tokens))
+
+        if wait_time > 0:
+            with self._lock:
+                self.wait_count += 1
+                self.total_wait_seconds += wait_time
+
+            logger.debug(f"レート制限により待機: {provider}/{model_name} ({wait_time:.1f}秒)")
+
+        return wait_time
+
+    def record_usage(
+        self,
+        provider: str,
+        model_name: str,
+        reserved_tokens: int,
+        actual_tokens: int
+    ) -> None:
+        """
+        実際のトークン使用量を反映する
+
+        Args:
+            provider: プロバイダー名
+            model_name: モデル名
+            reserved_tokens: 予約時の推定トークン数
+            actual_tokens: 実際のトークン数
+        """
+        for limiter in self.get_limiters(provider, model_name):
+            limiter.record_usage(reserved_tokens, actual_tokens)
+
+    def release(self, provider: str, model_name: str, tokens: int = 0) -> None:
+        """
+        acquireで確保した実行枠を返却する
+
+        プロバイダーがレート制限でリクエストを受け付けなかった場合に呼ぶ。
+        リトライの待機はRetry-Afterなどで行うため、ローカルのバケットは消費しない
+        （スロットリング中のリトライでバケットを使い切り、無関係なリクエストを待たせないようにする）。
+
+        Args:
+            provider: プロバイダー名
+            model_name: モデル名
+            tokens: acquireに渡した推定トークン数
+        """
+        for limiter in self.get_limiters(provider, model_name):
+            limiter.release(tokens)
+
+    def get_statistics(self) -> Dict:
+        """
+        待機の統計を取得する
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            return {
+                'wait_count': self.wait_count,
+                'total_wait_seconds': self.total_wait_seconds
+            }
+
+
+# プロセス全体で共有するレジストリ
+_default_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """
+    プロセス全体で共有するRateLimiterRegistryを取得する
+
+    Returns:
+        共有のRateLimiterRegistry
+    """
+    return _default_registry
@@ -0,0 +1,340 @@
+"""
+レスポンスキャッシュモジュール
+
+LLMの抽出結果（生のレスポンス、パース済みJSON、トークン使用量）をSQLiteに保存し、
+同じ入力での再実行時にAPIを呼ばずに再利用する。
+キーはモデル名・PDFの内容ハッシュ・システムプロンプトのハッシュ・スキーマのハッシュ・
+レンダリング設定から計算し、有効期限（TTL）と合計サイズの上限（LRU）で削除する。
+合計サイズは保存のたびに差分で更新し、期限切れの削除と合計サイズの再集計は一定間隔でのみ行う。
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+def hash_text(text: str) -> str:
+    """
+    文字列のSHA-256ハッシュを計算する
+
+    Args:
+        text: 対象の文字列
+
+    Returns:
+        SHA-256ハッシュ（16進文字列）
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """LLMの抽出結果をSQLiteにキャッシュするクラス"""
+
+    # 期限切れの削除と合計サイズの再集計を行う間隔（秒）
+    EVICT_INTERVAL_SECONDS = 60.0
+
+    # 合計サイズの上限を超えた場合に、1回の問い合わせで取得する削除候補の数
+    EVICT_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = "output/cache/responses.sqlite3",
+        ttl_hours: Optional[float] = None,
+        max_size_mb: float = 512.0
+    ):
+        """
+        ResponseCacheの初期化
+
+        Args:
+            db_path: SQLiteデータベースのパス
+            ttl_hours: 有効期限（時間、Noneの場合は無期限）
+            max_size_mb: キャッシュの最大合計サイズ（MB）
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_hours * 3600 if ttl_hours is not None else None
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                raw_response TEXT,
+                extracted_data TEXT,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                response_time REAL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses(accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_created_at ON responses(created_at)"
+        )
+        self._conn.commit()
+
+        # 合計サイズ（保存・削除のたびに差分で更新し、evict()で再集計する）
+        self._total_size = self._get_total_size()
+        self._last_evict_at = 0.0
+
+        # 統計情報
+        self.hit_count = 0
+        self.miss_count = 0
+
+        logger.info(f"ResponseCache初期化完了: {self.db_path}")
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        pdf_hash: str,
+        system_prompt: str,
+        schema: Optional[Dict],
+        render_params: Optional[Dict] = None
+    ) -> str:
+        """
+        キャッシュキーを計算する
+
+        Args:
+            model_name: モデル名
+            pdf_hash: PDFの内容ハッシュ
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+            render_params: レンダリング設定（DPI・フォーマット・品質など）
+
+        Returns:
+            キャッシュキー（SHA-256）
+        """
+        components = {
+            'model': model_name,
+            'pdf': pdf_hash,
+            'prompt': hash_text(system_prompt or ''),
+            'schema': hash_text(json.dumps(schema or {}, ensure_ascii=False, sort_keys=True)),
+            'render': render_params or {}
+        }
+        return hash_text(json.dumps(components, ensure_ascii=False, sort_keys=True))
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュから抽出結果を取得する
+
+        Args:
+            cache_key: キャッシュキー
+
+        Returns:
+            抽出結果の辞書（キャッシュにない・期限切れの場合はNone）:
+            {
+                'raw_response': str,
+                'extracted_data': Dict,
+                'tokens': {'input_tokens': int, 'output_tokens': int},
+                'response_time': float,
+                'created_at': float
+            }
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT raw_response, extracted_data, input_tokens, output_tokens,
+                       response_time, created_at
+                FROM responses WHERE cache_key = ?
+                """,
+                (cache_key,)
+            ).fetchone()
+
+            if row is not None and self._is_expired(row[5], now):
+                self._delete_entry(cache_key)
+                self._conn.commit()
+                row = None
+
+            if row is None:
+                self.miss_count += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE cache_key = ?",
+                (now, cache_key)
+            )
+            self._conn.commit()
+            self.hit_count += 1
+
+        raw_response, extracted_data, input_tokens, output_tokens, response_time, created_at = row
+        return {
+            'raw_response': raw_response,
+            'extracted_data': json.loads(extracted_data) if extracted_data is not None else None,
+            'tokens': {'input_tokens': input_tokens, 'output_tokens': output_tokens},
+            'response_time': response_time,
+            'created_at': created_at
+        }
+
+    def put(
+        self,
+        cache_key: str,
+        model_name: str,
+        extracted_data: Any,
+        tokens: Dict[str, int],
+        raw_response: Optional[str] = None,
+        response_time: Optional[float] = None
+    ) -> None:
+        """
+        抽出結果をキャッシュに保存する
+
+        Args:
+            cache_key: キャッシュキー
+            model_name: モデル名
+            extracted_data: パース済みの抽出結果
+            tokens: トークン使用量 {'input_tokens': int, 'output_tokens': int}
+            raw_response: 生のレスポンステキスト
+            response_time: 応答時間（秒）
+        """
+        extracted_json = json.dumps(extracted_data, ensure_ascii=False)
+        size_bytes = len(extracted_json.encode('utf-8'))
+        if raw_response is not None:
+            size_bytes += len(raw_response.encode('utf-8'))
+
+        now = time.time()
+
+        with self._lock:
+            replaced = self._conn.execute(
+                "SELECT size_bytes FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (
+                    cache_key, model_name, raw_response, extracted_data,
+                    input_tokens, output_tokens, response_time,
+                    size_bytes, created_at, accessed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    cache_key, model_name, raw_response, extracted_json,
+                    tokens.get('input_tokens', 0), tokens.get('output_tokens', 0),
+                    response_time, size_bytes, now, now
+                )
+            )
+            self._conn.commit()
+
+            self._total_size += size_bytes - (replaced[0] if replaced is not None else 0)
+            needs_evict = (
+                self._total_size > self.max_size_bytes
+                or now - self._last_evict_at >= self.EVICT_INTERVAL_SECONDS
+            )
+
+        if needs_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        期限切れのエントリを削除し、合計サイズを上限以下にする（最終アクセスが古い順）
+
+        合計サイズはデータベースから再集計する（他のプロセスが書き込んだ分も反映される）。
+
+        Returns:
+            削除したエントリ数
+        """
+        with self._lock:
+            removed = 0
+            now = time.time()
+
+            if self.ttl_seconds is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (now - self.ttl_seconds,)
+                )
+                removed += cursor.rowcount
+
+            self._total_size = self._get_total_size()
+
+            while self._total_size > self.max_size_bytes:
+                rows = self._conn.execute(
+                    "SELECT cache_key FROM responses ORDER BY accessed_at LIMIT ?",
+                    (self.EVICT_BATCH_SIZE,)
+                ).fetchall()
+                if not rows:
+                    break
+
+                for (cache_key,) in rows:
+                    if self._total_size <= self.max_size_bytes:
+                        break
+                    self._delete_entry(cache_key)
+                    removed += 1
+
+            self._conn.commit()
+            self._last_evict_at = now
+            total_size = self._total_size
+
+        if removed:
+            logger.info(
+                f"レスポンスキャッシュを削除: {removed}件 "
+                f"(現在: {total_size / 1024 / 1024:.1f}MB)"
+            )
+
+        return removed
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除する"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_size = 0
+
+        logger.info(f"レスポンスキャッシュをクリアしました: {self.db_path}")
+
+    def get_statistics(self) -> Dict:
+        """
+        キャッシュの統計を取得する
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            entry_count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                'hit_count': self.hit_count,
+                'miss_count': self.miss_count,
+                'entry_count': entry_count,
+                'total_size_mb': self._total_size / 1024 / 1024,
+                'max_size_mb': self.max_size_bytes / 1024 / 1024
+            }
+
+    def close(self) -> None:
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._conn.close()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """エントリが有効期限切れかを判定する"""
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _delete_entry(self, cache_key: str) -> None:
+        """エントリを削除して合計サイズを更新する（ロック取得済みで呼ぶこと）"""
+        row = self._conn.execute(
+            "SELECT size_bytes FROM responses WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+        if row is None:
+            return
+
+        self._conn.execute("DELETE FROM responses WHERE cache_key = ?", (cache_key,))
+        self._total_size -= row[0]
+
+    def _get_total_size(self) -> int:
+        """合計サイズを取得する（ロック取得済みで呼ぶこと）"""
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM responses"
+        ).fetchone()[0]
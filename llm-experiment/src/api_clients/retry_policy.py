@@ -0,0 +1,465 @@
+"""
+リトライポリシーモジュール
+
+API呼び出しのリトライ方針（リトライ可否の判定、待機時間の計算、実行全体のリトライ予算）を提供する。
+待機時間はプロバイダーのRetry-After／レート制限ヘッダーを優先し、
+ない場合はDecorrelated Jitterで計算するため、並行実行時にリトライが集中しない。
+ヘッダーの待機時間が上限（日次クォータの超過など）を超える場合はリトライしない。
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RetryBudget:
+    """
+    実行全体で共有するリトライ予算
+
+    複数のクライアント・スレッドから共有し、リトライ回数と待機時間の合計に上限を設ける。
+    """
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None
+    ):
+        """
+        RetryBudgetの初期化
+
+        Args:
+            max_retries: 実行全体のリトライ回数の上限（Noneの場合は無制限）
+            max_wait_seconds: 実行全体のリトライ待機時間の上限（秒、Noneの場合は無制限）
+        """
+        self.max_retries = max_retries
+        self.max_wait_seconds = max_wait_seconds
+
+        self._lock = threading.Lock()
+        self.used_retries = 0
+        self.used_wait_seconds = 0.0
+
+    def try_consume(self, wait_time: float) -> bool:
+        """
+        リトライ1回分の予算を確保する
+
+        Args:
+            wait_time: リトライ前の待機時間（秒）
+
+        Returns:
+            予算を確保できた場合True
+        """
+        with self._lock:
+            if self.max_retries is not None and self.used_retries + 1 > self.max_retries:
+                return False
+            if (self.max_wait_seconds is not None and
+                    self.used_wait_seconds + wait_time > self.max_wait_seconds):
+                return False
+
+            self.used_retries += 1
+            self.used_wait_seconds += wait_time
+            return True
+
+    def get_statistics(self) -> dict:
+        """
+        予算の使用状況を取得する
+
+        Returns:
+            使用状況の辞書
+        """
+        with self._lock:
+            return {
+                'used_retries': self.used_retries,
+                'max_retries': self.max_retries,
+                'used_wait_seconds': self.used_wait_seconds,
+                'max_wait_seconds': self.max_wait_seconds
+            }
+
+
+class RetryPolicy:
+    """API呼び出しのリトライ方針"""
+
+    # リトライしても結果が変わらないHTTPステータス
+    FATAL_STATUS_CODES = {400, 401, 403, 404, 413, 422}
+
+    # 一時的なエラーを示すHTTPステータス
+    RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+    # 各SDKの致命的なエラー（認証失敗、リクエスト/スキーマの不備など）
+    FATAL_ERROR_NAMES = {
+        'AuthenticationError', 'PermissionDeniedError', 'BadRequestError',
+        'NotFoundError', 'UnprocessableEntityError', 'ClientAuthenticationError',
+        'Unauthenticated', 'PermissionDenied', 'InvalidArgument',
+        'ValidationError', 'SchemaError', 'JSONDecodeError'
+    }
+
+    # 各SDKの一時的なエラー（レート制限、タイムアウト、接続エラー、サーバーエラー）
+    RETRYABLE_ERROR_NAMES = {
+        'RateLimitError', 'APITimeoutError', 'APIConnectionError',
+        'InternalServerError', 'OverloadedError', 'ServiceUnavailableError',
+        'ResourceExhausted', 'ServiceUnavailable', 'DeadlineExceeded',
+        'TooManyRequests',
+        'ServiceRequestError', 'ServiceResponseError'
+    }
+
+    # プロバイダーがレート制限・過負荷でリクエストを受け付けなかったことを示すHTTPステータスとSDKのエラー
+    THROTTLED_STATUS_CODES = {429, 529}
+    THROTTLED_ERROR_NAMES = {'RateLimitError', 'OverloadedError', 'ResourceExhausted', 'TooManyRequests'}
+
+    # プログラム・入力データの誤りを示す組み込み例外
+    FATAL_BUILTIN_ERRORS = (
+        ValueError, TypeError, KeyError, AttributeError,
+        NotImplementedError, FileNotFoundError, PermissionError
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        max_retry_after: float = 600.0
+    ):
+        """
+        RetryPolicyの初期化
+
+        Args:
+            max_attempts: 最大試行回数（初回を含む）
+            base_delay: 待機時間の基準値（秒）
+            max_delay: 待機時間の上限（秒）
+            budget: 実行全体で共有するリトライ予算
+            max_retry_after: プロバイダーが指定した待機時間の上限（秒）。
+                これを超える待機時間が指定された場合はリトライしない
+
+        Raises:
+            ValueError: 設定値が不正な場合
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attemptsは1以上を指定してください: {max_attempts}")
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError(f"待機時間の設定が不正です: base_delay={base_delay}, max_delay={max_delay}")
+        if max_retry_after < 0:
+            raise ValueError(f"max_retry_afterは0以上を指定してください: {max_retry_after}")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_retry_after = max_retry_after
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        エラーがリトライ可能かを判定する
+
+        Args:
+            error: 発生した例外
+
+        Returns:
+            リトライ可能な場合True
+        """
+        status_code = self._get_status_code(error)
+        if status_code in self.RETRYABLE_STATUS_CODES:
+            return True
+        if status_code in self.FATAL_STATUS_CODES:
+            return False
+
+        error_names = {cls.__name__ for cls in type(error).__mro__}
+        if error_names & self.RETRYABLE_ERROR_NAMES:
+            return True
+        if error_names & self.FATAL_ERROR_NAMES:
+            return False
+
+        # 接続エラー・タイムアウトは一時的なエラー
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return True
+        if isinstance(error, self.FATAL_BUILTIN_ERRORS):
+            return False
+
+        # 判別できないエラーは一時的なものとして扱う
+        return True
+
+    def is_throttled(self, error: Exception) -> bool:
+        """
+        プロバイダーがレート制限・過負荷でリクエストを受け付けなかったかを判定する
+
+        Args:
+            error: 発生した例外
+
+        Returns:
+            受け付けられなかった場合True
+        """
+        if self._get_status_code(error) in self.THROTTLED_STATUS_CODES:
+            return True
+
+        error_names = {cls.__name__ for cls in type(error).__mro__}
+        return bool(error_names & self.THROTTLED_ERROR_NAMES)
+
+    def get_retry_after(self, error: Exception) -> Optional[float]:
+        """
+        プロバイダーが指定した待機時間を取得する
+
+        retry_after属性、またはレスポンスヘッダー（retry-after-ms, retry-after,
+        x-ratelimit-reset-*, anthropic-ratelimit-*-reset）から取得する。
+
+        Args:
+            error: 発生した例外
+
+        Returns:
+            待機時間（秒、指定がない場合はNone）
+        """
+        retry_after = getattr(error, 'retry_after', None)
+        if isinstance(retry_after, (int, float)):
+            return max(0.0, float(retry_after))
+
+        headers = self._get_headers(error)
+        if not headers:
+            return None
+
+        value = self._get_header(headers, 'retry-after-ms')
+        if value is not None:
+            try:
+                return max(0.0, float(value) / 1000)
+            except ValueError:
+                pass
+
+        value = self._get_header(headers, 'retry-after')
+        if value is not None:
+            seconds = self._parse_retry_after(value)
+            if seconds is not None:
+                return seconds
+
+        # レート制限のリセットまでの時間（リクエスト数・トークン数のうち長い方）
+        reset_times = []
+        for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens'):
+            value = self._get_header(headers, name)
+            if value is not None:
+                seconds = self._parse_duration(value)
+                if seconds is not None:
+                    reset_times.append(seconds)
+
+        for name in ('anthropic-ratelimit-requests-reset', 'anthropic-ratelimit-tokens-reset'):
+            value = self._get_header(headers, name)
+            if value is not None:
+                seconds = self._parse_timestamp(value)
+                if seconds is not None:
+                    reset_times.append(seconds)
+
+        return max(reset_times) if reset_times else None
+
+    def compute_backoff(self, previous_delay: Optional[float] = None) -> float:
+        """
+        Decorrelated Jitterで次の待機時間を計算する
+
+        Args:
+            previous_delay: 前回の待機時間（初回はNone）
+
+        Returns:
+            待機時間（秒）
+        """
+        if previous_delay is None:
+            previous_delay = self.base_delay
+
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def get_wait_time(self, error: Exception, previous_delay: Optional[float] = None) -> float:
+        """
+        リトライ前の待機時間を決定する
+
+        Args:
+            error: 発生した例外
+            previous_delay: 前回の待機時間
+
+        Returns:
+            待機時間（秒、プロバイダーの指定はmax_retry_afterまでに制限する）
+        """
+        retry_after = self.get_retry_after(error)
+        if retry_after is not None:
+            # 指定時刻ちょうどに集中しないよう、わずかに揺らぎを加える
+            return min(retry_after + random.uniform(0, self.base_delay * 0.1), self.max_retry_after)
+
+        return self.compute_backoff(previous_delay)
+
+    def execute(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        リトライ方針に従って関数を実行する
+
+        Args:
+            func: 実行する関数
+            *args: 関数の引数
+            **kwargs: 関数のキーワード引数
+
+        Returns:
+            関数の実行結果
+
+        Raises:
+            最後に発生した例外
+        """
+        previous_delay = None
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return func(*args, **kwargs)
+
+            except Exception as e:
+                wait_time = self._prepare_retry(e, attempt, previous_delay)
+                if wait_time is None:
+                    raise
+
+                time.sleep(wait_time)
+                previous_delay = wait_time
+
+    async def execute_async(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        リトライ方針に従ってコルーチン関数を実行する（待機中もイベントループを塞がない）
+
+        Args:
+            func: 実行するコルーチン関数
+            *args: 関数の引数
+            **kwargs: 関数のキーワード引数
+
+        Returns:
+            関数の実行結果
+
+        Raises:
+            最後に発生した例外
+        """
+        previous_delay = None
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await func(*args, **kwargs)
+
+            except Exception as e:
+                wait_time = self._prepare_retry(e, attempt, previous_delay)
+                if wait_time is None:
+                    raise
+
+                await asyncio.sleep(wait_time)
+                previous_delay = wait_time
+
+    def _prepare_retry(
+        self,
+        error: Exception,
+        attempt: int,
+        previous_delay: Optional[float]
+    ) -> Optional[float]:
+        """
+        リトライするかを判定し、待機時間を返す
+
+        Args:
+            error: 発生した例外
+            attempt: 何回目の試行で失敗したか（1始まり）
+            previous_delay: 前回の待機時間
+
+        Returns:
+            待機時間（秒、リトライしない場合はNone）
+        """
+        if not self.is_retryable(error):
+            logger.error(f"リトライ不可能なエラーです: {error.__class__.__name__}: {str(error)}")
+            return None
+
+        if attempt >= self.max_attempts:
+            logger.error(f"最大リトライ回数に達しました: {str(error)}")
+            return None
+
+        retry_after = self.get_retry_after(error)
+        if retry_after is not None and retry_after > self.max_retry_after:
+            logger.error(
+                f"指定された待機時間が上限を超えるためリトライしません: "
+                f"{retry_after:.0f}秒 > {self.max_retry_after:.0f}秒: {str(error)}"
+            )
+            return None
+
+        wait_time = self.get_wait_time(error, previous_delay)
+
+        if self.budget is not None and not self.budget.try_consume(wait_time):
+            logger.error(f"リトライ予算を使い切りました: {str(error)}")
+            return None
+
+        logger.warning(
+            f"リトライ {attempt}/{self.max_attempts - 1}: "
+            f"{str(error)} ({wait_time:.1f}秒後に再試行)"
+        )
+        return wait_time
+
+    @staticmethod
+    def _get_status_code(error: Exception) -> Optional[int]:
+        """例外からHTTPステータスコードを取得する"""
+        for candidate in (
+            getattr(error, 'status_code', None),
+            getattr(error, 'code', None),
+            getattr(getattr(error, 'response', None), 'status_code', None)
+        ):
+            if isinstance(candidate, int):
+                return candidate
+        return None
+
+    @staticmethod
+    def _get_headers(error: Exception) -> Optional[Mapping]:
+        """例外からレスポンスヘッダーを取得する"""
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if headers is None:
+            headers = getattr(error, 'headers', None)
+        return headers if isinstance(headers, Mapping) or hasattr(headers, 'get') else None
+
+    @staticmethod
+    def _get_header(headers: Mapping, name: str) -> Optional[str]:
+        """ヘッダーを大文字小文字を区別せずに取得する"""
+        value = headers.get(name)
+        if value is not None:
+            return str(value)
+
+        for key, value in headers.items():
+            if str(key).lower() == name:
+                return str(value)
+        return None
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """Retry-After（秒数またはHTTP日付）を秒数に変換する"""
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _parse_duration(value: str) -> Optional[float]:
+        """"6m0s", "1.5s", "20ms" 形式の期間を秒数に変換する"""
+        matches = re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', value)
+        if not matches:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return None
+
+        units = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+        return sum(float(number) * units[unit] for number, unit in matches)
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> Optional[float]:
+        """RFC 3339形式のリセット時刻を現在からの秒数に変換する"""
+        try:
+            reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
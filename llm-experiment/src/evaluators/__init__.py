@@ -1,11 +1,13 @@
 """
-U
+評価モジュール
 
-JSON<LF
+JSONスキーマ検証、精度計算、コスト計算・見積もり、モデルの逐次比較を行う。
 """
 
 from .schema_validator import SchemaValidator
 from .accuracy_calculator import AccuracyCalculator
 from .cost_calculator import CostCalculator
+from .cost_estimator import CostEstimator
+from .sequential_comparator import SequentialComparator
 
-__all__ = ['SchemaValidator', 'AccuracyCalculator', 'CostCalculator']
+__all__ = ['SchemaValidator', 'AccuracyCalculator', 'CostCalculator', 'CostEstimator', 'SequentialComparator']
@@ -402,6 +402,21 @@ class AccuracyCalculator:
 
         return diff
 
+    def get_field_results(self) -> Dict[str, str]:
+        """
+        正解データの各フィールドの判定結果を取得する
+
+        Returns:
+            フィールドパス → 判定結果（correct, incorrect, missing）の辞書
+        """
+        comparison = self._get_comparison_result()
+
+        return {
+            detail['path']: detail['status']
+            for detail in comparison['field_details']
+            if detail['status'] != 'extra'
+        }
+
     def get_metrics(self) -> Dict:
         """
         全ての評価指標を一度に計算する
@@ -0,0 +1,360 @@
+"""
+コスト見積もりモジュール
+
+API呼び出しの前に、ページ数・変換後の画像サイズ・プロンプトとスキーマの長さから
+入出力トークン数を推定し、実行全体のコストを見積もる。
+画像のトークン数は各プロバイダーの画像トークンの算出方法（タイル分割など）に従って計算する。
+"""
+
+import json
+import logging
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .cost_calculator import CostCalculator
+
+logger = logging.getLogger(__name__)
+
+
+# モデル名の接頭辞とプロバイダー（BaseLLMClient.providerと同じ名前）
+PROVIDER_PREFIXES: List[Tuple[str, str]] = [
+    ("gpt-", "openai"),
+    ("o1", "openai"),
+    ("claude-", "anthropic"),
+    ("gemini-", "gemini"),
+    ("azure-", "azure"),
+]
+
+# OpenAIの画像トークン（高解像度モード: 基本トークン + 512pxタイルごとのトークン）
+OPENAI_IMAGE_TOKENS = {
+    'default': {'base_tokens': 85, 'tile_tokens': 170},
+    # gpt-4o-miniは画像の料金をgpt-4oに揃えるため、トークン数が大きい
+    'gpt-4o-mini': {'base_tokens': 2833, 'tile_tokens': 5667},
+}
+
+# プロバイダーが不明なモデル（モックなど）の1ページあたりのトークン数
+DEFAULT_TOKENS_PER_IMAGE = 1000
+
+
+class CostEstimator:
+    """API呼び出し前にトークン数とコストを見積もるクラス"""
+
+    def __init__(
+        self,
+        cost_calculator: CostCalculator,
+        dpi: int = 150,
+        output_tokens_per_field: int = 30,
+        default_output_tokens: int = 500
+    ):
+        """
+        CostEstimatorの初期化
+
+        Args:
+            cost_calculator: 価格設定を読み込んだCostCalculator
+            dpi: PDF→画像変換の解像度（ページサイズから画像サイズを求めるのに使用）
+            output_tokens_per_field: スキーマの1項目あたりの出力トークン数
+            default_output_tokens: スキーマがない場合の出力トークン数
+        """
+        self.cost_calculator = cost_calculator
+        self.dpi = dpi
+        self.output_tokens_per_field = output_tokens_per_field
+        self.default_output_tokens = default_output_tokens
+
+    def get_provider(self, model: str) -> Optional[str]:
+        """
+        モデルのプロバイダーを取得する
+
+        価格設定に 'provider' があればそれを使用し、なければモデル名の接頭辞から判定する。
+
+        Args:
+            model: モデル名
+
+        Returns:
+            プロバイダー名（openai, anthropic, gemini, azure。不明な場合はNone）
+        """
+        provider = self.cost_calculator.pricing.get(model, {}).get('provider')
+        if provider:
+            return provider
+
+        for prefix, provider in PROVIDER_PREFIXES:
+            if model.startswith(prefix):
+                return provider
+
+        return None
+
+    def page_size_to_pixels(
+        self,
+        width_pt: float,
+        height_pt: float,
+        dpi: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        PDFのページサイズ（ポイント）を変換後の画像サイズ（ピクセル）に換算する
+
+        Args:
+            width_pt: ページの幅（ポイント）
+            height_pt: ページの高さ（ポイント）
+            dpi: 解像度（Noneの場合は初期化時の値を使用）
+
+        Returns:
+            (幅, 高さ) のタプル（ピクセル）
+        """
+        if dpi is None:
+            dpi = self.dpi
+
+        return round(width_pt * dpi / 72), round(height_pt * dpi / 72)
+
+    def estimate_image_tokens(self, model: str, width: int, height: int) -> int:
+        """
+        画像1枚の入力トークン数を推定する
+
+        Args:
+            model: モデル名
+            width: 画像の幅（ピクセル）
+            height: 画像の高さ（ピクセル）
+
+        Returns:
+            推定トークン数
+        """
+        provider = self.get_provider(model)
+
+        if provider == "openai":
+            return self._openai_image_tokens(model, width, height)
+        if provider == "anthropic":
+            return self._anthropic_image_tokens(width, height)
+        if provider == "gemini":
+            return self._gemini_image_tokens(width, height)
+        if provider == "azure":
+            # Document Intelligenceはページ単位の課金でトークンを使用しない
+            return 0
+
+        return DEFAULT_TOKENS_PER_IMAGE
+
+    @staticmethod
+    def _openai_image_tokens(model: str, width: int, height: int) -> int:
+        """
+        OpenAIの画像トークン数（2048px四方に収め、短辺を768pxに縮小して512pxタイルに分割）
+        """
+        params = OPENAI_IMAGE_TOKENS.get(model, OPENAI_IMAGE_TOKENS['default'])
+
+        scale = min(1.0, 2048 / max(width, height))
+        width, height = width * scale, height * scale
+
+        scale = min(1.0, 768 / min(width, height))
+        width, height = width * scale, height * scale
+
+        tiles = math.ceil(width / 512) * math.ceil(height / 512)
+        return params['base_tokens'] + params['tile_tokens'] * tiles
+
+    @staticmethod
+    def _anthropic_image_tokens(width: int, height: int) -> int:
+        """
+        Anthropicの画像トークン数（長辺1568px・約1.15メガピクセルに縮小し、750ピクセルあたり1トークン）
+        """
+        scale = min(1.0, 1568 / max(width, height), math.sqrt(1_150_000 / (width * height)))
+        return math.ceil(width * scale * height * scale / 750)
+
+    @staticmethod
+    def _gemini_image_tokens(width: int, height: int) -> int:
+        """
+        Geminiの画像トークン数（両辺384px以下は258トークン、それ以上は768pxタイルごとに258トークン）
+        """
+        if width <= 384 and height <= 384:
+            return 258
+
+        return 258 * math.ceil(width / 768) * math.ceil(height / 768)
+
+    @staticmethod
+    def estimate_text_tokens(text: str) -> int:
+        """
+        テキストのトークン数を推定する（ASCIIは4文字で1トークン、それ以外は1文字1トークン）
+
+        Args:
+            text: テキスト
+
+        Returns:
+            推定トークン数
+        """
+        ascii_count = sum(1 for char in text if ord(char) < 128)
+        return math.ceil(ascii_count / 4 + (len(text) - ascii_count))
+
+    def estimate_output_tokens(self, schema: Optional[Dict] = None) -> int:
+        """
+        出力トークン数を推定する（スキーマの末端の項目数 × 1項目あたりのトークン数）
+
+        Args:
+            schema: JSONスキーマ
+
+        Returns:
+            推定トークン数
+        """
+        field_count = self._count_fields(schema) if schema else 0
+        if not field_count:
+            return self.default_output_tokens
+
+        return field_count * self.output_tokens_per_field
+
+    def _count_fields(self, schema: Dict) -> int:
+        """スキーマの末端の項目数を数える（配列は要素のスキーマを1件分として数える）"""
+        if 'properties' in schema:
+            return sum(self._count_fields(child) for child in schema['properties'].values())
+        if isinstance(schema.get('items'), dict):
+            return self._count_fields(schema['items'])
+        return 1
+
+    def estimate_prompt_tokens(self, system_prompt: str = "", schema: Optional[Dict] = None) -> int:
+        """
+        リクエストごとに送るテキスト（システムプロンプトとスキーマ）のトークン数を推定する
+
+        Args:
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            推定トークン数
+        """
+        text_tokens = self.estimate_text_tokens(system_prompt)
+        if schema:
+            text_tokens += self.estimate_text_tokens(json.dumps(schema, ensure_ascii=False))
+        return text_tokens
+
+    def estimate_request(
+        self,
+        model: str,
+        image_sizes: List[Tuple[int, int]],
+        system_prompt: str = "",
+        schema: Optional[Dict] = None
+    ) -> Dict:
+        """
+        1リクエスト（PDF × モデル）のトークン数とコストを見積もる
+
+        Args:
+            model: モデル名
+            image_sizes: ページ画像の (幅, 高さ) のリスト（ピクセル）
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            見積もりの辞書（価格設定がないモデルのcost_jpyはNone）
+        """
+        image_tokens = sum(
+            self.estimate_image_tokens(model, width, height) for width, height in image_sizes
+        )
+        text_tokens = self.estimate_prompt_tokens(system_prompt, schema)
+        input_tokens = image_tokens + text_tokens
+        output_tokens = self.estimate_output_tokens(schema)
+
+        return {
+            'model': model,
+            'pages': len(image_sizes),
+            'image_tokens': image_tokens,
+            'text_tokens': text_tokens,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'cost_jpy': self._price(model, input_tokens, output_tokens)
+        }
+
+    def estimate_run(
+        self,
+        tasks: Iterable[Tuple[str, List[Tuple[int, int]]]],
+        system_prompt: str = "",
+        schema: Optional[Dict] = None
+    ) -> Dict:
+        """
+        実行全体のトークン数とコストを見積もる
+
+        トークン数をモデルごとに合計してから、モデルごとに1回だけ価格を計算する。
+
+        Args:
+            tasks: (モデル名, ページ画像サイズのリスト) の反復可能オブジェクト
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            見積もりの辞書
+            {'total_tasks', 'total_input_tokens', 'total_output_tokens', 'total_cost_jpy',
+             'unpriced_models', 'models': {モデル名: {'tasks', 'pages', 'input_tokens',
+             'output_tokens', 'cost_jpy'}}}（価格設定がないモデルのcost_jpyはNone）
+        """
+        text_tokens = self.estimate_prompt_tokens(system_prompt, schema)
+        output_tokens = self.estimate_output_tokens(schema)
+
+        models: Dict[str, Dict] = {}
+        for model, image_sizes in tasks:
+            total = models.setdefault(model, {
+                'tasks': 0, 'pages': 0, 'input_tokens': 0, 'output_tokens': 0, 'cost_jpy': None
+            })
+            total['tasks'] += 1
+            total['pages'] += len(image_sizes)
+            total['input_tokens'] += text_tokens + sum(
+                self.estimate_image_tokens(model, width, height) for width, height in image_sizes
+            )
+            total['output_tokens'] += output_tokens
+
+        for model, total in models.items():
+            total['cost_jpy'] = self._price(model, total['input_tokens'], total['output_tokens'])
+
+        unpriced_models = [model for model, total in models.items() if total['cost_jpy'] is None]
+        if unpriced_models:
+            logger.warning(f"価格設定がないためコストを0円として見積もります: {unpriced_models}")
+
+        return {
+            'total_tasks': sum(total['tasks'] for total in models.values()),
+            'total_input_tokens': sum(total['input_tokens'] for total in models.values()),
+            'total_output_tokens': sum(total['output_tokens'] for total in models.values()),
+            'total_cost_jpy': sum(total['cost_jpy'] or 0.0 for total in models.values()),
+            'unpriced_models': unpriced_models,
+            'models': models
+        }
+
+    def estimate_task_costs(
+        self,
+        tasks: Iterable[Tuple[Hashable, str, List[Tuple[int, int]]]],
+        system_prompt: str = "",
+        schema: Optional[Dict] = None
+    ) -> Dict[Tuple[Hashable, str], Optional[float]]:
+        """
+        タスクごとのコストを見積もる
+
+        コストはトークン数に比例するため、モデルごとに1トークンあたりの単価を1回だけ求めて掛け合わせる。
+
+        Args:
+            tasks: (タスクのキー, モデル名, ページ画像サイズのリスト) の反復可能オブジェクト
+            system_prompt: システムプロンプト
+            schema: JSONスキーマ
+
+        Returns:
+            {(タスクのキー, モデル名): コスト（円）} の辞書（価格設定がないモデルはNone）
+        """
+        text_tokens = self.estimate_prompt_tokens(system_prompt, schema)
+        output_tokens = self.estimate_output_tokens(schema)
+
+        unit_prices: Dict[str, Optional[Tuple[float, float]]] = {}
+        costs: Dict[Tuple[Hashable, str], Optional[float]] = {}
+        for key, model, image_sizes in tasks:
+            if model not in unit_prices:
+                input_price = self._price(model, 1_000_000, 0)
+                output_price = self._price(model, 0, 1_000_000)
+                unit_prices[model] = (
+                    None if input_price is None
+                    else (input_price / 1_000_000, output_price / 1_000_000)
+                )
+
+            if unit_prices[model] is None:
+                costs[(key, model)] = None
+                continue
+
+            input_tokens = text_tokens + sum(
+                self.estimate_image_tokens(model, width, height) for width, height in image_sizes
+            )
+            input_price, output_price = unit_prices[model]
+            costs[(key, model)] = input_tokens * input_price + output_tokens * output_price
+
+        return costs
+
+    def _price(self, model: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+        """価格設定があればコスト（円）を計算する"""
+        if model not in self.cost_calculator.pricing:
+            return None
+
+        return self.cost_calculator.calculate_cost(model, input_tokens, output_tokens, currency='JPY')
@@ -0,0 +1,223 @@
+"""
+逐次比較モジュール
+
+PDFごとの評価指標（項目正答率・F1スコア）を評価のたびに受け取り、
+各モデルと現在の首位モデルの差を逐次検定する。
+首位より指定の差（マージン）以上に劣ることが統計的に確かになったモデルを打ち切り、
+以降のPDFを送らないようにする。
+
+検定には漸近的な信頼系列（いつ打ち切っても有意水準が保たれる信頼区間の列）を使うため、
+評価のたびに判定しても誤って打ち切る確率は有意水準以下に抑えられる。
+"""
+
+import logging
+import math
+import threading
+from typing import Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# 逐次比較に使用できる評価指標（AccuracyCalculator.get_metricsのキー）
+METRICS = ("field_accuracy", "f1_score")
+
+
+class SequentialComparator:
+    """首位モデルとの差を逐次検定し、劣るモデルを打ち切るクラス"""
+
+    def __init__(
+        self,
+        models: List[str],
+        metric: str = "field_accuracy",
+        margin: float = 0.05,
+        alpha: float = 0.05,
+        min_samples: int = 10,
+        target_samples: int = 50
+    ):
+        """
+        SequentialComparatorの初期化
+
+        Args:
+            models: 比較するモデルのリスト
+            metric: 比較する評価指標（field_accuracy または f1_score）
+            margin: 打ち切る差（首位との平均の差の上側信頼限界がこれより小さいモデルを打ち切る）
+            alpha: 有意水準（比較するモデル数で補正する）
+            min_samples: 判定を始める共通のPDF数
+            target_samples: 信頼区間が最も狭くなるように調整するPDF数
+
+        Raises:
+            ValueError: 不正な設定が指定された場合
+        """
+        if metric not in METRICS:
+            raise ValueError(f"逐次比較に使用できない評価指標です: {metric}（{', '.join(METRICS)}）")
+        if margin < 0:
+            raise ValueError(f"マージンは0以上を指定してください: {margin}")
+        if not 0 < alpha < 1:
+            raise ValueError(f"有意水準は0より大きく1より小さい値を指定してください: {alpha}")
+        if min_samples < 2 or target_samples < 1:
+            raise ValueError(
+                f"PDF数は min_samples >= 2, target_samples >= 1 で指定してください: "
+                f"min_samples={min_samples}, target_samples={target_samples}"
+            )
+
+        self.models = list(dict.fromkeys(models))
+        self.metric = metric
+        self.margin = margin
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.target_samples = target_samples
+
+        # 首位以外の全モデルを首位と比較するため、有意水準をモデル数で分ける
+        self._comparison_alpha = alpha / max(len(self.models) - 1, 1)
+
+        self._lock = threading.Lock()
+        # モデル → {PDFファイル名: 評価指標}
+        self._scores: Dict[str, Dict[str, float]] = {model: {} for model in self.models}
+        # 打ち切ったモデル → 打ち切り時の比較結果
+        self._stopped: Dict[str, Dict] = {}
+
+    def record(self, model: str, pdf_name: str, metrics: Dict) -> List[str]:
+        """
+        評価結果を記録し、打ち切るモデルを判定する
+
+        Args:
+            model: モデル名
+            pdf_name: PDFファイル名
+            metrics: 評価指標の辞書（AccuracyCalculator.get_metricsの戻り値）
+
+        Returns:
+            新たに打ち切ったモデルのリスト
+        """
+        value = metrics.get(self.metric)
+        if value is None or model not in self._scores:
+            return []
+
+        with self._lock:
+            self._scores[model][pdf_name] = float(value)
+            return self._update()
+
+    def is_stopped(self, model: str) -> bool:
+        """
+        モデルを打ち切ったかを取得する
+
+        Args:
+            model: モデル名
+
+        Returns:
+            打ち切った場合True
+        """
+        with self._lock:
+            return model in self._stopped
+
+    def get_leader(self) -> Optional[str]:
+        """
+        現在の首位モデルを取得する
+
+        Returns:
+            打ち切っていないモデルのうち評価指標の平均が最も高いモデル（評価がない場合はNone）
+        """
+        with self._lock:
+            return self._get_leader()
+
+    def get_status(self) -> Dict[str, Dict]:
+        """
+        モデルごとの比較の状況を取得する
+
+        Returns:
+            {モデル名: {'samples', 'mean', 'is_leader', 'stopped', 'stopped_by', 'mean_diff', 'upper_bound'}}
+            の辞書（stopped_by・mean_diff・upper_boundは打ち切り時の首位と差。打ち切っていないモデルはNone）
+        """
+        with self._lock:
+            leader = self._get_leader()
+            status = {}
+            for model in self.models:
+                scores = self._scores[model]
+                stopped = self._stopped.get(model, {})
+                status[model] = {
+                    'samples': len(scores),
+                    'mean': sum(scores.values()) / len(scores) if scores else None,
+                    'is_leader': model == leader,
+                    'stopped': model in self._stopped,
+                    'stopped_by': stopped.get('leader'),
+                    'mean_diff': stopped.get('mean_diff'),
+                    'upper_bound': stopped.get('upper_bound')
+                }
+            return status
+
+    def confidence_radius(self, n: int, variance: float) -> float:
+        """
+        n件の差の平均に対する信頼系列の半径を計算する
+
+        Waudby-Smithらの漸近的な信頼系列（正規混合の境界）で、
+        target_samples件で最も狭くなるように混合の分散を決める。
+
+        Args:
+            n: 差の件数
+            variance: 差の分散の推定値
+
+        Returns:
+            信頼区間の半径
+        """
+        alpha = self._comparison_alpha
+        rho_squared = (-2 * math.log(alpha) + math.log(-2 * math.log(alpha) + 1)) / self.target_samples
+        scaled = n * rho_squared + 1
+        width = 2 * scaled / (n ** 2 * rho_squared) * math.log(math.sqrt(scaled) / alpha)
+        return math.sqrt(variance * width)
+
+    def _get_leader(self) -> Optional[str]:
+        """首位モデルを取得する（ロックを取得した状態で呼ぶこと）"""
+        candidates = [
+            model for model in self.models
+            if model not in self._stopped and self._scores[model]
+        ]
+        if not candidates:
+            return None
+
+        return max(
+            candidates,
+            key=lambda model: sum(self._scores[model].values()) / len(self._scores[model])
+        )
+
+    def _update(self) -> List[str]:
+        """首位と各モデルを比較し、劣るモデルを打ち切る（ロックを取得した状態で呼ぶこと）"""
+        leader = self._get_leader()
+        if leader is None:
+            return []
+
+        leader_scores = self._scores[leader]
+        newly_stopped = []
+
+        for model in self.models:
+            if model == leader or model in self._stopped:
+                continue
+
+            # 両モデルを評価したPDFで対応のある差をとる
+            scores = self._scores[model]
+            diffs = [
+                scores[pdf_name] - leader_scores[pdf_name]
+                for pdf_name in scores if pdf_name in leader_scores
+            ]
+            n = len(diffs)
+            if n < self.min_samples:
+                continue
+
+            mean_diff = sum(diffs) / n
+            # 分散は少数件で0にならないよう、差の範囲[-1, 1]に対する事前の分散を加えて推定する
+            variance = (0.25 + sum((diff - mean_diff) ** 2 for diff in diffs)) / (n + 1)
+            upper_bound = mean_diff + self.confidence_radius(n, variance)
+
+            if upper_bound < -self.margin:
+                self._stopped[model] = {
+                    'leader': leader,
+                    'samples': n,
+                    'mean_diff': mean_diff,
+                    'upper_bound': upper_bound
+                }
+                newly_stopped.append(model)
+                logger.warning(
+                    f"逐次比較により打ち切り: {model} ({self.metric}が{leader}より劣る: "
+                    f"差の平均={mean_diff:+.4f}, 上側信頼限界={upper_bound:+.4f} < -{self.margin}, "
+                    f"{n}PDF)"
+                )
+
+        return newly_stopped
@@ -5,20 +5,30 @@ PDF データ抽出 LLM 比較実験のメイン処理を実行する。
 """
 
 import argparse
+import asyncio
+import contextlib
 import json
 import logging
 import sys
 import time
+from datetime import datetime
 from glob import glob
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.processors import PDFProcessor, ImageConverter
-from src.evaluators import SchemaValidator, AccuracyCalculator, CostCalculator
-from src.utils import ExperimentLogger, ConfigLoader
+from src.processors import PDFProcessor, ImageConverter, PageRenderStage, DPISelector, RenderProfile, PageFilter
+from src.api_clients import BaseLLMClient, RetryPolicy, RetryBudget, ResponseCache, get_rate_limiter_registry
+from src.evaluators import (
+    SchemaValidator, AccuracyCalculator, CostCalculator, CostEstimator, SequentialComparator
+)
+from src.utils import (
+    ExperimentLogger, ConfigLoader, TaskScheduler, ScheduledTask, TaskJournal, ResultsStore,
+    StageTimer, BudgetPlanner
+)
+from src.utils.stage_timer import record_span
 from src.visualizers import ResultVisualizer
 
 
@@ -37,7 +47,30 @@ class ExperimentRunner:
         self,
         config_dir: str = "config",
         data_dir: str = "data",
-        output_dir: str = "output"
+        output_dir: str = "output",
+        render_cache_dir: Optional[str] = None,
+        render_cache_size_mb: float = 1024.0,
+        render_workers: int = 1,
+        retry_budget: Optional[int] = None,
+        retry_wait_budget: Optional[float] = None,
+        max_retry_after: float = 600.0,
+        response_cache_path: Optional[str] = None,
+        response_cache_ttl_hours: Optional[float] = None,
+        response_cache_size_mb: float = 512.0,
+        resume_session_id: Optional[str] = None,
+        stream_logs: bool = False,
+        save_parquet: bool = False,
+        results_store_path: Optional[str] = None,
+        max_cost_jpy: Optional[float] = None,
+        budget_jpy: Optional[float] = None,
+        early_stop_margin: Optional[float] = None,
+        early_stop_metric: str = "field_accuracy",
+        early_stop_alpha: float = 0.05,
+        early_stop_min_pdfs: int = 10,
+        adaptive_dpi: bool = False,
+        render_profiles: bool = False,
+        color_mode: str = 'rgb',
+        page_filter: bool = False
     ):
         """
         ExperimentRunnerの初期化
@@ -46,24 +79,148 @@ class ExperimentRunner:
             config_dir: 設定ファイルディレクトリ
             data_dir: データディレクトリ
             output_dir: 出力ディレクトリ
+            render_cache_dir: レンダリングキャッシュのディレクトリ（Noneの場合はキャッシュしない）
+            render_cache_size_mb: レンダリングキャッシュの最大サイズ（MB）
+            render_workers: 1つのPDFのページ変換の並列数
+            retry_budget: 実行全体のAPIリトライ回数の上限（Noneの場合は無制限）
+            retry_wait_budget: 実行全体のAPIリトライの待機時間の合計の上限（秒、Noneの場合は無制限）
+            max_retry_after: プロバイダーが指定した待機時間の上限（秒、超える場合はリトライしない）
+            response_cache_path: 抽出結果のキャッシュDBのパス（Noneの場合はキャッシュしない）
+            response_cache_ttl_hours: 抽出結果のキャッシュの有効期限（時間、Noneの場合は無期限）
+            response_cache_size_mb: 抽出結果のキャッシュの最大サイズ（MB）
+            resume_session_id: 再開するセッションID（Noneの場合は新しいセッションを開始）
+            stream_logs: ログを記録のたびにJSONLファイルへ追記し、メモリには集計値のみを保持するか
+            save_parquet: メトリクスをCSVに加えてParquetでも保存するか（pyarrowが必要）
+            results_store_path: セッションをまたいで結果を蓄積するDBのパス（Noneの場合は蓄積しない）
+            max_cost_jpy: 実行の見積もりコストの上限（円、Noneの場合は上限なし）
+            budget_jpy: 実行の予算（円）。指定した場合は安いモデルから実行し、
+                予算に収まらないモデルは層別サンプルのPDFで予算が尽きるまで実行する
+            early_stop_margin: 逐次比較の打ち切りのマージン。指定した場合は、首位のモデルより
+                このマージン以上に劣ることが統計的に確かになったモデルにPDFを送らない（Noneの場合は全PDFを実行）
+            early_stop_metric: 逐次比較に使用する評価指標（field_accuracy または f1_score）
+            early_stop_alpha: 逐次比較の有意水準
+            early_stop_min_pdfs: 逐次比較の判定を始める、首位と共通の評価済みPDF数
+            adaptive_dpi: 抽出時の解像度をページごとに文字の大きさから選ぶか（Falseの場合は150DPI）
+            render_profiles: プロバイダーの画像サイズの上限を超えるページを、上限に収まる解像度で直接変換するか
+            color_mode: 抽出時のページ画像のカラーモード（rgb, gray, bilevel, auto）
+            page_filter: 空白ページ・重複ページをAPIに送るページ画像から除外するか
+
+        Raises:
+            FileNotFoundError: 再開するセッションのジャーナルが見つからない場合
         """
         self.config_dir = Path(config_dir)
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
+        self.save_parquet = save_parquet
+        self.max_cost_jpy = max_cost_jpy
+        self.early_stop_settings = None
+        if early_stop_margin is not None:
+            self.early_stop_settings = {
+                'margin': early_stop_margin,
+                'metric': early_stop_metric,
+                'alpha': early_stop_alpha,
+                'min_samples': early_stop_min_pdfs
+            }
 
         # 各種マネージャーの初期化
         self.config_loader = ConfigLoader(config_dir)
-        self.logger = ExperimentLogger(output_dir / "logs")
+        self.logger = ExperimentLogger(
+            self.output_dir / "logs",
+            session_id=resume_session_id,
+            stream=stream_logs
+        )
+
+        # タスクジャーナル（状態遷移とログを追記し、停止後の再開に使用する）
+        journal_path = TaskJournal.get_path(self.output_dir / "journal", self.logger.session_id)
+        if resume_session_id and not journal_path.exists():
+            raise FileNotFoundError(f"再開するセッションのジャーナルが見つかりません: {journal_path}")
+
+        self.journal = TaskJournal(journal_path)
+        self.completed_tasks = set()
+
+        if resume_session_id:
+            self.completed_tasks = self.logger.restore_from_journal(self.journal)
+        else:
+            self.journal.record_session(self.logger.session_id, self.logger.session_start.isoformat())
+
+        self.logger.attach_journal(self.journal)
+
+        # セッションをまたいだ結果の蓄積（フィールドごとの判定結果は評価のたびに追加する）
+        self.results_store = None
+        if results_store_path:
+            self.results_store = ResultsStore(results_store_path)
+            self.results_store.register_session(
+                self.logger.session_id, self.logger.session_start.isoformat()
+            )
 
         # 設定の読み込み
         self.configs = self._load_configs()
 
         # プロセッサーの初期化
         self.pdf_processor = PDFProcessor()
-        self.image_converter = ImageConverter(dpi=200, max_size_mb=10.0)
+        self.image_converter = ImageConverter(
+            dpi=200,
+            max_size_mb=10.0,
+            cache_dir=render_cache_dir,
+            cache_max_size_mb=render_cache_size_mb,
+            render_workers=render_workers,
+            color_mode=color_mode
+        )
+
+        # 空白・重複ページの除外（Noneの場合は全ページを送る）
+        self.page_filter = PageFilter() if page_filter else None
+
+        # PDFごとの画像変換結果（ページの除外後）を全モデルで共有する
+        self.render_stage = PageRenderStage(self.image_converter, page_filter=self.page_filter)
+
+        # 抽出時のレンダリング解像度（レスポンスキャッシュのキーにも含める）
+        self.extraction_dpi = 150
+
+        # ページごとに解像度を選ぶ場合のDPISelector（Noneの場合はextraction_dpiで変換する）
+        self.dpi_selector = DPISelector() if adaptive_dpi else None
+
+        # プロバイダーの画像サイズの上限に合わせて変換するか（サーバー側で縮小される大きさの画像を作らない）
+        self.render_profiles = render_profiles
+
+        # 抽出結果のキャッシュ（同じ入力での再実行ではAPIを呼ばない）
+        self.response_cache = None
+        if response_cache_path:
+            self.response_cache = ResponseCache(
+                response_cache_path,
+                ttl_hours=response_cache_ttl_hours,
+                max_size_mb=response_cache_size_mb
+            )
+
+        # 全クライアントで共有するリトライ方針（リトライ予算は実行全体で共通）
+        self.retry_policy = RetryPolicy(
+            budget=RetryBudget(max_retries=retry_budget, max_wait_seconds=retry_wait_budget),
+            max_retry_after=max_retry_after
+        )
+
+        # プロセス共有のレート制限（全クライアント・ワーカーで共通のバケットを使用）
+        self.rate_limiter = get_rate_limiter_registry()
+        self.rate_limiter.configure(self.configs.get('rate_limits', {}))
 
         # 評価ツールの初期化
         self.cost_calculator = CostCalculator(self.configs.get('pricing', {}))
+        # ページごとに解像度を選ぶ場合は、選択しうる最大の解像度で見積もる
+        self.cost_estimator = CostEstimator(
+            self.cost_calculator,
+            dpi=self.dpi_selector.max_dpi if self.dpi_selector is not None else self.extraction_dpi
+        )
+
+        # 予算に応じたタスクの順序と実行可否の判定（Noneの場合は全タスクを実行する）
+        self.budget_planner = BudgetPlanner(budget_jpy) if budget_jpy is not None else None
+
+        # PDFごとの未処理のタスク数（待機中・実行中を含む。0になったPDFのハンドルと画像を解放する）
+        self._remaining_tasks: Dict[Path, int] = {}
+        self._current_pdf: Optional[Path] = None
+
+        # 逐次比較（実験の開始時にモデルのリストから作成する）
+        self.comparator: Optional[SequentialComparator] = None
+
+        # close()済みか
+        self._closed = False
 
         # スキーマバリデータ（スキーマがあれば）
         self.schema_validator = None
@@ -153,14 +310,92 @@ class ExperimentRunner:
         """
         logger.info(f"[MOCK] データ抽出: {model} - {pdf_path.name}")
 
-        # PDFを画像に変換（実際の処理）
+        # PDFを画像に変換（実際の処理。同じPDFは全モデルで変換結果を共有する）
+        try:
+            images = self._render_extraction_images(pdf_path, model)
+            logger.info(f"PDF→画像変換完了: {len(images)}ページ")
+        except Exception as e:
+            logger.error(f"PDF変換エラー: {str(e)}")
+            raise
+
+        return self._build_mock_result(images, model)
+
+    async def extract_data_mock_async(
+        self,
+        pdf_path: Path,
+        model: str,
+        system_prompt: str
+    ) -> Dict:
+        """
+        データ抽出のモック実装（非同期版）
+
+        PDF→画像変換はCPU処理のため、イベントループを塞がないようスレッドで実行する。
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+            system_prompt: システムプロンプト
+
+        Returns:
+            抽出結果とメタデータの辞書
+        """
+        logger.info(f"[MOCK] データ抽出: {model} - {pdf_path.name}")
+
         try:
-            images = self.image_converter.pdf_to_images(str(pdf_path), dpi=150)
+            images = await asyncio.to_thread(self._render_extraction_images, pdf_path, model)
             logger.info(f"PDF→画像変換完了: {len(images)}ページ")
         except Exception as e:
             logger.error(f"PDF変換エラー: {str(e)}")
             raise
 
+        # TODO: 実際のAPI連携では client.extract_data_from_pdf_cached_async() を await する
+        # （非同期SDKで実装していないクライアントは、同期版がスレッドで実行される）
+        return self._build_mock_result(images, model)
+
+    def _render_extraction_images(self, pdf_path: Path, model: str) -> List:
+        """
+        抽出に使用するページ画像を取得する（同じPDFは同じ画像サイズの上限のモデルで変換結果を共有する）
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+
+        Returns:
+            PIL Imageオブジェクトのリスト（page_filterが有効な場合は空白・重複ページを除外したもの）
+        """
+        render_profile = self._get_render_profile(model)
+
+        if self.dpi_selector is not None:
+            return self.render_stage.get_adaptive_images(pdf_path, self.dpi_selector, render_profile=render_profile)
+
+        return self.render_stage.get_images(pdf_path, dpi=self.extraction_dpi, render_profile=render_profile)
+
+    def _get_render_profile(self, model: str) -> Optional[RenderProfile]:
+        """
+        モデルのプロバイダーの画像サイズの上限を取得する
+
+        Args:
+            model: モデル名
+
+        Returns:
+            RenderProfile（render_profilesが無効な場合・上限がないプロバイダーの場合はNone）
+        """
+        if not self.render_profiles:
+            return None
+
+        return RenderProfile.for_provider(self.cost_estimator.get_provider(model))
+
+    def _build_mock_result(self, images: List, model: str) -> Dict:
+        """
+        モックの抽出結果を作成する
+
+        Args:
+            images: 変換済みのページ画像
+            model: モデル名
+
+        Returns:
+            抽出結果とメタデータの辞書
+        """
         # モックデータを返す
         # TODO: 実際のAPI連携モジュールに置き換える
         mock_extracted_data = {
@@ -170,10 +405,16 @@ class ExperimentRunner:
             "deposit": 200000
         }
 
-        # トークン数もモック
+        # トークン数もモック（見積もりと同じ算出方法で、実際の画像サイズから推定する）
+        estimate = self.cost_estimator.estimate_request(
+            model,
+            [image.size for image in images],
+            self.configs.get('system_prompt', ''),
+            self.configs.get('schema')
+        )
         mock_tokens = {
-            "input_tokens": len(images) * 1000,  # 1ページあたり1000トークンと仮定
-            "output_tokens": 500
+            "input_tokens": estimate['input_tokens'],
+            "output_tokens": estimate['output_tokens']
         }
 
         return {
@@ -198,35 +439,388 @@ class ExperimentRunner:
         Returns:
             抽出結果の辞書（失敗時はNone）
         """
-        pdf_name = pdf_path.stem
+        outcome = self._execute_extraction(pdf_path, model)
+        return self._record_extraction(outcome)
 
-        try:
-            # PDFの検証
-            is_valid, error_msg = self.pdf_processor.validate_pdf(str(pdf_path))
-            if not is_valid:
-                logger.error(f"PDF検証失敗: {pdf_path.name} - {error_msg}")
-                return None
+    def _execute_extraction(
+        self,
+        pdf_path: Path,
+        model: str
+    ) -> Dict:
+        """
+        データ抽出を実行し、記録に必要な情報をまとめて返す
+
+        ワーカースレッドから呼ばれるため、ExperimentLoggerへの記録は行わない。
+        記録は_record_extractionでメインスレッドから投入順に行う。
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+
+        Returns:
+            実行結果の辞書
+        """
+        outcome = self._new_outcome(pdf_path, model)
+        self.journal.record_state(pdf_path.stem, model, TaskJournal.STATE_RUNNING)
+
+        with outcome['stage_timer'].activate():
+            try:
+                # 逐次比較で打ち切ったモデルにはPDFを送らない
+                if self._is_early_stopped(outcome):
+                    return outcome
+
+                # PDFの検証
+                with record_span("validate"):
+                    is_valid, error_msg = self.pdf_processor.validate_pdf(str(pdf_path))
+                if not is_valid:
+                    outcome['validation_error'] = error_msg
+                    return outcome
+
+                outcome['request_timestamp'] = datetime.now().isoformat()
+
+                # キャッシュ済みの抽出結果があればAPIを呼ばない
+                cache_key = self._get_response_cache_key(pdf_path, model)
+                if self._restore_cached_outcome(outcome, cache_key):
+                    return outcome
+
+                # 予算の残りが足りない場合はAPIを呼ばずに見送る
+                if not self._reserve_budget(outcome):
+                    return outcome
+
+                # データ抽出
+                start_time = time.time()
+
+                # TODO: 実際のAPI連携に置き換える
+                outcome['result'] = self.extract_data_mock(
+                    pdf_path,
+                    model,
+                    self.configs.get('system_prompt', '')
+                )
+
+                outcome['response_time'] = time.time() - start_time
+                self._store_cached_outcome(outcome, cache_key)
+
+            except Exception as e:
+                outcome['error'] = e
+
+            finally:
+                self._settle_budget(outcome)
+
+        return outcome
+
+    async def _execute_extraction_async(
+        self,
+        pdf_path: Path,
+        model: str
+    ) -> Dict:
+        """
+        データ抽出を実行し、記録に必要な情報をまとめて返す（非同期版）
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+
+        Returns:
+            実行結果の辞書（_execute_extractionと同じ形式）
+        """
+        outcome = self._new_outcome(pdf_path, model)
+        self.journal.record_state(pdf_path.stem, model, TaskJournal.STATE_RUNNING)
+
+        with outcome['stage_timer'].activate():
+            try:
+                # 逐次比較で打ち切ったモデルにはPDFを送らない
+                if self._is_early_stopped(outcome):
+                    return outcome
+
+                # PDFの検証（初回はPDFのパースを伴うためスレッドで実行）
+                with record_span("validate"):
+                    is_valid, error_msg = await asyncio.to_thread(
+                        self.pdf_processor.validate_pdf, str(pdf_path)
+                    )
+                if not is_valid:
+                    outcome['validation_error'] = error_msg
+                    return outcome
+
+                outcome['request_timestamp'] = datetime.now().isoformat()
+
+                # キャッシュ済みの抽出結果があればAPIを呼ばない（初回はPDFのハッシュ計算を伴う）
+                cache_key = await asyncio.to_thread(self._get_response_cache_key, pdf_path, model)
+                if self._restore_cached_outcome(outcome, cache_key):
+                    return outcome
+
+                # 予算の残りが足りない場合はAPIを呼ばずに見送る
+                if not self._reserve_budget(outcome):
+                    return outcome
+
+                # データ抽出
+                start_time = time.time()
+
+                # TODO: 実際のAPI連携に置き換える
+                outcome['result'] = await self.extract_data_mock_async(
+                    pdf_path,
+                    model,
+                    self.configs.get('system_prompt', '')
+                )
+
+                outcome['response_time'] = time.time() - start_time
+                self._store_cached_outcome(outcome, cache_key)
+
+            except Exception as e:
+                outcome['error'] = e
+
+            finally:
+                self._settle_budget(outcome)
+
+        return outcome
+
+    def _is_early_stopped(self, outcome: Dict) -> bool:
+        """
+        逐次比較でモデルを打ち切ったかを判定する
+
+        Args:
+            outcome: 実行結果の辞書
+
+        Returns:
+            打ち切った場合True（outcomeにスキップの理由を記録する）
+        """
+        if self.comparator is None or not self.comparator.is_stopped(outcome['model']):
+            return False
+
+        outcome['skip_reason'] = "early_stop"
+        return True
+
+    def _reserve_budget(self, outcome: Dict) -> bool:
+        """
+        予算の残りからタスクの見積もりコストを予約する
+
+        Args:
+            outcome: 実行結果の辞書
+
+        Returns:
+            実行してよい場合True（予算不足で見送る場合はFalseを返し、outcomeにスキップの理由を記録する）
+        """
+        if self.budget_planner is None:
+            return True
+
+        if not self.budget_planner.try_reserve(outcome['pdf_path'], outcome['model']):
+            outcome['skip_reason'] = "budget"
+            return False
+
+        return True
 
-            # リクエストログ
-            self.logger.log_request(model, pdf_name)
+    def _settle_budget(self, outcome: Dict) -> None:
+        """
+        タスクの実際のコストで予算の予約を確定する
+
+        APIを呼ばなかったタスク（キャッシュ済み・検証失敗・打ち切りなど）は0円で確定し、
+        同じPDFのモデルとまとめて予約した見積もりを解放する。
 
-            # データ抽出
-            start_time = time.time()
+        Args:
+            outcome: 実行結果の辞書
+        """
+        if self.budget_planner is None or outcome['skip_reason'] == "budget":
+            return
 
-            # TODO: 実際のAPI連携に置き換える
-            result = self.extract_data_mock(
-                pdf_path,
+        model = outcome['model']
+        result = outcome['result']
+        actual_cost = 0.0
+        if result is not None and not result.get('cached') and model in self.cost_calculator.pricing:
+            actual_cost = self.cost_calculator.calculate_cost(
                 model,
-                self.configs.get('system_prompt', '')
+                result['tokens'].get('input_tokens', 0),
+                result['tokens'].get('output_tokens', 0),
+                currency='JPY'
             )
 
-            response_time = time.time() - start_time
+        self.budget_planner.settle(outcome['pdf_path'], model, actual_cost)
+
+    def _get_response_cache_key(self, pdf_path: Path, model: str) -> Optional[str]:
+        """
+        抽出結果のキャッシュキーを計算する
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+
+        Returns:
+            キャッシュキー（キャッシュが無効な場合はNone）
+        """
+        if self.response_cache is None:
+            return None
+
+        return ResponseCache.make_key(
+            model,
+            self.render_stage.get_pdf_hash(pdf_path),
+            self.configs.get('system_prompt', ''),
+            self.configs.get('schema', {}),
+            self.get_render_params(model)
+        )
+
+    def get_render_params(self, model: str) -> Dict:
+        """
+        抽出結果のキャッシュキーに含めるレンダリング設定を取得する
+
+        実行側のキャッシュキーとクライアント側のキャッシュキー（BaseLLMClient.render_params）で
+        同じ値を使用するため、レンダリング設定はここでのみ組み立てる。
+
+        Args:
+            model: モデル名
+
+        Returns:
+            レンダリング設定の辞書
+        """
+        # ページごとに解像度を選ぶ場合は、その設定をキーに含める
+        dpi = self.dpi_selector.cache_tag if self.dpi_selector is not None else self.extraction_dpi
+        render_params = {
+            'dpi': dpi,
+            'format': self.image_converter.format,
+            'quality': self.image_converter.quality
+        }
+
+        # RGB以外で変換する場合は、カラーモードをキーに含める
+        if self.image_converter.color_mode != 'rgb':
+            render_params['color_mode'] = self.image_converter.color_cache_tag
+
+        # 画像サイズの上限に合わせて変換する場合は、その上限をキーに含める
+        render_profile = self._get_render_profile(model)
+        if render_profile is not None:
+            render_params['profile'] = render_profile.cache_tag
+
+        # ページを除外する場合は、その設定をキーに含める
+        if self.page_filter is not None:
+            render_params['page_filter'] = self.page_filter.cache_tag
+
+        return render_params
+
+    def configure_client(self, client: BaseLLMClient) -> BaseLLMClient:
+        """
+        APIクライアントに実行の設定（レスポンスキャッシュ・リトライ方針・レート制限・レンダリング設定）を反映する
+
+        クライアントのキャッシュキーが実行側のキャッシュキーと一致するため、
+        どちらで保存した抽出結果も共有される。
+
+        Args:
+            client: APIクライアント
+
+        Returns:
+            設定したクライアント
+        """
+        client.response_cache = self.response_cache
+        client.retry_policy = self.retry_policy
+        client.max_retries = self.retry_policy.max_attempts
+        client.rate_limiter = self.rate_limiter
+        client.render_params = self.get_render_params(client.model_name)
+        return client
+
+    def _restore_cached_outcome(self, outcome: Dict, cache_key: Optional[str]) -> bool:
+        """
+        キャッシュ済みの抽出結果を実行結果に設定する
+
+        Args:
+            outcome: 実行結果の辞書
+            cache_key: キャッシュキー
+
+        Returns:
+            キャッシュを使用した場合True
+        """
+        if cache_key is None:
+            return False
+
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return False
+
+        logger.info(f"キャッシュ済みの抽出結果を使用: {outcome['model']} - {outcome['pdf_path'].name}")
+
+        outcome['result'] = {
+            "extracted_data": cached['extracted_data'],
+            "tokens": cached['tokens'],
+            "success": True,
+            "error_message": None,
+            "cached": True
+        }
+        # 応答時間は元のAPI呼び出しの値を記録する
+        outcome['response_time'] = cached['response_time']
+        return True
+
+    def _store_cached_outcome(self, outcome: Dict, cache_key: Optional[str]) -> None:
+        """
+        成功した抽出結果をキャッシュに保存する
+
+        Args:
+            outcome: 実行結果の辞書
+            cache_key: キャッシュキー
+        """
+        result = outcome['result']
+        if cache_key is None or not result.get('success'):
+            return
+
+        self.response_cache.put(
+            cache_key,
+            outcome['model'],
+            result['extracted_data'],
+            result['tokens'],
+            raw_response=result.get('raw_response'),
+            response_time=outcome['response_time']
+        )
+
+    @staticmethod
+    def _new_outcome(pdf_path: Path, model: str) -> Dict:
+        """
+        抽出タスクの実行結果の辞書を初期化する
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+
+        Returns:
+            実行結果の辞書
+        """
+        return {
+            'pdf_path': pdf_path,
+            'model': model,
+            'validation_error': None,
+            'request_timestamp': None,
+            'response_time': None,
+            'result': None,
+            'error': None,
+            'skip_reason': None,
+            'stage_timer': StageTimer()
+        }
+
+    def _record_extraction(self, outcome: Dict) -> Optional[Dict]:
+        """
+        抽出結果をログに記録し、抽出データを保存する
+
+        Args:
+            outcome: _execute_extractionの戻り値
+
+        Returns:
+            抽出結果の辞書（失敗時はNone）
+        """
+        pdf_path = outcome['pdf_path']
+        model = outcome['model']
+        pdf_name = pdf_path.stem
+
+        if outcome['validation_error'] is not None:
+            logger.error(f"PDF検証失敗: {pdf_path.name} - {outcome['validation_error']}")
+            return None
+
+        try:
+            if outcome['request_timestamp'] is not None:
+                # リクエストログ
+                self.logger.log_request(model, pdf_name, timestamp=outcome['request_timestamp'])
+
+            if outcome['error'] is not None:
+                raise outcome['error']
+
+            result = outcome['result']
 
             # レスポンスログ
             self.logger.log_response(
                 model=model,
                 pdf_name=pdf_name,
-                response_time=response_time,
+                response_time=outcome['response_time'],
                 tokens=result['tokens'],
                 success=result['success'],
                 error_message=result.get('error_message')
@@ -283,13 +877,22 @@ class ExperimentRunner:
             schema_errors = []
 
             if self.schema_validator:
-                schema_valid, schema_errors = self.schema_validator.validate(extracted_data)
+                with record_span("schema_validate"):
+                    schema_valid, schema_errors = self.schema_validator.validate(extracted_data)
 
             # 精度計算
-            accuracy_calc = AccuracyCalculator(golden_data, extracted_data)
-            metrics = accuracy_calc.get_metrics()
+            with record_span("accuracy"):
+                accuracy_calc = AccuracyCalculator(golden_data, extracted_data)
+                metrics = accuracy_calc.get_metrics()
             metrics['schema_valid'] = schema_valid
 
+            if self.results_store is not None:
+                self.results_store.add_field_results(
+                    self.logger.session_id, model, pdf_name,
+                    accuracy_calc.get_field_results(),
+                    timestamp=metrics['timestamp']
+                )
+
             # コスト計算
             cost_jpy = self.cost_calculator.calculate_cost(
                 model=model,
@@ -323,16 +926,168 @@ class ExperimentRunner:
         models: List[str],
         pdf_pattern: Optional[str] = None,
         skip_evaluation: bool = False,
-        skip_visualization: bool = False
+        skip_visualization: bool = False,
+        max_workers: int = 1,
+        model_concurrency: Optional[Dict[str, int]] = None
     ) -> None:
         """
-        実験を実行する
+        実験を実行する（終了時は失敗した場合も含めてclose()する）
 
         Args:
             models: 実行するモデルのリスト
             pdf_pattern: PDFファイルパターン
             skip_evaluation: 評価をスキップするか
             skip_visualization: 可視化をスキップするか
+            max_workers: 抽出タスクの全体の最大同時実行数
+            model_concurrency: モデルごとの最大同時実行数
+        """
+        try:
+            plan = self._start_experiment(models, pdf_pattern)
+            if not plan:
+                return
+
+            # 抽出タスクの作成（予算の指定がなければPDF順 × モデル順）
+            tasks = [
+                ScheduledTask(model, self._execute_extraction, pdf_path, model)
+                for pdf_path, model in self.plan_tasks(plan)
+            ]
+            scheduler = TaskScheduler(
+                max_workers=max_workers,
+                model_concurrency=model_concurrency
+            )
+            logger.info(f"並行実行: ワーカー数={scheduler.max_workers}, モデル別上限={scheduler.model_concurrency}")
+
+            # 実験実行（結果は投入順に返るため、ログの順序は逐次実行と同じ）
+            total_tasks = len(tasks)
+
+            # 途中で例外が発生した場合は、実行中のタスクの終了を待ってからclose()する
+            with contextlib.closing(scheduler.run(tasks)) as results:
+                for completed_tasks, (task, outcome, error) in enumerate(results, start=1):
+                    pdf_path, model = task.args
+                    self._handle_outcome(
+                        pdf_path, model, outcome, error,
+                        skip_evaluation, f"[{completed_tasks}/{total_tasks}]"
+                    )
+
+            self._finish_experiment(skip_visualization)
+        finally:
+            self.close()
+
+    async def run_experiment_async(
+        self,
+        models: List[str],
+        pdf_pattern: Optional[str] = None,
+        skip_evaluation: bool = False,
+        skip_visualization: bool = False,
+        max_in_flight: int = 100,
+        model_concurrency: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        実験を実行する（asyncio版）
+
+        抽出タスクをコルーチンとして同時に実行する。スレッドを使わずに
+        多数のリクエストを待機できるため、API待ちが大半を占める実験に向く。
+        記録と評価はイベントループ上で投入順に行うため、ログの順序は逐次実行と同じ。
+        終了時は失敗した場合も含めてclose()する。
+
+        Args:
+            models: 実行するモデルのリスト
+            pdf_pattern: PDFファイルパターン
+            skip_evaluation: 評価をスキップするか
+            skip_visualization: 可視化をスキップするか
+            max_in_flight: 全体の最大同時実行数
+            model_concurrency: モデルごとの最大同時実行数
+
+        Raises:
+            ValueError: 同時実行数に1未満が指定された場合
+        """
+        model_concurrency = model_concurrency or {}
+        if max_in_flight < 1 or any(limit < 1 for limit in model_concurrency.values()):
+            raise ValueError(
+                f"同時実行数は1以上を指定してください: "
+                f"max_in_flight={max_in_flight}, model_concurrency={model_concurrency}"
+            )
+
+        tasks = []
+        try:
+            plan = self._start_experiment(models, pdf_pattern)
+            if not plan:
+                return
+
+            in_flight = asyncio.Semaphore(max_in_flight)
+            model_limits = {
+                model: asyncio.Semaphore(limit)
+                for model, limit in model_concurrency.items()
+            }
+            logger.info(f"非同期実行: 最大同時実行数={max_in_flight}, モデル別上限={model_concurrency}")
+
+            async def run_task(pdf_path: Path, model: str) -> Dict:
+                # モデル別の枠を先に確保し、全体の枠を待機中のタスクで埋めない
+                async with model_limits.get(model) or contextlib.nullcontext():
+                    async with in_flight:
+                        return await self._execute_extraction_async(pdf_path, model)
+
+            # 抽出タスクの作成（予算の指定がなければPDF順 × モデル順）
+            tasks = [
+                (pdf_path, model, asyncio.create_task(run_task(pdf_path, model)))
+                for pdf_path, model in self.plan_tasks(plan)
+            ]
+            total_tasks = len(tasks)
+
+            for completed_tasks, (pdf_path, model, task) in enumerate(tasks, start=1):
+                outcome, error = None, None
+                try:
+                    outcome = await task
+                except Exception as e:
+                    error = e
+
+                self._handle_outcome(
+                    pdf_path, model, outcome, error,
+                    skip_evaluation, f"[{completed_tasks}/{total_tasks}]"
+                )
+
+            self._finish_experiment(skip_visualization)
+        finally:
+            # 途中で例外が発生した場合は、残りのタスクを取り消して終了を待ってからclose()する
+            unfinished = [task for _, _, task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+            self.close()
+
+    def close(self) -> None:
+        """
+        実験で開いたファイル・データベースを閉じる（複数回呼んでもよい）
+
+        PDFハンドル、ログのストリーミング出力、タスクジャーナル、レスポンスキャッシュ、
+        結果の蓄積DBを閉じる。
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self.pdf_processor.close_all()
+        self.logger.close()
+        self.journal.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.results_store is not None:
+            self.results_store.close()
+
+    def _start_experiment(
+        self,
+        models: List[str],
+        pdf_pattern: Optional[str]
+    ) -> Dict[Path, List[str]]:
+        """
+        実験の開始処理（PDFリストの取得、完了済みタスクの除外、PDFハンドルのオープン）を行う
+
+        Args:
+            models: 実行するモデルのリスト
+            pdf_pattern: PDFファイルパターン
+
+        Returns:
+            PDFファイルパスと実行するモデルのリストの辞書（PDF順、対象がない場合は空）
         """
         logger.info("=" * 80)
         logger.info("実験開始")
@@ -343,48 +1098,314 @@ class ExperimentRunner:
 
         if not pdf_files:
             logger.error("処理対象のPDFが見つかりません")
-            return
+            return {}
 
         logger.info(f"処理対象: {len(pdf_files)} PDF × {len(models)} モデル")
 
-        # 実験実行
-        total_tasks = len(pdf_files) * len(models)
-        completed_tasks = 0
-
+        # 再開時は完了済みのタスクを除外する
+        plan = {}
         for pdf_path in pdf_files:
-            pdf_name = pdf_path.stem
-            logger.info(f"\n処理中: {pdf_path.name}")
+            pdf_models = [
+                model for model in models
+                if (pdf_path.stem, model) not in self.completed_tasks
+            ]
+            if pdf_models:
+                plan[pdf_path] = pdf_models
+
+        skipped_count = len(pdf_files) * len(models) - sum(len(m) for m in plan.values())
+        if skipped_count:
+            logger.info(f"完了済みのタスクをスキップ: {skipped_count}件")
+
+        # 逐次比較（評価のたびに首位と比較し、劣るモデルを打ち切る）
+        self.comparator = None
+        if self.early_stop_settings is not None:
+            self.comparator = SequentialComparator(models, **self.early_stop_settings)
+            logger.info(
+                f"逐次比較: 評価指標={self.comparator.metric}, マージン={self.comparator.margin}, "
+                f"有意水準={self.comparator.alpha}, 判定開始={self.comparator.min_samples}PDF"
+            )
 
-            for model in models:
-                completed_tasks += 1
+            # 再開時は完了済みのタスクの評価を記録順に反映し、中断前の打ち切りの判定を引き継ぐ
+            restored = self.logger.restored_evaluations
+            for evaluation_log in restored:
+                self.comparator.record(evaluation_log['model'], evaluation_log['pdf_name'], evaluation_log)
+            if restored:
+                stopped = [model for model in models if self.comparator.is_stopped(model)]
                 logger.info(
-                    f"[{completed_tasks}/{total_tasks}] {model} - {pdf_path.name}"
+                    f"逐次比較に完了済みの評価を反映: {len(restored)}件"
+                    + (f", 打ち切り済み={stopped}" if stopped else "")
                 )
 
-                try:
-                    # データ抽出
-                    result = self.run_extraction(pdf_path, model)
+        # PDFハンドルを開く（検証・ページ数・メタデータを全モデルで1回のパースから取得する）
+        for pdf_path in plan:
+            self.pdf_processor.open_document(pdf_path)
+
+        # API呼び出しの前にコストを見積もり、上限を超える場合は何も送らずに中止する
+        projection = self.estimate_run_cost(plan)
+        if self.max_cost_jpy is not None and projection['total_cost_jpy'] > self.max_cost_jpy:
+            self.pdf_processor.close_all()
+            raise ValueError(
+                f"見積もりコストが上限を超えています: "
+                f"{projection['total_cost_jpy']:.2f}円 > {self.max_cost_jpy:.2f}円"
+            )
 
-                    if result is None:
-                        logger.warning(f"抽出失敗: {model} - {pdf_path.name}")
-                        continue
+        return plan
 
-                    # 評価
-                    if not skip_evaluation:
-                        eval_result = self.run_evaluation(
-                            pdf_name=pdf_name,
-                            model=model,
-                            extracted_data=result['extracted_data'],
-                            tokens=result['tokens']
-                        )
+    def estimate_run_cost(self, plan: Dict[Path, List[str]]) -> Dict:
+        """
+        実行のトークン数とコストを見積もり、ログに出力する（APIは呼ばない）
 
-                        if eval_result is None:
-                            logger.warning(f"評価失敗: {model} - {pdf_path.name}")
+        ページ画像のサイズはPDFのページサイズと抽出時の解像度から求めるため、
+        PDFを画像に変換せずに見積もれる。
 
-                except Exception as e:
-                    logger.error(f"タスク失敗: {model} - {pdf_path.name} - {str(e)}")
-                    self.logger.log_error(model, pdf_name, e, "task_error")
-                    continue
+        Args:
+            plan: PDFファイルパスと実行するモデルのリストの辞書
+
+        Returns:
+            CostEstimator.estimate_runの見積もりの辞書
+        """
+        image_sizes = self._get_image_sizes(plan)
+        tasks = [
+            (model, image_sizes[pdf_path])
+            for pdf_path, pdf_models in plan.items() if pdf_path in image_sizes
+            for model in pdf_models
+        ]
+
+        projection = self.cost_estimator.estimate_run(
+            tasks,
+            self.configs.get('system_prompt', ''),
+            self.configs.get('schema')
+        )
+
+        logger.info(
+            f"見積もりコスト: {projection['total_cost_jpy']:.2f}円 "
+            f"({projection['total_tasks']}タスク, "
+            f"入力{projection['total_input_tokens']:,}トークン, "
+            f"出力{projection['total_output_tokens']:,}トークン)"
+        )
+        for model, total in projection['models'].items():
+            cost = f"{total['cost_jpy']:.2f}円" if total['cost_jpy'] is not None else "価格設定なし"
+            logger.info(
+                f"  {model}: {cost} ({total['tasks']}タスク, {total['pages']}ページ, "
+                f"入力{total['input_tokens']:,}トークン, 出力{total['output_tokens']:,}トークン)"
+            )
+
+        return projection
+
+    def _get_image_sizes(self, plan: Dict[Path, List[str]]) -> Dict[Path, List[Tuple[int, int]]]:
+        """
+        PDFのページサイズから抽出時のページ画像のサイズを求める（PDFを画像に変換しない）
+
+        Args:
+            plan: PDFファイルパスと実行するモデルのリストの辞書
+
+        Returns:
+            {PDFファイルパス: ページ画像の (幅, 高さ) のリスト}（ページサイズを取得できないPDFは含まない）
+        """
+        image_sizes = {}
+        for pdf_path in plan:
+            try:
+                page_sizes = self.pdf_processor.get_page_sizes(str(pdf_path))
+            except ValueError:
+                logger.warning(f"ページサイズを取得できないため見積もりから除外: {pdf_path.name}")
+                continue
+
+            image_sizes[pdf_path] = [
+                self.cost_estimator.page_size_to_pixels(width, height)
+                for width, height in page_sizes
+            ]
+
+        return image_sizes
+
+    def plan_tasks(self, plan: Dict[Path, List[str]]) -> List[Tuple[Path, str]]:
+        """
+        抽出タスクを実行順に並べる
+
+        予算の指定がなければPDF順 × モデル順に並べる。予算の指定があれば、
+        タスクごとの見積もりコストからBudgetPlannerで並べ替える。
+
+        Args:
+            plan: PDFファイルパスと実行するモデルのリストの辞書
+
+        Returns:
+            (PDFファイルパス, モデル名) のリスト（実行順）
+        """
+        if self.budget_planner is None:
+            ordered = [(pdf_path, model) for pdf_path, pdf_models in plan.items() for model in pdf_models]
+        else:
+            image_sizes = self._get_image_sizes(plan)
+            task_costs = self.cost_estimator.estimate_task_costs(
+                (
+                    (pdf_path, model, image_sizes.get(pdf_path, []))
+                    for pdf_path, pdf_models in plan.items()
+                    for model in pdf_models
+                ),
+                self.configs.get('system_prompt', ''),
+                self.configs.get('schema')
+            )
+            page_counts = {pdf_path: len(sizes) for pdf_path, sizes in image_sizes.items()}
+            ordered = self.budget_planner.order_tasks(plan, task_costs, page_counts)
+
+        # 予算に応じた順序では同じPDFのタスクが離れて並び、並行実行中は後のタスクが
+        # 先に実行されていることもあるため、全タスクの処理が終わるまでPDFを解放しない
+        self._remaining_tasks = {}
+        for pdf_path, _ in ordered:
+            self._remaining_tasks[pdf_path] = self._remaining_tasks.get(pdf_path, 0) + 1
+
+        return ordered
+
+    def _handle_outcome(
+        self,
+        pdf_path: Path,
+        model: str,
+        outcome: Optional[Dict],
+        error: Optional[Exception],
+        skip_evaluation: bool,
+        progress: str
+    ) -> None:
+        """
+        抽出タスク1件の結果を記録・評価する（投入順に呼ぶこと）
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+            outcome: 抽出タスクの実行結果
+            error: タスク自体が送出した例外
+            skip_evaluation: 評価をスキップするか
+            progress: 進捗表示（例: "[3/10]"）
+        """
+        pdf_name = pdf_path.stem
+        if pdf_path != self._current_pdf:
+            self._current_pdf = pdf_path
+            logger.info(f"\n処理中: {pdf_path.name}")
+
+        logger.info(f"{progress} {model} - {pdf_path.name}")
+
+        # 抽出に失敗したタスクは再開時に再実行する
+        state = TaskJournal.STATE_FAILED
+
+        try:
+            if error is not None:
+                raise error
+
+            # 予算不足・逐次比較の打ち切りで見送ったタスクは記録せず、再開時に再判定する
+            if outcome['skip_reason'] is not None:
+                reason = "予算不足" if outcome['skip_reason'] == "budget" else "逐次比較による打ち切り"
+                logger.info(f"{reason}のためスキップ: {model} - {pdf_path.name}")
+                state = TaskJournal.STATE_SKIPPED
+                return
+
+            # 抽出結果の記録
+            result = self._record_extraction(outcome)
+
+            if result is None:
+                logger.warning(f"抽出失敗: {model} - {pdf_path.name}")
+                return
+
+            # 評価（スキーマ検証・精度計算の所要時間も抽出タスクのステージとして計測する）
+            if not skip_evaluation:
+                with outcome['stage_timer'].activate():
+                    eval_result = self.run_evaluation(
+                        pdf_name=pdf_name,
+                        model=model,
+                        extracted_data=result['extracted_data'],
+                        tokens=result['tokens']
+                    )
+
+                if eval_result is None:
+                    logger.warning(f"評価失敗: {model} - {pdf_path.name}")
+                elif self.comparator is not None:
+                    self.comparator.record(model, pdf_name, eval_result['metrics'])
+
+            state = TaskJournal.STATE_COMPLETED
+
+        except Exception as e:
+            logger.error(f"タスク失敗: {model} - {pdf_path.name} - {str(e)}")
+            self.logger.log_error(model, pdf_name, e, "task_error")
+
+        finally:
+            if outcome is not None and outcome['skip_reason'] is None:
+                self.logger.log_stage_times(model, pdf_name, outcome['stage_timer'].get_durations())
+            self.journal.record_state(pdf_name, model, state)
+
+            # すべてのタスクの処理が終わったPDFのハンドルと画像を解放
+            self._remaining_tasks[pdf_path] -= 1
+            if not self._remaining_tasks[pdf_path]:
+                del self._remaining_tasks[pdf_path]
+                self.pdf_processor.close_document(pdf_path)
+                self.render_stage.release(pdf_path)
+
+    def _finish_experiment(self, skip_visualization: bool) -> None:
+        """
+        実験の終了処理（統計のログ出力と結果の保存）を行う
+
+        Args:
+            skip_visualization: 可視化をスキップするか
+        """
+        render_stats = self.render_stage.get_statistics()
+        logger.info(
+            f"PDF→画像変換: {render_stats['render_count']}回 "
+            f"(再利用: {render_stats['hit_count']}回)"
+        )
+
+        if self.dpi_selector is not None:
+            dpi_stats = self.dpi_selector.get_statistics()
+            logger.info(
+                "ページごとの解像度: " + ", ".join(f"{dpi}DPI {count}ページ" for dpi, count in dpi_stats.items())
+            )
+
+        if self.image_converter.color_mode == 'auto':
+            color_stats = self.image_converter.color_detector.get_statistics()
+            logger.info(
+                "ページごとのカラーモード: " + ", ".join(f"{mode} {count}ページ" for mode, count in color_stats.items())
+            )
+
+        if self.page_filter is not None:
+            filter_stats = self.page_filter.get_statistics()
+            logger.info(
+                f"ページの除外: 空白 {filter_stats['blank_count']}ページ, "
+                f"重複 {filter_stats['duplicate_count']}ページ (全{filter_stats['page_count']}ページ)"
+            )
+            for pdf_name, dropped in filter_stats['dropped_pages'].items():
+                logger.info(f"  {pdf_name}: {', '.join(str(entry['page']) for entry in dropped)}ページ目を除外")
+
+        retry_stats = self.retry_policy.budget.get_statistics()
+        if retry_stats['used_retries']:
+            logger.info(
+                f"APIリトライ: {retry_stats['used_retries']}回 "
+                f"(待機合計: {retry_stats['used_wait_seconds']:.1f}秒)"
+            )
+
+        if self.response_cache is not None:
+            cache_stats = self.response_cache.get_statistics()
+            logger.info(
+                f"レスポンスキャッシュ: ヒット {cache_stats['hit_count']}回 / "
+                f"ミス {cache_stats['miss_count']}回 "
+                f"({cache_stats['entry_count']}件, {cache_stats['total_size_mb']:.1f}MB)"
+            )
+
+        if self.comparator is not None:
+            for model, status in self.comparator.get_status().items():
+                if status['stopped']:
+                    logger.info(
+                        f"逐次比較: {model} を打ち切り（{status['stopped_by']}との差の平均: "
+                        f"{status['mean_diff']:+.4f}, 評価済み{status['samples']}PDF）"
+                    )
+                elif status['is_leader']:
+                    logger.info(f"逐次比較: {model} が首位（評価済み{status['samples']}PDF）")
+
+        if self.budget_planner is not None:
+            logger.info(
+                f"予算: {self.budget_planner.spent:.2f}円 / {self.budget_planner.budget_jpy:.2f}円 "
+                f"(予算不足でスキップ: {self.budget_planner.skipped_count}タスク)"
+            )
+
+        limit_stats = self.rate_limiter.get_statistics()
+        if limit_stats['wait_count']:
+            logger.info(
+                f"レート制限による待機: {limit_stats['wait_count']}回 "
+                f"(待機合計: {limit_stats['total_wait_seconds']:.1f}秒)"
+            )
 
         logger.info("\n" + "=" * 80)
         logger.info("実験完了")
@@ -406,12 +1427,28 @@ class ExperimentRunner:
         csv_path = self.logger.save_to_csv()
         logger.info(f"✓ CSV保存: {csv_path}")
 
+        # Parquetに保存
+        if self.save_parquet:
+            try:
+                parquet_path = self.logger.save_to_parquet()
+                logger.info(f"✓ Parquet保存: {parquet_path}")
+            except ImportError as e:
+                logger.error(f"✗ Parquet保存エラー: {str(e)}")
+
         # サマリーレポート保存
         summary_path = self.logger.save_summary_report()
         logger.info(f"✓ サマリー保存: {summary_path}")
 
+        # 結果ストアに取り込み
+        if self.results_store is not None:
+            self.results_store.ingest_session(
+                self.logger.generate_summary_report(),
+                self.logger.iter_metrics()
+            )
+            logger.info(f"✓ 結果ストア更新: {self.results_store.db_path}")
+
         # 可視化の生成
-        if generate_visualizations and self.logger.evaluation_logs:
+        if generate_visualizations and self.logger.get_statistics()['total_evaluations']:
             try:
                 logger.info("\n可視化を生成中...")
                 visualizer = ResultVisualizer(self.output_dir / "visualizations")
@@ -429,6 +1466,30 @@ class ExperimentRunner:
         self.logger.print_summary()
 
 
+def parse_model_concurrency(values: List[str]) -> Dict[str, int]:
+    """
+    "MODEL=N" 形式の指定をモデルごとの同時実行数の辞書に変換する
+
+    Args:
+        values: "MODEL=N" 形式の文字列のリスト
+
+    Returns:
+        モデル名と同時実行数の辞書
+
+    Raises:
+        ValueError: 形式が不正な場合
+    """
+    model_concurrency = {}
+
+    for value in values:
+        model, sep, limit = value.rpartition('=')
+        if not sep or not model or not limit.isdigit():
+            raise ValueError(f"モデル別同時実行数の形式が不正です（MODEL=N）: {value}")
+        model_concurrency[model] = int(limit)
+
+    return model_concurrency
+
+
 def main():
     """メイン関数"""
     parser = argparse.ArgumentParser(
@@ -459,6 +1520,178 @@ def main():
         help="可視化をスキップ"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="抽出タスクの最大同時実行数（デフォルト: 1 = 逐次実行）"
+    )
+
+    parser.add_argument(
+        "--model-concurrency",
+        nargs="+",
+        default=[],
+        metavar="MODEL=N",
+        help="モデルごとの最大同時実行数（例: gpt-4o=4 claude-3-opus=1）"
+    )
+
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="asyncioで抽出タスクを実行（スレッドを使わずに多数のリクエストを同時に待機）"
+    )
+
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=100,
+        help="--async時の全体の最大同時実行数（デフォルト: 100）"
+    )
+
+    parser.add_argument(
+        "--render-cache-dir",
+        help="PDF→画像変換結果のキャッシュディレクトリ（例: output/images/cache）"
+    )
+
+    parser.add_argument(
+        "--render-cache-size-mb",
+        type=float,
+        default=1024.0,
+        help="レンダリングキャッシュの最大サイズ（MB、デフォルト: 1024）"
+    )
+
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=1,
+        help="1つのPDFのページ変換の並列数（popplerプロセス数、デフォルト: 1）"
+    )
+
+    parser.add_argument(
+        "--adaptive-dpi",
+        action="store_true",
+        help="抽出時の解像度をページごとに文字の大きさから選ぶ（100/150/200DPI、デフォルト: 150DPI固定）"
+    )
+
+    parser.add_argument(
+        "--render-profiles",
+        action="store_true",
+        help="プロバイダーの画像サイズの上限（長辺・短辺・ピクセル数）を超えるページを、上限に収まる解像度で直接変換する"
+    )
+
+    parser.add_argument(
+        "--color-mode",
+        choices=["rgb", "gray", "bilevel", "auto"],
+        default="rgb",
+        help="抽出時のページ画像のカラーモード（gray: グレースケール、bilevel: 白黒2値、auto: ページごとに判定、デフォルト: rgb）"
+    )
+
+    parser.add_argument(
+        "--page-filter",
+        action="store_true",
+        help="空白ページ・重複ページ（繰り返しの別紙など）をAPIに送るページ画像から除外"
+    )
+
+    parser.add_argument(
+        "--response-cache",
+        help="抽出結果のキャッシュDBのパス（例: output/cache/responses.sqlite3）"
+    )
+
+    parser.add_argument(
+        "--response-cache-ttl-hours",
+        type=float,
+        help="抽出結果のキャッシュの有効期限（時間、デフォルト: 無期限）"
+    )
+
+    parser.add_argument(
+        "--response-cache-size-mb",
+        type=float,
+        default=512.0,
+        help="抽出結果のキャッシュの最大サイズ（MB、デフォルト: 512）"
+    )
+
+    parser.add_argument(
+        "--retry-budget",
+        type=int,
+        help="実行全体のAPIリトライ回数の上限（デフォルト: 無制限）"
+    )
+
+    parser.add_argument(
+        "--retry-wait-budget",
+        type=float,
+        help="実行全体のAPIリトライの待機時間の合計の上限（秒、デフォルト: 無制限）"
+    )
+
+    parser.add_argument(
+        "--max-retry-after",
+        type=float,
+        default=600.0,
+        help="プロバイダーが指定した待機時間（Retry-After等）の上限。超える場合はリトライしない（秒、デフォルト: 600）"
+    )
+
+    parser.add_argument(
+        "--stream-logs",
+        action="store_true",
+        help="ログを記録のたびにJSONLファイルへ追記（大規模な実行でメモリ使用量を一定に保つ）"
+    )
+
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="メトリクスをCSVに加えてParquetでも保存（型付きの列、pyarrowが必要）"
+    )
+
+    parser.add_argument(
+        "--results-store",
+        help="セッションをまたいで結果を蓄積するDBのパス（例: output/results/results.sqlite3）"
+    )
+
+    parser.add_argument(
+        "--max-cost-jpy",
+        type=float,
+        help="見積もりコストの上限（円）。超える場合はAPIを呼ばずに中止する"
+    )
+
+    parser.add_argument(
+        "--budget-jpy",
+        type=float,
+        help="実行の予算（円）。安いモデルから実行し、高いモデルは層別サンプルのPDFで予算が尽きるまで実行する"
+    )
+
+    parser.add_argument(
+        "--early-stop-margin",
+        type=float,
+        help="逐次比較の打ち切りのマージン（例: 0.05）。首位より統計的に劣るモデルにはPDFを送らない"
+    )
+
+    parser.add_argument(
+        "--early-stop-metric",
+        choices=["field_accuracy", "f1_score"],
+        default="field_accuracy",
+        help="逐次比較に使用する評価指標（デフォルト: field_accuracy）"
+    )
+
+    parser.add_argument(
+        "--early-stop-alpha",
+        type=float,
+        default=0.05,
+        help="逐次比較の有意水準（デフォルト: 0.05）"
+    )
+
+    parser.add_argument(
+        "--early-stop-min-pdfs",
+        type=int,
+        default=10,
+        help="逐次比較の判定を始める評価済みPDF数（デフォルト: 10）"
+    )
+
+    parser.add_argument(
+        "--resume",
+        metavar="SESSION_ID",
+        help="停止したセッションを再開（ジャーナルから完了済みのタスクとログを復元）"
+    )
+
     parser.add_argument(
         "--config-dir",
         default="config",
@@ -485,12 +1718,44 @@ def main():
 
     args = parser.parse_args()
 
+    try:
+        model_concurrency = parse_model_concurrency(args.model_concurrency)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.early_stop_margin is not None and args.skip_evaluation:
+        parser.error("--early-stop-margin は評価結果を使用するため --skip-evaluation と併用できません")
+
+    runner = None
     try:
         # 実験ランナーの初期化
         runner = ExperimentRunner(
             config_dir=args.config_dir,
             data_dir=args.data_dir,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            render_cache_dir=args.render_cache_dir,
+            render_cache_size_mb=args.render_cache_size_mb,
+            render_workers=args.render_workers,
+            retry_budget=args.retry_budget,
+            retry_wait_budget=args.retry_wait_budget,
+            max_retry_after=args.max_retry_after,
+            response_cache_path=args.response_cache,
+            response_cache_ttl_hours=args.response_cache_ttl_hours,
+            response_cache_size_mb=args.response_cache_size_mb,
+            resume_session_id=args.resume,
+            stream_logs=args.stream_logs,
+            save_parquet=args.parquet,
+            results_store_path=args.results_store,
+            max_cost_jpy=args.max_cost_jpy,
+            budget_jpy=args.budget_jpy,
+            early_stop_margin=args.early_stop_margin,
+            early_stop_metric=args.early_stop_metric,
+            early_stop_alpha=args.early_stop_alpha,
+            early_stop_min_pdfs=args.early_stop_min_pdfs,
+            adaptive_dpi=args.adaptive_dpi,
+            render_profiles=args.render_profiles,
+            color_mode=args.color_mode,
+            page_filter=args.page_filter
         )
 
         if args.dry_run:
@@ -499,15 +1764,31 @@ def main():
             pdf_files = runner.get_pdf_list(args.pdf)
             logger.info(f"処理対象PDF: {len(pdf_files)}件")
             logger.info(f"実行モデル: {args.models}")
+            plan = {pdf_path: args.models for pdf_path in pdf_files}
+            runner.estimate_run_cost(plan)
+            if runner.budget_planner is not None:
+                runner.plan_tasks(plan)
             return
 
         # 実験実行
-        runner.run_experiment(
-            models=args.models,
-            pdf_pattern=args.pdf,
-            skip_evaluation=args.skip_evaluation,
-            skip_visualization=args.skip_visualization
-        )
+        if args.use_async:
+            asyncio.run(runner.run_experiment_async(
+                models=args.models,
+                pdf_pattern=args.pdf,
+                skip_evaluation=args.skip_evaluation,
+                skip_visualization=args.skip_visualization,
+                max_in_flight=args.max_in_flight,
+                model_concurrency=model_concurrency
+            ))
+        else:
+            runner.run_experiment(
+                models=args.models,
+                pdf_pattern=args.pdf,
+                skip_evaluation=args.skip_evaluation,
+                skip_visualization=args.skip_visualization,
+                max_workers=args.workers,
+                model_concurrency=model_concurrency
+            )
 
         logger.info("\n✓ 実験が正常に完了しました")
 
@@ -517,6 +1798,9 @@ def main():
     except Exception as e:
         logger.error(f"\n✗ 実験が失敗しました: {str(e)}", exc_info=True)
         sys.exit(1)
+    finally:
+        if runner is not None:
+            runner.close()
 
 
 if __name__ == '__main__':
@@ -1,10 +1,19 @@
 """
-PDF
+PDF処理モジュール
 
-PDFաn<;	ےLF
+PDFファイルの読み込み、検証、画像変換（ページごとの解像度・カラーモードの選択を含む）、
+空白・重複ページの除外を行う。
 """
 
-from .pdf_processor import PDFProcessor
+from .pdf_processor import PDFProcessor, PDFDocument, compute_file_hash
 from .image_converter import ImageConverter
+from .encoded_page import EncodedPage
+from .page_render_stage import PageRenderStage
+from .render_cache import RenderCache
+from .dpi_selector import DPISelector
+from .render_profile import RenderProfile
+from .color_mode import ColorModeDetector
+from .page_filter import PageFilter
 
-__all__ = ['PDFProcessor', 'ImageConverter']
+__all__ = ['PDFProcessor', 'PDFDocument', 'ImageConverter', 'EncodedPage', 'PageRenderStage', 'RenderCache',
+           'DPISelector', 'RenderProfile', 'ColorModeDetector', 'PageFilter', 'compute_file_hash']
@@ -0,0 +1,150 @@
+"""
+カラーモード判定モジュール
+
+ページ画像に色が使われているか、白黒2値に近いかを判定し、
+グレースケール（8bit）・2値（1bit）の画像に変換する。
+白黒でスキャンされた契約書はRGBで保持する必要がないため、
+メモリ使用量とアップロードサイズを削減できる。
+"""
+
+import threading
+from typing import Dict
+from PIL import Image, ImageChops
+
+# 指定できるカラーモード（autoはページごとに判定する）
+COLOR_MODES = ('rgb', 'gray', 'bilevel', 'auto')
+
+# カラーモード → PILの画像モード
+PIL_MODES = {'rgb': 'RGB', 'gray': 'L', 'bilevel': '1'}
+
+
+class ColorModeDetector:
+    """ページ画像のカラーモードを判定・変換するクラス"""
+
+    def __init__(
+        self,
+        chroma_threshold: int = 24,
+        max_color_ratio: float = 0.001,
+        min_bilevel_ratio: float = 0.97,
+        bilevel_threshold: int = 160
+    ):
+        """
+        ColorModeDetectorの初期化
+
+        Args:
+            chroma_threshold: 色付きとみなす画素の彩度（RGBの最大値と最小値の差、0-255）
+            max_color_ratio: 色付きの画素の割合がこれ以下のページをグレースケールとみなす
+            min_bilevel_ratio: 白・黒に近い画素の割合がこれ以上のページを2値とみなす
+            bilevel_threshold: 2値化で白とする明るさの下限（0-255）
+
+        Raises:
+            ValueError: 不正な設定が指定された場合
+        """
+        if not 0 <= max_color_ratio <= 1 or not 0 <= min_bilevel_ratio <= 1:
+            raise ValueError(
+                f"割合は0以上1以下を指定してください: max_color_ratio={max_color_ratio}, "
+                f"min_bilevel_ratio={min_bilevel_ratio}"
+            )
+
+        self.chroma_threshold = chroma_threshold
+        self.max_color_ratio = max_color_ratio
+        self.min_bilevel_ratio = min_bilevel_ratio
+        self.bilevel_threshold = bilevel_threshold
+
+        # 統計情報（カラーモードごとのページ数）
+        self._lock = threading.Lock()
+        self.page_counts: Dict[str, int] = {}
+
+    @property
+    def cache_tag(self) -> str:
+        """変換結果のキャッシュキーに含める設定の文字列"""
+        return (
+            f"auto-c{self.chroma_threshold}-r{self.max_color_ratio:g}-"
+            f"b{self.min_bilevel_ratio:g}-t{self.bilevel_threshold}"
+        )
+
+    def analyze_page(self, image: Image.Image) -> Dict[str, float]:
+        """
+        ページ画像の色の使われ方を分析する
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            {'color_ratio', 'bilevel_ratio'} の辞書
+            （color_ratioは色付きの画素の割合、bilevel_ratioは白・黒に近い画素の割合）
+        """
+        pixel_count = image.width * image.height
+
+        color_ratio = 0.0
+        if image.mode not in ('1', 'L'):
+            red, green, blue = image.convert('RGB').split()
+            brightest = ImageChops.lighter(ImageChops.lighter(red, green), blue)
+            darkest = ImageChops.darker(ImageChops.darker(red, green), blue)
+            chroma = ImageChops.difference(brightest, darkest).histogram()
+            color_ratio = sum(chroma[self.chroma_threshold:]) / pixel_count
+
+        # 明るさの両端1/4に入る画素を白・黒に近いとみなす
+        histogram = image.convert('L').histogram()
+        bilevel_ratio = (sum(histogram[:64]) + sum(histogram[192:])) / pixel_count
+
+        return {'color_ratio': color_ratio, 'bilevel_ratio': bilevel_ratio}
+
+    def select_mode(self, image: Image.Image) -> str:
+        """
+        ページ画像のカラーモードを判定する
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            'rgb'・'gray'・'bilevel' のいずれか
+        """
+        analysis = self.analyze_page(image)
+
+        if analysis['color_ratio'] > self.max_color_ratio:
+            mode = 'rgb'
+        elif analysis['bilevel_ratio'] >= self.min_bilevel_ratio:
+            mode = 'bilevel'
+        else:
+            mode = 'gray'
+
+        with self._lock:
+            self.page_counts[mode] = self.page_counts.get(mode, 0) + 1
+
+        return mode
+
+    def convert(self, image: Image.Image, mode: str) -> Image.Image:
+        """
+        ページ画像を指定のカラーモードに変換する
+
+        Args:
+            image: PIL Imageオブジェクト
+            mode: 'rgb'・'gray'・'bilevel' のいずれか
+
+        Returns:
+            変換した画像（既に指定のモードの場合は元の画像）
+
+        Raises:
+            ValueError: 不正なカラーモードが指定された場合
+        """
+        if mode not in PIL_MODES:
+            raise ValueError(f"不正なカラーモードです: {mode}（{', '.join(PIL_MODES)}）")
+
+        if image.mode == PIL_MODES[mode]:
+            return image
+
+        if mode == 'bilevel':
+            return image.convert('L').point(lambda value: 255 if value >= self.bilevel_threshold else 0, mode='1')
+
+        return image.convert(PIL_MODES[mode])
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        カラーモードごとの判定したページ数を取得する
+
+        Returns:
+            {カラーモード: ページ数} の辞書
+        """
+        with self._lock:
+            return dict(self.page_counts)
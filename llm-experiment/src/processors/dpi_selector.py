@@ -0,0 +1,224 @@
+"""
+解像度選択モジュール
+
+低解像度で変換したプローブ画像から、ページごとに文字の大きさと内容の有無を推定し、
+文字が判読できる最小の解像度を選ぶ。
+画像のトークン数とアップロードサイズはピクセル数に比例するため、
+小さい文字の表は高い解像度のまま、表紙や空白に近いページは低い解像度で変換できる。
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from PIL import Image, ImageFilter
+
+logger = logging.getLogger(__name__)
+
+
+class DPISelector:
+    """プローブ画像からページごとの変換解像度を選ぶクラス"""
+
+    def __init__(
+        self,
+        dpi_steps: Sequence[int] = (100, 150, 200),
+        probe_dpi: int = 72,
+        target_text_px: float = 20.0,
+        ink_threshold: int = 160,
+        blank_edge_ratio: float = 0.002,
+        strips: int = 4
+    ):
+        """
+        DPISelectorの初期化
+
+        Args:
+            dpi_steps: 選択できる解像度（昇順に並べ替える。最小値が下限、最大値が上限）
+            probe_dpi: 文字の大きさを推定するプローブ画像の解像度
+            target_text_px: 判読に必要な文字の行の高さ（ピクセル）
+            ink_threshold: 文字とみなす画素の明るさの上限（0-255）
+            blank_edge_ratio: これ未満のエッジ画素の割合のページを空白に近いとみなす
+            strips: 段組みを分けて行を検出するための縦の分割数
+
+        Raises:
+            ValueError: 不正な設定が指定された場合
+        """
+        if not dpi_steps or min(dpi_steps) < 1:
+            raise ValueError(f"解像度は1以上の値を1つ以上指定してください: {dpi_steps}")
+        if probe_dpi < 1 or target_text_px <= 0 or strips < 1:
+            raise ValueError(
+                f"不正な設定です: probe_dpi={probe_dpi}, target_text_px={target_text_px}, strips={strips}"
+            )
+
+        self.dpi_steps = sorted(set(dpi_steps))
+        self.probe_dpi = probe_dpi
+        self.target_text_px = target_text_px
+        self.ink_threshold = ink_threshold
+        self.blank_edge_ratio = blank_edge_ratio
+        self.strips = strips
+
+        # 統計情報（解像度ごとのページ数）
+        self._lock = threading.Lock()
+        self.page_counts: Dict[int, int] = {}
+
+    @property
+    def min_dpi(self) -> int:
+        """選択できる最小の解像度"""
+        return self.dpi_steps[0]
+
+    @property
+    def max_dpi(self) -> int:
+        """選択できる最大の解像度"""
+        return self.dpi_steps[-1]
+
+    @property
+    def cache_tag(self) -> str:
+        """変換結果のキャッシュキーに含める設定の文字列"""
+        return (
+            f"auto:{'/'.join(map(str, self.dpi_steps))}:probe{self.probe_dpi}:"
+            f"text{self.target_text_px:g}:ink{self.ink_threshold}:"
+            f"blank{self.blank_edge_ratio:g}:strips{self.strips}"
+        )
+
+    def analyze_page(self, image: Image.Image) -> Dict:
+        """
+        プローブ画像1ページの内容を分析する
+
+        Args:
+            image: probe_dpiで変換したページ画像
+
+        Returns:
+            {'ink_ratio', 'edge_ratio', 'line_count', 'text_height_pt'} の辞書
+            （text_height_ptは小さい方から25%の行の高さ（ポイント）。行がない場合はNone）
+        """
+        gray = image.convert('L')
+        pixel_count = gray.width * gray.height
+
+        ink = gray.point(lambda value: 255 if value < self.ink_threshold else 0)
+        ink_ratio = ink.histogram()[255] / pixel_count
+
+        # FIND_EDGESは画像の外周1ピクセルをエッジとして出力するため除く
+        edges = gray.filter(ImageFilter.FIND_EDGES)
+        if edges.width > 2 and edges.height > 2:
+            edges = edges.crop((1, 1, edges.width - 1, edges.height - 1))
+        edge_ratio = sum(edges.histogram()[64:]) / (edges.width * edges.height)
+
+        line_heights = self._find_line_heights(ink)
+        text_height_pt = None
+        if line_heights:
+            line_heights.sort()
+            text_height_pt = line_heights[len(line_heights) // 4] * 72 / self.probe_dpi
+
+        return {
+            'ink_ratio': ink_ratio,
+            'edge_ratio': edge_ratio,
+            'line_count': len(line_heights),
+            'text_height_pt': text_height_pt
+        }
+
+    def _find_line_heights(self, ink: Image.Image) -> List[int]:
+        """
+        文字の行の高さ（ピクセル）を検出する
+
+        ページを縦に分割した帯ごとに、文字の画素を含む行が続く範囲を1行とみなす。
+        段組みや表の列で行の位置がずれていても、帯ごとに分けることで行が結合されにくくなる。
+        高さ1ピクセルの範囲は罫線やノイズ、1インチを超える範囲は図や写真とみなして除く。
+        """
+        heights = []
+        strip_width = max(ink.width // self.strips, 1)
+        max_height = self.probe_dpi
+
+        for left in range(0, ink.width, strip_width):
+            strip = ink.crop((left, 0, min(left + strip_width, ink.width), ink.height))
+            # 各行の文字の画素の割合（帯の幅の1%以上を文字の行とみなす）
+            profile = strip.resize((1, strip.height), Image.BOX).tobytes()
+            min_value = 255 * 0.01
+
+            run = 0
+            for value in list(profile) + [0]:
+                if value >= min_value:
+                    run += 1
+                    continue
+                if 2 <= run <= max_height:
+                    heights.append(run)
+                run = 0
+
+        return heights
+
+    def select_dpi(self, image: Image.Image) -> int:
+        """
+        プローブ画像1ページの変換解像度を選ぶ
+
+        - 空白に近いページ（エッジが少ない）は最小の解像度
+        - 文字の行を検出できないページ（図や写真のみ）は最大の解像度
+        - それ以外は、小さい方の行の高さが target_text_px 以上になる最小の解像度
+
+        Args:
+            image: probe_dpiで変換したページ画像
+
+        Returns:
+            解像度（dpi_stepsのいずれか）
+        """
+        analysis = self.analyze_page(image)
+
+        if analysis['edge_ratio'] < self.blank_edge_ratio:
+            return self.min_dpi
+
+        if analysis['text_height_pt'] is None:
+            return self.max_dpi
+
+        required_dpi = self.target_text_px * 72 / analysis['text_height_pt']
+        for dpi in self.dpi_steps:
+            if dpi >= required_dpi:
+                return dpi
+
+        return self.max_dpi
+
+    def select_page_dpis(self, probe_images: List[Image.Image]) -> List[int]:
+        """
+        プローブ画像からページごとの変換解像度を選ぶ
+
+        Args:
+            probe_images: probe_dpiで変換したページ画像のリスト
+
+        Returns:
+            ページ順の解像度のリスト
+        """
+        page_dpis = [self.select_dpi(image) for image in probe_images]
+
+        with self._lock:
+            for dpi in page_dpis:
+                self.page_counts[dpi] = self.page_counts.get(dpi, 0) + 1
+
+        return page_dpis
+
+    def get_statistics(self) -> Dict[int, int]:
+        """
+        解像度ごとの選択したページ数を取得する
+
+        Returns:
+            {解像度: ページ数} の辞書（解像度の昇順）
+        """
+        with self._lock:
+            return dict(sorted(self.page_counts.items()))
+
+
+def group_page_runs(page_dpis: List[int], first_page: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    """
+    同じ解像度が続くページをまとめる
+
+    Args:
+        page_dpis: ページ順の解像度のリスト
+        first_page: 先頭のページ番号（1-indexed、Noneの場合は1）
+
+    Returns:
+        (解像度, 開始ページ, 終了ページ) のリスト
+    """
+    runs = []
+    page = first_page or 1
+    for dpi in page_dpis:
+        if runs and runs[-1][0] == dpi:
+            runs[-1] = (dpi, runs[-1][1], page)
+        else:
+            runs.append((dpi, page, page))
+        page += 1
+
+    return runs
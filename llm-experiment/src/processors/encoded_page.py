@@ -0,0 +1,105 @@
+"""
+エンコード済みページモジュール
+
+APIに送るページ画像を、エンコード済みのバイト列として保持する。
+サイズ最適化で得たバイト列をそのまま使うことで、送信前の再エンコードを不要にする。
+"""
+
+import base64
+import io
+from typing import Tuple
+from PIL import Image
+
+# 画像フォーマット → MIMEタイプ
+MIME_TYPES = {
+    'JPEG': 'image/jpeg',
+    'PNG': 'image/png',
+    'WEBP': 'image/webp',
+    'GIF': 'image/gif',
+    'TIFF': 'image/tiff'
+}
+
+
+class EncodedPage:
+    """エンコード済みのページ画像（バイト列・MIMEタイプ・画像サイズ）を保持するクラス"""
+
+    def __init__(self, data: bytes, format: str, width: int, height: int):
+        """
+        EncodedPageの初期化
+
+        Args:
+            data: エンコード済み画像のバイト列
+            format: 画像フォーマット（PNG, JPEG等）
+            width: 画像の幅（ピクセル）
+            height: 画像の高さ（ピクセル）
+        """
+        self.data = data
+        self.format = format.upper()
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'EncodedPage':
+        """
+        エンコード済みのバイト列から作成する（ヘッダーのみ読み、画素はデコードしない）
+
+        Args:
+            data: エンコード済み画像のバイト列
+
+        Returns:
+            EncodedPageオブジェクト
+        """
+        with Image.open(io.BytesIO(data)) as image:
+            return cls(data, image.format, image.width, image.height)
+
+    @property
+    def mime_type(self) -> str:
+        """MIMEタイプ（APIのmedia_type等に指定する）"""
+        return MIME_TYPES.get(self.format, f"image/{self.format.lower()}")
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """画像サイズ（幅, 高さ）"""
+        return self.width, self.height
+
+    @property
+    def size_bytes(self) -> int:
+        """バイト列のサイズ"""
+        return len(self.data)
+
+    @property
+    def view(self) -> memoryview:
+        """バイト列のmemoryview（コピーせずに参照する）"""
+        return memoryview(self.data)
+
+    def to_base64(self) -> str:
+        """
+        Base64エンコードした文字列を取得する
+
+        Returns:
+            Base64エンコードされた文字列
+        """
+        return base64.b64encode(self.view).decode('ascii')
+
+    def to_data_url(self) -> str:
+        """
+        data URL（data:<MIMEタイプ>;base64,...）を取得する
+
+        Returns:
+            data URL
+        """
+        return f"data:{self.mime_type};base64,{self.to_base64()}"
+
+    def to_image(self) -> Image.Image:
+        """
+        PIL Imageにデコードする
+
+        Returns:
+            PIL Imageオブジェクト
+        """
+        image = Image.open(io.BytesIO(self.data))
+        image.load()
+        return image
+
+    def __repr__(self) -> str:
+        return f"EncodedPage({self.mime_type}, {self.width}x{self.height}, {self.size_bytes} bytes)"
@@ -7,22 +7,43 @@ PDFファイルを画像に変換し、Base64エンコードやサイズ最適
 import base64
 import io
 import logging
+import math
+import os
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Tuple, Union
 from PIL import Image
 import pdf2image
 
+from ..utils.stage_timer import record_span
+from .color_mode import COLOR_MODES, ColorModeDetector
+from .dpi_selector import DPISelector, group_page_runs
+from .encoded_page import EncodedPage
+from .pdf_processor import compute_file_hash
+from .render_cache import RenderCache
+from .render_profile import RenderProfile
+
 logger = logging.getLogger(__name__)
 
 
 class ImageConverter:
     """PDF→画像変換とBase64エンコードを行うクラス"""
 
+    # サイズ最適化で縮小率を探索するエンコードの最大回数（収まる縮小率が見つかるまでは続ける）
+    SEARCH_STEPS = 6
+
     def __init__(
         self,
         dpi: int = 200,
         format: str = 'PNG',
-        max_size_mb: float = 10.0
+        max_size_mb: float = 10.0,
+        quality: int = 85,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_max_size_mb: float = 1024.0,
+        render_workers: int = 1,
+        min_quality: int = 40,
+        max_pixels: Optional[int] = None,
+        max_side: Optional[int] = None,
+        color_mode: str = 'rgb'
     ):
         """
         ImageConverterの初期化
@@ -31,10 +52,48 @@ class ImageConverter:
             dpi: 画像変換時の解像度（デフォルト: 200）
             format: 出力画像フォーマット（PNG, JPEG等）
             max_size_mb: 画像の最大サイズ（MB）
+            quality: JPEG品質（1-100）
+            cache_dir: レンダリングキャッシュのディレクトリ（Noneの場合はキャッシュしない）
+            cache_max_size_mb: レンダリングキャッシュの最大サイズ（MB）
+            render_workers: ページ変換の並列数（ページ範囲を分割してpopplerを並列実行する）
+            min_quality: サイズ最適化で下げられるJPEG品質の下限（これ以上下げる場合は縮小する）
+            max_pixels: サイズ最適化後の画像の最大ピクセル数（Noneの場合は制限なし）
+            max_side: サイズ最適化後の画像の長辺の最大ピクセル数（Noneの場合は制限なし）
+            color_mode: 変換後の画像のカラーモード
+                （rgb: フルカラー、gray: グレースケール、bilevel: 白黒2値、auto: ページごとに判定）
+
+        Raises:
+            ValueError: render_workersが1未満の場合、min_qualityがqualityより大きい場合、
+                不正なカラーモードが指定された場合
         """
+        if render_workers < 1:
+            raise ValueError(f"render_workersは1以上を指定してください: {render_workers}")
+        if not 1 <= min_quality <= quality:
+            raise ValueError(f"min_qualityは1以上quality以下を指定してください: {min_quality}")
+        if color_mode not in COLOR_MODES:
+            raise ValueError(f"不正なカラーモードです: {color_mode}（{', '.join(COLOR_MODES)}）")
+
         self.dpi = dpi
         self.format = format.upper()
         self.max_size_mb = max_size_mb
+        self.quality = quality
+        self.min_quality = min_quality
+        self.max_pixels = max_pixels
+        self.max_side = max_side
+        self.render_workers = render_workers
+        self.color_mode = color_mode
+        self.color_detector = ColorModeDetector() if color_mode != 'rgb' else None
+
+        self.render_cache: Optional[RenderCache] = None
+        if cache_dir is not None:
+            self.render_cache = RenderCache(cache_dir, max_size_mb=cache_max_size_mb)
+
+    @property
+    def color_cache_tag(self) -> str:
+        """変換結果のキャッシュキーに含めるカラーモードの文字列"""
+        if self.color_mode == 'auto':
+            return self.color_detector.cache_tag
+        return self.color_mode
 
     def pdf_to_images(
         self,
@@ -45,6 +104,7 @@ class ImageConverter:
     ) -> List[Image.Image]:
         """
         PDFファイルを画像のリストに変換する
+        （レンダリングキャッシュが有効な場合は、キャッシュ済みのページを再利用する）
 
         Args:
             pdf_path: PDFファイルのパス
@@ -62,17 +122,247 @@ class ImageConverter:
         if dpi is None:
             dpi = self.dpi
 
-        logger.info(f"PDF→画像変換開始: {pdf_path} (DPI: {dpi})")
+        if self.render_cache is not None:
+            try:
+                page_bytes = self._get_cached_page_bytes(pdf_path, dpi, first_page, last_page)
+            except FileNotFoundError:
+                logger.error(f"PDFファイルが見つかりません: {pdf_path}")
+                raise
+            except Exception as e:
+                logger.error(f"PDF→画像変換に失敗しました: {pdf_path}, エラー: {str(e)}")
+                raise Exception(f"PDF変換エラー: {str(e)}")
+
+            return [self._decode_image(data) for data in page_bytes]
+
+        return self._render_pages(pdf_path, dpi, first_page, last_page)
+
+    def pdf_to_images_adaptive(
+        self,
+        pdf_path: str,
+        dpi_selector: DPISelector,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        render_profile: Optional[RenderProfile] = None,
+        page_sizes: Optional[List[Tuple[float, float]]] = None
+    ) -> List[Image.Image]:
+        """
+        ページごとに選んだ解像度でPDFファイルを画像のリストに変換する
+
+        低解像度のプローブ画像から文字の大きさを推定してページごとの解像度を選び、
+        同じ解像度が続くページをまとめて変換する。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            dpi_selector: 解像度を選ぶDPISelector
+            first_page: 開始ページ（1-indexed、Noneの場合は最初から）
+            last_page: 終了ページ（1-indexed、Noneの場合は最後まで）
+            render_profile: 画像サイズの上限（指定した場合、選んだ解像度を上限に収まるように下げる）
+            page_sizes: PDF全体のページ順の (幅, 高さ)（ポイント単位、render_profileの判定に使用）
+
+        Returns:
+            PIL Imageオブジェクトのリスト（ページごとに解像度が異なる）
+
+        Raises:
+            FileNotFoundError: PDFファイルが存在しない場合
+            Exception: PDF変換に失敗した場合
+        """
+        probe_images = self.pdf_to_images(pdf_path, dpi=dpi_selector.probe_dpi,
+                                          first_page=first_page, last_page=last_page)
+        page_dpis = dpi_selector.select_page_dpis(probe_images)
+        del probe_images
+
+        if render_profile is not None and page_sizes:
+            page_dpis = render_profile.limit_dpis(page_dpis, page_sizes[(first_page or 1) - 1:])
+
+        logger.info(f"ページごとの解像度: {pdf_path} {page_dpis}")
+
+        return self._render_page_runs(pdf_path, page_dpis, first_page)
+
+    def pdf_to_images_for_profile(
+        self,
+        pdf_path: str,
+        render_profile: RenderProfile,
+        page_sizes: List[Tuple[float, float]],
+        dpi: Optional[int] = None
+    ) -> List[Image.Image]:
+        """
+        画像サイズの上限に収まる解像度でPDFファイルを画像のリストに変換する
+
+        上限を超えるページは、変換後に縮小する代わりに、上限に収まる解像度で直接変換する。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            render_profile: 画像サイズの上限
+            page_sizes: ページ順の (幅, 高さ)（ポイント単位、PDFProcessor.get_page_sizesの戻り値）
+            dpi: 上限に収まるページの解像度（指定がない場合は初期化時の値を使用）
+
+        Returns:
+            PIL Imageオブジェクトのリスト
+
+        Raises:
+            FileNotFoundError: PDFファイルが存在しない場合
+            Exception: PDF変換に失敗した場合
+        """
+        if dpi is None:
+            dpi = self.dpi
+
+        page_dpis = render_profile.limit_dpis([dpi] * len(page_sizes), page_sizes)
+        if any(page_dpi < dpi for page_dpi in page_dpis):
+            logger.info(f"画像サイズの上限に合わせた解像度: {pdf_path} ({render_profile.name}) {page_dpis}")
+
+        return self._render_page_runs(pdf_path, page_dpis)
+
+    def _render_page_runs(
+        self,
+        pdf_path: str,
+        page_dpis: List[int],
+        first_page: Optional[int] = None
+    ) -> List[Image.Image]:
+        """
+        同じ解像度が続くページをまとめて変換する
+
+        Args:
+            pdf_path: PDFファイルのパス
+            page_dpis: ページ順の解像度
+            first_page: 先頭のページ番号（1-indexed、Noneの場合は1）
+
+        Returns:
+            PIL Imageオブジェクトのリスト（ページ順）
+        """
+        images = []
+        for dpi, run_first, run_last in group_page_runs(page_dpis, first_page):
+            images.extend(self.pdf_to_images(pdf_path, dpi=dpi, first_page=run_first, last_page=run_last))
+
+        return images
+
+    def get_page_count(self, pdf_path: str) -> int:
+        """
+        PDFのページ数を取得する（popplerのpdfinfoを使用）
+
+        Args:
+            pdf_path: PDFファイルのパス
+
+        Returns:
+            ページ数
+
+        Raises:
+            FileNotFoundError: PDFファイルが存在しない場合
+        """
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"PDFファイルが見つかりません: {pdf_path}")
+
+        return pdf2image.pdfinfo_from_path(pdf_path)['Pages']
+
+    def iter_pages(
+        self,
+        pdf_path: str,
+        dpi: Optional[int] = None,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        page_count: Optional[int] = None
+    ) -> Iterator[Image.Image]:
+        """
+        PDFのページ画像を1ページずつ返すジェネレータ
+
+        一度に変換するのはrender_workersページ分だけなので、
+        ページ数が多いPDFでもメモリ使用量が一定に保たれる。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            dpi: 解像度（指定がない場合は初期化時の値を使用）
+            first_page: 開始ページ（1-indexed、Noneの場合は最初から）
+            last_page: 終了ページ（1-indexed、Noneの場合は最後まで）
+            page_count: 総ページ数（既知の場合。Noneの場合はpdfinfoで取得）
+
+        Yields:
+            PIL Imageオブジェクト（ページ順）
+
+        Raises:
+            FileNotFoundError: PDFファイルが存在しない場合
+            Exception: PDF変換に失敗した場合
+        """
+        if dpi is None:
+            dpi = self.dpi
+
+        pdf_hash = compute_file_hash(pdf_path) if self.render_cache is not None else None
+
+        for chunk_first, chunk_last in self._iter_page_chunks(pdf_path, first_page, last_page, page_count):
+            if pdf_hash is not None:
+                for data in self._get_cached_page_bytes(pdf_path, dpi, chunk_first, chunk_last, pdf_hash=pdf_hash):
+                    yield self._decode_image(data)
+                continue
+
+            images = self._render_pages(pdf_path, dpi, chunk_first, chunk_last)
+            # 返したページへの参照をすぐに手放す
+            while images:
+                yield images.pop(0)
+
+    def _iter_page_chunks(
+        self,
+        pdf_path: str,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        page_count: Optional[int] = None
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        ページ範囲をrender_workersページずつに分割する
+
+        Args:
+            pdf_path: PDFファイルのパス
+            first_page: 開始ページ（1-indexed）
+            last_page: 終了ページ（1-indexed）
+            page_count: 総ページ数（既知の場合）
+
+        Yields:
+            (開始ページ, 終了ページ) のタプル
+        """
+        if first_page is None:
+            first_page = 1
+        if last_page is None:
+            last_page = page_count if page_count is not None else self.get_page_count(pdf_path)
+
+        for chunk_first in range(first_page, last_page + 1, self.render_workers):
+            yield chunk_first, min(chunk_first + self.render_workers - 1, last_page)
+
+    def _render_pages(
+        self,
+        pdf_path: str,
+        dpi: int,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None
+    ) -> List[Image.Image]:
+        """
+        pdf2imageでPDFを画像に変換する（キャッシュを使用しない）
+
+        Args:
+            pdf_path: PDFファイルのパス
+            dpi: 解像度
+            first_page: 開始ページ（1-indexed）
+            last_page: 終了ページ（1-indexed）
+
+        Returns:
+            PIL Imageオブジェクトのリスト
+        """
+        logger.info(f"PDF→画像変換開始: {pdf_path} (DPI: {dpi}, 並列数: {self.render_workers})")
 
         try:
             # PDFを画像に変換
-            images = pdf2image.convert_from_path(
-                pdf_path,
-                dpi=dpi,
-                first_page=first_page,
-                last_page=last_page,
-                fmt=self.format.lower()
-            )
+            # thread_countを指定すると、pdf2imageがページ範囲を分割して
+            # 複数のpopplerプロセスで並列に変換し、ページ順に結合して返す
+            # グレースケール・2値の場合はpopplerでグレースケールで変換する（RGBのビットマップを作らない）
+            with record_span("rasterize"):
+                images = pdf2image.convert_from_path(
+                    pdf_path,
+                    dpi=dpi,
+                    first_page=first_page,
+                    last_page=last_page,
+                    fmt=self.format.lower(),
+                    thread_count=self.render_workers,
+                    grayscale=self.color_mode in ('gray', 'bilevel')
+                )
+
+                if self.color_detector is not None:
+                    images = [self._apply_color_mode(image) for image in images]
 
             logger.info(f"PDF→画像変換完了: {len(images)}ページ")
             return images
@@ -84,16 +374,144 @@ class ImageConverter:
             logger.error(f"PDF→画像変換に失敗しました: {pdf_path}, エラー: {str(e)}")
             raise Exception(f"PDF変換エラー: {str(e)}")
 
+    def _apply_color_mode(self, image: Image.Image) -> Image.Image:
+        """
+        ページ画像をカラーモードに変換する（autoの場合はページごとに判定する）
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            変換した画像
+        """
+        mode = self.color_mode
+        if mode == 'auto':
+            mode = self.color_detector.select_mode(image)
+
+        return self.color_detector.convert(image, mode)
+
+    def _get_cached_page_bytes(
+        self,
+        pdf_path: str,
+        dpi: int,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        pdf_hash: Optional[str] = None
+    ) -> List[bytes]:
+        """
+        レンダリングキャッシュからページ画像のバイト列を取得する
+        （キャッシュにないページのみ変換してキャッシュに保存する）
+
+        Args:
+            pdf_path: PDFファイルのパス
+            dpi: 解像度
+            first_page: 開始ページ（1-indexed、Noneの場合は最初から）
+            last_page: 終了ページ（1-indexed、Noneの場合は最後まで）
+            pdf_hash: PDFの内容ハッシュ（計算済みの場合）
+
+        Returns:
+            エンコード済み画像のバイト列のリスト（ページ順）
+        """
+        if pdf_hash is None:
+            pdf_hash = compute_file_hash(pdf_path)
+
+        if first_page is None:
+            first_page = 1
+        if last_page is None:
+            last_page = pdf2image.pdfinfo_from_path(pdf_path)['Pages']
+
+        page_numbers = list(range(first_page, last_page + 1))
+        cache_args = (dpi, self.format, self.quality)
+
+        pages = {
+            page_number: self.render_cache.get(pdf_hash, page_number, *cache_args, color_mode=self.color_cache_tag)
+            for page_number in page_numbers
+        }
+        missing = [page_number for page_number, data in pages.items() if data is None]
+
+        if not missing:
+            logger.info(f"レンダリングキャッシュを使用: {pdf_path} ({len(page_numbers)}ページ, DPI: {dpi})")
+            return [pages[page_number] for page_number in page_numbers]
+
+        # 不足しているページを含む範囲だけ変換する
+        images = self._render_pages(pdf_path, dpi, missing[0], missing[-1])
+
+        for page_number, image in zip(range(missing[0], missing[-1] + 1), images):
+            if pages[page_number] is None:
+                data = self._encode_bytes(image, self.format, self.quality)
+                self.render_cache.put(pdf_hash, page_number, *cache_args, data, color_mode=self.color_cache_tag)
+                pages[page_number] = data
+
+        return [pages[page_number] for page_number in page_numbers]
+
+    def _encode_bytes(self, image: Image.Image, format: str, quality: int) -> bytes:
+        """
+        画像を指定フォーマットのバイト列にエンコードする
+
+        Args:
+            image: PIL Imageオブジェクト
+            format: 画像フォーマット
+            quality: JPEG品質
+
+        Returns:
+            エンコード済み画像のバイト列
+        """
+        save_kwargs = {}
+        if format == 'JPEG':
+            image = self._flatten_alpha(image)
+            # JPEGは1bitをサポートしないため、グレースケールのJPEGにする
+            if image.mode == '1':
+                image = image.convert('L')
+            save_kwargs['quality'] = quality
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=format, **save_kwargs)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _flatten_alpha(image: Image.Image) -> Image.Image:
+        """
+        RGBA画像を白背景で合成してRGBに変換する（JPEGは透過をサポートしない）
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            RGBA以外の画像（RGBA以外の場合は元の画像）
+        """
+        if image.mode != 'RGBA':
+            return image
+
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[3])
+        return background
+
+    @staticmethod
+    def _decode_image(data: bytes) -> Image.Image:
+        """
+        バイト列から画像を読み込む
+
+        Args:
+            data: エンコード済み画像のバイト列
+
+        Returns:
+            PIL Imageオブジェクト
+        """
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        return image
+
     def encode_image_base64(
         self,
-        image: Union[Image.Image, str],
+        image: Union[Image.Image, str, bytes],
         format: Optional[str] = None
     ) -> str:
         """
         画像をBase64エンコードする
 
         Args:
-            image: PIL Imageオブジェクトまたはファイルパス
+            image: PIL Imageオブジェクト、ファイルパス、またはエンコード済みのバイト列
+                （バイト列は再エンコードせずにそのままBase64エンコードする）
             format: 画像フォーマット（Noneの場合は初期化時の値を使用）
 
         Returns:
@@ -106,17 +524,20 @@ class ImageConverter:
             format = self.format
 
         try:
-            # 文字列の場合はファイルパスとして扱う
-            if isinstance(image, str):
-                image = Image.open(image)
-
-            # 画像をバイナリデータに変換
-            buffer = io.BytesIO()
-            image.save(buffer, format=format)
-            buffer.seek(0)
+            if isinstance(image, bytes):
+                data = image
+            else:
+                # 文字列の場合はファイルパスとして扱う
+                if isinstance(image, str):
+                    image = Image.open(image)
+
+                # 画像をバイナリデータに変換
+                buffer = io.BytesIO()
+                image.save(buffer, format=format)
+                data = buffer.getvalue()
 
             # Base64エンコード
-            encoded = base64.b64encode(buffer.read()).decode('utf-8')
+            encoded = base64.b64encode(data).decode('utf-8')
 
             logger.debug(f"Base64エンコード完了: {len(encoded)}文字")
             return encoded
@@ -129,21 +550,54 @@ class ImageConverter:
         self,
         image: Image.Image,
         max_size_mb: Optional[float] = None,
-        quality: int = 85,
+        quality: Optional[int] = None,
         format: Optional[str] = None
     ) -> Image.Image:
         """
         画像のファイルサイズを最適化する
+        （エンコード済みのバイト列も必要な場合はoptimize_image_bytesを使用する）
 
         Args:
             image: PIL Imageオブジェクト
             max_size_mb: 最大サイズ（MB）
-            quality: JPEG品質（1-100）
+            quality: JPEG品質（1-100、Noneの場合は初期化時の値を使用）
             format: 画像フォーマット
 
         Returns:
             最適化された画像
 
+        Raises:
+            ValueError: 最適化に失敗した場合
+        """
+        optimized, _ = self.optimize_image_bytes(image, max_size_mb=max_size_mb, quality=quality, format=format)
+        return optimized
+
+    def optimize_image_bytes(
+        self,
+        image: Image.Image,
+        max_size_mb: Optional[float] = None,
+        quality: Optional[int] = None,
+        format: Optional[str] = None
+    ) -> Tuple[Image.Image, bytes]:
+        """
+        画像を最大サイズ以下にエンコードする
+
+        最大ピクセル数・長辺の上限に合わせて縮小したうえで、
+        1. 指定の品質で収まればそのまま
+        2. JPEGの場合、品質をmin_qualityまでの範囲で二分探索
+        3. min_qualityでも収まらない場合、縮小率を二分探索し、縮小後の画像で品質を再度二分探索
+        の順に、最大サイズに収まる中で最も解像度・品質が高いエンコード結果を選ぶ。
+        探索で得たバイト列をそのまま返すため、Base64エンコードの前に再エンコードする必要がない。
+
+        Args:
+            image: PIL Imageオブジェクト
+            max_size_mb: 最大サイズ（MB、Noneの場合は初期化時の値を使用）
+            quality: JPEG品質の上限（1-100、Noneの場合は初期化時の値を使用）
+            format: 画像フォーマット（Noneの場合は初期化時の値を使用）
+
+        Returns:
+            (最適化された画像, エンコード済みのバイト列) のタプル
+
         Raises:
             ValueError: 最適化に失敗した場合
         """
@@ -153,70 +607,216 @@ class ImageConverter:
         if format is None:
             format = self.format
 
-        max_size_bytes = max_size_mb * 1024 * 1024
+        if quality is None:
+            quality = self.quality
 
-        try:
-            # 現在のサイズをチェック
-            buffer = io.BytesIO()
-            save_kwargs = {}
+        max_size_bytes = int(max_size_mb * 1024 * 1024)
+        min_quality = min(self.min_quality, quality)
+        searches_quality = format == 'JPEG'
 
-            if format == 'JPEG':
-                # RGBAをRGBに変換（JPEGは透過をサポートしない）
-                if image.mode == 'RGBA':
-                    # 白背景で合成
-                    background = Image.new('RGB', image.size, (255, 255, 255))
-                    background.paste(image, mask=image.split()[3])
-                    image = background
-                save_kwargs['quality'] = quality
+        try:
+            if searches_quality:
+                image = self._flatten_alpha(image)
 
-            image.save(buffer, format=format, **save_kwargs)
-            current_size = buffer.tell()
+            limited = self._resize(image, self._pixel_limit_scale(image.width, image.height))
+            data = self._encode_bytes(limited, format, quality)
+            attempts = 1
 
-            logger.info(f"画像サイズ: {current_size / 1024 / 1024:.2f}MB (制限: {max_size_mb}MB)")
+            logger.info(f"画像サイズ: {len(data) / 1024 / 1024:.2f}MB (制限: {max_size_mb}MB)")
 
             # サイズが制限以下なら最適化不要
-            if current_size <= max_size_bytes:
-                return image
-
-            # サイズオーバーの場合、リサイズで対応
-            logger.warning(f"画像サイズが制限を超えています。リサイズを実行します。")
-
-            scale_factor = (max_size_bytes / current_size) ** 0.5
-            new_width = int(image.width * scale_factor * 0.9)  # 少し余裕を持たせる
-            new_height = int(image.height * scale_factor * 0.9)
-
-            resized_image = image.resize(
-                (new_width, new_height),
-                Image.Resampling.LANCZOS
-            )
-
-            # リサイズ後のサイズを確認
-            buffer = io.BytesIO()
-            resized_image.save(buffer, format=format, **save_kwargs)
-            new_size = buffer.tell()
+            if len(data) <= max_size_bytes:
+                return limited, data
+
+            logger.warning(f"画像サイズが制限を超えています。品質・解像度を調整します。")
+            original_size = len(data)
+            result_image, result_quality = limited, quality
+
+            if searches_quality and min_quality < quality:
+                data = self._encode_bytes(limited, format, min_quality)
+                attempts += 1
+                if len(data) <= max_size_bytes:
+                    result_quality = min_quality
+                    found = self._search_quality(limited, format, min_quality + 1, quality - 1, max_size_bytes)
+                    attempts += found[2]
+                    if found[0] is not None:
+                        result_quality, data = found[0], found[1]
+
+            if len(data) > max_size_bytes:
+                floor_quality = min_quality if searches_quality else quality
+                result_image, data, scale_attempts = self._search_scale(
+                    limited, format, floor_quality, len(data), max_size_bytes
+                )
+                attempts += scale_attempts
+                result_quality = floor_quality
+
+                if searches_quality and floor_quality < quality:
+                    # 縮小率の探索で余った分を品質に回す
+                    found = self._search_quality(result_image, format, floor_quality + 1, quality, max_size_bytes)
+                    attempts += found[2]
+                    if found[0] is not None:
+                        result_quality, data = found[0], found[1]
 
             logger.info(
-                f"リサイズ完了: {image.width}x{image.height} → {new_width}x{new_height}, "
-                f"{current_size / 1024 / 1024:.2f}MB → {new_size / 1024 / 1024:.2f}MB"
+                f"最適化完了: {image.width}x{image.height} → {result_image.width}x{result_image.height}, "
+                f"{original_size / 1024 / 1024:.2f}MB → {len(data) / 1024 / 1024:.2f}MB"
+                + (f", 品質{result_quality}" if searches_quality else "")
+                + f" (エンコード{attempts}回)"
             )
 
-            return resized_image
+            return result_image, data
 
         except Exception as e:
             logger.error(f"画像の最適化に失敗しました: {str(e)}")
             raise ValueError(f"画像の最適化に失敗しました: {str(e)}")
 
-    def get_image_info(self, image: Image.Image) -> dict:
+    def _pixel_limit_scale(self, width: int, height: int) -> float:
         """
-        画像の情報を取得する
+        最大ピクセル数・長辺の上限に収まる縮小率を計算する
+
+        Args:
+            width: 画像の幅
+            height: 画像の高さ
+
+        Returns:
+            縮小率（上限に収まる場合は1.0）
+        """
+        scale = 1.0
+        if self.max_pixels is not None:
+            scale = min(scale, math.sqrt(self.max_pixels / (width * height)))
+        if self.max_side is not None:
+            scale = min(scale, self.max_side / max(width, height))
+        return scale
+
+    @staticmethod
+    def _resize(image: Image.Image, scale: float) -> Image.Image:
+        """
+        画像を縮小する
 
         Args:
             image: PIL Imageオブジェクト
+            scale: 縮小率（1.0以上の場合は元の画像を返す）
+
+        Returns:
+            縮小した画像
+        """
+        if scale >= 1.0:
+            return image
+
+        # 1bitの画像はLANCZOSで縮小できないため、グレースケールにしてから縮小する
+        if image.mode == '1':
+            image = image.convert('L')
+
+        size = (max(int(image.width * scale), 1), max(int(image.height * scale), 1))
+        return image.resize(size, Image.Resampling.LANCZOS)
+
+    def _search_quality(
+        self,
+        image: Image.Image,
+        format: str,
+        low: int,
+        high: int,
+        max_size_bytes: int
+    ) -> Tuple[Optional[int], Optional[bytes], int]:
+        """
+        最大サイズに収まる最も高いJPEG品質を二分探索する
+
+        Args:
+            image: PIL Imageオブジェクト
+            format: 画像フォーマット
+            low: 探索する品質の下限
+            high: 探索する品質の上限
+            max_size_bytes: 最大サイズ（バイト）
+
+        Returns:
+            (品質, バイト列, エンコード回数) のタプル（収まる品質がない場合、品質とバイト列はNone）
+        """
+        best_quality, best_data, attempts = None, None, 0
+        while low <= high:
+            quality = (low + high) // 2
+            data = self._encode_bytes(image, format, quality)
+            attempts += 1
+            if len(data) <= max_size_bytes:
+                best_quality, best_data = quality, data
+                low = quality + 1
+            else:
+                high = quality - 1
+
+        return best_quality, best_data, attempts
+
+    def _search_scale(
+        self,
+        image: Image.Image,
+        format: str,
+        quality: int,
+        size_bytes: int,
+        max_size_bytes: int
+    ) -> Tuple[Image.Image, bytes, int]:
+        """
+        最大サイズに収まる最も大きい縮小率を二分探索する
+
+        エンコード後のサイズはおおむねピクセル数に比例するため、最初の候補は
+        サイズの比の平方根から見積もり、以降は収まる縮小率と収まらない縮小率の間を二分する。
+
+        Args:
+            image: PIL Imageオブジェクト
+            format: 画像フォーマット
+            quality: JPEG品質
+            size_bytes: 縮小前の画像をqualityでエンコードしたサイズ（バイト）
+            max_size_bytes: 最大サイズ（バイト）
+
+        Returns:
+            (縮小した画像, バイト列, エンコード回数) のタプル
+
+        Raises:
+            ValueError: 1ピクセルまで縮小しても収まらない場合
+        """
+        low, high = 0.0, 1.0
+        best = None
+        attempts = 0
+        scale = math.sqrt(max_size_bytes / size_bytes) * 0.95
+
+        while True:
+            resized = self._resize(image, scale)
+            data = self._encode_bytes(resized, format, quality)
+            attempts += 1
+
+            if len(data) <= max_size_bytes:
+                best = (resized, data)
+                low = scale
+            else:
+                if resized.width == 1 and resized.height == 1:
+                    raise ValueError(f"最大サイズ{max_size_bytes}バイトに収まりません")
+                high = scale
+
+            # 収まる縮小率が見つかり、試行回数の上限か十分な精度に達したら終了する
+            if best is not None and (attempts >= self.SEARCH_STEPS or high - low < 0.02):
+                return best[0], best[1], attempts
+
+            scale = (low + high) / 2
+
+    def get_image_info(self, image: Union[Image.Image, EncodedPage]) -> dict:
+        """
+        画像の情報を取得する
+        （EncodedPageの場合は保持しているバイト列のサイズを使い、再エンコードしない）
+
+        Args:
+            image: PIL ImageオブジェクトまたはEncodedPage
 
         Returns:
             画像情報の辞書
         """
         try:
+            if isinstance(image, EncodedPage):
+                return {
+                    'width': image.width,
+                    'height': image.height,
+                    'mode': None,
+                    'format': image.format,
+                    'size_bytes': image.size_bytes,
+                    'size_mb': image.size_bytes / 1024 / 1024
+                }
+
             buffer = io.BytesIO()
             image.save(buffer, format=self.format)
             size_bytes = buffer.tell()
@@ -292,6 +892,110 @@ class ImageConverter:
             logger.error(f"画像の保存に失敗しました: {str(e)}")
             raise Exception(f"画像保存エラー: {str(e)}")
 
+    def encode_page(
+        self,
+        image: Image.Image,
+        optimize: bool = True,
+        format: Optional[str] = None
+    ) -> EncodedPage:
+        """
+        ページ画像をエンコードする
+
+        Args:
+            image: PIL Imageオブジェクト
+            optimize: サイズ最適化を行うか（最適化の探索で得たバイト列をそのまま使う）
+            format: 画像フォーマット（Noneの場合は初期化時の値を使用）
+
+        Returns:
+            EncodedPageオブジェクト
+        """
+        if format is None:
+            format = self.format
+
+        if optimize:
+            image, data = self.optimize_image_bytes(image, format=format)
+        else:
+            data = self._encode_bytes(image, format, self.quality)
+
+        return EncodedPage(data, format, image.width, image.height)
+
+    def pdf_to_encoded_pages(
+        self,
+        pdf_path: str,
+        optimize: bool = True,
+        dpi: Optional[int] = None
+    ) -> List[EncodedPage]:
+        """
+        PDFファイルをエンコード済みページのリストに変換する
+        （iter_encoded_pagesの結果をリストにまとめる便利メソッド）
+
+        Args:
+            pdf_path: PDFファイルのパス
+            optimize: サイズ最適化を行うか
+            dpi: 解像度
+
+        Returns:
+            EncodedPageオブジェクトのリスト
+
+        Raises:
+            Exception: 変換に失敗した場合
+        """
+        pages = list(self.iter_encoded_pages(pdf_path, optimize=optimize, dpi=dpi))
+        logger.info(f"PDF→エンコード済みページ変換完了: {len(pages)}ページ, "
+                    f"{sum(page.size_bytes for page in pages) / 1024 / 1024:.2f}MB")
+        return pages
+
+    def iter_encoded_pages(
+        self,
+        pdf_path: str,
+        optimize: bool = True,
+        dpi: Optional[int] = None,
+        page_count: Optional[int] = None
+    ) -> Iterator[EncodedPage]:
+        """
+        PDFのページを1ページずつ変換・最適化・エンコードして返すジェネレータ
+
+        ページ画像はエンコード後すぐに破棄されるため、
+        APIクライアントへページを逐次送る場合でもメモリ使用量が一定に保たれる。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            optimize: サイズ最適化を行うか
+            dpi: 解像度
+            page_count: 総ページ数（既知の場合。Noneの場合はpdfinfoで取得）
+
+        Yields:
+            EncodedPageオブジェクト（ページ順）
+
+        Raises:
+            Exception: 変換に失敗した場合
+        """
+        if dpi is None:
+            dpi = self.dpi
+
+        try:
+            # キャッシュ済みのバイト列はそのまま使う（再エンコード不要）
+            if self.render_cache is not None and not optimize:
+                pdf_hash = compute_file_hash(pdf_path)
+                for chunk_first, chunk_last in self._iter_page_chunks(pdf_path, page_count=page_count):
+                    page_bytes = self._get_cached_page_bytes(
+                        pdf_path, dpi, chunk_first, chunk_last, pdf_hash=pdf_hash
+                    )
+                    for data in page_bytes:
+                        yield EncodedPage.from_bytes(data)
+                return
+
+            for i, image in enumerate(self.iter_pages(pdf_path, dpi=dpi, page_count=page_count), start=1):
+                with record_span("optimize" if optimize else "encode"):
+                    page = self.encode_page(image, optimize=optimize)
+                yield page
+
+                logger.info(f"ページ {i} をエンコードしました")
+
+        except Exception as e:
+            logger.error(f"PDF→画像エンコードに失敗しました: {pdf_path}, エラー: {str(e)}")
+            raise
+
     def pdf_to_base64_images(
         self,
         pdf_path: str,
@@ -300,7 +1004,7 @@ class ImageConverter:
     ) -> List[str]:
         """
         PDFファイルをBase64エンコードされた画像のリストに変換する
-        （pdf_to_imagesとencode_image_base64を組み合わせた便利メソッド）
+        （iter_base64_imagesの結果をリストにまとめる便利メソッド）
 
         Args:
             pdf_path: PDFファイルのパス
@@ -313,26 +1017,34 @@ class ImageConverter:
         Raises:
             Exception: 変換に失敗した場合
         """
-        try:
-            # PDFを画像に変換
-            images = self.pdf_to_images(pdf_path, dpi=dpi)
-
-            # Base64エンコード
-            encoded_images = []
-            for i, image in enumerate(images, start=1):
-                # 最適化
-                if optimize:
-                    image = self.optimize_image_size(image)
+        encoded_images = list(self.iter_base64_images(pdf_path, optimize=optimize, dpi=dpi))
+        logger.info(f"PDF→Base64変換完了: {len(encoded_images)}ページ")
+        return encoded_images
 
-                # エンコード
-                encoded = self.encode_image_base64(image)
-                encoded_images.append(encoded)
+    def iter_base64_images(
+        self,
+        pdf_path: str,
+        optimize: bool = True,
+        dpi: Optional[int] = None,
+        page_count: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        PDFのページを1ページずつ変換・最適化・Base64エンコードして返すジェネレータ
+        （iter_encoded_pagesのバイト列をそのままBase64エンコードする）
 
-                logger.info(f"ページ {i}/{len(images)} をエンコードしました")
+        Args:
+            pdf_path: PDFファイルのパス
+            optimize: サイズ最適化を行うか
+            dpi: 解像度
+            page_count: 総ページ数（既知の場合。Noneの場合はpdfinfoで取得）
 
-            logger.info(f"PDF→Base64変換完了: {len(encoded_images)}ページ")
-            return encoded_images
+        Yields:
+            Base64エンコードされた画像（ページ順）
 
-        except Exception as e:
-            logger.error(f"PDF→Base64変換に失敗しました: {pdf_path}, エラー: {str(e)}")
-            raise
+        Raises:
+            Exception: 変換に失敗した場合
+        """
+        for page in self.iter_encoded_pages(pdf_path, optimize=optimize, dpi=dpi, page_count=page_count):
+            with record_span("encode"):
+                encoded = page.to_base64()
+            yield encoded
@@ -0,0 +1,240 @@
+"""
+ページフィルターモジュール
+
+変換したページ画像から、APIに送る必要のないページを除外する。
+- 空白ページ（区切りの白紙など）: 縮小したグレースケール画像の明るさの標準偏差で判定する
+- 重複ページ（繰り返される定型の別紙など）: 差分ハッシュ（dHash）で候補を探し、
+  縮小画像の画素の差で確認する（最初に出現したページを残す）
+除外したページは元のページ番号とともに記録する。
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from PIL import Image, ImageChops, ImageStat
+
+logger = logging.getLogger(__name__)
+
+
+class PageFilter:
+    """空白ページ・重複ページを除外するクラス"""
+
+    # 判定に使用する縮小画像の長辺（ピクセル）
+    THUMBNAIL_SIDE = 512
+
+    def __init__(
+        self,
+        blank_threshold: float = 3.0,
+        hash_size: int = 16,
+        max_hash_distance: int = 10,
+        max_pixel_diff: float = 2.0
+    ):
+        """
+        PageFilterの初期化
+
+        Args:
+            blank_threshold: 縮小画像の明るさの標準偏差（0-255）がこれ未満のページを空白とみなす
+            hash_size: 差分ハッシュの一辺の大きさ（ハッシュはhash_size^2ビット）
+            max_hash_distance: 重複の候補とする差分ハッシュのハミング距離の上限
+            max_pixel_diff: 縮小画像の画素の差の平均（0-255）がこれ以下の候補を重複とみなす
+
+        Raises:
+            ValueError: 不正な設定が指定された場合
+        """
+        if blank_threshold < 0 or max_pixel_diff < 0:
+            raise ValueError(
+                f"しきい値は0以上を指定してください: blank_threshold={blank_threshold}, "
+                f"max_pixel_diff={max_pixel_diff}"
+            )
+        if hash_size < 2:
+            raise ValueError(f"ハッシュの大きさは2以上を指定してください: {hash_size}")
+
+        self.blank_threshold = blank_threshold
+        self.hash_size = hash_size
+        self.max_hash_distance = max_hash_distance
+        self.max_pixel_diff = max_pixel_diff
+
+        # 統計情報（ドキュメントごとのページ数と除外したページ）
+        self._lock = threading.Lock()
+        self.reports: Dict[str, Dict] = {}
+
+    @property
+    def cache_tag(self) -> str:
+        """除外の結果に影響する設定の文字列"""
+        return (
+            f"blank{self.blank_threshold:g}-h{self.hash_size}-"
+            f"d{self.max_hash_distance}-p{self.max_pixel_diff:g}"
+        )
+
+    def _thumbnail(self, image: Image.Image) -> Image.Image:
+        """
+        判定に使用するグレースケールの縮小画像を作成する
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            長辺がTHUMBNAIL_SIDE以下のグレースケール画像
+        """
+        thumbnail = image.convert('L')
+        thumbnail.thumbnail((self.THUMBNAIL_SIDE, self.THUMBNAIL_SIDE), Image.BOX)
+        return thumbnail
+
+    def is_blank(self, image: Image.Image) -> bool:
+        """
+        ページが空白か判定する
+
+        縮小により紙のざらつきなどの細かいノイズは平均化され、文字のあるページとの差が大きくなる。
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            空白の場合True
+        """
+        return self._is_blank_thumbnail(self._thumbnail(image))
+
+    def _is_blank_thumbnail(self, thumbnail: Image.Image) -> bool:
+        """縮小画像の明るさの標準偏差から空白か判定する"""
+        return ImageStat.Stat(thumbnail).stddev[0] < self.blank_threshold
+
+    def compute_hash(self, image: Image.Image) -> int:
+        """
+        ページの差分ハッシュ（dHash）を計算する
+
+        Args:
+            image: PIL Imageオブジェクト
+
+        Returns:
+            隣り合う画素の明るさの大小を並べた hash_size^2 ビットの整数
+        """
+        return self._hash_thumbnail(self._thumbnail(image))
+
+    def _hash_thumbnail(self, thumbnail: Image.Image) -> int:
+        """縮小画像から差分ハッシュを計算する"""
+        width = self.hash_size + 1
+        pixels = thumbnail.resize((width, self.hash_size), Image.BOX).tobytes()
+
+        value = 0
+        for row in range(self.hash_size):
+            for column in range(self.hash_size):
+                left = pixels[row * width + column]
+                right = pixels[row * width + column + 1]
+                value = (value << 1) | (left > right)
+
+        return value
+
+    @staticmethod
+    def hash_distance(hash_a: int, hash_b: int) -> int:
+        """
+        2つの差分ハッシュのハミング距離を計算する
+
+        Args:
+            hash_a: 差分ハッシュ
+            hash_b: 差分ハッシュ
+
+        Returns:
+            異なるビットの数
+        """
+        return bin(hash_a ^ hash_b).count('1')
+
+    def _is_same_page(self, thumbnail_a: Image.Image, thumbnail_b: Image.Image) -> bool:
+        """縮小画像の画素の差の平均から同じページか判定する"""
+        if thumbnail_a.size != thumbnail_b.size:
+            return False
+
+        difference = ImageChops.difference(thumbnail_a, thumbnail_b)
+        return ImageStat.Stat(difference).mean[0] <= self.max_pixel_diff
+
+    def filter_pages(
+        self,
+        images: Sequence[Image.Image],
+        label: Optional[str] = None
+    ) -> Tuple[List[Image.Image], List[Dict]]:
+        """
+        空白ページ・重複ページを除外する
+
+        すべてのページが空白の場合は、最初のページを残す。
+
+        Args:
+            images: ページ順のPIL Imageオブジェクトのリスト
+            label: 統計に記録するドキュメント名（Noneの場合は記録しない）
+
+        Returns:
+            (残したページ画像のリスト, 除外したページのリスト) のタプル。
+            除外したページは {'page': 元のページ番号(1始まり), 'reason': 'blank' または 'duplicate'}
+            の辞書で、重複の場合は 'duplicate_of'（残したページの番号）を含む
+        """
+        kept: List[Image.Image] = []
+        kept_pages: List[Tuple[int, int, Image.Image]] = []
+        dropped: List[Dict] = []
+
+        for page_number, image in enumerate(images, start=1):
+            thumbnail = self._thumbnail(image)
+
+            if self._is_blank_thumbnail(thumbnail):
+                dropped.append({'page': page_number, 'reason': 'blank'})
+                continue
+
+            page_hash = self._hash_thumbnail(thumbnail)
+            original = next(
+                (
+                    kept_number for kept_number, kept_hash, kept_thumbnail in kept_pages
+                    if self.hash_distance(page_hash, kept_hash) <= self.max_hash_distance
+                    and self._is_same_page(thumbnail, kept_thumbnail)
+                ),
+                None
+            )
+            if original is not None:
+                dropped.append({'page': page_number, 'reason': 'duplicate', 'duplicate_of': original})
+                continue
+
+            kept.append(image)
+            kept_pages.append((page_number, page_hash, thumbnail))
+
+        if not kept and images:
+            kept.append(images[0])
+            dropped.pop(0)
+
+        if dropped:
+            logger.info(
+                f"ページを除外: {label or 'PDF'} "
+                f"{', '.join(self._describe(entry) for entry in dropped)} "
+                f"({len(images)}ページ中{len(kept)}ページを使用)"
+            )
+
+        if label is not None:
+            with self._lock:
+                self.reports[label] = {'pages': len(images), 'dropped': dropped}
+
+        return kept, dropped
+
+    @staticmethod
+    def _describe(entry: Dict) -> str:
+        """除外したページのログ用の説明"""
+        if entry['reason'] == 'blank':
+            return f"{entry['page']}ページ目（空白）"
+        return f"{entry['page']}ページ目（{entry['duplicate_of']}ページ目と重複）"
+
+    def get_statistics(self) -> Dict:
+        """
+        除外したページの統計を取得する
+
+        同じドキュメントを複数回処理した場合は、最後の結果を集計する。
+
+        Returns:
+            {'page_count', 'blank_count', 'duplicate_count', 'dropped_pages'} の辞書
+            （dropped_pagesは {ドキュメント名: 除外したページのリスト}）
+        """
+        with self._lock:
+            reports = {label: dict(report) for label, report in self.reports.items()}
+
+        dropped = [entry for report in reports.values() for entry in report['dropped']]
+        return {
+            'page_count': sum(report['pages'] for report in reports.values()),
+            'blank_count': sum(1 for entry in dropped if entry['reason'] == 'blank'),
+            'duplicate_count': sum(1 for entry in dropped if entry['reason'] == 'duplicate'),
+            'dropped_pages': {
+                label: report['dropped'] for label, report in reports.items() if report['dropped']
+            }
+        }
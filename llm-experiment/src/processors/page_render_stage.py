@@ -0,0 +1,247 @@
+"""
+ページレンダリングステージモジュール
+
+1回の実験実行の中で、同じPDFの画像変換結果を全モデルで共有する。
+PDFの内容ハッシュ・DPI（ページごとに選ぶ場合はその設定）・画像サイズの上限・フォーマットをキーにして、
+変換は1回だけ行う。
+PageFilterを指定した場合は、変換後に空白・重複ページを除外した結果を共有する。
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from PIL import Image
+
+from .dpi_selector import DPISelector
+from .image_converter import ImageConverter
+from .page_filter import PageFilter
+from .pdf_processor import PDFDocument, compute_file_hash
+from .render_profile import RenderProfile
+
+logger = logging.getLogger(__name__)
+
+
+class PageRenderStage:
+    """PDF→画像変換の結果を実行中に共有するクラス"""
+
+    def __init__(self, image_converter: ImageConverter, page_filter: Optional[PageFilter] = None):
+        """
+        PageRenderStageの初期化
+
+        Args:
+            image_converter: 画像変換に使用するImageConverter
+            page_filter: 変換後に空白・重複ページを除外するPageFilter（Noneの場合は除外しない）
+        """
+        self.image_converter = image_converter
+        self.page_filter = page_filter
+
+        self._lock = threading.Lock()
+        self._path_hashes: Dict[str, str] = {}
+        self._page_sizes: Dict[str, List[Tuple[float, float]]] = {}
+        self._entries: Dict[Tuple[str, Union[int, str], str], List[Image.Image]] = {}
+        self._entry_locks: Dict[Tuple[str, Union[int, str], str], threading.Lock] = {}
+
+        # 統計情報
+        self.render_count = 0
+        self.hit_count = 0
+
+    def get_pdf_hash(self, pdf_path: Union[str, Path]) -> str:
+        """
+        PDFの内容ハッシュを取得する（パスごとに1回だけ計算）
+
+        Args:
+            pdf_path: PDFファイルのパス
+
+        Returns:
+            SHA-256ハッシュ
+        """
+        path_key = str(pdf_path)
+
+        with self._lock:
+            pdf_hash = self._path_hashes.get(path_key)
+
+        if pdf_hash is None:
+            pdf_hash = compute_file_hash(path_key)
+            with self._lock:
+                self._path_hashes[path_key] = pdf_hash
+
+        return pdf_hash
+
+    def get_page_sizes(self, pdf_path: Union[str, Path]) -> List[Tuple[float, float]]:
+        """
+        PDFのページサイズを取得する（内容ごとに1回だけ読み込む）
+
+        Args:
+            pdf_path: PDFファイルのパス
+
+        Returns:
+            (幅, 高さ) のリスト（ポイント単位、ページ順）
+        """
+        pdf_hash = self.get_pdf_hash(pdf_path)
+
+        with self._lock:
+            page_sizes = self._page_sizes.get(pdf_hash)
+
+        if page_sizes is None:
+            document = PDFDocument(pdf_path)
+            try:
+                page_sizes = document.get_page_sizes()
+            finally:
+                document.close()
+
+            with self._lock:
+                self._page_sizes[pdf_hash] = page_sizes
+
+        return page_sizes
+
+    def get_images(
+        self,
+        pdf_path: Union[str, Path],
+        dpi: Optional[int] = None,
+        render_profile: Optional[RenderProfile] = None
+    ) -> List[Image.Image]:
+        """
+        PDFのページ画像を取得する（未変換の場合のみ変換する）
+
+        同じキーに対して複数のスレッドから同時に呼ばれた場合も、変換は1回だけ行われる。
+        返される画像は共有されるため、呼び出し側で変更しないこと。
+
+        Args:
+            pdf_path: PDFファイルのパス
+            dpi: 解像度（指定がない場合はImageConverterの値を使用）
+            render_profile: 画像サイズの上限（指定した場合、上限を超えるページは解像度を下げて変換する）
+
+        Returns:
+            PIL Imageオブジェクトのリスト
+        """
+        if dpi is None:
+            dpi = self.image_converter.dpi
+
+        if render_profile is None:
+            return self._get_or_render(
+                pdf_path, dpi, f"DPI: {dpi}",
+                lambda: self.image_converter.pdf_to_images(str(pdf_path), dpi=dpi)
+            )
+
+        return self._get_or_render(
+            pdf_path, f"{dpi}:{render_profile.cache_tag}", f"DPI: {dpi}, 上限: {render_profile.name}",
+            lambda: self.image_converter.pdf_to_images_for_profile(
+                str(pdf_path), render_profile, self.get_page_sizes(pdf_path), dpi=dpi
+            )
+        )
+
+    def get_adaptive_images(
+        self,
+        pdf_path: Union[str, Path],
+        dpi_selector: DPISelector,
+        render_profile: Optional[RenderProfile] = None
+    ) -> List[Image.Image]:
+        """
+        ページごとに選んだ解像度でPDFのページ画像を取得する（未変換の場合のみ変換する）
+
+        Args:
+            pdf_path: PDFファイルのパス
+            dpi_selector: 解像度を選ぶDPISelector
+            render_profile: 画像サイズの上限（指定した場合、選んだ解像度を上限に収まるように下げる）
+
+        Returns:
+            PIL Imageオブジェクトのリスト
+        """
+        if render_profile is None:
+            return self._get_or_render(
+                pdf_path, dpi_selector.cache_tag, "DPI: ページごと",
+                lambda: self.image_converter.pdf_to_images_adaptive(str(pdf_path), dpi_selector)
+            )
+
+        return self._get_or_render(
+            pdf_path, f"{dpi_selector.cache_tag}:{render_profile.cache_tag}",
+            f"DPI: ページごと, 上限: {render_profile.name}",
+            lambda: self.image_converter.pdf_to_images_adaptive(
+                str(pdf_path), dpi_selector,
+                render_profile=render_profile, page_sizes=self.get_page_sizes(pdf_path)
+            )
+        )
+
+    def _get_or_render(
+        self,
+        pdf_path: Union[str, Path],
+        variant: Union[int, str],
+        label: str,
+        render: Callable[[], List[Image.Image]]
+    ) -> List[Image.Image]:
+        """
+        変換済みのページ画像を取得し、なければ変換する
+
+        Args:
+            pdf_path: PDFファイルのパス
+            variant: 解像度、またはページごとに選ぶ場合・画像サイズの上限がある場合はその設定の文字列
+            label: ログに出力する解像度の説明
+            render: 変換を行う関数
+
+        Returns:
+            PIL Imageオブジェクトのリスト（PageFilterを指定した場合は除外後のページ）
+        """
+        key = (self.get_pdf_hash(pdf_path), variant, self.image_converter.format)
+
+        with self._lock:
+            entry_lock = self._entry_locks.setdefault(key, threading.Lock())
+
+        with entry_lock:
+            with self._lock:
+                images = self._entries.get(key)
+
+            if images is not None:
+                with self._lock:
+                    self.hit_count += 1
+                logger.info(f"変換済みページを再利用: {Path(pdf_path).name} ({label})")
+                return images
+
+            images = render()
+            if self.page_filter is not None:
+                images, _ = self.page_filter.filter_pages(images, label=Path(pdf_path).name)
+
+            with self._lock:
+                self._entries[key] = images
+                self.render_count += 1
+
+            return images
+
+    def release(self, pdf_path: Union[str, Path]) -> None:
+        """
+        PDFの変換結果を破棄してメモリを解放する
+
+        Args:
+            pdf_path: PDFファイルのパス
+        """
+        path_key = str(pdf_path)
+
+        with self._lock:
+            pdf_hash = self._path_hashes.pop(path_key, None)
+            if pdf_hash is None:
+                return
+
+            # 同じ内容のPDFが別パスで使用中の場合は残す
+            if pdf_hash in self._path_hashes.values():
+                return
+
+            for key in [key for key in self._entries if key[0] == pdf_hash]:
+                del self._entries[key]
+                del self._entry_locks[key]
+            self._page_sizes.pop(pdf_hash, None)
+
+        logger.debug(f"変換済みページを解放: {Path(pdf_path).name}")
+
+    def get_statistics(self) -> Dict:
+        """
+        変換と再利用の統計を取得する
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            return {
+                'render_count': self.render_count,
+                'hit_count': self.hit_count,
+                'cached_entries': len(self._entries)
+            }
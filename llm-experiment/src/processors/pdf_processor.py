@@ -4,15 +4,260 @@ PDF処理モジュール
 PDFファイルの読み込み、検証、基本情報の取得を行う。
 """
 
+import hashlib
+import io
 import os
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import PyPDF2
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def compute_file_hash(file_path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """
+    ファイル内容のSHA-256ハッシュを計算する
+
+    Args:
+        file_path: ファイルのパス
+        chunk_size: 読み込み単位（バイト）
+
+    Returns:
+        16進文字列のハッシュ値
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+    """
+    sha256 = hashlib.sha256()
+
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+class PDFDocument:
+    """
+    1回のパースで検証・ページ数・メタデータ・テキスト抽出を提供するPDFハンドル
+
+    ファイルの読み込みとPyPDF2によるパースは最初に必要になった時点で1回だけ行い、
+    以降は同じ結果を使い回す。使用後はclose()でメモリを解放する。
+    """
+
+    def __init__(self, pdf_path: Union[str, Path]):
+        """
+        PDFDocumentの初期化（ファイルはまだ読み込まない）
+
+        Args:
+            pdf_path: PDFファイルのパス
+        """
+        self.pdf_path = str(pdf_path)
+
+        self._lock = threading.RLock()
+        self._data: Optional[bytes] = None
+        self._reader: Optional[PyPDF2.PdfReader] = None
+        self._sha256: Optional[str] = None
+        self._closed = False
+
+    @property
+    def data(self) -> bytes:
+        """PDFファイルのバイナリデータ（初回アクセス時に読み込む）"""
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"PDFDocumentは既に閉じられています: {self.pdf_path}")
+
+            if self._data is None:
+                with open(self.pdf_path, 'rb') as file:
+                    self._data = file.read()
+
+            return self._data
+
+    @property
+    def reader(self) -> PyPDF2.PdfReader:
+        """PyPDF2のPdfReader（初回アクセス時に1回だけパースする）"""
+        with self._lock:
+            if self._reader is None:
+                self._reader = PyPDF2.PdfReader(io.BytesIO(self.data))
+                logger.debug(f"PDFをパースしました: {self.pdf_path}")
+
+            return self._reader
+
+    @property
+    def sha256(self) -> str:
+        """PDFファイル内容のSHA-256ハッシュ"""
+        with self._lock:
+            if self._sha256 is None:
+                self._sha256 = hashlib.sha256(self.data).hexdigest()
+
+            return self._sha256
+
+    @property
+    def page_count(self) -> int:
+        """ページ数"""
+        with self._lock:
+            return len(self.reader.pages)
+
+    @property
+    def is_encrypted(self) -> bool:
+        """暗号化されているか"""
+        with self._lock:
+            return self.reader.is_encrypted
+
+    @property
+    def is_closed(self) -> bool:
+        """閉じられているか"""
+        return self._closed
+
+    def validate(self) -> Tuple[bool, Optional[str]]:
+        """
+        PDFファイルの有効性を検証する
+
+        Returns:
+            (検証結果, エラーメッセージ) のタプル
+            検証成功時は (True, None)、失敗時は (False, エラーメッセージ)
+        """
+        pdf_path = self.pdf_path
+
+        # ファイルの存在確認
+        if not os.path.exists(pdf_path):
+            return False, f"ファイルが存在しません: {pdf_path}"
+
+        # 拡張子確認
+        if not pdf_path.lower().endswith('.pdf'):
+            return False, f"PDFファイルではありません: {pdf_path}"
+
+        # ファイルサイズ確認
+        file_size = os.path.getsize(pdf_path)
+        if file_size == 0:
+            return False, "ファイルサイズが0バイトです"
+
+        # PDFとして読み込めるか確認
+        try:
+            with self._lock:
+                # PDFヘッダー確認
+                if not self.data.startswith(b'%PDF-'):
+                    return False, "有効なPDFヘッダーがありません"
+
+                # ページ数確認
+                page_count = self.page_count
+                if page_count == 0:
+                    return False, "ページが存在しません"
+
+                # 暗号化確認
+                if self.is_encrypted:
+                    logger.warning(f"PDFファイルは暗号化されています: {pdf_path}")
+                    return False, "暗号化されたPDFファイルは処理できません"
+
+            logger.info(f"PDFファイルの検証成功: {pdf_path} ({page_count}ページ, {file_size}バイト)")
+            return True, None
+
+        except Exception as e:
+            error_msg = f"PDFファイルの検証に失敗しました: {str(e)}"
+            logger.error(f"{error_msg} ({pdf_path})")
+            return False, error_msg
+
+    def get_metadata(self) -> dict:
+        """
+        PDFファイルのメタデータを取得する
+
+        Returns:
+            メタデータの辞書
+        """
+        with self._lock:
+            reader = self.reader
+
+            metadata = {
+                'page_count': len(reader.pages),
+                'file_name': Path(self.pdf_path).name,
+                'file_size': len(self.data),
+                'is_encrypted': reader.is_encrypted,
+            }
+
+            # PDF情報があれば追加
+            if reader.metadata:
+                pdf_info = reader.metadata
+                if pdf_info.title:
+                    metadata['title'] = pdf_info.title
+                if pdf_info.author:
+                    metadata['author'] = pdf_info.author
+                if pdf_info.creator:
+                    metadata['creator'] = pdf_info.creator
+                if pdf_info.producer:
+                    metadata['producer'] = pdf_info.producer
+                if pdf_info.creation_date:
+                    metadata['creation_date'] = str(pdf_info.creation_date)
+                if pdf_info.modification_date:
+                    metadata['modification_date'] = str(pdf_info.modification_date)
+
+        return metadata
+
+    def get_page_sizes(self) -> List[Tuple[float, float]]:
+        """
+        各ページの表示サイズを取得する（MediaBoxに回転を反映した幅・高さ）
+
+        Returns:
+            (幅, 高さ) のリスト（ポイント単位、1pt = 1/72インチ、ページ順）
+        """
+        with self._lock:
+            sizes = []
+            for page in self.reader.pages:
+                width = float(page.mediabox.width)
+                height = float(page.mediabox.height)
+                if page.rotation % 180 == 90:
+                    width, height = height, width
+                sizes.append((width, height))
+
+        return sizes
+
+    def extract_text(self, page_numbers: Optional[list] = None) -> str:
+        """
+        PDFファイルからテキストを抽出する
+
+        Args:
+            page_numbers: 抽出するページ番号のリスト（0-indexed、Noneの場合は全ページ）
+
+        Returns:
+            抽出されたテキスト
+        """
+        with self._lock:
+            reader = self.reader
+            total_pages = len(reader.pages)
+
+            # ページ番号の指定がない場合は全ページ
+            if page_numbers is None:
+                page_numbers = range(total_pages)
+
+            extracted_text = []
+            for page_num in page_numbers:
+                if 0 <= page_num < total_pages:
+                    page = reader.pages[page_num]
+                    text = page.extract_text()
+                    extracted_text.append(f"--- Page {page_num + 1} ---\n{text}\n")
+                else:
+                    logger.warning(f"ページ番号が範囲外です: {page_num} (総ページ数: {total_pages})")
+
+        return '\n'.join(extracted_text)
+
+    def close(self) -> None:
+        """読み込んだデータとパース結果を破棄する"""
+        with self._lock:
+            self._data = None
+            self._reader = None
+            self._closed = True
+
+    def __enter__(self) -> 'PDFDocument':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"PDFDocument(path={self.pdf_path}, closed={self._closed})"
+
+
 class PDFProcessor:
     """PDFファイルの基本的な処理を行うクラス"""
 
@@ -21,6 +266,77 @@ class PDFProcessor:
         self.current_pdf_path: Optional[str] = None
         self.current_pdf_reader: Optional[PyPDF2.PdfReader] = None
 
+        # open_documentで開いたPDFハンドル（パスごと）
+        self._documents: Dict[str, PDFDocument] = {}
+        self._documents_lock = threading.Lock()
+
+    def open_document(self, pdf_path: Union[str, Path]) -> PDFDocument:
+        """
+        PDFハンドルを開く（既に開いている場合は同じハンドルを返す）
+
+        開いている間は、validate_pdf・get_page_count・get_pdf_metadata・extract_text が
+        同じパース結果を共有する。使用後はclose_documentで閉じること。
+
+        Args:
+            pdf_path: PDFファイルのパス
+
+        Returns:
+            PDFDocumentオブジェクト
+        """
+        path_key = str(pdf_path)
+
+        with self._documents_lock:
+            document = self._documents.get(path_key)
+            if document is None:
+                document = PDFDocument(path_key)
+                self._documents[path_key] = document
+
+        return document
+
+    def close_document(self, pdf_path: Union[str, Path]) -> None:
+        """
+        PDFハンドルを閉じる
+
+        Args:
+            pdf_path: PDFファイルのパス
+        """
+        with self._documents_lock:
+            document = self._documents.pop(str(pdf_path), None)
+
+        if document is not None:
+            document.close()
+
+    def close_all(self) -> None:
+        """開いているすべてのPDFハンドルを閉じる"""
+        with self._documents_lock:
+            documents = list(self._documents.values())
+            self._documents.clear()
+
+        for document in documents:
+            document.close()
+
+    def _get_document(self, pdf_path: str) -> Tuple[PDFDocument, bool]:
+        """
+        PDFハンドルを取得する
+
+        open_documentで開いているハンドルがあればそれを返し、
+        なければ一時的なハンドルを作成する。
+
+        Args:
+            pdf_path: PDFファイルのパス
+
+        Returns:
+            (PDFDocument, 一時的なハンドルか) のタプル
+            一時的なハンドルは呼び出し側で閉じる
+        """
+        with self._documents_lock:
+            document = self._documents.get(str(pdf_path))
+
+        if document is not None:
+            return document, False
+
+        return PDFDocument(pdf_path), True
+
     def load_pdf(self, pdf_path: str) -> bytes:
         """
         PDFファイルを読み込んでバイナリデータとして返す
@@ -42,8 +358,8 @@ class PDFProcessor:
             raise ValueError(f"PDFファイルではありません: {pdf_path}")
 
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_data = file.read()
+            document, _ = self._get_document(pdf_path)
+            pdf_data = document.data
 
             # PDFとして有効か簡易チェック
             if not pdf_data.startswith(b'%PDF-'):
@@ -77,10 +393,10 @@ class PDFProcessor:
         if pdf_path is None:
             raise ValueError("PDFファイルが指定されていません")
 
+        document, is_temporary = self._get_document(pdf_path)
+
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                page_count = len(pdf_reader.pages)
+            page_count = document.page_count
 
             logger.info(f"ページ数: {page_count} ({pdf_path})")
             return page_count
@@ -89,6 +405,10 @@ class PDFProcessor:
             logger.error(f"ページ数の取得に失敗しました: {pdf_path}, エラー: {str(e)}")
             raise ValueError(f"PDFファイルの処理に失敗しました: {str(e)}")
 
+        finally:
+            if is_temporary:
+                document.close()
+
     def validate_pdf(self, pdf_path: str) -> Tuple[bool, Optional[str]]:
         """
         PDFファイルの有効性を検証する
@@ -100,48 +420,14 @@ class PDFProcessor:
             (検証結果, エラーメッセージ) のタプル
             検証成功時は (True, None)、失敗時は (False, エラーメッセージ)
         """
-        # ファイルの存在確認
-        if not os.path.exists(pdf_path):
-            return False, f"ファイルが存在しません: {pdf_path}"
-
-        # 拡張子確認
-        if not pdf_path.lower().endswith('.pdf'):
-            return False, f"PDFファイルではありません: {pdf_path}"
+        document, is_temporary = self._get_document(pdf_path)
 
-        # ファイルサイズ確認
-        file_size = os.path.getsize(pdf_path)
-        if file_size == 0:
-            return False, "ファイルサイズが0バイトです"
-
-        # PDFとして読み込めるか確認
         try:
-            with open(pdf_path, 'rb') as file:
-                # PDFヘッダー確認
-                header = file.read(5)
-                if not header.startswith(b'%PDF-'):
-                    return False, "有効なPDFヘッダーがありません"
+            return document.validate()
 
-                # PyPDF2で読み込めるか確認
-                file.seek(0)
-                pdf_reader = PyPDF2.PdfReader(file)
-
-                # ページ数確認
-                page_count = len(pdf_reader.pages)
-                if page_count == 0:
-                    return False, "ページが存在しません"
-
-                # 暗号化確認
-                if pdf_reader.is_encrypted:
-                    logger.warning(f"PDFファイルは暗号化されています: {pdf_path}")
-                    return False, "暗号化されたPDFファイルは処理できません"
-
-            logger.info(f"PDFファイルの検証成功: {pdf_path} ({page_count}ページ, {file_size}バイト)")
-            return True, None
-
-        except Exception as e:
-            error_msg = f"PDFファイルの検証に失敗しました: {str(e)}"
-            logger.error(f"{error_msg} ({pdf_path})")
-            return False, error_msg
+        finally:
+            if is_temporary:
+                document.close()
 
     def get_pdf_metadata(self, pdf_path: Optional[str] = None) -> dict:
         """
@@ -159,32 +445,10 @@ class PDFProcessor:
         if pdf_path is None:
             raise ValueError("PDFファイルが指定されていません")
 
+        document, is_temporary = self._get_document(pdf_path)
+
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-
-                metadata = {
-                    'page_count': len(pdf_reader.pages),
-                    'file_name': Path(pdf_path).name,
-                    'file_size': os.path.getsize(pdf_path),
-                    'is_encrypted': pdf_reader.is_encrypted,
-                }
-
-                # PDF情報があれば追加
-                if pdf_reader.metadata:
-                    pdf_info = pdf_reader.metadata
-                    if pdf_info.title:
-                        metadata['title'] = pdf_info.title
-                    if pdf_info.author:
-                        metadata['author'] = pdf_info.author
-                    if pdf_info.creator:
-                        metadata['creator'] = pdf_info.creator
-                    if pdf_info.producer:
-                        metadata['producer'] = pdf_info.producer
-                    if pdf_info.creation_date:
-                        metadata['creation_date'] = str(pdf_info.creation_date)
-                    if pdf_info.modification_date:
-                        metadata['modification_date'] = str(pdf_info.modification_date)
+            metadata = document.get_metadata()
 
             logger.info(f"メタデータを取得しました: {pdf_path}")
             return metadata
@@ -193,6 +457,42 @@ class PDFProcessor:
             logger.error(f"メタデータの取得に失敗しました: {pdf_path}, エラー: {str(e)}")
             return {}
 
+        finally:
+            if is_temporary:
+                document.close()
+
+    def get_page_sizes(self, pdf_path: Optional[str] = None) -> List[Tuple[float, float]]:
+        """
+        PDFファイルの各ページの表示サイズを取得する（画像に変換せずに取得できる）
+
+        Args:
+            pdf_path: PDFファイルのパス（Noneの場合は最後に読み込んだファイル）
+
+        Returns:
+            (幅, 高さ) のリスト（ポイント単位、ページ順）
+
+        Raises:
+            ValueError: PDFファイルが指定されていない、または無効な場合
+        """
+        if pdf_path is None:
+            pdf_path = self.current_pdf_path
+
+        if pdf_path is None:
+            raise ValueError("PDFファイルが指定されていません")
+
+        document, is_temporary = self._get_document(pdf_path)
+
+        try:
+            return document.get_page_sizes()
+
+        except Exception as e:
+            logger.error(f"ページサイズの取得に失敗しました: {pdf_path}, エラー: {str(e)}")
+            raise ValueError(f"PDFファイルの処理に失敗しました: {str(e)}")
+
+        finally:
+            if is_temporary:
+                document.close()
+
     def extract_text(self, pdf_path: Optional[str] = None, page_numbers: Optional[list] = None) -> str:
         """
         PDFファイルからテキストを抽出する
@@ -210,28 +510,17 @@ class PDFProcessor:
         if pdf_path is None:
             raise ValueError("PDFファイルが指定されていません")
 
+        document, is_temporary = self._get_document(pdf_path)
+
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
-
-                # ページ番号の指定がない場合は全ページ
-                if page_numbers is None:
-                    page_numbers = range(total_pages)
-
-                extracted_text = []
-                for page_num in page_numbers:
-                    if 0 <= page_num < total_pages:
-                        page = pdf_reader.pages[page_num]
-                        text = page.extract_text()
-                        extracted_text.append(f"--- Page {page_num + 1} ---\n{text}\n")
-                    else:
-                        logger.warning(f"ページ番号が範囲外です: {page_num} (総ページ数: {total_pages})")
-
-                result = '\n'.join(extracted_text)
-                logger.info(f"テキストを抽出しました: {pdf_path} ({len(result)}文字)")
-                return result
+            result = document.extract_text(page_numbers)
+            logger.info(f"テキストを抽出しました: {pdf_path} ({len(result)}文字)")
+            return result
 
         except Exception as e:
             logger.error(f"テキストの抽出に失敗しました: {pdf_path}, エラー: {str(e)}")
             raise ValueError(f"テキストの抽出に失敗しました: {str(e)}")
+
+        finally:
+            if is_temporary:
+                document.close()
@@ -0,0 +1,237 @@
+"""
+レンダリングキャッシュモジュール
+
+PDFページの変換画像をディスクに保存し、再実行時に再利用する。
+キーはPDFの内容ハッシュ（SHA-256）・ページ番号・DPI・フォーマット・品質・カラーモードで、
+合計サイズが上限を超えた場合は最終アクセスが古いものから削除する（LRU）。
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """ページ画像のディスクキャッシュを管理するクラス"""
+
+    # 上限を超えた場合に削除して戻す合計サイズの上限に対する割合
+    # （上限ちょうどまでしか削除しないと、以降の保存のたびにディレクトリ全体を走査することになる）
+    EVICT_TARGET_RATIO = 0.9
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = "output/images/cache",
+        max_size_mb: float = 1024.0
+    ):
+        """
+        RenderCacheの初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+            max_size_mb: キャッシュの最大合計サイズ（MB）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._total_size = sum(path.stat().st_size for path in self._iter_entries())
+
+        # 統計情報
+        self.hit_count = 0
+        self.miss_count = 0
+
+        logger.info(
+            f"RenderCache初期化完了: {self.cache_dir} "
+            f"({self._total_size / 1024 / 1024:.1f}MB / {max_size_mb}MB)"
+        )
+
+    def get_path(
+        self,
+        pdf_hash: str,
+        page_number: int,
+        dpi: int,
+        format: str,
+        quality: int,
+        color_mode: str = 'rgb'
+    ) -> Path:
+        """
+        キャッシュエントリのファイルパスを取得する
+
+        Args:
+            pdf_hash: PDFの内容ハッシュ
+            page_number: ページ番号（1-indexed）
+            dpi: 解像度
+            format: 画像フォーマット
+            quality: 画像品質
+            color_mode: カラーモード（rgb以外の場合のみファイル名に含める）
+
+        Returns:
+            キャッシュファイルのパス
+        """
+        mode_suffix = f"_{color_mode}" if color_mode != 'rgb' else ""
+        file_name = f"{pdf_hash}_p{page_number:04d}_{dpi}dpi_q{quality}{mode_suffix}.{format.lower()}"
+        return self.cache_dir / pdf_hash[:2] / file_name
+
+    def get(
+        self,
+        pdf_hash: str,
+        page_number: int,
+        dpi: int,
+        format: str,
+        quality: int,
+        color_mode: str = 'rgb'
+    ) -> Optional[bytes]:
+        """
+        キャッシュからページ画像のバイト列を取得する
+
+        Args:
+            pdf_hash: PDFの内容ハッシュ
+            page_number: ページ番号（1-indexed）
+            dpi: 解像度
+            format: 画像フォーマット
+            quality: 画像品質
+            color_mode: カラーモード
+
+        Returns:
+            エンコード済み画像のバイト列（キャッシュにない場合はNone）
+        """
+        path = self.get_path(pdf_hash, page_number, dpi, format, quality, color_mode)
+
+        try:
+            data = path.read_bytes()
+            # 最終アクセス時刻を更新（LRU用）
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.miss_count += 1
+            return None
+
+        with self._lock:
+            self.hit_count += 1
+
+        return data
+
+    def put(
+        self,
+        pdf_hash: str,
+        page_number: int,
+        dpi: int,
+        format: str,
+        quality: int,
+        data: bytes,
+        color_mode: str = 'rgb'
+    ) -> None:
+        """
+        ページ画像のバイト列をキャッシュに保存する
+
+        Args:
+            pdf_hash: PDFの内容ハッシュ
+            page_number: ページ番号（1-indexed）
+            dpi: 解像度
+            format: 画像フォーマット
+            quality: 画像品質
+            data: エンコード済み画像のバイト列
+            color_mode: カラーモード
+        """
+        path = self.get_path(pdf_hash, page_number, dpi, format, quality, color_mode)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            previous_size = path.stat().st_size
+        except FileNotFoundError:
+            previous_size = 0
+
+        # 一時ファイルに書き込んでから置き換える（並行実行時の読みかけ防止）
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self._total_size += len(data) - previous_size
+            over_limit = self._total_size > self.max_size_bytes
+
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        最終アクセスが古いエントリから削除し、合計サイズを上限のEVICT_TARGET_RATIO倍以下にする
+
+        Returns:
+            削除したエントリ数
+        """
+        with self._lock:
+            entries = []
+            for path in self._iter_entries():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            entries.sort()
+            total_size = sum(size for _, size, _ in entries)
+            target_size = self.max_size_bytes * self.EVICT_TARGET_RATIO
+            removed = 0
+
+            for _, size, path in entries:
+                if total_size <= target_size:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+                removed += 1
+
+            self._total_size = total_size
+
+        if removed:
+            logger.info(
+                f"レンダリングキャッシュを削除: {removed}件 "
+                f"(現在: {total_size / 1024 / 1024:.1f}MB)"
+            )
+
+        return removed
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除する"""
+        with self._lock:
+            for path in self._iter_entries():
+                path.unlink(missing_ok=True)
+            self._total_size = 0
+
+        logger.info(f"レンダリングキャッシュをクリアしました: {self.cache_dir}")
+
+    def get_statistics(self) -> Dict:
+        """
+        キャッシュの統計を取得する
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            return {
+                'hit_count': self.hit_count,
+                'miss_count': self.miss_count,
+                'total_size_mb': self._total_size / 1024 / 1024,
+                'max_size_mb': self.max_size_bytes / 1024 / 1024
+            }
+
+    def _iter_entries(self):
+        """キャッシュファイルを列挙する（書き込み中の一時ファイルは除く）"""
+        for path in self.cache_dir.glob('*/*'):
+            if path.is_file() and path.suffix != '.tmp':
+                yield path
@@ -0,0 +1,133 @@
+"""
+レンダリングプロファイルモジュール
+
+プロバイダーごとに、APIがサーバー側で縮小せずに扱う画像サイズの上限（長辺・短辺・ピクセル数）を定義し、
+ページサイズ（ポイント）から上限に収まる解像度をページごとに求める。
+popplerで最初から上限に収まる解像度で変換するため、大きい画像を作ってから縮小する必要がない。
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# プロバイダー → 画像サイズの上限（CostEstimatorの画像トークンの算出方法と同じ値）
+PROVIDER_IMAGE_LIMITS: Dict[str, Dict[str, int]] = {
+    # 2048px四方に収め、短辺を768pxに縮小する（高解像度モード）
+    'openai': {'max_side': 2048, 'max_short_side': 768},
+    # 長辺1568px・約1.15メガピクセルを超える画像は縮小される
+    'anthropic': {'max_side': 1568, 'max_pixels': 1_150_000},
+    # 3072px四方を超える画像は縮小される
+    'gemini': {'max_side': 3072},
+}
+
+
+class RenderProfile:
+    """画像サイズの上限に収まる解像度をページごとに求めるクラス"""
+
+    def __init__(
+        self,
+        name: str,
+        max_side: Optional[int] = None,
+        max_short_side: Optional[int] = None,
+        max_pixels: Optional[int] = None
+    ):
+        """
+        RenderProfileの初期化
+
+        Args:
+            name: プロファイル名（プロバイダー名）
+            max_side: 長辺の最大ピクセル数（Noneの場合は制限なし）
+            max_short_side: 短辺の最大ピクセル数（Noneの場合は制限なし）
+            max_pixels: 最大ピクセル数（Noneの場合は制限なし）
+        """
+        self.name = name
+        self.max_side = max_side
+        self.max_short_side = max_short_side
+        self.max_pixels = max_pixels
+
+    @classmethod
+    def for_provider(cls, provider: Optional[str]) -> Optional['RenderProfile']:
+        """
+        プロバイダーのプロファイルを取得する
+
+        Args:
+            provider: プロバイダー名（CostEstimator.get_providerの戻り値）
+
+        Returns:
+            RenderProfile（画像サイズの上限がないプロバイダーの場合はNone）
+        """
+        limits = PROVIDER_IMAGE_LIMITS.get(provider)
+        if limits is None:
+            return None
+
+        return cls(provider, **limits)
+
+    @property
+    def cache_tag(self) -> str:
+        """変換結果のキャッシュキーに含める設定の文字列"""
+        return f"{self.name}:side{self.max_side}:short{self.max_short_side}:px{self.max_pixels}"
+
+    def fits(self, width: int, height: int) -> bool:
+        """
+        画像サイズが上限に収まるか判定する
+
+        Args:
+            width: 画像の幅（ピクセル）
+            height: 画像の高さ（ピクセル）
+
+        Returns:
+            収まる場合True
+        """
+        if self.max_side is not None and max(width, height) > self.max_side:
+            return False
+        if self.max_short_side is not None and min(width, height) > self.max_short_side:
+            return False
+        if self.max_pixels is not None and width * height > self.max_pixels:
+            return False
+        return True
+
+    def page_dpi(self, width_pt: float, height_pt: float, dpi: int) -> int:
+        """
+        ページを上限に収まる解像度に制限する
+
+        Args:
+            width_pt: ページの幅（ポイント）
+            height_pt: ページの高さ（ポイント）
+            dpi: 希望する解像度
+
+        Returns:
+            dpi以下で、変換後の画像が上限に収まる最大の解像度（1未満にはしない）
+        """
+        limits = []
+        if self.max_side is not None:
+            limits.append(self.max_side * 72 / max(width_pt, height_pt))
+        if self.max_short_side is not None:
+            limits.append(self.max_short_side * 72 / min(width_pt, height_pt))
+        if self.max_pixels is not None:
+            limits.append(math.sqrt(self.max_pixels / (width_pt * height_pt)) * 72)
+
+        page_dpi = max(min([dpi] + [math.floor(limit) for limit in limits]), 1)
+
+        # popplerは画像サイズを切り上げるため、収まるまで下げる
+        while page_dpi > 1 and not self.fits(
+            math.ceil(width_pt * page_dpi / 72), math.ceil(height_pt * page_dpi / 72)
+        ):
+            page_dpi -= 1
+
+        return page_dpi
+
+    def limit_dpis(self, page_dpis: Sequence[int], page_sizes: Sequence[Tuple[float, float]]) -> List[int]:
+        """
+        ページごとの解像度を上限に収まるように制限する
+
+        Args:
+            page_dpis: ページ順の解像度
+            page_sizes: ページ順の (幅, 高さ)（ポイント単位。足りないページは制限しない）
+
+        Returns:
+            制限した解像度のリスト
+        """
+        limited = list(page_dpis)
+        for index, (width_pt, height_pt) in enumerate(page_sizes[:len(limited)]):
+            limited[index] = self.page_dpi(width_pt, height_pt, limited[index])
+
+        return limited
@@ -6,5 +6,12 @@
 
 from .logger import ExperimentLogger
 from .config_loader import ConfigLoader
+from .task_scheduler import TaskScheduler, ScheduledTask
+from .task_journal import TaskJournal
+from .metrics_sink import MetricsSink
+from .results_store import ResultsStore
+from .stage_timer import StageTimer, LatencyHistogram
+from .budget_planner import BudgetPlanner
 
-__all__ = ['ExperimentLogger', 'ConfigLoader']
+__all__ = ['ExperimentLogger', 'ConfigLoader', 'TaskScheduler', 'ScheduledTask', 'TaskJournal',
+           'MetricsSink', 'ResultsStore', 'StageTimer', 'LatencyHistogram', 'BudgetPlanner']
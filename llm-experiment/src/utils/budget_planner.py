@@ -0,0 +1,228 @@
+"""
+予算プランナーモジュール
+
+円建ての予算内で、モデル比較の情報量が大きくなるように抽出タスク（PDF × モデル）を並べ、
+実行中の支出を管理する。
+
+- 安いモデルから順に、コーパス全体を実行しても予算に収まるモデルは全PDFで実行する
+- 収まらない高いモデルは、ページ数で層別したPDFの順に、予算が尽きるまで実行する
+- 同じPDFの同じフェーズのタスク（グループ）はまとめて受け入れるか見送るため、
+  実行されたPDFではそのフェーズの全モデルの結果が揃い、モデル間で比較できる
+"""
+
+import logging
+import random
+import threading
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+TaskKey = Tuple[Path, str]
+
+
+class BudgetPlanner:
+    """予算に応じてタスクの順序と実行可否を決めるクラス"""
+
+    def __init__(self, budget_jpy: float, seed: int = 0):
+        """
+        BudgetPlannerの初期化
+
+        Args:
+            budget_jpy: 予算（円）
+            seed: 層内のPDFの並びを決める乱数のシード
+
+        Raises:
+            ValueError: 予算が負の場合
+        """
+        if budget_jpy < 0:
+            raise ValueError(f"予算は0以上を指定してください: {budget_jpy}")
+
+        self.budget_jpy = budget_jpy
+        self.seed = seed
+
+        self._lock = threading.Lock()
+        self._spent = 0.0
+        self._reserved = 0.0
+        # タスク → 見積もりコスト、タスク → グループ、グループ → タスクのリスト
+        self._estimates: Dict[TaskKey, float] = {}
+        self._groups: Dict[TaskKey, Tuple[Path, int]] = {}
+        self._group_members: Dict[Tuple[Path, int], List[TaskKey]] = {}
+        # グループ → 受け入れたか（未判定のグループは含まない）
+        self._admitted: Dict[Tuple[Path, int], bool] = {}
+        # 受け入れて予約中のタスク → 予約額
+        self._reservations: Dict[TaskKey, float] = {}
+        # 確定済みのタスク（グループの受け入れ前に確定したタスクは予約しない）
+        self._settled = set()
+        self.full_models: List[str] = []
+        self.sampled_models: List[str] = []
+        self.skipped_count = 0
+
+    @property
+    def spent(self) -> float:
+        """確定した支出（円）"""
+        with self._lock:
+            return self._spent
+
+    @property
+    def remaining(self) -> float:
+        """予算の残り（円、実行中のタスクの予約額を除く）"""
+        with self._lock:
+            return self.budget_jpy - self._spent - self._reserved
+
+    def order_tasks(
+        self,
+        plan: Dict[Path, List[str]],
+        task_costs: Dict[TaskKey, Optional[float]],
+        page_counts: Dict[Path, int]
+    ) -> List[TaskKey]:
+        """
+        タスクを実行順に並べる
+
+        モデルをコーパス全体の見積もりコストの安い順に並べ、累計が予算に収まるモデルを
+        全PDFで実行するフェーズ、残りのモデルを層別サンプルの順に実行するフェーズに分ける。
+
+        Args:
+            plan: PDFファイルパスと実行するモデルのリストの辞書
+            task_costs: (PDFファイルパス, モデル名) → 見積もりコスト（円、価格設定がない場合はNone）
+            page_counts: PDFファイルパス → ページ数（層別に使用）
+
+        Returns:
+            (PDFファイルパス, モデル名) のリスト（実行順）
+        """
+        model_totals: Dict[str, float] = {}
+        for pdf_path, models in plan.items():
+            for model in models:
+                cost = task_costs.get((pdf_path, model)) or 0.0
+                self._estimates[(pdf_path, model)] = cost
+                model_totals[model] = model_totals.get(model, 0.0) + cost
+
+        cumulative = 0.0
+        self.full_models, self.sampled_models = [], []
+        for model in sorted(model_totals, key=lambda m: model_totals[m]):
+            if not self.sampled_models and cumulative + model_totals[model] <= self.budget_jpy:
+                cumulative += model_totals[model]
+                self.full_models.append(model)
+            else:
+                self.sampled_models.append(model)
+
+        ordered: List[TaskKey] = []
+        self._groups, self._group_members = {}, {}
+        phases = (
+            (self.full_models, list(plan)),
+            (self.sampled_models, self._stratified_order(list(plan), page_counts))
+        )
+        for phase, (phase_models, pdf_order) in enumerate(phases):
+            for pdf_path in pdf_order:
+                for model in phase_models:
+                    if model in plan[pdf_path]:
+                        ordered.append((pdf_path, model))
+                        self._groups[(pdf_path, model)] = (pdf_path, phase)
+                        self._group_members.setdefault((pdf_path, phase), []).append((pdf_path, model))
+
+        logger.info(
+            f"予算に応じた実行順: 予算={self.budget_jpy:.2f}円, "
+            f"全PDFで実行={self.full_models}, 層別サンプルで実行={self.sampled_models}"
+        )
+        return ordered
+
+    def _stratified_order(self, pdf_paths: List[Path], page_counts: Dict[Path, int]) -> List[Path]:
+        """
+        PDFをページ数で層別し、各層から順に1件ずつ取り出した順序を返す
+
+        どこで打ち切っても各層の件数の比率が保たれるため、予算が尽きた時点までの
+        PDFが層別サンプルになる。層内の順序はシードで決まる乱数で並べる。
+
+        Args:
+            pdf_paths: PDFファイルパスのリスト
+            page_counts: PDFファイルパス → ページ数
+
+        Returns:
+            並べ替えたPDFファイルパスのリスト
+        """
+        strata: Dict[Hashable, List[Path]] = {}
+        for pdf_path in pdf_paths:
+            # 1, 2-3, 4-7, 8-15, ... ページで層に分ける
+            stratum = max(page_counts.get(pdf_path, 1), 1).bit_length()
+            strata.setdefault(stratum, []).append(pdf_path)
+
+        rng = random.Random(self.seed)
+        queues = []
+        for stratum in sorted(strata):
+            members = strata[stratum]
+            rng.shuffle(members)
+            queues.append(members)
+
+        # 層の大きさに比例して取り出す（各層の取り出し済みの割合が最も小さい層から取る）
+        taken = [0] * len(queues)
+        ordered = []
+        while len(ordered) < len(pdf_paths):
+            index = min(
+                (i for i in range(len(queues)) if taken[i] < len(queues[i])),
+                key=lambda i: (taken[i] / len(queues[i]), i)
+            )
+            ordered.append(queues[index][taken[index]])
+            taken[index] += 1
+
+        return ordered
+
+    def try_reserve(self, pdf_path: Path, model: str) -> bool:
+        """
+        タスクの実行可否を判定し、実行する場合は見積もりコストを予約する
+
+        グループの最初のタスクで、グループ全体の見積もりが予算の残りに収まるかを判定する。
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+
+        Returns:
+            実行してよい場合True（予算不足で見送る場合False）
+        """
+        key = (pdf_path, model)
+        group = self._groups.get(key)
+
+        with self._lock:
+            if group is None:
+                # order_tasksで並べていないタスクは予算の対象外
+                return True
+
+            if group not in self._admitted:
+                members = [
+                    task for task in self._group_members[group]
+                    if task not in self._settled
+                ]
+                group_cost = sum(self._estimates[task] for task in members)
+                admitted = self._spent + self._reserved + group_cost <= self.budget_jpy
+                self._admitted[group] = admitted
+
+                if admitted:
+                    for task in members:
+                        self._reservations[task] = self._estimates[task]
+                    self._reserved += group_cost
+                else:
+                    logger.warning(
+                        f"予算不足のため見送り: {pdf_path.name} {[task[1] for task in members]} "
+                        f"(見積もり{group_cost:.2f}円, 残り{self.budget_jpy - self._spent - self._reserved:.2f}円)"
+                    )
+
+            if not self._admitted[group]:
+                self.skipped_count += 1
+                return False
+
+            return True
+
+    def settle(self, pdf_path: Path, model: str, actual_cost: float) -> None:
+        """
+        タスクの実際のコストを確定し、予約を解放する
+
+        Args:
+            pdf_path: PDFファイルパス
+            model: モデル名
+            actual_cost: 実際のコスト（円、APIを呼ばなかった場合は0）
+        """
+        with self._lock:
+            self._settled.add((pdf_path, model))
+            self._reserved -= self._reservations.pop((pdf_path, model), 0.0)
+            self._spent += actual_cost
@@ -170,6 +170,40 @@ class ConfigLoader:
             logger.error(f"スキーマの読み込みに失敗: {str(e)}")
             raise
 
+    def load_rate_limits(self, file_name: str = "rate_limits.json") -> Dict[str, Dict]:
+        """
+        レート制限設定を読み込む
+
+        Args:
+            file_name: レート制限設定ファイル名
+
+        Returns:
+            プロバイダーごとのレート制限設定の辞書（ファイルがない場合は空の辞書）
+
+        Raises:
+            ValueError: JSONが無効な場合
+        """
+        file_path = self.config_dir / file_name
+
+        if not file_path.exists():
+            logger.warning(f"レート制限設定ファイルが見つかりません: {file_path}")
+            logger.info("レート制限なしで実行します")
+            return {}
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                rate_limits = json.load(f)
+
+            logger.info(f"レート制限設定を読み込みました: {file_path} ({len(rate_limits)}プロバイダー)")
+            return rate_limits
+
+        except json.JSONDecodeError as e:
+            logger.error(f"レート制限設定ファイルのJSONパースに失敗: {str(e)}")
+            raise ValueError(f"レート制限設定ファイルのJSONが無効です: {str(e)}")
+        except Exception as e:
+            logger.error(f"レート制限設定の読み込みに失敗: {str(e)}")
+            raise
+
     def load_system_prompt(self, file_name: str = "system_prompt.txt") -> str:
         """
         システムプロンプトを読み込む
@@ -300,6 +334,12 @@ class ConfigLoader:
             logger.warning(f"スキーマの読み込み失敗: {str(e)}")
             configs['schema'] = {}
 
+        try:
+            configs['rate_limits'] = self.load_rate_limits()
+        except Exception as e:
+            logger.warning(f"レート制限設定の読み込み失敗: {str(e)}")
+            configs['rate_limits'] = {}
+
         try:
             configs['system_prompt'] = self.load_system_prompt()
         except Exception as e:
@@ -7,24 +7,99 @@
 import csv
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 import pandas as pd
 
+from .task_journal import TaskJournal
+from .metrics_sink import MetricsSink
+from .stage_timer import STAGES, LatencyHistogram
+
 
 logger = logging.getLogger(__name__)
 
+# メトリクス（評価ログ + レスポンスログ）の列と型（Parquet出力のスキーマ）
+METRICS_COLUMNS: List[Tuple[str, str]] = [
+    ('timestamp', 'timestamp'),
+    ('model', 'string'),
+    ('pdf_name', 'string'),
+    ('field_accuracy', 'float64'),
+    ('f1_score', 'float64'),
+    ('exact_match', 'bool'),
+    ('schema_valid', 'bool'),
+    ('cost_jpy', 'float64'),
+    ('session_id', 'string'),
+    ('total_fields', 'int64'),
+    ('correct_fields', 'int64'),
+    ('incorrect_fields', 'int64'),
+    ('missing_fields', 'int64'),
+    ('extra_fields', 'int64'),
+    ('response_time', 'float64'),
+    ('input_tokens', 'int64'),
+    ('output_tokens', 'int64'),
+    ('total_tokens', 'int64'),
+]
+
+
+def get_metrics_arrow_schema():
+    """
+    メトリクスのArrowスキーマを取得する
+
+    Returns:
+        pyarrow.Schema
+
+    Raises:
+        ImportError: pyarrowがインストールされていない場合
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Parquet出力にはpyarrowが必要です: pip install pyarrow"
+        ) from e
+
+    types = {
+        'timestamp': pa.timestamp('us'),
+        'string': pa.string(),
+        'float64': pa.float64(),
+        'int64': pa.int64(),
+        'bool': pa.bool_()
+    }
+    return pa.schema([pa.field(name, types[type_name]) for name, type_name in METRICS_COLUMNS])
+
 
 class ExperimentLogger:
-    """実験ログを管理するクラス"""
+    """
+    実験ログを管理するクラス
+
+    通常はすべてのログをメモリ上のリストに保持し、終了時にまとめて出力する。
+    ストリーミングモードではログを記録のたびにJSONLファイル（MetricsSink）へ追記し、
+    メモリにはモデルごとの集計値と、評価ログとの結合を待つレスポンスのみを保持する。
+    ストリーミングモードでは、評価ログは記録時点までに記録されたレスポンスと結合される。
+    """
 
-    def __init__(self, log_dir: str = "output/logs"):
+    def __init__(
+        self,
+        log_dir: str = "output/logs",
+        session_id: Optional[str] = None,
+        journal: Optional[TaskJournal] = None,
+        stream: bool = False,
+        flush_every: int = 100,
+        max_pending_responses: int = 10000
+    ):
         """
         ExperimentLoggerの初期化
 
         Args:
             log_dir: ログ出力ディレクトリ
+            session_id: セッションID（指定がない場合は開始時刻から生成。再開時に指定する）
+            journal: ログを追記するタスクジャーナル（Noneの場合はメモリにのみ保持）
+            stream: ストリーミングモードで記録するか
+            flush_every: ストリーミングモードでフラッシュするまでにバッファするレコード数
+            max_pending_responses: ストリーミングモードで評価ログとの結合を待つレスポンスの最大件数
+                （超えた場合は古いものから破棄する）
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -35,9 +110,36 @@ class ExperimentLogger:
         self.evaluation_logs: List[Dict] = []
         self.error_logs: List[Dict] = []
 
+        # (モデル名, PDFファイル名) → 最初のレスポンスログ（評価ログとの結合用）
+        self._response_index: Dict[Tuple[str, str], Dict] = {}
+
+        # ジャーナルから復元した評価ログ（ストリーミングモードでも保持する。再開時の逐次比較に使用）
+        self.restored_evaluations: List[Dict] = []
+
         # タイムスタンプ
         self.session_start = datetime.now()
-        self.session_id = self.session_start.strftime("%Y%m%d_%H%M%S")
+        self.session_id = session_id or self.session_start.strftime("%Y%m%d_%H%M%S")
+
+        # ログを追記するジャーナル
+        self.journal = journal
+
+        # ストリーミングモードの出力先と集計値
+        self.stream = stream
+        self.sink: Optional[MetricsSink] = None
+        self.max_pending_responses = max_pending_responses
+        self._pending_responses: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._model_totals: Dict[str, Dict[str, Any]] = {}
+        self._counts = {'request': 0, 'response': 0, 'success': 0, 'evaluation': 0, 'error': 0}
+
+        # モデル → ステージ → 所要時間のヒストグラム（両モードとも集計値のみ保持する）
+        self._stage_histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+        if stream:
+            self.sink = MetricsSink(
+                self.log_dir.parent / "results",
+                self.session_id,
+                flush_every=flush_every
+            )
 
         # ロガーの設定
         self._setup_file_logger()
@@ -87,7 +189,8 @@ class ExperimentLogger:
             'session_id': self.session_id
         }
 
-        self.request_logs.append(request_log)
+        self._store('request', request_log)
+        self._write_journal('request', request_log)
         logger.info(f"リクエスト記録: {model} - {pdf_name}")
 
     def log_response(
@@ -123,7 +226,8 @@ class ExperimentLogger:
             'session_id': self.session_id
         }
 
-        self.response_logs.append(response_log)
+        self._store('response', response_log)
+        self._write_journal('response', response_log)
 
         if success:
             logger.info(
@@ -174,7 +278,8 @@ class ExperimentLogger:
                 'extra_fields': stats.get('extra_fields', 0)
             })
 
-        self.evaluation_logs.append(evaluation_log)
+        self._store('evaluation', evaluation_log)
+        self._write_journal('evaluation', evaluation_log)
 
         logger.info(
             f"評価記録: {model} - {pdf_name} "
@@ -208,11 +313,249 @@ class ExperimentLogger:
             'session_id': self.session_id
         }
 
-        self.error_logs.append(error_log)
+        self._store('error', error_log)
+        self._write_journal('error', error_log)
         logger.error(
             f"エラー記録: {model} - {pdf_name} - {error_type}: {str(error)}"
         )
 
+    def log_stage_times(
+        self,
+        model: str,
+        pdf_name: str,
+        stage_times: Dict[str, float]
+    ) -> None:
+        """
+        1タスクのステージごとの所要時間を記録する
+
+        Args:
+            model: モデル名
+            pdf_name: PDFファイル名
+            stage_times: {ステージ名: 所要時間（秒）} の辞書（StageTimer.get_durations()）
+        """
+        if not stage_times:
+            return
+
+        stage_log = {
+            'timestamp': datetime.now().isoformat(),
+            'model': model,
+            'pdf_name': pdf_name,
+            'stage_times': dict(stage_times),
+            'session_id': self.session_id
+        }
+
+        self._store('stage', stage_log)
+        self._write_journal('stage', stage_log)
+        logger.debug(
+            f"ステージ所要時間記録: {model} - {pdf_name} - "
+            + ", ".join(f"{stage}={seconds:.3f}秒" for stage, seconds in stage_times.items())
+        )
+
+    def attach_journal(self, journal: TaskJournal) -> None:
+        """
+        以降のログを追記するタスクジャーナルを設定する
+
+        Args:
+            journal: タスクジャーナル
+        """
+        self.journal = journal
+
+    def restore_from_journal(self, journal: TaskJournal) -> Set[Tuple[str, str]]:
+        """
+        タスクジャーナルからログを復元する（実行の再開用）
+
+        完了済みのタスクの、完了した試行（最後にrunningになった以降）のログのみを復元する。
+        未完了のタスクは再実行されるため、そのログは破棄する。以前のセッションで失敗した試行のログも
+        復元しない（失敗したレスポンスが評価ログと結合されたり、エラー数に数えられたりしないようにする）。
+
+        Args:
+            journal: タスクジャーナル
+
+        Returns:
+            完了済みのタスク (pdf_name, model) のセット
+        """
+        loaded = journal.load()
+        completed = {
+            task for task, state in loaded['states'].items()
+            if state == TaskJournal.STATE_COMPLETED
+        }
+
+        session = loaded['session']
+        if session is not None and session.get('session_start'):
+            self.session_start = datetime.fromisoformat(session['session_start'])
+
+        restored_count = 0
+        attempt_starts = loaded['attempt_starts']
+        for index, (kind, record) in enumerate(loaded['logs']):
+            task = (record.get('pdf_name'), record.get('model'))
+            if task in completed and index >= attempt_starts.get(task, 0):
+                self._store(kind, record)
+                if kind == 'evaluation':
+                    self.restored_evaluations.append(record)
+                restored_count += 1
+
+        logger.info(
+            f"ジャーナルから復元: 完了済みタスク{len(completed)}件, "
+            f"ログ{restored_count}件 ({journal.journal_path})"
+        )
+        return completed
+
+    def _store(self, kind: str, record: Dict) -> None:
+        """
+        ログのレコードを保持する（ストリーミングモードではファイルに追記して集計する）
+
+        同じモデル・PDFのレスポンスが複数ある場合は、最初のレスポンスを評価ログとの結合に使用する。
+
+        Args:
+            kind: ログの種類（request, response, evaluation, error, stage）
+            record: ログのレコード
+        """
+        if kind == 'stage':
+            histograms = self._stage_histograms.setdefault(record['model'], {})
+            for stage, seconds in record['stage_times'].items():
+                histograms.setdefault(stage, LatencyHistogram()).record(seconds)
+            return
+
+        key = (record['model'], record['pdf_name'])
+
+        if self.sink is None:
+            if kind == 'request':
+                self.request_logs.append(record)
+            elif kind == 'response':
+                self.response_logs.append(record)
+                self._response_index.setdefault(key, record)
+            elif kind == 'evaluation':
+                self.evaluation_logs.append(record)
+            else:
+                self.error_logs.append(record)
+            return
+
+        self._counts[kind] += 1
+
+        if kind == 'request':
+            self.sink.write('requests', record)
+        elif kind == 'response':
+            self.sink.write('responses', record)
+            if record['success']:
+                self._counts['success'] += 1
+            if key not in self._pending_responses:
+                self._pending_responses[key] = {
+                    field: record.get(field)
+                    for field in ('response_time', 'input_tokens', 'output_tokens', 'total_tokens')
+                }
+                if len(self._pending_responses) > self.max_pending_responses:
+                    self._pending_responses.popitem(last=False)
+        elif kind == 'evaluation':
+            response_log = self._pending_responses.pop(key, None)
+            self.sink.write('metrics', self._merge_response(record, response_log))
+            self._accumulate(self._model_totals, record, response_log)
+        else:
+            self.sink.write('errors', record)
+
+    def get_response_log(self, model: str, pdf_name: str) -> Optional[Dict]:
+        """
+        モデル・PDFに対応するレスポンスログを取得する
+
+        Args:
+            model: モデル名
+            pdf_name: PDFファイル名
+
+        Returns:
+            レスポンスログ（ない場合はNone）
+        """
+        return self._response_index.get((model, pdf_name))
+
+    @staticmethod
+    def _merge_response(eval_log: Dict, response_log: Optional[Dict]) -> Dict:
+        """
+        評価ログにレスポンスの応答時間とトークン数を結合する
+
+        Args:
+            eval_log: 評価ログ
+            response_log: 対応するレスポンスログ（ない場合はNone）
+
+        Returns:
+            結合したレコード
+        """
+        merged = eval_log.copy()
+        if response_log:
+            merged.update({
+                'response_time': response_log.get('response_time', 0.0),
+                'input_tokens': response_log.get('input_tokens', 0),
+                'output_tokens': response_log.get('output_tokens', 0),
+                'total_tokens': response_log.get('total_tokens', 0)
+            })
+        return merged
+
+    @staticmethod
+    def _accumulate(
+        totals: Dict[str, Dict[str, Any]],
+        eval_log: Dict,
+        response_log: Optional[Dict]
+    ) -> None:
+        """
+        評価ログ1件をモデルごとの集計値に加算する
+
+        Args:
+            totals: モデル名 → 集計値の辞書（更新される）
+            eval_log: 評価ログ
+            response_log: 対応するレスポンスログ（ない場合はNone）
+        """
+        total = totals.get(eval_log['model'])
+        if total is None:
+            total = totals[eval_log['model']] = {
+                'count': 0,
+                'field_accuracy': 0.0,
+                'f1_score': 0.0,
+                'exact_match_count': 0,
+                'schema_valid_count': 0,
+                'cost_count': 0,
+                'total_cost': 0.0,
+                'response_count': 0,
+                'total_response_time': 0.0,
+                'total_tokens': 0
+            }
+
+        total['count'] += 1
+        total['field_accuracy'] += eval_log['field_accuracy']
+        total['f1_score'] += eval_log['f1_score']
+        if eval_log['exact_match']:
+            total['exact_match_count'] += 1
+        if eval_log['schema_valid']:
+            total['schema_valid_count'] += 1
+
+        # コストを集計
+        if eval_log['cost_jpy'] is not None:
+            total['cost_count'] += 1
+            total['total_cost'] += eval_log['cost_jpy']
+
+        # レスポンスタイムを集計
+        if response_log is not None:
+            total['response_count'] += 1
+            total['total_response_time'] += response_log['response_time']
+            total['total_tokens'] += response_log['total_tokens']
+
+    def flush(self) -> None:
+        """ストリーミングモードのバッファをファイルに書き出す"""
+        if self.sink is not None:
+            self.sink.flush()
+
+    def close(self) -> None:
+        """ストリーミングモードのファイルを閉じる"""
+        if self.sink is not None:
+            self.sink.close()
+
+    def _write_journal(self, kind: str, record: Dict) -> None:
+        """
+        ジャーナルが設定されていればログを追記する
+
+        Args:
+            kind: ログの種類
+            record: ログのレコード
+        """
+        if self.journal is not None:
+            self.journal.record_log(kind, record)
+
     def save_to_csv(self, output_path: Optional[str] = None) -> str:
         """
         ログをCSVファイルに保存する
@@ -230,28 +573,11 @@ class ExperimentLogger:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 評価ログとレスポンスログをマージ
-        merged_logs = []
+        if self.sink is not None:
+            return self._save_stream_to_csv(output_path)
 
-        for eval_log in self.evaluation_logs:
-            # 対応するレスポンスログを探す
-            response_log = None
-            for resp in self.response_logs:
-                if (resp['model'] == eval_log['model'] and
-                    resp['pdf_name'] == eval_log['pdf_name']):
-                    response_log = resp
-                    break
-
-            merged = eval_log.copy()
-            if response_log:
-                merged.update({
-                    'response_time': response_log.get('response_time', 0.0),
-                    'input_tokens': response_log.get('input_tokens', 0),
-                    'output_tokens': response_log.get('output_tokens', 0),
-                    'total_tokens': response_log.get('total_tokens', 0)
-                })
-
-            merged_logs.append(merged)
+        # 評価ログとレスポンスログをマージ
+        merged_logs = list(self.iter_metrics())
 
         # CSVに書き込み
         if merged_logs:
@@ -263,6 +589,105 @@ class ExperimentLogger:
 
         return str(output_path)
 
+    def save_to_parquet(
+        self,
+        output_path: Optional[str] = None,
+        row_group_size: int = 10000
+    ) -> str:
+        """
+        ログをParquetファイルに保存する（METRICS_COLUMNSの型で保存する）
+
+        Args:
+            output_path: 出力ファイルパス（指定がない場合は自動生成）
+            row_group_size: 1つの行グループに書き込む行数
+
+        Returns:
+            保存したファイルパス
+
+        Raises:
+            ImportError: pyarrowがインストールされていない場合
+        """
+        schema = get_metrics_arrow_schema()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if output_path is None:
+            output_path = self.log_dir.parent / "results" / f"metrics_{self.session_id}.parquet"
+        else:
+            output_path = Path(output_path)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 行グループ単位で書き込み、全レコードをメモリに保持しない
+        row_count = 0
+        rows: List[Dict] = []
+
+        with pq.ParquetWriter(str(output_path), schema, compression='zstd') as writer:
+            for record in self.iter_metrics():
+                row = {name: record.get(name) for name in schema.names}
+                if row['timestamp'] is not None:
+                    row['timestamp'] = datetime.fromisoformat(row['timestamp'])
+                rows.append(row)
+
+                if len(rows) >= row_group_size:
+                    writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+                    row_count += len(rows)
+                    rows = []
+
+            if rows:
+                writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+                row_count += len(rows)
+
+        logger.info(f"Parquetファイル保存: {output_path} ({row_count}行)")
+        return str(output_path)
+
+    def iter_metrics(self) -> Iterator[Dict]:
+        """
+        評価ログにレスポンスを結合したレコードを順に返す
+
+        Yields:
+            結合したレコード（ストリーミングモードではファイルから読み込む）
+        """
+        if self.sink is not None:
+            yield from self.sink.read('metrics')
+            return
+
+        for eval_log in self.evaluation_logs:
+            # 対応するレスポンスログ
+            response_log = self.get_response_log(eval_log['model'], eval_log['pdf_name'])
+            yield self._merge_response(eval_log, response_log)
+
+    def _save_stream_to_csv(self, output_path: Path) -> str:
+        """
+        ストリーミングモードで追記した結合済みレコードをCSVファイルに変換する
+
+        ファイルを2回走査し（列の収集と書き込み）、レコードをメモリに保持しない。
+
+        Args:
+            output_path: 出力ファイルパス
+
+        Returns:
+            保存したファイルパス
+        """
+        columns: Dict[str, None] = {}
+        for record in self.iter_metrics():
+            columns.update(dict.fromkeys(record))
+
+        if not columns:
+            logger.warning("保存するログデータがありません")
+            return str(output_path)
+
+        row_count = 0
+        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(columns))
+            writer.writeheader()
+            for record in self.iter_metrics():
+                writer.writerow(record)
+                row_count += 1
+
+        logger.info(f"CSVファイル保存: {output_path} ({row_count}行)")
+        return str(output_path)
+
     def generate_summary_report(self) -> Dict:
         """
         サマリーレポートを生成する
@@ -270,75 +695,80 @@ class ExperimentLogger:
         Returns:
             サマリーレポートの辞書
         """
-        if not self.evaluation_logs:
+        stats = self.get_statistics()
+        total_evaluations = stats['total_evaluations']
+
+        if not total_evaluations:
             logger.warning("評価ログがありません")
             return {
                 'session_id': self.session_id,
                 'session_start': self.session_start.isoformat(),
+                'session_end': datetime.now().isoformat(),
                 'total_evaluations': 0,
+                'total_errors': stats['total_errors'],
                 'models': {}
             }
 
-        # モデルごとに集計
+        # モデルごとに集計（ストリーミングモードでは記録時に集計済み）
+        if self.sink is not None:
+            totals = self._model_totals
+        else:
+            totals = {}
+            for log in self.evaluation_logs:
+                response_log = self.get_response_log(log['model'], log['pdf_name'])
+                self._accumulate(totals, log, response_log)
+
         models_summary = {}
-        model_names = set(log['model'] for log in self.evaluation_logs)
-
-        for model in model_names:
-            model_logs = [log for log in self.evaluation_logs if log['model'] == model]
-
-            if not model_logs:
-                continue
-
-            # 平均値を計算
-            avg_field_accuracy = sum(log['field_accuracy'] for log in model_logs) / len(model_logs)
-            avg_f1_score = sum(log['f1_score'] for log in model_logs) / len(model_logs)
-            exact_match_count = sum(1 for log in model_logs if log['exact_match'])
-            exact_match_rate = exact_match_count / len(model_logs)
-            schema_valid_count = sum(1 for log in model_logs if log['schema_valid'])
-            schema_conformance_rate = schema_valid_count / len(model_logs)
-
-            # コストを集計
-            costs = [log['cost_jpy'] for log in model_logs if log['cost_jpy'] is not None]
-            avg_cost = sum(costs) / len(costs) if costs else 0.0
-            total_cost = sum(costs) if costs else 0.0
-
-            # レスポンスタイムを集計
-            response_times = []
-            total_tokens = 0
-            for log in model_logs:
-                for resp in self.response_logs:
-                    if (resp['model'] == model and
-                        resp['pdf_name'] == log['pdf_name']):
-                        response_times.append(resp['response_time'])
-                        total_tokens += resp['total_tokens']
-                        break
-
-            avg_response_time = sum(response_times) / len(response_times) if response_times else 0.0
 
+        for model, total in totals.items():
+            count = total['count']
             models_summary[model] = {
-                'count': len(model_logs),
-                'avg_field_accuracy': avg_field_accuracy,
-                'avg_f1_score': avg_f1_score,
-                'exact_match_rate': exact_match_rate,
-                'schema_conformance_rate': schema_conformance_rate,
-                'avg_cost_per_pdf': avg_cost,
-                'total_cost': total_cost,
-                'avg_response_time': avg_response_time,
-                'total_tokens': total_tokens
+                'count': count,
+                'avg_field_accuracy': total['field_accuracy'] / count,
+                'avg_f1_score': total['f1_score'] / count,
+                'exact_match_rate': total['exact_match_count'] / count,
+                'schema_conformance_rate': total['schema_valid_count'] / count,
+                'avg_cost_per_pdf': (
+                    total['total_cost'] / total['cost_count'] if total['cost_count'] else 0.0
+                ),
+                'total_cost': total['total_cost'],
+                'avg_response_time': (
+                    total['total_response_time'] / total['response_count']
+                    if total['response_count'] else 0.0
+                ),
+                'total_tokens': total['total_tokens']
             }
 
+            if model in self._stage_histograms:
+                models_summary[model]['stage_latency'] = self.get_stage_latency(model)
+
         summary = {
             'session_id': self.session_id,
             'session_start': self.session_start.isoformat(),
             'session_end': datetime.now().isoformat(),
-            'total_evaluations': len(self.evaluation_logs),
-            'total_errors': len(self.error_logs),
+            'total_evaluations': total_evaluations,
+            'total_errors': stats['total_errors'],
             'models': models_summary
         }
 
         logger.info(f"サマリーレポート生成完了: {len(models_summary)}モデル")
         return summary
 
+    def get_stage_latency(self, model: str) -> Dict[str, Dict[str, float]]:
+        """
+        モデルのステージごとの所要時間の統計を取得する
+
+        Args:
+            model: モデル名
+
+        Returns:
+            {ステージ名: {'count', 'mean', 'p50', 'p90', 'p99', 'max'}} の辞書（処理順）
+        """
+        histograms = self._stage_histograms.get(model, {})
+        order = {stage: i for i, stage in enumerate(STAGES)}
+        stages = sorted(histograms, key=lambda stage: order.get(stage, len(STAGES)))
+        return {stage: histograms[stage].summary() for stage in stages}
+
     def save_summary_report(self, output_path: Optional[str] = None) -> str:
         """
         サマリーレポートをJSONファイルに保存する
@@ -371,6 +801,16 @@ class ExperimentLogger:
         Returns:
             統計情報の辞書
         """
+        if self.sink is not None:
+            counts = self._counts
+            return {
+                'total_requests': counts['request'],
+                'total_responses': counts['response'],
+                'total_evaluations': counts['evaluation'],
+                'total_errors': counts['error'],
+                'success_rate': counts['success'] / counts['response'] if counts['response'] else 0.0
+            }
+
         stats = {
             'total_requests': len(self.request_logs),
             'total_responses': len(self.response_logs),
@@ -410,6 +850,13 @@ class ExperimentLogger:
             print(f"  合計コスト: {data['total_cost']:.2f}円")
             print(f"  平均応答時間: {data['avg_response_time']:.2f}秒")
             print(f"  合計トークン: {data['total_tokens']:,}")
+            if data.get('stage_latency'):
+                print("  ステージ別所要時間 (p50 / p90 / p99):")
+                for stage, latency in data['stage_latency'].items():
+                    print(
+                        f"    {stage}: {latency['p50']:.3f}秒 / "
+                        f"{latency['p90']:.3f}秒 / {latency['p99']:.3f}秒 ({latency['count']}件)"
+                    )
             print()
 
         print("=" * 80)
@@ -0,0 +1,136 @@
+"""
+メトリクスシンクモジュール
+
+実験ログのレコードを種類ごとのJSONLファイルに追記する。
+書き込みはバッファしてまとめてフラッシュするため、レコードごとのI/Oを抑えつつ、
+実行中でもフラッシュ済みの結果をファイルから確認できる。
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsSink:
+    """実験ログのレコードをJSONLファイルに追記するクラス"""
+
+    KINDS = ("requests", "responses", "metrics", "errors")
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        session_id: str,
+        flush_every: int = 100
+    ):
+        """
+        MetricsSinkの初期化
+
+        既存のファイルは空にしてから書き込む。
+
+        Args:
+            output_dir: 出力ディレクトリ
+            session_id: セッションID（ファイル名に使用）
+            flush_every: フラッシュするまでにバッファするレコード数
+
+        Raises:
+            ValueError: flush_everyが1未満の場合
+        """
+        if flush_every < 1:
+            raise ValueError(f"flush_everyは1以上を指定してください: {flush_every}")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.session_id = session_id
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        self._buffer: Dict[str, List[str]] = {kind: [] for kind in self.KINDS}
+        self._buffered_count = 0
+        self._files = {
+            kind: open(self.get_path(kind), 'w', encoding='utf-8')
+            for kind in self.KINDS
+        }
+
+        logger.info(f"MetricsSink初期化完了: {self.output_dir}")
+
+    def get_path(self, kind: str) -> Path:
+        """
+        レコードの種類に対応するファイルパスを取得する
+
+        Args:
+            kind: レコードの種類（requests, responses, metrics, errors）
+
+        Returns:
+            JSONLファイルのパス
+        """
+        return self.output_dir / f"{kind}_{self.session_id}.jsonl"
+
+    def write(self, kind: str, record: Dict) -> None:
+        """
+        レコードを追記する（flush_every件ごとにまとめてフラッシュする）
+
+        Args:
+            kind: レコードの種類
+            record: レコード
+
+        Raises:
+            ValueError: 不明なレコードの種類が指定された場合
+        """
+        if kind not in self._buffer:
+            raise ValueError(f"不明なレコードの種類です: {kind}")
+
+        line = json.dumps(record, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._buffer[kind].append(line)
+            self._buffered_count += 1
+            if self._buffered_count >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """バッファ中のレコードをファイルに書き出す"""
+        with self._lock:
+            self._flush_locked()
+
+    def read(self, kind: str) -> Iterator[Dict]:
+        """
+        書き出し済みのレコードを1件ずつ読み込む（バッファ中のレコードは先にフラッシュする）
+
+        Args:
+            kind: レコードの種類
+
+        Yields:
+            レコード
+        """
+        self.flush()
+
+        with open(self.get_path(kind), 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def close(self) -> None:
+        """バッファをフラッシュしてファイルを閉じる"""
+        with self._lock:
+            self._flush_locked()
+            for f in self._files.values():
+                f.close()
+
+    def _flush_locked(self) -> None:
+        """バッファを書き出す（ロック取得済みで呼ぶこと）"""
+        if not self._buffered_count:
+            return
+
+        for kind, lines in self._buffer.items():
+            if lines:
+                f = self._files[kind]
+                f.write('\n'.join(lines) + '\n')
+                f.flush()
+                lines.clear()
+
+        self._buffered_count = 0
@@ -0,0 +1,504 @@
+"""
+結果ストアモジュール
+
+セッションごとのサマリー（ExperimentLogger.generate_summary_reportの集計値）、
+PDFごとの評価結果、フィールドごとの判定結果を1つのSQLiteファイルに蓄積し、
+セッションをまたいだ推移・劣化・フィールド別正答率を検索する。
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+# サマリーのモデル別集計値の列
+SUMMARY_COLUMNS = [
+    'count', 'avg_field_accuracy', 'avg_f1_score', 'exact_match_rate',
+    'schema_conformance_rate', 'avg_cost_per_pdf', 'total_cost',
+    'avg_response_time', 'total_tokens'
+]
+
+# PDFごとの評価結果の列（セッションID・モデル名・PDFファイル名以外）
+EVALUATION_COLUMNS = [
+    'timestamp', 'field_accuracy', 'f1_score', 'exact_match', 'schema_valid',
+    'cost_jpy', 'response_time', 'input_tokens', 'output_tokens', 'total_tokens'
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    session_start TEXT NOT NULL,
+    session_end TEXT,
+    total_evaluations INTEGER NOT NULL,
+    total_errors INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS model_summaries (
+    session_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    count INTEGER,
+    avg_field_accuracy REAL,
+    avg_f1_score REAL,
+    exact_match_rate REAL,
+    schema_conformance_rate REAL,
+    avg_cost_per_pdf REAL,
+    total_cost REAL,
+    avg_response_time REAL,
+    total_tokens INTEGER,
+    PRIMARY KEY (session_id, model)
+);
+CREATE INDEX IF NOT EXISTS idx_model_summaries_model ON model_summaries(model);
+CREATE TABLE IF NOT EXISTS evaluations (
+    session_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    pdf_name TEXT NOT NULL,
+    timestamp TEXT,
+    field_accuracy REAL,
+    f1_score REAL,
+    exact_match INTEGER,
+    schema_valid INTEGER,
+    cost_jpy REAL,
+    response_time REAL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    total_tokens INTEGER,
+    PRIMARY KEY (session_id, model, pdf_name)
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_model_timestamp ON evaluations(model, timestamp);
+CREATE INDEX IF NOT EXISTS idx_evaluations_pdf_name ON evaluations(pdf_name);
+CREATE TABLE IF NOT EXISTS field_results (
+    session_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    pdf_name TEXT NOT NULL,
+    field_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    timestamp TEXT,
+    PRIMARY KEY (session_id, model, pdf_name, field_path)
+);
+CREATE INDEX IF NOT EXISTS idx_field_results_model_field ON field_results(model, field_path);
+"""
+
+
+class ResultsStore:
+    """複数セッションの実験結果を蓄積・検索するクラス"""
+
+    def __init__(self, db_path: Union[str, Path] = "output/results/results.sqlite3"):
+        """
+        ResultsStoreの初期化
+
+        Args:
+            db_path: SQLiteデータベースのパス
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        logger.info(f"ResultsStore初期化完了: {self.db_path}")
+
+    def ingest_session(self, summary: Dict, metrics: Iterable[Dict]) -> int:
+        """
+        1セッションのサマリーと評価結果を取り込む（同じセッションは置き換える）
+
+        Args:
+            summary: ExperimentLogger.generate_summary_reportの戻り値
+            metrics: 評価ログにレスポンスを結合したレコード（ExperimentLogger.iter_metricsなど）
+
+        Returns:
+            取り込んだ評価結果の件数
+        """
+        session_id = summary['session_id']
+
+        rows = [
+            (
+                session_id, record['model'], record['pdf_name'],
+                *(self._to_db_value(record.get(column)) for column in EVALUATION_COLUMNS)
+            )
+            for record in metrics
+        ]
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO sessions (
+                    session_id, session_start, session_end,
+                    total_evaluations, total_errors, ingested_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    session_id,
+                    summary['session_start'],
+                    summary.get('session_end'),
+                    summary.get('total_evaluations', 0),
+                    summary.get('total_errors', 0),
+                    datetime.now().isoformat()
+                )
+            )
+
+            self._conn.execute("DELETE FROM model_summaries WHERE session_id = ?", (session_id,))
+            self._conn.executemany(
+                f"""
+                INSERT INTO model_summaries (session_id, model, {', '.join(SUMMARY_COLUMNS)})
+                VALUES ({', '.join('?' * (len(SUMMARY_COLUMNS) + 2))})
+                """,
+                [
+                    (session_id, model, *(data.get(column) for column in SUMMARY_COLUMNS))
+                    for model, data in summary.get('models', {}).items()
+                ]
+            )
+
+            self._conn.execute("DELETE FROM evaluations WHERE session_id = ?", (session_id,))
+            self._conn.executemany(
+                f"""
+                INSERT OR REPLACE INTO evaluations (
+                    session_id, model, pdf_name, {', '.join(EVALUATION_COLUMNS)}
+                )
+                VALUES ({', '.join('?' * (len(EVALUATION_COLUMNS) + 3))})
+                """,
+                rows
+            )
+            self._conn.commit()
+
+        logger.info(f"セッションを取り込みました: {session_id} (評価{len(rows)}件)")
+        return len(rows)
+
+    def ingest_files(
+        self,
+        summary_path: Union[str, Path],
+        metrics_path: Optional[Union[str, Path]] = None
+    ) -> int:
+        """
+        保存済みのサマリーJSONとメトリクスファイル（CSV/Parquet）を取り込む
+
+        Args:
+            summary_path: サマリーJSONのパス
+            metrics_path: メトリクスファイルのパス（Noneの場合はサマリーのみ取り込む）
+
+        Returns:
+            取り込んだ評価結果の件数
+        """
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+
+        metrics: List[Dict] = []
+        if metrics_path is not None:
+            metrics_path = Path(metrics_path)
+            if metrics_path.suffix == '.parquet':
+                df = pd.read_parquet(metrics_path)
+            else:
+                df = pd.read_csv(metrics_path)
+            df = df.astype(object).where(df.notna(), None)
+            metrics = df.to_dict('records')
+
+        return self.ingest_session(summary, metrics)
+
+    def ingest_directory(self, results_dir: Union[str, Path], replace: bool = False) -> List[str]:
+        """
+        結果ディレクトリのsummary_<セッションID>.jsonを取り込む（取り込み済みのセッションは飛ばす）
+
+        同じセッションIDのmetrics_<セッションID>.parquet（なければ.csv）があれば評価結果も取り込む。
+
+        Args:
+            results_dir: 結果ディレクトリ
+            replace: 取り込み済みのセッションも取り込み直すか
+
+        Returns:
+            取り込んだセッションIDのリスト
+        """
+        results_dir = Path(results_dir)
+        # 実行中に登録しただけのセッション（session_endがない）は取り込み済みとみなさない
+        sessions = self.list_sessions()
+        ingested = set() if replace else set(
+            sessions.loc[sessions['session_end'].notna(), 'session_id']
+        )
+        session_ids = []
+
+        for summary_path in sorted(results_dir.glob("summary_*.json")):
+            session_id = summary_path.stem[len("summary_"):]
+            if session_id in ingested:
+                continue
+
+            metrics_path = None
+            for suffix in ('.parquet', '.csv'):
+                candidate = results_dir / f"metrics_{session_id}{suffix}"
+                if candidate.exists():
+                    metrics_path = candidate
+                    break
+
+            try:
+                self.ingest_files(summary_path, metrics_path)
+                session_ids.append(session_id)
+            except Exception as e:
+                logger.error(f"セッションの取り込みに失敗: {summary_path} - {str(e)}")
+
+        logger.info(f"結果ディレクトリを取り込みました: {results_dir} ({len(session_ids)}セッション)")
+        return session_ids
+
+    def register_session(self, session_id: str, session_start: str) -> None:
+        """
+        実行中のセッションを登録する（取り込み済みの場合は何もしない）
+
+        実行中に追加したフィールドごとの判定結果を、セッション終了前から検索できるようにする。
+
+        Args:
+            session_id: セッションID
+            session_start: セッション開始時刻（ISO形式）
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR IGNORE INTO sessions (
+                    session_id, session_start, session_end,
+                    total_evaluations, total_errors, ingested_at
+                ) VALUES (?, ?, NULL, 0, 0, ?)
+                """,
+                (session_id, session_start, datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+    def add_field_results(
+        self,
+        session_id: str,
+        model: str,
+        pdf_name: str,
+        field_results: Dict[str, str],
+        timestamp: Optional[str] = None
+    ) -> None:
+        """
+        1件の評価のフィールドごとの判定結果を追加する（評価のたびに呼ぶ）
+
+        Args:
+            session_id: セッションID
+            model: モデル名
+            pdf_name: PDFファイル名
+            field_results: フィールドパス → 判定結果（correct, incorrect, missing）
+            timestamp: 評価時刻（指定がない場合は現在時刻）
+        """
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO field_results (
+                    session_id, model, pdf_name, field_path, status, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (session_id, model, pdf_name, field_path, status, timestamp)
+                    for field_path, status in field_results.items()
+                ]
+            )
+            self._conn.commit()
+
+    def list_sessions(self) -> pd.DataFrame:
+        """
+        取り込み済みのセッションを取得する
+
+        Returns:
+            セッションのDataFrame（開始時刻順）
+        """
+        return self._query("SELECT * FROM sessions ORDER BY session_start")
+
+    def get_model_trend(
+        self,
+        model: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        セッションごとのモデル別集計値の推移を取得する
+
+        Args:
+            model: モデル名（Noneの場合は全モデル）
+            since: この時刻（ISO形式）以降に開始したセッションのみ
+
+        Returns:
+            session_id, session_start, model と集計値の列を持つDataFrame（開始時刻順）
+        """
+        conditions, params = self._build_conditions(model=model, since=since)
+
+        return self._query(
+            f"""
+            SELECT s.session_id, s.session_start, m.model,
+                   {', '.join(f'm.{column}' for column in SUMMARY_COLUMNS)}
+            FROM model_summaries m
+            JOIN sessions s ON s.session_id = m.session_id
+            {conditions}
+            ORDER BY s.session_start, m.model
+            """,
+            params
+        )
+
+    def find_regressions(
+        self,
+        metric: str = 'avg_f1_score',
+        threshold: float = 0.01,
+        higher_is_better: bool = True
+    ) -> pd.DataFrame:
+        """
+        直前のセッションから指標が悪化したモデルを検出する
+
+        Args:
+            metric: 比較する集計値（SUMMARY_COLUMNSのいずれか）
+            threshold: 悪化とみなす変化量
+            higher_is_better: 値が大きいほど良い指標か（コスト・応答時間はFalse）
+
+        Returns:
+            model, session_id, previous_session_id, previous_value, value, change の列を持つDataFrame
+
+        Raises:
+            ValueError: 不明な指標が指定された場合
+        """
+        if metric not in SUMMARY_COLUMNS:
+            raise ValueError(f"不明な指標です: {metric}")
+
+        sign = -1 if higher_is_better else 1
+
+        return self._query(
+            f"""
+            SELECT model, session_id, previous_session_id, previous_value, value,
+                   value - previous_value AS change
+            FROM (
+                SELECT m.model, m.session_id, m.{metric} AS value,
+                       LAG(m.session_id) OVER w AS previous_session_id,
+                       LAG(m.{metric}) OVER w AS previous_value
+                FROM model_summaries m
+                JOIN sessions s ON s.session_id = m.session_id
+                WINDOW w AS (PARTITION BY m.model ORDER BY s.session_start)
+            )
+            WHERE previous_value IS NOT NULL AND (value - previous_value) * ? > ?
+            ORDER BY model, session_id
+            """,
+            (sign, threshold)
+        )
+
+    def get_field_accuracy(
+        self,
+        model: Optional[str] = None,
+        since: Optional[str] = None,
+        by_session: bool = False
+    ) -> pd.DataFrame:
+        """
+        フィールドごとの正答率を取得する
+
+        Args:
+            model: モデル名（Noneの場合は全モデル）
+            since: この時刻（ISO形式）以降に開始したセッションのみ
+            by_session: セッションごとに集計するか（Falseの場合は期間全体で集計）
+
+        Returns:
+            model, field_path, total, correct, accuracy（by_session時はsession_id, session_startも）の
+            列を持つDataFrame
+        """
+        conditions, params = self._build_conditions(model=model, since=since, table='f')
+        group_columns = "s.session_id, s.session_start, f.model" if by_session else "f.model"
+
+        return self._query(
+            f"""
+            SELECT {group_columns}, f.field_path,
+                   COUNT(*) AS total,
+                   SUM(f.status = 'correct') AS correct,
+                   AVG(f.status = 'correct') AS accuracy
+            FROM field_results f
+            JOIN sessions s ON s.session_id = f.session_id
+            {conditions}
+            GROUP BY {group_columns}, f.field_path
+            ORDER BY {group_columns}, accuracy
+            """,
+            params
+        )
+
+    def get_pdf_history(self, pdf_name: str) -> pd.DataFrame:
+        """
+        1つのPDFの評価結果の履歴を取得する
+
+        Args:
+            pdf_name: PDFファイル名
+
+        Returns:
+            評価結果のDataFrame（評価時刻順）
+        """
+        return self._query(
+            "SELECT * FROM evaluations WHERE pdf_name = ? ORDER BY timestamp, model",
+            (pdf_name,)
+        )
+
+    def close(self) -> None:
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """
+        SQLを実行してDataFrameを返す
+
+        Args:
+            sql: SQL
+            params: パラメータ
+
+        Returns:
+            結果のDataFrame
+        """
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    @staticmethod
+    def _build_conditions(
+        model: Optional[str] = None,
+        since: Optional[str] = None,
+        table: str = 'm'
+    ) -> tuple:
+        """
+        モデル・期間の絞り込み条件を組み立てる
+
+        Args:
+            model: モデル名
+            since: この時刻以降に開始したセッションのみ
+            table: モデル名を持つテーブルの別名
+
+        Returns:
+            (WHERE句, パラメータ) のタプル
+        """
+        clauses = []
+        params = []
+
+        if model is not None:
+            clauses.append(f"{table}.model = ?")
+            params.append(model)
+        if since is not None:
+            clauses.append("s.session_start >= ?")
+            params.append(since)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    @staticmethod
+    def _to_db_value(value):
+        """
+        SQLiteに保存できる値に変換する
+
+        Args:
+            value: 値
+
+        Returns:
+            変換した値
+        """
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        if hasattr(value, 'item'):
+            # numpyの数値型
+            return value.item()
+        return value
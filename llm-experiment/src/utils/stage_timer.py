@@ -0,0 +1,243 @@
+"""
+ステージ計測モジュール
+
+1タスク（PDF × モデル）の処理を、PDF検証・ラスタライズ・画像最適化・Base64エンコード・
+API通信・JSONパース・スキーマ検証・精度計算のステージに分けて所要時間を計測する。
+計測値はモデルごとの対数バケットのヒストグラムに集計し、パーセンタイルを算出する。
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+# 計測するステージ（表示順）
+STAGES = (
+    "validate",
+    "rasterize",
+    "optimize",
+    "encode",
+    "network",
+    "parse",
+    "schema_validate",
+    "accuracy",
+)
+
+# 実行中のタスクのStageTimer（スレッド・asyncioタスクごとに独立）
+_current_timer: ContextVar[Optional["StageTimer"]] = ContextVar("current_stage_timer", default=None)
+
+
+class LatencyHistogram:
+    """
+    所要時間を対数バケットで集計するヒストグラム
+
+    バケット幅は値に比例するため、件数によらずメモリ使用量は一定で、
+    パーセンタイルの相対誤差はおおよそ (growth - 1) / 2 以内に収まる。
+    """
+
+    def __init__(self, min_value: float = 1e-4, growth: float = 1.1):
+        """
+        LatencyHistogramの初期化
+
+        Args:
+            min_value: 最小バケットの上限（秒）。これ未満の値は最小バケットに入る
+            growth: 隣り合うバケットの境界の比
+
+        Raises:
+            ValueError: min_valueが正でない、またはgrowthが1以下の場合
+        """
+        if min_value <= 0:
+            raise ValueError(f"min_valueは正の値を指定してください: {min_value}")
+        if growth <= 1:
+            raise ValueError(f"growthは1より大きい値を指定してください: {growth}")
+
+        self.min_value = min_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        """
+        値を1件記録する
+
+        Args:
+            value: 所要時間（秒）
+        """
+        value = max(value, 0.0)
+        index = self._bucket_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        別のヒストグラムの集計を加える
+
+        Args:
+            other: 同じmin_value・growthのヒストグラム
+
+        Raises:
+            ValueError: バケットの設定が異なる場合
+        """
+        if (other.min_value, other.growth) != (self.min_value, self.growth):
+            raise ValueError("バケットの設定が異なるヒストグラムは結合できません")
+
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        パーセンタイルを取得する
+
+        Args:
+            p: パーセンタイル（0〜100）
+
+        Returns:
+            パーセンタイル値（秒）。記録がない場合はNone
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(self.count * p / 100))
+        cumulative = 0
+        for index in sorted(self._buckets):
+            cumulative += self._buckets[index]
+            if cumulative >= rank:
+                # バケットの幾何平均を代表値とし、実測の最小・最大値の範囲に収める
+                value = self._bucket_upper(index) / math.sqrt(self.growth)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        件数・平均・p50/p90/p99・最大値をまとめて取得する
+
+        Returns:
+            {'count', 'mean', 'p50', 'p90', 'p99', 'max'} の辞書
+        """
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50) or 0.0,
+            'p90': self.percentile(90) or 0.0,
+            'p99': self.percentile(99) or 0.0,
+            'max': self.max or 0.0
+        }
+
+    def _bucket_index(self, value: float) -> int:
+        """値が入るバケットの番号を取得する"""
+        if value <= self.min_value:
+            return 0
+        return math.ceil(math.log(value / self.min_value) / self._log_growth)
+
+    def _bucket_upper(self, index: int) -> float:
+        """バケットの上限を取得する"""
+        return self.min_value * self.growth ** index
+
+
+class StageTimer:
+    """
+    1タスクのステージごとの所要時間を計測するクラス
+
+    activate()の範囲内では、record_span()で計測した時間がこのタイマーに加算される。
+    同じステージを複数回計測した場合（ページごとのエンコード、リトライなど）は合計する。
+    """
+
+    def __init__(self):
+        """StageTimerの初期化"""
+        self._lock = threading.Lock()
+        self.durations: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        """
+        ステージの所要時間を加算する
+
+        Args:
+            stage: ステージ名
+            seconds: 所要時間（秒）
+        """
+        with self._lock:
+            self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """
+        ブロックの所要時間をステージに加算するコンテキストマネージャ
+
+        Args:
+            stage: ステージ名
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        """
+        ブロック内のrecord_span()の計測先をこのタイマーにするコンテキストマネージャ
+
+        Yields:
+            このタイマー
+        """
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+    def get_durations(self) -> Dict[str, float]:
+        """
+        ステージごとの所要時間を取得する
+
+        Returns:
+            {ステージ名: 所要時間（秒）} の辞書
+        """
+        with self._lock:
+            return dict(self.durations)
+
+
+def get_current_timer() -> Optional[StageTimer]:
+    """
+    実行中のタスクのStageTimerを取得する
+
+    Returns:
+        StageTimer（activate()の範囲外の場合はNone）
+    """
+    return _current_timer.get()
+
+
+@contextmanager
+def record_span(stage: str) -> Iterator[None]:
+    """
+    実行中のタスクのStageTimerにブロックの所要時間を加算する
+
+    activate()の範囲外では何もしないため、計測しない呼び出し元からも安全に使える。
+
+    Args:
+        stage: ステージ名
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    with timer.span(stage):
+        yield
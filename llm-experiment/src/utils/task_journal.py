@@ -0,0 +1,234 @@
+"""
+タスクジャーナルモジュール
+
+(PDF, モデル) ごとのタスクの状態遷移と実験ログを、追記専用のJSONLファイルに記録する。
+実行が途中で停止した場合は、ジャーナルから完了済みのタスクとログを復元して再開する。
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskJournal:
+    """
+    タスクの状態遷移とログを追記するジャーナル
+
+    1行に1レコードのJSONを追記する。レコードの種類:
+        {"type": "session", "session_id": ..., "session_start": ..., ...}
+        {"type": "state", "pdf_name": ..., "model": ..., "state": ..., "timestamp": ...}
+        {"type": "log", "kind": "request" | "response" | "evaluation" | "error" | "stage", "record": {...}}
+
+    書き込みのたびにフラッシュするため、プロセスが停止しても書き込み済みの行は失われない。
+    停止時に書きかけだった最終行は、開くときに切り詰める（次のレコードが連結されないようにする）。
+    """
+
+    STATE_RUNNING = "running"
+    STATE_COMPLETED = "completed"
+    STATE_FAILED = "failed"
+    STATE_SKIPPED = "skipped"
+
+    LOG_KINDS = ("request", "response", "evaluation", "error", "stage")
+
+    # 書きかけの最終行を探すときに末尾から読み込む単位（バイト）
+    TRUNCATE_CHUNK_SIZE = 4096
+
+    def __init__(self, journal_path: Union[str, Path], fsync: bool = False):
+        """
+        TaskJournalの初期化
+
+        Args:
+            journal_path: ジャーナルファイルのパス
+            fsync: 書き込みのたびにディスクへ同期するか（OSの停止にも備える場合）
+        """
+        self.journal_path = Path(journal_path)
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._truncate_torn_line()
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+
+        logger.info(f"TaskJournal初期化完了: {self.journal_path}")
+
+    @staticmethod
+    def get_path(journal_dir: Union[str, Path], session_id: str) -> Path:
+        """
+        セッションIDに対応するジャーナルファイルのパスを取得する
+
+        Args:
+            journal_dir: ジャーナルディレクトリ
+            session_id: セッションID
+
+        Returns:
+            ジャーナルファイルのパス
+        """
+        return Path(journal_dir) / f"journal_{session_id}.jsonl"
+
+    def record_session(self, session_id: str, session_start: str, **metadata: Any) -> None:
+        """
+        セッション情報を記録する
+
+        Args:
+            session_id: セッションID
+            session_start: セッション開始時刻（ISO形式）
+            **metadata: その他の情報
+        """
+        self._append({
+            'type': 'session',
+            'session_id': session_id,
+            'session_start': session_start,
+            **metadata
+        })
+
+    def record_state(self, pdf_name: str, model: str, state: str) -> None:
+        """
+        タスクの状態遷移を記録する
+
+        Args:
+            pdf_name: PDFファイル名
+            model: モデル名
+            state: 状態（running, completed, failed, skipped）
+
+        Raises:
+            ValueError: 不明な状態が指定された場合
+        """
+        if state not in (self.STATE_RUNNING, self.STATE_COMPLETED, self.STATE_FAILED, self.STATE_SKIPPED):
+            raise ValueError(f"不明なタスク状態です: {state}")
+
+        self._append({
+            'type': 'state',
+            'pdf_name': pdf_name,
+            'model': model,
+            'state': state,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    def record_log(self, kind: str, record: Dict) -> None:
+        """
+        実験ログのレコードを記録する
+
+        Args:
+            kind: ログの種類（request, response, evaluation, error）
+            record: ログのレコード
+
+        Raises:
+            ValueError: 不明なログの種類が指定された場合
+        """
+        if kind not in self.LOG_KINDS:
+            raise ValueError(f"不明なログの種類です: {kind}")
+
+        self._append({'type': 'log', 'kind': kind, 'record': record})
+
+    def load(self) -> Dict:
+        """
+        ジャーナルを読み込む
+
+        Returns:
+            読み込み結果の辞書:
+            {
+                'session': Dict（セッション情報、記録がない場合はNone）,
+                'states': {(pdf_name, model): 最後の状態},
+                'logs': [(kind, record), ...]（記録順）,
+                'attempt_starts': {(pdf_name, model): 最後にrunningになった時点のlogsの位置}
+            }
+        """
+        session: Optional[Dict] = None
+        states: Dict[Tuple[str, str], str] = {}
+        logs: List[Tuple[str, Dict]] = []
+        attempt_starts: Dict[Tuple[str, str], int] = {}
+
+        with self._lock:
+            self._file.flush()
+
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"ジャーナルの不正な行を無視します: {self.journal_path}:{line_number}")
+                    continue
+
+                entry_type = entry.get('type')
+                if entry_type == 'session':
+                    if session is None:
+                        session = entry
+                elif entry_type == 'state':
+                    task = (entry['pdf_name'], entry['model'])
+                    states[task] = entry['state']
+                    if entry['state'] == self.STATE_RUNNING:
+                        attempt_starts[task] = len(logs)
+                elif entry_type == 'log':
+                    logs.append((entry['kind'], entry['record']))
+
+        return {'session': session, 'states': states, 'logs': logs, 'attempt_starts': attempt_starts}
+
+    def get_completed_tasks(self) -> Set[Tuple[str, str]]:
+        """
+        完了済みのタスクを取得する
+
+        Returns:
+            (pdf_name, model) のセット
+        """
+        states = self.load()['states']
+        return {task for task, state in states.items() if state == self.STATE_COMPLETED}
+
+    def close(self) -> None:
+        """ジャーナルファイルを閉じる"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def _truncate_torn_line(self) -> None:
+        """
+        書きかけの最終行（改行で終わっていない行）を切り詰める
+
+        追記モードで開いたまま次のレコードを書くと書きかけの行に連結され、
+        そのレコードも読み込み時に不正な行として失われるため、開く前に最後の改行の直後まで戻す。
+        """
+        if not self.journal_path.exists():
+            return
+
+        with open(self.journal_path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(position - self.TRUNCATE_CHUNK_SIZE, 0)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+
+            if position < end:
+                f.truncate(position)
+                logger.warning(
+                    f"ジャーナルの書きかけの最終行を切り詰めます: {self.journal_path} ({end - position}バイト)"
+                )
+
+    def _append(self, entry: Dict) -> None:
+        """
+        レコードを1行追記する
+
+        Args:
+            entry: レコード
+        """
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
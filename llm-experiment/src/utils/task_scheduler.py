@@ -0,0 +1,172 @@
+"""
+タスクスケジューラモジュール
+
+抽出タスク（PDF × モデル）を並行実行する。
+全体のワーカー数とモデルごとの同時実行数を制限しつつ、
+結果は投入順に返すため、ログ出力の順序は逐次実行時と同じになる。
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledTask:
+    """スケジューラに投入する1件のタスク"""
+
+    def __init__(
+        self,
+        model: str,
+        func: Callable[..., Any],
+        *args,
+        **kwargs
+    ):
+        """
+        ScheduledTaskの初期化
+
+        Args:
+            model: タスクを実行するモデル名（同時実行数の制限単位）
+            func: 実行する関数
+            *args: 関数の引数
+            **kwargs: 関数のキーワード引数
+        """
+        self.model = model
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> Any:
+        """タスクを実行する"""
+        return self.func(*self.args, **self.kwargs)
+
+    def __repr__(self) -> str:
+        return f"ScheduledTask(model={self.model}, func={getattr(self.func, '__name__', self.func)})"
+
+
+class TaskScheduler:
+    """抽出タスクを並行実行するスケジューラ"""
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        model_concurrency: Optional[Dict[str, int]] = None
+    ):
+        """
+        TaskSchedulerの初期化
+
+        Args:
+            max_workers: 全体の最大同時実行数
+            model_concurrency: モデルごとの最大同時実行数（指定がないモデルはmax_workersまで）
+
+        Raises:
+            ValueError: 同時実行数が1未満の場合
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workersは1以上を指定してください: {max_workers}")
+
+        model_concurrency = model_concurrency or {}
+        for model, limit in model_concurrency.items():
+            if limit < 1:
+                raise ValueError(f"モデル '{model}' の同時実行数は1以上を指定してください: {limit}")
+
+        self.max_workers = max_workers
+        self.model_concurrency = dict(model_concurrency)
+
+    def get_model_limit(self, model: str) -> int:
+        """
+        モデルの同時実行数の上限を取得する
+
+        Args:
+            model: モデル名
+
+        Returns:
+            同時実行数の上限
+        """
+        return min(self.model_concurrency.get(model, self.max_workers), self.max_workers)
+
+    def run(self, tasks: List[ScheduledTask]) -> Iterator[Tuple[ScheduledTask, Any, Optional[Exception]]]:
+        """
+        タスクを並行実行し、投入順に結果を返す
+
+        タスク内で発生した例外は呼び出し元に送出せず、結果タプルに格納して返す。
+        途中で反復をやめた場合（呼び出し元で例外が発生した場合など）は、ジェネレータを
+        close()すると未投入のタスクを破棄し、実行中のタスクの終了を待ってから戻る。
+
+        Args:
+            tasks: 実行するタスクのリスト
+
+        Yields:
+            (タスク, 実行結果, 例外) のタプル（投入順）
+        """
+        if self.max_workers == 1:
+            # 逐次実行（スレッドを使わない）
+            for task in tasks:
+                yield (task,) + self._run_task(task)
+            return
+
+        pending = deque(enumerate(tasks))
+        running: Dict[Future, int] = {}
+        running_per_model: Dict[str, int] = {}
+        finished: Dict[int, Tuple[Any, Optional[Exception]]] = {}
+        next_index = 0
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                self._dispatch(executor, pending, running, running_per_model)
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    model = tasks[index].model
+                    running_per_model[model] -= 1
+                    finished[index] = future.result()
+
+                # 投入順に確定した結果を返す
+                while next_index in finished:
+                    yield (tasks[next_index],) + finished.pop(next_index)
+                    next_index += 1
+        finally:
+            # 中断された場合も、実行中のタスクが終わるまで待ってから戻る
+            # （呼び出し元がタスクの使用するファイルを閉じる前に、書き込みを終わらせる）
+            pending.clear()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _dispatch(
+        self,
+        executor: ThreadPoolExecutor,
+        pending: deque,
+        running: Dict[Future, int],
+        running_per_model: Dict[str, int]
+    ) -> None:
+        """
+        同時実行数の空きがある限り、待機中のタスクを投入する
+
+        モデルの上限に達しているタスクは飛ばし、後続の別モデルのタスクを先に投入する。
+        """
+        deferred = deque()
+
+        while pending and len(running) < self.max_workers:
+            index, task = pending.popleft()
+            if running_per_model.get(task.model, 0) >= self.get_model_limit(task.model):
+                deferred.append((index, task))
+                continue
+
+            future = executor.submit(self._run_task, task)
+            running[future] = index
+            running_per_model[task.model] = running_per_model.get(task.model, 0) + 1
+
+        # 飛ばしたタスクは元の順序のまま先頭に戻す
+        pending.extendleft(reversed(deferred))
+
+    @staticmethod
+    def _run_task(task: ScheduledTask) -> Tuple[Any, Optional[Exception]]:
+        """タスクを実行し、(結果, 例外) を返す"""
+        try:
+            return task.run(), None
+        except Exception as e:
+            logger.error(f"タスク実行エラー: {task.model} - {str(e)}")
+            return None, e
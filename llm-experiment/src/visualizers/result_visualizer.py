@@ -7,7 +7,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
@@ -95,6 +95,52 @@ class ResultVisualizer:
         logger.info(f"メトリクスCSV読み込み: {csv_path} ({len(df)}行)")
         return df
 
+    def load_metrics_parquet(
+        self,
+        parquet_path: Union[str, List[str]],
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        メトリクスParquetを読み込む（pyarrowが必要）
+
+        Args:
+            parquet_path: Parquetファイルのパス、Parquetファイルのみを含むディレクトリ、
+                またはパスのリスト（複数セッションをまとめて読み込む場合）
+            columns: 読み込む列（Noneの場合はすべての列）
+
+        Returns:
+            メトリクスのDataFrame
+        """
+        if isinstance(parquet_path, (list, tuple)):
+            frames = [pd.read_parquet(path, columns=columns) for path in parquet_path]
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+        else:
+            df = pd.read_parquet(parquet_path, columns=columns)
+
+        logger.info(f"メトリクスParquet読み込み: {parquet_path} ({len(df)}行)")
+        return df
+
+    def load_metrics(
+        self,
+        metrics_path: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        メトリクスファイルを拡張子に応じて読み込む
+
+        Args:
+            metrics_path: メトリクスファイルのパス（.csv または .parquet）
+            columns: 読み込む列（Noneの場合はすべての列）
+
+        Returns:
+            メトリクスのDataFrame
+        """
+        if Path(metrics_path).suffix == '.parquet':
+            return self.load_metrics_parquet(metrics_path, columns=columns)
+
+        df = self.load_metrics_csv(metrics_path)
+        return df[columns] if columns is not None else df
+
     def plot_accuracy_comparison(
         self,
         summary: Dict,
@@ -488,7 +534,7 @@ class ResultVisualizer:
 
         Args:
             summary_path: サマリーファイルのパス
-            csv_path: メトリクスCSVのパス（オプション）
+            csv_path: メトリクスファイル（CSVまたはParquet）のパス（オプション）
 
         Returns:
             生成されたファイルパスのリスト
@@ -532,7 +578,7 @@ class ResultVisualizer:
         # CSVがあれば詳細メトリクスも生成
         if csv_path:
             try:
-                df = self.load_metrics_csv(csv_path)
+                df = self.load_metrics(csv_path)
                 generated_files.append(self.plot_detailed_metrics(df))
             except Exception as e:
                 logger.error(f"詳細メトリクスグラフ生成エラー: {str(e)}")
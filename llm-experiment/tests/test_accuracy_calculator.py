@@ -244,6 +244,19 @@ class TestAccuracyCalculator:
         accuracy = calculator.calculate_field_accuracy()
         assert accuracy == 1.0
 
+    def test_get_field_results(self):
+        """フィールドごとの判定結果のテスト"""
+        golden = {"rent": 100000, "tenant": {"name": "山田", "address": "東京"}}
+        extracted = {"rent": 100000, "tenant": {"name": "田中"}, "extra": 1}
+
+        calculator = AccuracyCalculator(golden, extracted)
+
+        assert calculator.get_field_results() == {
+            "rent": "correct",
+            "tenant.name": "incorrect",
+            "tenant.address": "missing"
+        }
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,197 @@
+"""
+予算プランナーモジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import BudgetPlanner, TaskJournal
+
+
+MODELS = ["claude-3-opus", "gpt-4o-mini", "gemini-2.5-flash"]
+MODEL_COSTS = {"gemini-2.5-flash": 0.1, "gpt-4o-mini": 0.5, "claude-3-opus": 20.0}
+
+
+def make_plan(pdf_count=10):
+    """PDF × 3モデルの計画・見積もりコスト・ページ数を作成する"""
+    pdf_paths = [Path(f"contract_{i:03d}.pdf") for i in range(pdf_count)]
+    plan = {pdf_path: list(MODELS) for pdf_path in pdf_paths}
+    task_costs = {
+        (pdf_path, model): MODEL_COSTS[model]
+        for pdf_path in pdf_paths for model in MODELS
+    }
+    # 1ページと8ページのPDFを半分ずつ
+    page_counts = {pdf_path: 1 if i % 2 else 8 for i, pdf_path in enumerate(pdf_paths)}
+    return plan, task_costs, page_counts
+
+
+class TestBudgetPlanner:
+    """BudgetPlannerクラスのテスト"""
+
+    def test_cheap_models_run_first(self):
+        """予算に収まる安いモデルを全PDFで先に実行するテスト"""
+        planner = BudgetPlanner(budget_jpy=50.0)
+        plan, task_costs, page_counts = make_plan()
+
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        assert planner.full_models == ["gemini-2.5-flash", "gpt-4o-mini"]
+        assert planner.sampled_models == ["claude-3-opus"]
+        assert len(ordered) == 30
+        # 先頭20件は安いモデルのみ（PDF順）
+        assert {model for _, model in ordered[:20]} == {"gemini-2.5-flash", "gpt-4o-mini"}
+        assert ordered[0] == (Path("contract_000.pdf"), "gemini-2.5-flash")
+        assert ordered[1] == (Path("contract_000.pdf"), "gpt-4o-mini")
+        assert {model for _, model in ordered[20:]} == {"claude-3-opus"}
+
+    def test_all_models_fit(self):
+        """全モデルが予算に収まる場合は全タスクが全PDFフェーズになるテスト"""
+        planner = BudgetPlanner(budget_jpy=1000.0)
+        plan, task_costs, page_counts = make_plan()
+
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        assert planner.sampled_models == []
+        assert all(planner.try_reserve(pdf_path, model) for pdf_path, model in ordered)
+
+    def test_stratified_sample_order(self):
+        """高いモデルのPDFの並びがページ数の層に偏らないテスト"""
+        planner = BudgetPlanner(budget_jpy=50.0, seed=1)
+        plan, task_costs, page_counts = make_plan()
+
+        sampled = [pdf_path for pdf_path, model in planner.order_tasks(plan, task_costs, page_counts)
+                   if model == "claude-3-opus"]
+
+        assert sorted(sampled) == sorted(plan)
+        # どこで打ち切っても各層の件数の差は1以内
+        for end in range(1, len(sampled) + 1):
+            short = sum(1 for pdf_path in sampled[:end] if page_counts[pdf_path] == 1)
+            assert abs(short - (end - short)) <= 1
+
+    def test_stratified_order_is_deterministic(self):
+        """同じシードでは同じ順序になるテスト"""
+        plan, task_costs, page_counts = make_plan()
+
+        first = BudgetPlanner(50.0, seed=3).order_tasks(plan, task_costs, page_counts)
+        second = BudgetPlanner(50.0, seed=3).order_tasks(plan, task_costs, page_counts)
+
+        assert first == second
+
+    def test_stops_expensive_model_when_budget_exhausted(self):
+        """予算が尽きた後の高いモデルのタスクを見送るテスト"""
+        planner = BudgetPlanner(budget_jpy=50.0)
+        plan, task_costs, page_counts = make_plan()
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        executed = []
+        for pdf_path, model in ordered:
+            if planner.try_reserve(pdf_path, model):
+                planner.settle(pdf_path, model, task_costs[(pdf_path, model)])
+                executed.append((pdf_path, model))
+
+        # 安いモデル6円 + 高いモデル2件40円
+        assert len(executed) == 22
+        assert planner.spent == pytest.approx(46.0)
+        assert planner.skipped_count == 8
+        assert planner.remaining == pytest.approx(4.0)
+
+    def test_actual_cost_frees_budget(self):
+        """実際のコストが見積もりより安い場合は残りの予算が増えるテスト"""
+        planner = BudgetPlanner(budget_jpy=50.0)
+        plan, task_costs, page_counts = make_plan()
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        executed = 0
+        for pdf_path, model in ordered:
+            if planner.try_reserve(pdf_path, model):
+                planner.settle(pdf_path, model, task_costs[(pdf_path, model)] / 2)
+                executed += 1
+
+        # 実コストが見積もりの半分のため、高いモデルを見積もりどおりの場合の2件より多い3件実行できる
+        assert executed == 23
+
+    def test_reservation_blocks_concurrent_tasks(self):
+        """実行中のタスクの予約額が残りの予算から差し引かれるテスト"""
+        planner = BudgetPlanner(budget_jpy=30.0)
+        plan, task_costs, page_counts = make_plan(pdf_count=2)
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+        expensive = [task for task in ordered if task[1] == "claude-3-opus"]
+
+        assert planner.try_reserve(*expensive[0])
+        # 1件目を確定する前は2件目の予算が足りない
+        assert not planner.try_reserve(*expensive[1])
+        assert planner.remaining == pytest.approx(10.0)
+
+        planner.settle(*expensive[0], 20.0)
+        assert planner.spent == pytest.approx(20.0)
+        assert planner.remaining == pytest.approx(10.0)
+
+    def test_settled_before_admission_not_reserved(self):
+        """グループの受け入れ前に確定したタスク（キャッシュ済みなど）は予約しないテスト"""
+        planner = BudgetPlanner(budget_jpy=30.0)
+        plan, task_costs, page_counts = make_plan(pdf_count=1)
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        # 高いモデルを含むグループの受け入れ前に、他のタスクを0円で確定する
+        planner.settle(*ordered[0], 0.0)
+        assert all(planner.try_reserve(*task) for task in ordered[1:])
+        for task in ordered[1:]:
+            planner.settle(*task, 0.0)
+
+        assert planner.remaining == pytest.approx(30.0)
+
+    def test_group_admitted_together(self):
+        """同じPDFの同じフェーズのタスクはまとめて受け入れるか見送るテスト"""
+        planner = BudgetPlanner(budget_jpy=0.2)
+        plan, task_costs, page_counts = make_plan(pdf_count=3)
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        assert planner.full_models == []
+        results = [(task, planner.try_reserve(*task)) for task in ordered]
+
+        # 1件目のPDFの3モデル（20.6円）は予算を超えるため全て見送る
+        assert all(not admitted for _, admitted in results)
+
+    def test_reorder_does_not_duplicate_group_members(self):
+        """order_tasksを再度呼んでもグループの見積もりが重複しないテスト"""
+        planner = BudgetPlanner(budget_jpy=1.0)
+        plan, task_costs, page_counts = make_plan(pdf_count=1)
+        planner.order_tasks(plan, task_costs, page_counts)
+        ordered = planner.order_tasks(plan, task_costs, page_counts)
+
+        # 全PDFフェーズのグループ（0.6円）は1回分の見積もりで予約される
+        assert planner.try_reserve(*ordered[0])
+        assert planner.remaining == pytest.approx(0.4)
+
+    def test_unpriced_and_unplanned_tasks(self):
+        """価格設定がないタスクは0円、計画外のタスクは予算の対象外になるテスト"""
+        planner = BudgetPlanner(budget_jpy=0.0)
+        pdf_path = Path("contract_000.pdf")
+
+        ordered = planner.order_tasks({pdf_path: ["mock-model"]}, {(pdf_path, "mock-model"): None}, {})
+
+        assert ordered == [(pdf_path, "mock-model")]
+        assert planner.try_reserve(pdf_path, "mock-model")
+        assert planner.try_reserve(Path("other.pdf"), "gpt-4o")
+
+    def test_negative_budget(self):
+        """負の予算でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            BudgetPlanner(budget_jpy=-1.0)
+
+    def test_journal_skipped_state(self, tmp_path):
+        """見送ったタスクは完了済みに含まれないテスト"""
+        journal = TaskJournal(tmp_path / "journal.jsonl")
+        journal.record_state("contract_000", "claude-3-opus", TaskJournal.STATE_SKIPPED)
+        journal.record_state("contract_000", "gpt-4o-mini", TaskJournal.STATE_COMPLETED)
+
+        assert journal.get_completed_tasks() == {("contract_000", "gpt-4o-mini")}
+        journal.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,80 @@
+"""
+カラーモード判定モジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from PIL import Image, ImageDraw
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import ColorModeDetector
+
+
+def make_page(text_color='black', background='white', size=(300, 400)):
+    """文字の行を模した横線を描いたページ画像を作成"""
+    image = Image.new('RGB', size, background)
+    draw = ImageDraw.Draw(image)
+    for top in range(40, size[1] - 40, 20):
+        draw.rectangle([30, top, size[0] - 30, top + 6], fill=text_color)
+    return image
+
+
+class TestColorModeDetector:
+    """ColorModeDetectorクラスのテスト"""
+
+    @pytest.fixture
+    def detector(self):
+        """ColorModeDetectorのインスタンスを返す"""
+        return ColorModeDetector()
+
+    def test_invalid_settings(self):
+        """不正な設定のテスト"""
+        with pytest.raises(ValueError):
+            ColorModeDetector(max_color_ratio=1.5)
+
+    def test_bilevel_page(self, detector):
+        """白黒の文字だけのページは2値と判定されるテスト"""
+        assert detector.select_mode(make_page()) == 'bilevel'
+
+    def test_gray_page(self, detector):
+        """中間の明るさが多いページはグレースケールと判定されるテスト"""
+        page = make_page(background=(200, 200, 200))
+        ImageDraw.Draw(page).rectangle([0, 0, 300, 200], fill=(128, 128, 128))
+
+        assert detector.select_mode(page) == 'gray'
+
+    def test_color_page(self, detector):
+        """色付きの文字があるページはRGBと判定されるテスト"""
+        assert detector.select_mode(make_page(text_color=(200, 30, 30))) == 'rgb'
+
+    def test_statistics(self, detector):
+        """判定したページ数がカラーモードごとに集計されるテスト"""
+        detector.select_mode(make_page())
+        detector.select_mode(make_page())
+        detector.select_mode(make_page(text_color='red'))
+
+        assert detector.get_statistics() == {'bilevel': 2, 'rgb': 1}
+
+    def test_convert(self, detector):
+        """カラーモードへの変換テスト"""
+        page = make_page()
+
+        assert detector.convert(page, 'gray').mode == 'L'
+        bilevel = detector.convert(page, 'bilevel')
+        assert bilevel.mode == '1'
+        assert set(bilevel.convert('L').getextrema()) == {0, 255}
+        assert detector.convert(page, 'rgb') is page
+
+        with pytest.raises(ValueError):
+            detector.convert(page, 'cmyk')
+
+    def test_cache_tag(self, detector):
+        """設定が異なる場合はキャッシュの設定文字列が異なるテスト"""
+        assert detector.cache_tag != ColorModeDetector(bilevel_threshold=128).cache_tag
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -90,6 +90,24 @@ class TestConfigLoader:
         with pytest.raises(FileNotFoundError):
             loader.load_pricing()
 
+    def test_load_rate_limits(self, loader, config_dir):
+        """レート制限設定を読み込むテスト"""
+        rate_limits = {
+            "openai": {
+                "requests_per_minute": 500,
+                "models": {"gpt-4o": {"tokens_per_minute": 30000}}
+            }
+        }
+
+        with open(config_dir / "rate_limits.json", 'w') as f:
+            json.dump(rate_limits, f)
+
+        assert loader.load_rate_limits() == rate_limits
+
+    def test_load_rate_limits_not_found(self, loader):
+        """レート制限設定ファイルが存在しない場合は空の辞書のテスト"""
+        assert loader.load_rate_limits() == {}
+
     def test_load_schema(self, loader, config_dir):
         """スキーマを読み込むテスト"""
         schema = {
@@ -0,0 +1,155 @@
+"""
+コスト見積もりモジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.evaluators import CostCalculator, CostEstimator
+
+
+class TestCostEstimator:
+    """CostEstimatorクラスのテスト"""
+
+    @pytest.fixture
+    def estimator(self):
+        """CostEstimatorのインスタンスを返す"""
+        calculator = CostCalculator({
+            "gpt-4o": {
+                "input_token_price_per_1m": 2.0,
+                "output_token_price_per_1m": 10.0,
+                "currency": "USD",
+                "exchange_rate": 150.0
+            },
+            "custom-model": {
+                "input_token_price_per_1m": 1.0,
+                "output_token_price_per_1m": 1.0,
+                "provider": "gemini"
+            }
+        })
+        return CostEstimator(calculator, dpi=150)
+
+    def test_get_provider(self, estimator):
+        """モデル名・価格設定からプロバイダーを判定するテスト"""
+        assert estimator.get_provider("gpt-4o-mini") == "openai"
+        assert estimator.get_provider("claude-3-opus") == "anthropic"
+        assert estimator.get_provider("gemini-2.5-pro") == "gemini"
+        assert estimator.get_provider("azure-document-intelligence") == "azure"
+        assert estimator.get_provider("custom-model") == "gemini"
+        assert estimator.get_provider("mock-model") is None
+
+    def test_page_size_to_pixels(self, estimator):
+        """A4のページサイズが解像度に応じた画像サイズになるテスト"""
+        assert estimator.page_size_to_pixels(595, 842) == (1240, 1754)
+        assert estimator.page_size_to_pixels(595, 842, dpi=72) == (595, 842)
+
+    def test_openai_image_tokens(self, estimator):
+        """OpenAIのタイル分割によるトークン数のテスト"""
+        assert estimator.estimate_image_tokens("gpt-4o", 1024, 1024) == 765
+        assert estimator.estimate_image_tokens("gpt-4o", 2048, 4096) == 1105
+        assert estimator.estimate_image_tokens("gpt-4o-mini", 1024, 1024) == 2833 + 5667 * 4
+
+    def test_anthropic_image_tokens(self, estimator):
+        """Anthropicのピクセル数によるトークン数のテスト"""
+        assert estimator.estimate_image_tokens("claude-3-opus", 1000, 1000) == 1334
+        # 大きい画像は縮小されるため上限がある
+        assert estimator.estimate_image_tokens("claude-3-opus", 4000, 4000) <= 1534
+
+    def test_gemini_image_tokens(self, estimator):
+        """Geminiのタイル分割によるトークン数のテスト"""
+        assert estimator.estimate_image_tokens("gemini-2.5-pro", 300, 300) == 258
+        assert estimator.estimate_image_tokens("gemini-2.5-pro", 1240, 1754) == 258 * 6
+
+    def test_other_image_tokens(self, estimator):
+        """ページ課金・不明なプロバイダーのトークン数のテスト"""
+        assert estimator.estimate_image_tokens("azure-document-intelligence", 1240, 1754) == 0
+        assert estimator.estimate_image_tokens("mock-model", 1240, 1754) == 1000
+
+    def test_estimate_text_tokens(self, estimator):
+        """テキストのトークン数の推定テスト"""
+        assert estimator.estimate_text_tokens("") == 0
+        assert estimator.estimate_text_tokens("abcd") == 1
+        assert estimator.estimate_text_tokens("abcd契約") == 3
+
+    def test_estimate_output_tokens(self, estimator):
+        """スキーマの項目数から出力トークン数を推定するテスト"""
+        schema = {
+            'type': 'object',
+            'properties': {
+                'rent': {'type': 'integer'},
+                'parties': {'properties': {'lessor': {}, 'lessee': {}}},
+                'items': {'type': 'array', 'items': {'properties': {'name': {}}}}
+            }
+        }
+
+        assert estimator.estimate_output_tokens(schema) == 4 * 30
+        assert estimator.estimate_output_tokens(None) == 500
+
+    def test_estimate_request(self, estimator):
+        """1リクエストの見積もりテスト"""
+        estimate = estimator.estimate_request("gpt-4o", [(1024, 1024)] * 2, system_prompt="abcd")
+
+        assert estimate['pages'] == 2
+        assert estimate['image_tokens'] == 765 * 2
+        assert estimate['input_tokens'] == 765 * 2 + 1
+        assert estimate['output_tokens'] == 500
+        assert estimate['cost_jpy'] == pytest.approx(
+            (1531 / 1_000_000 * 2.0 + 500 / 1_000_000 * 10.0) * 150.0
+        )
+        assert estimator.estimate_request("mock-model", [(1024, 1024)])['cost_jpy'] is None
+
+    def test_estimate_run(self, estimator):
+        """実行全体の見積もりがモデルごとに集計されるテスト"""
+        tasks = [
+            ("gpt-4o", [(1024, 1024)]),
+            ("gpt-4o", [(1024, 1024)] * 3),
+            ("mock-model", [(1024, 1024)])
+        ]
+
+        projection = estimator.estimate_run(tasks)
+
+        gpt = projection['models']['gpt-4o']
+        assert gpt['tasks'] == 2
+        assert gpt['pages'] == 4
+        assert gpt['input_tokens'] == 765 * 4
+        assert gpt['output_tokens'] == 1000
+        assert gpt['cost_jpy'] == pytest.approx(
+            (3060 / 1_000_000 * 2.0 + 1000 / 1_000_000 * 10.0) * 150.0
+        )
+        assert projection['models']['mock-model']['cost_jpy'] is None
+        assert projection['unpriced_models'] == ["mock-model"]
+        assert projection['total_tasks'] == 3
+        assert projection['total_cost_jpy'] == pytest.approx(gpt['cost_jpy'])
+
+    def test_estimate_task_costs(self, estimator):
+        """タスクごとの見積もりコストが1リクエストの見積もりと一致するテスト"""
+        tasks = [
+            ("a.pdf", "gpt-4o", [(1024, 1024)]),
+            ("b.pdf", "gpt-4o", [(1024, 1024)] * 3),
+            ("a.pdf", "mock-model", [(1024, 1024)])
+        ]
+
+        costs = estimator.estimate_task_costs(tasks, system_prompt="abcd")
+
+        assert costs[("a.pdf", "gpt-4o")] == pytest.approx(
+            estimator.estimate_request("gpt-4o", [(1024, 1024)], system_prompt="abcd")['cost_jpy']
+        )
+        assert costs[("b.pdf", "gpt-4o")] == pytest.approx(
+            estimator.estimate_request("gpt-4o", [(1024, 1024)] * 3, system_prompt="abcd")['cost_jpy']
+        )
+        assert costs[("a.pdf", "mock-model")] is None
+
+    def test_estimate_run_empty(self, estimator):
+        """タスクがない場合の見積もりテスト"""
+        projection = estimator.estimate_run([])
+
+        assert projection['total_cost_jpy'] == 0.0
+        assert projection['models'] == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
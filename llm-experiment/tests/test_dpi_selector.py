@@ -0,0 +1,131 @@
+"""
+解像度選択モジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from PIL import Image, ImageDraw
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import DPISelector
+from src.processors.dpi_selector import group_page_runs
+
+
+def make_text_page(line_height, width=612, height=792, columns=1):
+    """文字の行を黒い矩形で模したプローブ画像（72DPIのレターサイズ）を作成する"""
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    column_width = (width - 80) // columns
+
+    for column in range(columns):
+        # 段ごとに行の位置をずらす
+        y = 40 + column * line_height // 2
+        while y + line_height < height - 40:
+            x = 40 + column * column_width
+            while x + line_height < 40 + (column + 1) * column_width - 10:
+                draw.rectangle([x, y, x + int(line_height * 0.6), y + line_height - 1], fill='black')
+                x += int(line_height * 0.8)
+            y += line_height + max(2, line_height // 3)
+
+    return image
+
+
+class TestDPISelector:
+    """DPISelectorクラスのテスト"""
+
+    @pytest.fixture
+    def selector(self):
+        """DPISelectorのインスタンスを返す"""
+        return DPISelector(dpi_steps=(100, 150, 200), probe_dpi=72, target_text_px=20)
+
+    def test_blank_page_uses_min_dpi(self, selector):
+        """空白のページは最小の解像度になるテスト"""
+        assert selector.select_dpi(Image.new('RGB', (612, 792), 'white')) == 100
+
+    def test_cover_page_uses_min_dpi(self, selector):
+        """大きな見出しのみのページは最小の解像度になるテスト"""
+        image = Image.new('RGB', (612, 792), 'white')
+        ImageDraw.Draw(image).rectangle([100, 100, 500, 139], fill='black')
+
+        assert selector.select_dpi(image) == 100
+
+    @pytest.mark.parametrize("line_height, expected_dpi", [
+        (6, 200),    # 6pt: 表の小さい文字
+        (8, 200),
+        (11, 150),   # 11pt: 本文
+        (16, 100),   # 16pt以上: 見出し
+        (30, 100),
+    ])
+    def test_text_size_selects_dpi(self, selector, line_height, expected_dpi):
+        """文字の行の高さから判読できる最小の解像度を選ぶテスト"""
+        image = make_text_page(line_height)
+
+        analysis = selector.analyze_page(image)
+        assert analysis['text_height_pt'] == pytest.approx(line_height, abs=1)
+        assert selector.select_dpi(image) == expected_dpi
+
+    def test_multi_column_lines_not_merged(self, selector):
+        """段組みで行の位置がずれていても行が結合されないテスト"""
+        image = make_text_page(8, columns=2)
+
+        assert selector.analyze_page(image)['text_height_pt'] == pytest.approx(8, abs=1)
+
+    def test_figure_only_page_uses_max_dpi(self, selector):
+        """文字の行を検出できない図のみのページは最大の解像度になるテスト"""
+        image = Image.new('RGB', (612, 792), 'white')
+        ImageDraw.Draw(image).ellipse([100, 100, 500, 500], fill=(90, 90, 90))
+
+        analysis = selector.analyze_page(image)
+        assert analysis['text_height_pt'] is None
+        assert selector.select_dpi(image) == 200
+
+    def test_probe_dpi_scales_text_height(self):
+        """プローブの解像度に応じて行の高さをポイントに換算するテスト"""
+        selector = DPISelector(probe_dpi=144)
+
+        # 144DPIで16ピクセル = 8pt
+        assert selector.analyze_page(make_text_page(16))['text_height_pt'] == pytest.approx(8, abs=0.5)
+
+    def test_select_page_dpis_statistics(self, selector):
+        """ページごとの解像度と統計のテスト"""
+        pages = [Image.new('RGB', (612, 792), 'white'), make_text_page(6), make_text_page(11)]
+
+        assert selector.select_page_dpis(pages) == [100, 200, 150]
+        assert selector.get_statistics() == {100: 1, 150: 1, 200: 1}
+
+    def test_cache_tag_reflects_settings(self, selector):
+        """設定が異なる場合はキャッシュのタグが異なるテスト"""
+        assert selector.cache_tag != DPISelector(dpi_steps=(100, 200)).cache_tag
+        assert selector.cache_tag == DPISelector().cache_tag
+        assert (selector.min_dpi, selector.max_dpi) == (100, 200)
+
+    def test_invalid_settings(self):
+        """不正な設定でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            DPISelector(dpi_steps=())
+        with pytest.raises(ValueError):
+            DPISelector(probe_dpi=0)
+        with pytest.raises(ValueError):
+            DPISelector(target_text_px=0)
+
+
+class TestGroupPageRuns:
+    """group_page_runs関数のテスト"""
+
+    def test_groups_consecutive_pages(self):
+        """同じ解像度が続くページをまとめるテスト"""
+        assert group_page_runs([100, 100, 200, 200, 200, 100]) == [
+            (100, 1, 2), (200, 3, 5), (100, 6, 6)
+        ]
+
+    def test_first_page_offset(self):
+        """開始ページを指定した場合のテスト"""
+        assert group_page_runs([150, 150], first_page=3) == [(150, 3, 4)]
+        assert group_page_runs([]) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,64 @@
+"""
+エンコード済みページモジュールのテスト
+"""
+
+import pytest
+import base64
+import io
+from pathlib import Path
+import sys
+from PIL import Image
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import EncodedPage
+
+
+class TestEncodedPage:
+    """EncodedPageクラスのテスト"""
+
+    @pytest.fixture
+    def jpeg_bytes(self):
+        """テスト用のJPEGのバイト列を返す"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (40, 30), color='white').save(buffer, format='JPEG')
+        return buffer.getvalue()
+
+    def test_from_bytes(self, jpeg_bytes):
+        """バイト列のヘッダーからフォーマットと画像サイズを取得するテスト"""
+        page = EncodedPage.from_bytes(jpeg_bytes)
+
+        assert page.format == 'JPEG'
+        assert page.mime_type == 'image/jpeg'
+        assert page.size == (40, 30)
+        assert page.size_bytes == len(jpeg_bytes)
+
+    def test_view_shares_bytes(self, jpeg_bytes):
+        """memoryviewがバイト列をコピーせずに参照するテスト"""
+        page = EncodedPage(jpeg_bytes, 'jpeg', 40, 30)
+
+        assert page.view.obj is jpeg_bytes
+        assert page.view.nbytes == len(jpeg_bytes)
+
+    def test_to_base64(self, jpeg_bytes):
+        """Base64・data URLへの変換テスト"""
+        page = EncodedPage(jpeg_bytes, 'JPEG', 40, 30)
+        expected = base64.b64encode(jpeg_bytes).decode('ascii')
+
+        assert page.to_base64() == expected
+        assert page.to_data_url() == f"data:image/jpeg;base64,{expected}"
+
+    def test_to_image(self, jpeg_bytes):
+        """PIL Imageへのデコードテスト"""
+        image = EncodedPage(jpeg_bytes, 'JPEG', 40, 30).to_image()
+
+        assert image.size == (40, 30)
+
+    def test_unknown_format_mime_type(self):
+        """MIMEタイプの表にないフォーマットのテスト"""
+        assert EncodedPage(b"", 'BMP', 1, 1).mime_type == 'image/bmp'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
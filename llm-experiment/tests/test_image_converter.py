@@ -3,16 +3,20 @@
 """
 
 import pytest
+import base64
+import io
 import os
 import tempfile
 from pathlib import Path
 import sys
-from PIL import Image
+from unittest.mock import patch
+from PIL import Image, ImageDraw
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.processors import ImageConverter
+from src.processors import DPISelector, EncodedPage, ImageConverter, RenderProfile
+from src.utils import StageTimer
 
 
 class TestImageConverter:
@@ -45,6 +49,153 @@ class TestImageConverter:
         assert converter.format == 'PNG'
         assert converter.max_size_mb == 5.0
 
+    def test_invalid_render_workers(self):
+        """不正な変換並列数のテスト"""
+        with pytest.raises(ValueError):
+            ImageConverter(render_workers=0)
+
+    def test_pdf_to_images_parallel_render(self):
+        """並列変換時にpdf2imageへ並列数が渡されるテスト"""
+        converter = ImageConverter(dpi=150, render_workers=4)
+        pages = [Image.new('RGB', (10, 10)) for _ in range(8)]
+
+        with patch('pdf2image.convert_from_path', return_value=pages) as mock_convert:
+            images = converter.pdf_to_images("contract.pdf")
+
+        assert images == pages
+        assert mock_convert.call_args.kwargs['thread_count'] == 4
+        assert mock_convert.call_args.kwargs['dpi'] == 150
+
+    def test_pdf_to_images_adaptive(self):
+        """プローブ画像から選んだ解像度で、同じ解像度が続くページをまとめて変換するテスト"""
+        converter = ImageConverter(dpi=150)
+        selector = DPISelector(dpi_steps=(100, 200), probe_dpi=72)
+        blank = Image.new('RGB', (612, 792), 'white')
+        figure = Image.new('RGB', (612, 792), 'white')
+        ImageDraw.Draw(figure).ellipse([100, 100, 500, 500], fill='black')
+        probe = [blank, blank, figure]
+
+        def convert(pdf_path, dpi, first_page=None, last_page=None, **kwargs):
+            if dpi == 72:
+                return probe[(first_page or 1) - 1:last_page]
+            return [Image.new('RGB', (dpi, dpi)) for _ in range(first_page, last_page + 1)]
+
+        with patch('pdf2image.convert_from_path', side_effect=convert) as mock_convert:
+            images = converter.pdf_to_images_adaptive("contract.pdf", selector)
+
+        assert [image.size for image in images] == [(100, 100), (100, 100), (200, 200)]
+        calls = [(call.kwargs['dpi'], call.kwargs['first_page'], call.kwargs['last_page'])
+                 for call in mock_convert.call_args_list]
+        assert calls == [(72, None, None), (100, 1, 2), (200, 3, 3)]
+
+    def test_pdf_to_images_for_profile(self):
+        """上限を超えるページだけ解像度を下げ、同じ解像度が続くページをまとめて変換するテスト"""
+        converter = ImageConverter(dpi=150)
+        profile = RenderProfile("test", max_side=1800)
+        page_sizes = [(595, 842), (595, 842), (1440, 720)]
+
+        def convert(pdf_path, dpi, first_page=None, last_page=None, **kwargs):
+            return [Image.new('RGB', (dpi, dpi)) for _ in range(first_page, last_page + 1)]
+
+        with patch('pdf2image.convert_from_path', side_effect=convert) as mock_convert:
+            images = converter.pdf_to_images_for_profile("contract.pdf", profile, page_sizes)
+
+        assert [image.size for image in images] == [(150, 150), (150, 150), (90, 90)]
+        calls = [(call.kwargs['dpi'], call.kwargs['first_page'], call.kwargs['last_page'])
+                 for call in mock_convert.call_args_list]
+        assert calls == [(150, 1, 2), (90, 3, 3)]
+
+    def test_color_mode_gray_renders_grayscale(self):
+        """グレースケールではpopplerでグレースケールで変換されるテスト"""
+        converter = ImageConverter(dpi=150, color_mode='gray')
+
+        with patch('pdf2image.convert_from_path', return_value=[Image.new('L', (10, 10))]) as mock_convert:
+            images = converter.pdf_to_images("contract.pdf")
+
+        assert mock_convert.call_args.kwargs['grayscale'] is True
+        assert images[0].mode == 'L'
+
+    def test_color_mode_bilevel(self):
+        """2値では1bitの画像になり、PNG・JPEGでエンコードできるテスト"""
+        converter = ImageConverter(dpi=150, color_mode='bilevel')
+        page = Image.new('L', (200, 200), 255)
+        ImageDraw.Draw(page).rectangle([20, 20, 180, 40], fill=0)
+
+        with patch('pdf2image.convert_from_path', return_value=[page]):
+            image = converter.pdf_to_images("contract.pdf")[0]
+
+        assert image.mode == '1'
+        png = converter._encode_bytes(image, 'PNG', 85)
+        assert len(png) < len(converter._encode_bytes(page.convert('RGB'), 'PNG', 85))
+        assert Image.open(io.BytesIO(converter._encode_bytes(image, 'JPEG', 85))).mode == 'L'
+
+    def test_color_mode_auto(self):
+        """autoではページごとに判定して変換されるテスト"""
+        converter = ImageConverter(dpi=150, color_mode='auto')
+        color_page = Image.new('RGB', (50, 50), (200, 30, 30))
+        mono_page = Image.new('RGB', (50, 50), 'white')
+
+        with patch('pdf2image.convert_from_path', return_value=[color_page, mono_page]) as mock_convert:
+            images = converter.pdf_to_images("contract.pdf")
+
+        assert mock_convert.call_args.kwargs['grayscale'] is False
+        assert [image.mode for image in images] == ['RGB', '1']
+        assert converter.color_detector.get_statistics() == {'rgb': 1, 'bilevel': 1}
+
+    def test_invalid_color_mode(self):
+        """不正なカラーモードのテスト"""
+        with pytest.raises(ValueError):
+            ImageConverter(color_mode='cmyk')
+
+    def test_iter_pages_renders_in_chunks(self, tmp_path):
+        """ページがrender_workersページずつ変換されるテスト"""
+        pdf_path = tmp_path / "contract.pdf"
+        pdf_path.write_bytes(b'%PDF-1.4 dummy')
+        converter = ImageConverter(dpi=150, render_workers=2)
+
+        def convert(pdf_path, first_page=None, last_page=None, **kwargs):
+            return [Image.new('RGB', (10, 10)) for _ in range(first_page, last_page + 1)]
+
+        with patch('pdf2image.convert_from_path', side_effect=convert) as mock_convert, \
+                patch('pdf2image.pdfinfo_from_path', return_value={'Pages': 5}):
+            pages = converter.iter_pages(str(pdf_path))
+            first = next(pages)
+            # 最初のページを取得した時点では最初の2ページ分だけ変換されている
+            assert mock_convert.call_count == 1
+            assert isinstance(first, Image.Image)
+            assert len(list(pages)) == 4
+
+        ranges = [(c.kwargs['first_page'], c.kwargs['last_page']) for c in mock_convert.call_args_list]
+        assert ranges == [(1, 2), (3, 4), (5, 5)]
+
+    def test_iter_base64_images(self, tmp_path):
+        """Base64画像を1ページずつ返すテスト"""
+        pdf_path = tmp_path / "contract.pdf"
+        pdf_path.write_bytes(b'%PDF-1.4 dummy')
+        converter = ImageConverter(dpi=150)
+
+        def convert(pdf_path, first_page=None, last_page=None, **kwargs):
+            return [Image.new('RGB', (10, 10)) for _ in range(first_page, last_page + 1)]
+
+        with patch('pdf2image.convert_from_path', side_effect=convert):
+            encoded = list(converter.iter_base64_images(str(pdf_path), page_count=3))
+
+        assert len(encoded) == 3
+        assert all(isinstance(e, str) and len(e) > 0 for e in encoded)
+
+    def test_iter_base64_images_records_stages(self, tmp_path):
+        """変換・最適化・エンコードの所要時間がステージごとに記録されるテスト"""
+        pdf_path = tmp_path / "contract.pdf"
+        pdf_path.write_bytes(b'%PDF-1.4 dummy')
+        converter = ImageConverter(dpi=150)
+        timer = StageTimer()
+
+        with patch('pdf2image.convert_from_path', return_value=[Image.new('RGB', (10, 10))]), \
+                timer.activate():
+            list(converter.iter_base64_images(str(pdf_path), page_count=1))
+
+        assert set(timer.get_durations()) == {"rasterize", "optimize", "encode"}
+
     def test_encode_image_base64(self, converter, sample_image):
         """Base64エンコードテスト"""
         encoded = converter.encode_image_base64(sample_image)
@@ -93,6 +244,95 @@ class TestImageConverter:
         assert optimized is not None
         assert optimized.mode == 'RGB'
 
+    @staticmethod
+    def make_noise_image(width, height):
+        """圧縮しにくいテスト用のノイズ画像を作成"""
+        return Image.frombytes('RGB', (width, height), os.urandom(width * height * 3))
+
+    def test_optimize_image_bytes_lowers_quality(self):
+        """品質を下げれば収まる場合は解像度を保つテスト"""
+        converter = ImageConverter(format='JPEG', quality=95, min_quality=20)
+        image = self.make_noise_image(300, 300)
+        full_size = len(converter._encode_bytes(image, 'JPEG', 95))
+        floor_size = len(converter._encode_bytes(image, 'JPEG', 20))
+        max_size_mb = (full_size + floor_size) / 2 / 1024 / 1024
+
+        optimized, data = converter.optimize_image_bytes(image, max_size_mb=max_size_mb)
+
+        assert optimized.size == image.size
+        assert floor_size < len(data) <= max_size_mb * 1024 * 1024
+
+    def test_optimize_image_bytes_scales_down(self):
+        """品質の下限でも収まらない場合は縮小して収めるテスト"""
+        converter = ImageConverter(format='JPEG', quality=85, min_quality=40)
+        image = self.make_noise_image(400, 400)
+
+        optimized, data = converter.optimize_image_bytes(image, max_size_mb=0.02)
+
+        assert len(data) <= 0.02 * 1024 * 1024
+        assert optimized.width < image.width
+        # 返されたバイト列は返された画像をエンコードしたもの
+        assert Image.open(io.BytesIO(data)).size == optimized.size
+
+    def test_optimize_image_bytes_pixel_limit(self):
+        """長辺の上限に合わせて縮小されるテスト"""
+        converter = ImageConverter(format='PNG', max_side=50)
+
+        optimized, data = converter.optimize_image_bytes(Image.new('RGB', (200, 100), color='white'))
+
+        assert optimized.size == (50, 25)
+        assert Image.open(io.BytesIO(data)).size == (50, 25)
+
+    def test_invalid_min_quality(self):
+        """品質の下限が上限より大きい場合のテスト"""
+        with pytest.raises(ValueError):
+            ImageConverter(quality=50, min_quality=60)
+
+    def test_encode_image_base64_bytes(self, converter):
+        """エンコード済みのバイト列は再エンコードせずにBase64エンコードされるテスト"""
+        data = b"encoded image bytes"
+
+        assert converter.encode_image_base64(data) == base64.b64encode(data).decode('utf-8')
+
+    def test_encode_page_uses_optimized_bytes(self):
+        """最適化の探索で得たバイト列がそのままEncodedPageになるテスト"""
+        converter = ImageConverter(format='JPEG', quality=85, min_quality=40, max_size_mb=0.02)
+        image = self.make_noise_image(400, 400)
+
+        with patch.object(converter, 'encode_image_base64') as mock_encode:
+            page = converter.encode_page(image)
+
+        mock_encode.assert_not_called()
+        assert page.mime_type == 'image/jpeg'
+        assert page.size_bytes <= 0.02 * 1024 * 1024
+        assert Image.open(io.BytesIO(page.data)).size == page.size
+
+    def test_get_image_info_encoded_page(self, converter):
+        """EncodedPageの情報は再エンコードせずに取得されるテスト"""
+        page = EncodedPage(b"x" * 2048, 'PNG', 30, 20)
+
+        info = converter.get_image_info(page)
+
+        assert info['width'] == 30
+        assert info['height'] == 20
+        assert info['size_bytes'] == 2048
+
+    def test_iter_encoded_pages(self, tmp_path):
+        """エンコード済みページを1ページずつ返し、Base64版と一致するテスト"""
+        pdf_path = tmp_path / "contract.pdf"
+        pdf_path.write_bytes(b'%PDF-1.4 dummy')
+        converter = ImageConverter(dpi=150)
+
+        def convert(pdf_path, first_page=None, last_page=None, **kwargs):
+            return [Image.new('RGB', (10, 10)) for _ in range(first_page, last_page + 1)]
+
+        with patch('pdf2image.convert_from_path', side_effect=convert):
+            pages = list(converter.iter_encoded_pages(str(pdf_path), page_count=2))
+            encoded = list(converter.iter_base64_images(str(pdf_path), page_count=2))
+
+        assert [page.size for page in pages] == [(10, 10), (10, 10)]
+        assert [page.to_base64() for page in pages] == encoded
+
     def test_save_images(self, converter, sample_image):
         """画像保存テスト"""
         with tempfile.TemporaryDirectory() as tmpdir:
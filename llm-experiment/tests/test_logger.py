@@ -109,6 +109,40 @@ class TestExperimentLogger:
         assert 'model1' in summary['models']
         assert summary['models']['model1']['count'] == 1
 
+    def test_summary_report_joins_first_response(self, logger):
+        """モデル・PDFごとに最初のレスポンスが集計に使用されるテスト"""
+        metrics = {"field_accuracy": 0.8, "f1_score": 0.8, "exact_match": True, "schema_valid": True}
+        logger.log_response("model1", "pdf1", 2.0, {"input_tokens": 1000, "output_tokens": 500}, True)
+        logger.log_response("model1", "pdf1", 9.0, {"input_tokens": 9000, "output_tokens": 900}, True)
+        logger.log_response("model2", "pdf1", 4.0, {"input_tokens": 100, "output_tokens": 50}, True)
+        logger.log_evaluation("model1", "pdf1", metrics, 100.0)
+        logger.log_evaluation("model1", "pdf2", metrics, None)
+        logger.log_evaluation("model2", "pdf1", metrics, 50.0)
+
+        summary = logger.generate_summary_report()
+        model1 = summary['models']['model1']
+
+        assert list(summary['models']) == ['model1', 'model2']
+        assert model1['count'] == 2
+        assert model1['avg_response_time'] == 2.0
+        assert model1['total_tokens'] == 1500
+        assert model1['avg_cost_per_pdf'] == 100.0
+        assert model1['exact_match_rate'] == 1.0
+        assert summary['models']['model2']['total_tokens'] == 150
+        assert logger.get_response_log("model1", "pdf1")['response_time'] == 2.0
+        assert logger.get_response_log("model1", "pdf2") is None
+
+    def test_empty_summary_report(self, logger, capsys):
+        """評価ログがない場合もサマリーを表示できるテスト"""
+        summary = logger.generate_summary_report()
+
+        assert summary['total_evaluations'] == 0
+        assert 'session_end' in summary
+        assert summary['total_errors'] == 0
+
+        logger.print_summary()
+        assert "評価件数: 0" in capsys.readouterr().out
+
     def test_save_to_csv(self):
         """CSV保存のテスト"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -141,5 +175,125 @@ class TestExperimentLogger:
             assert Path(report_path).suffix == '.json'
 
 
+class TestExperimentLoggerStream:
+    """ExperimentLoggerのストリーミングモードのテスト"""
+
+    @pytest.fixture
+    def logger(self, tmp_path):
+        """ストリーミングモードのロガーを返す"""
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", stream=True, flush_every=2)
+        yield logger
+        logger.close()
+
+    def _log_task(self, logger, model, pdf_name, accuracy):
+        """1タスク分のログを記録する"""
+        metrics = {"field_accuracy": accuracy, "f1_score": accuracy, "exact_match": False, "schema_valid": True}
+        logger.log_request(model, pdf_name)
+        logger.log_response(model, pdf_name, 2.0, {"input_tokens": 1000, "output_tokens": 500}, True)
+        logger.log_evaluation(model, pdf_name, metrics, 100.0)
+
+    def test_logs_not_kept_in_memory(self, logger):
+        """ログがメモリに保持されず、集計値のみ保持されるテスト"""
+        for i in range(10):
+            self._log_task(logger, "model1", f"pdf{i}", 0.5)
+
+        assert logger.request_logs == []
+        assert logger.response_logs == []
+        assert logger.evaluation_logs == []
+        assert len(logger._pending_responses) == 0
+
+        stats = logger.get_statistics()
+        assert stats['total_requests'] == 10
+        assert stats['total_evaluations'] == 10
+        assert stats['success_rate'] == 1.0
+
+    def test_partial_results_visible(self, logger):
+        """実行中でもフラッシュ済みの結果をファイルから読めるテスト"""
+        self._log_task(logger, "model1", "pdf1", 0.5)
+        self._log_task(logger, "model1", "pdf2", 0.5)
+
+        # 2件ごとにフラッシュされるため、6件目の記録で評価結果が2件とも書き出される
+        metrics_path = logger.sink.get_path('metrics')
+        lines = metrics_path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 2
+
+    def test_summary_matches_memory_mode(self, logger, tmp_path):
+        """サマリーがメモリモードと同じになるテスト"""
+        memory_logger = ExperimentLogger(log_dir=tmp_path / "memory_logs")
+
+        for target in (logger, memory_logger):
+            self._log_task(target, "model1", "pdf1", 0.8)
+            self._log_task(target, "model1", "pdf2", 0.6)
+            self._log_task(target, "model2", "pdf1", 1.0)
+
+        assert logger.generate_summary_report()['models'] == \
+            memory_logger.generate_summary_report()['models']
+
+    def test_save_to_csv(self, logger, tmp_path):
+        """追記したレコードがCSVに変換されるテスト"""
+        import pandas as pd
+
+        self._log_task(logger, "model1", "pdf1", 0.8)
+        self._log_task(logger, "model2", "pdf1", 0.6)
+
+        csv_path = logger.save_to_csv(tmp_path / "metrics.csv")
+        df = pd.read_csv(csv_path)
+
+        assert len(df) == 2
+        assert list(df['model']) == ["model1", "model2"]
+        assert list(df['total_tokens']) == [1500, 1500]
+
+    def test_pending_responses_bounded(self, tmp_path):
+        """評価されないレスポンスが上限を超えて保持されないテスト"""
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", stream=True, max_pending_responses=5)
+
+        for i in range(20):
+            logger.log_response("model1", f"pdf{i}", 1.0, {"input_tokens": 1, "output_tokens": 1}, True)
+
+        assert len(logger._pending_responses) == 5
+        logger.close()
+
+
+class TestExperimentLoggerParquet:
+    """ExperimentLoggerのParquet出力のテスト"""
+
+    def _log_tasks(self, logger):
+        """2タスク分のログを記録する"""
+        metrics = {
+            "field_accuracy": 0.9, "f1_score": 0.85, "exact_match": False, "schema_valid": True,
+            "statistics": {"total_fields": 10, "correct_fields": 9}
+        }
+        for model in ("model1", "model2"):
+            logger.log_response(model, "pdf1", 2.0, {"input_tokens": 1000, "output_tokens": 500}, True)
+            logger.log_evaluation(model, "pdf1", metrics, 100.0 if model == "model1" else None)
+
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_save_to_parquet(self, tmp_path, stream):
+        """スキーマの型でParquetに保存されるテスト"""
+        pa = pytest.importorskip('pyarrow')
+        pq = pytest.importorskip('pyarrow.parquet')
+
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", stream=stream)
+        self._log_tasks(logger)
+
+        parquet_path = logger.save_to_parquet(row_group_size=1)
+        table = pq.read_table(parquet_path)
+
+        assert table.schema.field('timestamp').type == pa.timestamp('us')
+        assert table.schema.field('total_tokens').type == pa.int64()
+        assert table.schema.field('exact_match').type == pa.bool_()
+        assert pq.ParquetFile(parquet_path).num_row_groups == 2
+        assert table.column('model').to_pylist() == ["model1", "model2"]
+        assert table.column('cost_jpy').to_pylist() == [100.0, None]
+        assert table.column('correct_fields').to_pylist() == [9, 9]
+        logger.close()
+
+    def test_arrow_schema_columns(self):
+        """スキーマの列がCSVの列と一致するテスト"""
+        pytest.importorskip('pyarrow')
+        from src.utils.logger import METRICS_COLUMNS, get_metrics_arrow_schema
+
+        assert get_metrics_arrow_schema().names == [name for name, _ in METRICS_COLUMNS]
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,62 @@
+"""
+メトリクスシンクモジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import MetricsSink
+
+
+class TestMetricsSink:
+    """MetricsSinkクラスのテスト"""
+
+    def test_batched_flush(self, tmp_path):
+        """flush_every件ごとにファイルへ書き出されるテスト"""
+        sink = MetricsSink(tmp_path, "session", flush_every=3)
+        path = sink.get_path('metrics')
+
+        sink.write('metrics', {'model': 'gpt-4o', 'value': 1})
+        sink.write('metrics', {'model': 'gpt-4o', 'value': 2})
+        assert path.read_text(encoding='utf-8') == ""
+
+        sink.write('errors', {'model': 'gpt-4o', 'value': 3})
+        assert len(path.read_text(encoding='utf-8').splitlines()) == 2
+        assert len(sink.get_path('errors').read_text(encoding='utf-8').splitlines()) == 1
+        sink.close()
+
+    def test_read_flushes_buffer(self, tmp_path):
+        """読み込み時にバッファ中のレコードも含まれるテスト"""
+        sink = MetricsSink(tmp_path, "session", flush_every=100)
+        sink.write('metrics', {'model': 'gpt-4o', 'value': 1})
+
+        assert list(sink.read('metrics')) == [{'model': 'gpt-4o', 'value': 1}]
+        sink.close()
+
+    def test_existing_file_truncated(self, tmp_path):
+        """同じセッションIDで作り直すと既存のファイルが空になるテスト"""
+        sink = MetricsSink(tmp_path, "session")
+        sink.write('metrics', {'value': 1})
+        sink.close()
+
+        reopened = MetricsSink(tmp_path, "session")
+        assert list(reopened.read('metrics')) == []
+        reopened.close()
+
+    def test_invalid_kind(self, tmp_path):
+        """不明なレコードの種類・不正な設定でエラーになるテスト"""
+        sink = MetricsSink(tmp_path, "session")
+        with pytest.raises(ValueError):
+            sink.write('unknown', {})
+        sink.close()
+
+        with pytest.raises(ValueError):
+            MetricsSink(tmp_path, "session", flush_every=0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
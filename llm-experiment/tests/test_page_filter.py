@@ -0,0 +1,150 @@
+"""
+ページフィルターモジュールのテスト
+"""
+
+import pytest
+import random
+from pathlib import Path
+import sys
+from PIL import Image, ImageDraw
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import PageFilter
+
+
+def make_page(seed, size=(600, 850), footer=None):
+    """文字の行を模した長さの異なる横線を描いたページ画像を作成（seedごとに異なる内容）"""
+    rng = random.Random(seed)
+    image = Image.new('RGB', size, 'white')
+    draw = ImageDraw.Draw(image)
+    for top in range(60, size[1] - 80, 14):
+        left = 50
+        while left < size[0] - 60:
+            word = rng.randint(8, 40)
+            draw.rectangle([left, top, min(left + word, size[0] - 50), top + 6], fill='black')
+            left += word + rng.randint(4, 12)
+    if footer is not None:
+        # ページ番号を模した小さな印
+        draw.rectangle([size[0] // 2, size[1] - 40, size[0] // 2 + 4 * footer, size[1] - 34], fill='black')
+    return image
+
+
+def make_blank_page(size=(600, 850), noise=0):
+    """空白ページ（noiseを指定した場合は紙のざらつきを模した点を含む）の画像を作成"""
+    image = Image.new('RGB', size, (250, 250, 250))
+    rng = random.Random(0)
+    for _ in range(noise):
+        image.putpixel((rng.randrange(size[0]), rng.randrange(size[1])), (200, 200, 200))
+    return image
+
+
+class TestPageFilter:
+    """PageFilterクラスのテスト"""
+
+    @pytest.fixture
+    def page_filter(self):
+        """PageFilterのインスタンスを返す"""
+        return PageFilter()
+
+    def test_invalid_settings(self):
+        """不正な設定のテスト"""
+        with pytest.raises(ValueError):
+            PageFilter(blank_threshold=-1)
+        with pytest.raises(ValueError):
+            PageFilter(hash_size=1)
+
+    def test_blank_detection(self, page_filter):
+        """ざらつきのある白紙は空白、1行だけのページは空白でないと判定されるテスト"""
+        one_line = make_blank_page()
+        ImageDraw.Draw(one_line).rectangle([50, 400, 250, 408], fill='black')
+
+        assert page_filter.is_blank(make_blank_page())
+        assert page_filter.is_blank(make_blank_page(noise=2000))
+        assert not page_filter.is_blank(one_line)
+        assert not page_filter.is_blank(make_page(1))
+
+    def test_hash_distance(self, page_filter):
+        """同じページのハッシュは一致し、異なるページのハッシュは離れるテスト"""
+        first = page_filter.compute_hash(make_page(1))
+
+        assert page_filter.hash_distance(first, page_filter.compute_hash(make_page(1))) == 0
+        assert page_filter.hash_distance(first, page_filter.compute_hash(make_page(2))) > 0
+
+    def test_filter_pages(self, page_filter):
+        """空白ページと重複ページが元のページ番号とともに除外されるテスト"""
+        pages = [
+            make_page(1, footer=1),
+            make_blank_page(noise=500),
+            make_page(2, footer=3),
+            make_page(1, footer=4),
+            make_page(3, footer=5),
+        ]
+
+        kept, dropped = page_filter.filter_pages(pages)
+
+        assert kept == [pages[0], pages[2], pages[4]]
+        assert dropped == [
+            {'page': 2, 'reason': 'blank'},
+            {'page': 4, 'reason': 'duplicate', 'duplicate_of': 1},
+        ]
+
+    def test_distinct_pages_kept(self, page_filter):
+        """レイアウトが同じでも内容の異なるページは除外されないテスト"""
+        pages = [make_page(seed) for seed in range(6)]
+
+        kept, dropped = page_filter.filter_pages(pages)
+
+        assert kept == pages
+        assert dropped == []
+
+    def test_different_size_not_duplicate(self, page_filter):
+        """大きさの異なるページは重複とみなされないテスト"""
+        pages = [make_page(1), make_page(1).resize((850, 600))]
+
+        kept, _ = page_filter.filter_pages(pages)
+
+        assert len(kept) == 2
+
+    def test_all_blank_keeps_first_page(self, page_filter):
+        """すべて空白の場合は最初のページを残すテスト"""
+        pages = [make_blank_page(), make_blank_page(noise=100)]
+
+        kept, dropped = page_filter.filter_pages(pages)
+
+        assert kept == [pages[0]]
+        assert dropped == [{'page': 2, 'reason': 'blank'}]
+
+    def test_grayscale_and_bilevel_pages(self, page_filter):
+        """グレースケール・2値のページ画像も判定できるテスト"""
+        pages = [make_page(1).convert('L'), make_page(1).convert('1'), Image.new('1', (600, 850), 1)]
+
+        kept, dropped = page_filter.filter_pages(pages)
+
+        assert kept == [pages[0]]
+        assert [entry['reason'] for entry in dropped] == ['duplicate', 'blank']
+
+    def test_statistics(self, page_filter):
+        """ドキュメントごとに除外したページが記録され、同じドキュメントは最後の結果で集計されるテスト"""
+        pages = [make_page(1), make_blank_page(), make_page(1)]
+
+        page_filter.filter_pages(pages, label="a.pdf")
+        page_filter.filter_pages(pages, label="a.pdf")
+        page_filter.filter_pages([make_page(2)], label="b.pdf")
+        page_filter.filter_pages(pages)
+
+        stats = page_filter.get_statistics()
+        assert stats['page_count'] == 4
+        assert stats['blank_count'] == 1
+        assert stats['duplicate_count'] == 1
+        assert list(stats['dropped_pages']) == ["a.pdf"]
+        assert [entry['page'] for entry in stats['dropped_pages']["a.pdf"]] == [2, 3]
+
+    def test_cache_tag(self):
+        """設定が異なる場合はキャッシュタグも異なるテスト"""
+        assert PageFilter().cache_tag != PageFilter(max_pixel_diff=5).cache_tag
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,143 @@
+"""
+ページレンダリングステージモジュールのテスト
+"""
+
+import pytest
+import threading
+from pathlib import Path
+from unittest.mock import patch
+import sys
+from PIL import Image
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import DPISelector, ImageConverter, PageFilter, PageRenderStage, RenderProfile
+
+
+class TestPageRenderStage:
+    """PageRenderStageクラスのテスト"""
+
+    @pytest.fixture
+    def stage(self):
+        """PageRenderStageのインスタンスを返す"""
+        return PageRenderStage(ImageConverter(dpi=150, format='PNG'))
+
+    @pytest.fixture
+    def pdf_paths(self, tmp_path):
+        """内容の異なるダミーPDFを2つ作成"""
+        paths = []
+        for i in range(2):
+            path = tmp_path / f"contract_{i}.pdf"
+            path.write_bytes(b'%PDF-1.4 dummy ' + str(i).encode())
+            paths.append(path)
+        return paths
+
+    @pytest.fixture
+    def mock_convert(self):
+        """pdf2image.convert_from_pathをモック化"""
+        with patch('pdf2image.convert_from_path') as mock:
+            mock.side_effect = lambda *args, **kwargs: [Image.new('RGB', (10, 10))]
+            yield mock
+
+    def test_render_once_per_pdf(self, stage, pdf_paths, mock_convert):
+        """同じPDFは1回だけ変換されるテスト"""
+        first = stage.get_images(pdf_paths[0])
+        second = stage.get_images(pdf_paths[0])
+
+        assert first is second
+        assert mock_convert.call_count == 1
+
+        stats = stage.get_statistics()
+        assert stats['render_count'] == 1
+        assert stats['hit_count'] == 1
+
+    def test_key_includes_dpi(self, stage, pdf_paths, mock_convert):
+        """DPIが異なる場合は別々に変換されるテスト"""
+        stage.get_images(pdf_paths[0], dpi=100)
+        stage.get_images(pdf_paths[0], dpi=200)
+
+        assert mock_convert.call_count == 2
+
+    def test_adaptive_images_shared(self, stage, pdf_paths, mock_convert):
+        """ページごとに解像度を選ぶ変換結果も共有され、固定の解像度とは別に変換されるテスト"""
+        selector = DPISelector()
+
+        first = stage.get_adaptive_images(pdf_paths[0], selector)
+        second = stage.get_adaptive_images(pdf_paths[0], selector)
+        stage.get_images(pdf_paths[0])
+
+        assert first is second
+        # プローブ + 選んだ解像度での変換 + 固定の解像度での変換
+        assert mock_convert.call_count == 3
+        assert stage.get_statistics()['cached_entries'] == 2
+
+    def test_profile_images(self, stage, pdf_paths, mock_convert):
+        """画像サイズの上限に合わせた解像度で変換され、上限が同じ場合は共有されるテスト"""
+        profile = RenderProfile.for_provider("anthropic")
+
+        with patch.object(stage, 'get_page_sizes', return_value=[(595, 842)]):
+            first = stage.get_images(pdf_paths[0], render_profile=profile)
+            second = stage.get_images(pdf_paths[0], render_profile=RenderProfile.for_provider("anthropic"))
+            stage.get_images(pdf_paths[0])
+
+        assert first is second
+        assert [call.kwargs['dpi'] for call in mock_convert.call_args_list] == [109, 150]
+
+    def test_same_content_shares_render(self, stage, pdf_paths, tmp_path, mock_convert):
+        """内容が同じPDFは別パスでも共有されるテスト"""
+        copy_path = tmp_path / "copy.pdf"
+        copy_path.write_bytes(pdf_paths[0].read_bytes())
+
+        stage.get_images(pdf_paths[0])
+        stage.get_images(copy_path)
+
+        assert mock_convert.call_count == 1
+
+    def test_release(self, stage, pdf_paths, mock_convert):
+        """解放後は再変換されるテスト"""
+        stage.get_images(pdf_paths[0])
+        stage.release(pdf_paths[0])
+        assert stage.get_statistics()['cached_entries'] == 0
+
+        stage.get_images(pdf_paths[0])
+        assert mock_convert.call_count == 2
+
+    def test_page_filter(self, pdf_paths):
+        """PageFilterを指定した場合は空白ページを除外した結果が共有されるテスト"""
+        page = Image.new('RGB', (100, 140), 'white')
+        for top in range(10, 130, 8):
+            page.paste((0, 0, 0), (10, top, 10 + top % 80, top + 3))
+        blank = Image.new('RGB', (100, 140), 'white')
+
+        stage = PageRenderStage(ImageConverter(dpi=150, format='PNG'), page_filter=PageFilter())
+        with patch('pdf2image.convert_from_path', return_value=[blank, page]) as mock:
+            first = stage.get_images(pdf_paths[0])
+            second = stage.get_images(pdf_paths[0])
+
+        assert first == [page]
+        assert first is second
+        assert mock.call_count == 1
+        assert stage.page_filter.get_statistics()['dropped_pages'] == {
+            pdf_paths[0].name: [{'page': 1, 'reason': 'blank'}]
+        }
+
+    def test_concurrent_access(self, stage, pdf_paths, mock_convert):
+        """複数スレッドから同時に要求しても変換は1回のテスト"""
+        results = []
+
+        def worker():
+            results.append(stage.get_images(pdf_paths[1]))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_convert.call_count == 1
+        assert all(images is results[0] for images in results)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
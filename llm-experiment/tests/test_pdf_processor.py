@@ -7,11 +7,23 @@ import os
 import tempfile
 from pathlib import Path
 import sys
+from unittest.mock import patch
+import PyPDF2
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.processors import PDFProcessor
+from src.processors import PDFProcessor, PDFDocument, compute_file_hash
+
+
+def create_blank_pdf(path: Path, page_count: int = 2) -> str:
+    """テスト用の白紙PDFを作成する"""
+    writer = PyPDF2.PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=595, height=842)
+    with open(path, 'wb') as f:
+        writer.write(f)
+    return str(path)
 
 
 class TestPDFProcessor:
@@ -74,6 +86,21 @@ class TestPDFProcessor:
         with pytest.raises(FileNotFoundError):
             processor.load_pdf("nonexistent.pdf")
 
+    def test_compute_file_hash(self):
+        """ファイルハッシュ計算テスト"""
+        import hashlib
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp.write(b"%PDF-1.4 test")
+            tmp_path = tmp.name
+
+        try:
+            expected = hashlib.sha256(b"%PDF-1.4 test").hexdigest()
+            assert compute_file_hash(tmp_path) == expected
+            assert compute_file_hash(tmp_path, chunk_size=3) == expected
+        finally:
+            os.unlink(tmp_path)
+
     def test_get_page_count_no_pdf_loaded(self, processor):
         """PDFが読み込まれていない状態でのページ数取得テスト"""
         with pytest.raises(ValueError):
@@ -141,5 +168,83 @@ class TestPDFProcessor:
             assert len(text) > 0
 
 
+
+class TestPDFDocument:
+    """PDFDocumentクラスのテスト"""
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        """3ページの白紙PDFを作成"""
+        return create_blank_pdf(tmp_path / "contract.pdf", page_count=3)
+
+    def test_document_properties(self, pdf_path):
+        """ページ数・ハッシュ・メタデータの取得テスト"""
+        with PDFDocument(pdf_path) as document:
+            assert document.page_count == 3
+            assert document.is_encrypted is False
+            assert document.sha256 == compute_file_hash(pdf_path)
+
+            metadata = document.get_metadata()
+            assert metadata['page_count'] == 3
+            assert metadata['file_name'] == "contract.pdf"
+            assert metadata['file_size'] == os.path.getsize(pdf_path)
+
+        assert document.is_closed
+
+    def test_get_page_sizes(self, tmp_path):
+        """ページサイズが回転を反映して取得できるテスト"""
+        writer = PyPDF2.PdfWriter()
+        writer.add_blank_page(width=595, height=842)
+        writer.add_blank_page(width=595, height=842)
+        writer.pages[1].rotate(90)
+        path = tmp_path / "rotated.pdf"
+        with open(path, 'wb') as f:
+            writer.write(f)
+
+        assert PDFProcessor().get_page_sizes(str(path)) == [(595.0, 842.0), (842.0, 595.0)]
+
+    def test_document_validate(self, pdf_path, tmp_path):
+        """検証テスト"""
+        assert PDFDocument(pdf_path).validate() == (True, None)
+
+        is_valid, error_msg = PDFDocument(tmp_path / "missing.pdf").validate()
+        assert is_valid is False
+        assert "存在しません" in error_msg
+
+    def test_closed_document(self, pdf_path):
+        """閉じたハンドルへのアクセスはエラーになるテスト"""
+        document = PDFDocument(pdf_path)
+        document.close()
+
+        with pytest.raises(ValueError):
+            document.data
+
+    def test_processor_parses_open_document_once(self, pdf_path):
+        """open_document中は1回のパースで全情報を取得するテスト"""
+        processor = PDFProcessor()
+        document = processor.open_document(pdf_path)
+        assert processor.open_document(pdf_path) is document
+
+        with patch('PyPDF2.PdfReader', wraps=PyPDF2.PdfReader) as mock_reader:
+            assert processor.validate_pdf(pdf_path) == (True, None)
+            assert processor.get_page_count(pdf_path) == 3
+            assert processor.get_pdf_metadata(pdf_path)['page_count'] == 3
+            assert len(processor.get_page_sizes(pdf_path)) == 3
+            assert "--- Page 1 ---" in processor.extract_text(pdf_path)
+
+        assert mock_reader.call_count == 1
+
+        processor.close_document(pdf_path)
+        assert document.is_closed
+
+    def test_processor_without_open_document(self, pdf_path):
+        """open_documentなしでも従来通り動作するテスト"""
+        processor = PDFProcessor()
+
+        assert processor.validate_pdf(pdf_path) == (True, None)
+        assert processor.get_page_count(pdf_path) == 3
+        assert processor._documents == {}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
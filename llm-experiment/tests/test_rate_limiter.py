@@ -0,0 +1,399 @@
+"""
+レート制限モジュールのテスト
+"""
+
+import pytest
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api_clients import BaseLLMClient, GPTClient, RateLimiter, RateLimiterRegistry, RetryPolicy
+from src.api_clients.rate_limiter import TokenBucket
+from src.utils import StageTimer
+
+
+class HTTPError(Exception):
+    """ステータスコードを持つSDK例外の代替"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestTokenBucket:
+    """TokenBucketクラスのテスト"""
+
+    def test_reserve_within_capacity(self):
+        """容量内の予約は待機なしのテスト"""
+        bucket = TokenBucket(capacity=10, refill_per_second=1)
+
+        assert bucket.reserve(4) == 0.0
+        assert bucket.reserve(6) == 0.0
+
+    def test_reserve_over_capacity_waits(self):
+        """残量不足の場合は補充までの待機時間を返すテスト"""
+        bucket = TokenBucket(capacity=10, refill_per_second=2)
+        bucket.reserve(10)
+
+        assert bucket.reserve(4) == pytest.approx(2.0, abs=0.05)
+        # 予約済みの不足分の後ろに並ぶ
+        assert bucket.reserve(2) == pytest.approx(3.0, abs=0.05)
+
+    def test_amount_capped_at_capacity(self):
+        """容量を超える量は容量に切り詰められるテスト"""
+        bucket = TokenBucket(capacity=10, refill_per_second=1)
+
+        assert bucket.reserve(100) == 0.0
+
+    def test_adjust(self):
+        """残量の補正テスト"""
+        bucket = TokenBucket(capacity=10, refill_per_second=0.001)
+        bucket.reserve(8)
+
+        bucket.adjust(5)
+        assert bucket.get_available() == pytest.approx(7.0, abs=0.01)
+
+        # 容量を超えて返却されない
+        bucket.adjust(100)
+        assert bucket.get_available() == pytest.approx(10.0)
+
+    def test_invalid_settings(self):
+        """不正な設定でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=0, refill_per_second=1)
+
+
+class TestRateLimiter:
+    """RateLimiterクラスのテスト"""
+
+    def test_requests_per_minute(self):
+        """リクエスト数/分の制限テスト"""
+        limiter = RateLimiter(requests_per_minute=2)
+
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(30.0, abs=0.1)
+
+    def test_tokens_per_minute(self):
+        """トークン数/分の制限テスト"""
+        limiter = RateLimiter(tokens_per_minute=6000)
+
+        assert limiter.reserve(tokens=6000) == 0.0
+        assert limiter.reserve(tokens=1000) == pytest.approx(10.0, abs=0.1)
+
+    def test_record_usage_returns_unused_tokens(self):
+        """推定より少なかった分が返却されるテスト"""
+        limiter = RateLimiter(tokens_per_minute=6000)
+
+        limiter.reserve(tokens=6000)
+        limiter.record_usage(reserved_tokens=6000, actual_tokens=1000)
+
+        assert limiter.reserve(tokens=5000) == 0.0
+
+    def test_release(self):
+        """返却したリクエストとトークンが再び使用できるテスト"""
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=6000)
+
+        assert limiter.reserve(tokens=6000) == 0.0
+        limiter.release(tokens=6000)
+
+        assert limiter.reserve(tokens=6000) == 0.0
+
+
+class TestRateLimiterRegistry:
+    """RateLimiterRegistryクラスのテスト"""
+
+    @pytest.fixture
+    def registry(self):
+        """レート制限を設定したレジストリを返す"""
+        return RateLimiterRegistry({
+            'openai': {
+                'requests_per_minute': 100,
+                'models': {
+                    'gpt-4o': {'tokens_per_minute': 30000}
+                },
+                'note': 'テスト'
+            }
+        })
+
+    def test_get_limiters(self, registry):
+        """プロバイダーとモデルの制限が取得されるテスト"""
+        assert len(registry.get_limiters('openai', 'gpt-4o')) == 2
+        assert len(registry.get_limiters('openai', 'gpt-4o-mini')) == 1
+        assert registry.get_limiters('anthropic', 'claude-3.5-sonnet') == []
+
+    def test_limiters_shared(self, registry):
+        """同じプロバイダーの制限は共有されるテスト"""
+        provider_limiter = registry.get_limiters('openai', 'gpt-4o')[0]
+
+        assert registry.get_limiters('openai', 'gpt-4o-mini')[0] is provider_limiter
+        assert registry.get_limiters('openai', 'gpt-4o')[0] is provider_limiter
+
+    @patch('time.sleep')
+    def test_acquire_waits(self, mock_sleep):
+        """制限を超えた場合に待機するテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 1}})
+
+        assert registry.acquire('openai', 'gpt-4o') == 0.0
+        wait_time = registry.acquire('openai', 'gpt-4o')
+
+        assert wait_time == pytest.approx(60.0, abs=0.1)
+        mock_sleep.assert_called_once()
+        assert registry.get_statistics()['wait_count'] == 1
+
+    def test_acquire_async(self):
+        """非同期版ではasyncio.sleepで待機するテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 1}})
+
+        async def acquire_twice():
+            await registry.acquire_async('openai', 'gpt-4o')
+            return await registry.acquire_async('openai', 'gpt-4o')
+
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                patch('time.sleep') as mock_time_sleep:
+            wait_time = asyncio.run(acquire_twice())
+
+        assert wait_time == pytest.approx(60.0, abs=0.1)
+        mock_sleep.assert_called_once()
+        mock_time_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_acquire_without_limits(self, mock_sleep):
+        """制限がない場合は待機しないテスト"""
+        registry = RateLimiterRegistry()
+
+        for _ in range(100):
+            registry.acquire('openai', 'gpt-4o', tokens=100000)
+
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_concurrent_acquire(self, mock_sleep):
+        """複数スレッドから同時に確保しても制限を超えないテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 10}})
+        waits = []
+
+        def worker():
+            waits.append(registry.acquire('openai', 'gpt-4o'))
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 10件は即時、残り10件は順番に待機する
+        assert sum(1 for wait in waits if wait == 0.0) == 10
+        assert max(waits) == pytest.approx(60.0, abs=0.5)
+
+
+class TestClientRateLimit:
+    """クライアントのレート制限連携のテスト"""
+
+    @patch('time.sleep')
+    def test_clients_share_registry(self, mock_sleep):
+        """複数のクライアントが同じバケットから消費するテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 1}})
+        clients = [
+            GPTClient("test_key", rate_limiter=registry),
+            GPTClient("test_key", model_name="gpt-4o-mini", rate_limiter=registry)
+        ]
+
+        for client in clients:
+            client._retry_with_backoff(lambda: "ok")
+
+        assert mock_sleep.call_count == 1
+
+    def test_record_token_usage(self):
+        """トークン使用量が記録され、レート制限に反映されるテスト"""
+        registry = RateLimiterRegistry({'openai': {'tokens_per_minute': 6000}})
+        client = GPTClient("test_key", rate_limiter=registry)
+
+        client._retry_with_backoff(lambda: "ok", estimated_tokens=6000)
+        client._record_token_usage(800, 200, estimated_tokens=6000)
+
+        assert client.get_token_usage() == {'input_tokens': 800, 'output_tokens': 200}
+        assert registry.get_limiters('openai', 'gpt-4o')[0].reserve(tokens=5000) == 0.0
+
+    @patch('time.sleep')
+    def test_throttled_attempts_not_charged(self, mock_sleep):
+        """プロバイダーがレート制限で受け付けなかった試行はバケットを消費しないテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 2}})
+        client = GPTClient("test_key", rate_limiter=registry, retry_policy=RetryPolicy(max_attempts=5))
+        calls = []
+
+        def throttled_twice():
+            calls.append(1)
+            if len(calls) <= 2:
+                raise HTTPError(429)
+            return "ok"
+
+        assert client._retry_with_backoff(throttled_twice) == "ok"
+        # 成功した1回分のみ消費しているため、もう1回は待機なしで実行できる
+        assert registry.get_limiters('openai', 'gpt-4o')[0].reserve() == 0.0
+
+    @patch('time.sleep')
+    def test_server_error_attempts_charged(self, mock_sleep):
+        """レート制限以外で失敗した試行はバケットを消費するテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 2}})
+        client = GPTClient("test_key", rate_limiter=registry, retry_policy=RetryPolicy(max_attempts=5))
+        calls = []
+
+        def failing_once():
+            calls.append(1)
+            if len(calls) == 1:
+                raise HTTPError(503)
+            return "ok"
+
+        assert client._retry_with_backoff(failing_once) == "ok"
+        assert registry.get_limiters('openai', 'gpt-4o')[0].reserve() > 0.0
+
+    @patch('time.sleep')
+    def test_stage_spans(self, mock_sleep):
+        """API呼び出しとJSON抽出の所要時間がステージとして記録されるテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 1}})
+        client = GPTClient("test_key", rate_limiter=registry)
+        timer = StageTimer()
+
+        with timer.activate():
+            client._retry_with_backoff(lambda: "ok")
+            client._retry_with_backoff(lambda: "ok")
+            client._extract_json_from_response('{"rent": 100000}')
+
+        durations = timer.get_durations()
+        assert set(durations) == {"network", "parse"}
+        # レート制限の待機はnetworkに含まれない
+        assert mock_sleep.call_count == 1
+        assert durations["network"] < 1.0
+
+
+class TestClientAsync:
+    """クライアントの非同期インターフェースのテスト"""
+
+    class SyncOnlyClient(BaseLLMClient):
+        """同期版のみ実装したクライアント"""
+
+        provider = "openai"
+
+        def extract_data_from_pdf(self, pdf_path, system_prompt, schema):
+            self._record_token_usage(100, 20)
+            return {'extracted_data': {'pdf': pdf_path}, 'success': True, 'error_message': None}
+
+    def test_default_async_uses_sync_implementation(self):
+        """非同期版が未実装の場合は同期版が使用されるテスト"""
+        client = self.SyncOnlyClient("test_key", "gpt-4o", rate_limiter=RateLimiterRegistry())
+
+        result = asyncio.run(client.extract_data_from_pdf_async("a.pdf", "", {}))
+
+        assert result['success']
+        assert result['extracted_data'] == {'pdf': 'a.pdf'}
+        assert result['tokens'] == {'input_tokens': 100, 'output_tokens': 20}
+
+    def test_retry_with_backoff_async(self):
+        """非同期版のリトライでレート制限が適用されるテスト"""
+        registry = RateLimiterRegistry({'openai': {'requests_per_minute': 1}})
+        client = GPTClient("test_key", rate_limiter=registry)
+
+        async def call_api():
+            return "ok"
+
+        async def call_twice():
+            await client._retry_with_backoff_async(call_api)
+            return await client._measure_time_async(client._retry_with_backoff_async, call_api)
+
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result, elapsed = asyncio.run(call_twice())
+
+        assert result == "ok"
+        assert mock_sleep.call_count == 1
+        assert elapsed >= 0
+        # イベントループのスレッドのレスポンスタイムは更新しない（実行時間は戻り値で返す）
+        assert client.get_response_time() is None
+
+    def test_native_async_measurements_not_shared(self):
+        """非同期SDKで実装したクライアントの同時実行で、使用量・レスポンスタイムが戻り値で返るテスト"""
+
+        class NativeAsyncClient(BaseLLMClient):
+            provider = "openai"
+
+            def extract_data_from_pdf(self, pdf_path, system_prompt, schema):
+                raise NotImplementedError
+
+            async def extract_data_from_pdf_async(self, pdf_path, system_prompt, schema):
+                tokens = int(pdf_path)
+
+                async def call_api():
+                    await asyncio.sleep(tokens / 1000)
+                    return tokens
+
+                response, response_time = await self._measure_time_async(
+                    self._retry_with_backoff_async, call_api
+                )
+                return {
+                    'extracted_data': {},
+                    'success': True,
+                    'error_message': None,
+                    'tokens': self._report_token_usage(response, response),
+                    'response_time': response_time
+                }
+
+        client = NativeAsyncClient("test_key", "gpt-4o", rate_limiter=RateLimiterRegistry())
+
+        async def run_both():
+            return await asyncio.gather(
+                client.extract_data_from_pdf_async("50", "", {}),
+                client.extract_data_from_pdf_async("10", "", {})
+            )
+
+        first, second = asyncio.run(run_both())
+
+        assert first['tokens'] == {'input_tokens': 50, 'output_tokens': 50}
+        assert second['tokens'] == {'input_tokens': 10, 'output_tokens': 10}
+        assert first['response_time'] > second['response_time']
+        assert client.get_token_usage() == {'input_tokens': 0, 'output_tokens': 0}
+        assert client.get_response_time() is None
+
+    def test_client_async_uses_sync_implementation(self):
+        """クライアントの非同期版は同期版をスレッドで実行するテスト（同期版が未実装の場合はその失敗結果を返す）"""
+        client = GPTClient("test_key", rate_limiter=RateLimiterRegistry())
+
+        result = asyncio.run(client.extract_data_from_pdf_async("a.pdf", "", {}))
+
+        assert not result['success']
+        assert 'extract_data_from_pdf()' in result['error_message']
+
+    def test_concurrent_async_token_usage(self):
+        """同じクライアントで同時に実行したリクエストのトークン使用量が混ざらないテスト"""
+        barrier = threading.Barrier(2)
+
+        class SlowClient(BaseLLMClient):
+            provider = "openai"
+
+            def extract_data_from_pdf(self, pdf_path, system_prompt, schema):
+                tokens = int(pdf_path)
+                self._record_token_usage(tokens, tokens)
+                # もう一方のリクエストが使用量を記録するまで待つ
+                barrier.wait(timeout=5)
+                return {'extracted_data': {}, 'success': True, 'error_message': None}
+
+        client = SlowClient("test_key", "gpt-4o", rate_limiter=RateLimiterRegistry())
+
+        async def run_both():
+            return await asyncio.gather(
+                client.extract_data_from_pdf_async("100", "", {}),
+                client.extract_data_from_pdf_async("200", "", {})
+            )
+
+        first, second = asyncio.run(run_both())
+
+        assert first['tokens'] == {'input_tokens': 100, 'output_tokens': 100}
+        assert second['tokens'] == {'input_tokens': 200, 'output_tokens': 200}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,173 @@
+"""
+レンダリングキャッシュモジュールのテスト
+"""
+
+import pytest
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+import sys
+from PIL import Image
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import ImageConverter, RenderCache
+
+
+class TestRenderCache:
+    """RenderCacheクラスのテスト"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """一時ディレクトリを使用したキャッシュを返す"""
+        return RenderCache(tmp_path / "cache", max_size_mb=1.0)
+
+    def test_put_and_get(self, cache):
+        """保存と取得のテスト"""
+        cache.put("abcdef", 1, 200, 'PNG', 85, b"page-1")
+
+        assert cache.get("abcdef", 1, 200, 'PNG', 85) == b"page-1"
+        assert cache.get("abcdef", 2, 200, 'PNG', 85) is None
+
+        stats = cache.get_statistics()
+        assert stats['hit_count'] == 1
+        assert stats['miss_count'] == 1
+
+    def test_key_components(self, cache):
+        """DPI・フォーマット・品質がキーに含まれるテスト"""
+        cache.put("abcdef", 1, 200, 'PNG', 85, b"png")
+
+        assert cache.get("abcdef", 1, 150, 'PNG', 85) is None
+        assert cache.get("abcdef", 1, 200, 'JPEG', 85) is None
+        assert cache.get("abcdef", 1, 200, 'PNG', 70) is None
+
+    def test_color_mode_key(self, cache):
+        """カラーモードがキーに含まれ、RGBは従来のファイル名のままのテスト"""
+        cache.put("abcdef", 1, 200, 'PNG', 85, b"gray", color_mode='gray')
+
+        assert cache.get("abcdef", 1, 200, 'PNG', 85) is None
+        assert cache.get("abcdef", 1, 200, 'PNG', 85, color_mode='gray') == b"gray"
+        assert cache.get_path("abcdef", 1, 200, 'PNG', 85).name == "abcdef_p0001_200dpi_q85.png"
+
+    def test_lru_eviction(self, tmp_path):
+        """サイズ上限を超えた場合に古いエントリが削除されるテスト"""
+        cache = RenderCache(tmp_path / "cache", max_size_mb=2500 / 1024 / 1024)
+        data = b"x" * 1000
+
+        cache.put("aa0001", 1, 200, 'PNG', 85, data)
+        cache.put("aa0001", 2, 200, 'PNG', 85, data)
+
+        # ページ1を新しくアクセスしたことにする
+        old_time = time.time() - 100
+        os.utime(cache.get_path("aa0001", 2, 200, 'PNG', 85), (old_time, old_time))
+        cache.get("aa0001", 1, 200, 'PNG', 85)
+
+        cache.put("aa0001", 3, 200, 'PNG', 85, data)
+
+        assert cache.get("aa0001", 1, 200, 'PNG', 85) == data
+        assert cache.get("aa0001", 2, 200, 'PNG', 85) is None
+        assert cache.get("aa0001", 3, 200, 'PNG', 85) == data
+        assert cache.get_statistics()['total_size_mb'] <= 2500 / 1024 / 1024
+
+    def test_eviction_leaves_headroom(self, tmp_path):
+        """上限を超えた場合は下限まで削除し、以降の保存のたびに削除しないテスト"""
+        cache = RenderCache(tmp_path / "cache", max_size_mb=10000 / 1024 / 1024)
+        data = b"x" * 1000
+
+        with patch.object(cache, 'evict', wraps=cache.evict) as mock_evict:
+            for page_number in range(1, 13):
+                cache.put("aa0001", page_number, 200, 'PNG', 85, data)
+
+        assert mock_evict.call_count == 1
+        assert cache.get_statistics()['total_size_mb'] <= 10000 / 1024 / 1024
+
+    def test_existing_entries_counted(self, tmp_path):
+        """既存のキャッシュサイズが初期化時に読み込まれるテスト"""
+        cache = RenderCache(tmp_path / "cache")
+        cache.put("abcdef", 1, 200, 'PNG', 85, b"x" * 2048)
+
+        reopened = RenderCache(tmp_path / "cache")
+        assert reopened.get_statistics()['total_size_mb'] == pytest.approx(2048 / 1024 / 1024)
+
+    def test_clear(self, cache):
+        """キャッシュクリアのテスト"""
+        cache.put("abcdef", 1, 200, 'PNG', 85, b"page-1")
+        cache.clear()
+
+        assert cache.get("abcdef", 1, 200, 'PNG', 85) is None
+        assert cache.get_statistics()['total_size_mb'] == 0
+
+
+class TestImageConverterRenderCache:
+    """ImageConverterのレンダリングキャッシュ連携のテスト"""
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        """ダミーPDFを作成"""
+        path = tmp_path / "contract.pdf"
+        path.write_bytes(b'%PDF-1.4 dummy')
+        return str(path)
+
+    @pytest.fixture
+    def mock_pdf2image(self):
+        """pdf2imageの変換処理をモック化（3ページのPDF）"""
+        def convert(pdf_path, dpi=200, first_page=None, last_page=None, **kwargs):
+            first_page = first_page or 1
+            last_page = last_page or 3
+            return [
+                Image.new('RGB', (20, 20), color=(page * 40, 0, 0))
+                for page in range(first_page, last_page + 1)
+            ]
+
+        with patch('pdf2image.convert_from_path', side_effect=convert) as mock_convert, \
+                patch('pdf2image.pdfinfo_from_path', return_value={'Pages': 3}):
+            yield mock_convert
+
+    def test_pdf_to_images_uses_cache(self, tmp_path, pdf_path, mock_pdf2image):
+        """2回目の変換ではキャッシュが使用されるテスト"""
+        converter = ImageConverter(dpi=100, cache_dir=tmp_path / "cache")
+
+        first = converter.pdf_to_images(pdf_path)
+        second = converter.pdf_to_images(pdf_path)
+
+        assert mock_pdf2image.call_count == 1
+        assert len(second) == 3
+        assert [img.getpixel((0, 0)) for img in second] == \
+            [img.getpixel((0, 0)) for img in first]
+
+    def test_cache_shared_between_converters(self, tmp_path, pdf_path, mock_pdf2image):
+        """別インスタンス（再実行）でもキャッシュが使用されるテスト"""
+        ImageConverter(dpi=100, cache_dir=tmp_path / "cache").pdf_to_images(pdf_path)
+        ImageConverter(dpi=100, cache_dir=tmp_path / "cache").pdf_to_images(pdf_path)
+
+        assert mock_pdf2image.call_count == 1
+
+    def test_only_missing_pages_rendered(self, tmp_path, pdf_path, mock_pdf2image):
+        """キャッシュにないページのみ変換されるテスト"""
+        converter = ImageConverter(dpi=100, cache_dir=tmp_path / "cache")
+
+        converter.pdf_to_images(pdf_path, first_page=1, last_page=2)
+        images = converter.pdf_to_images(pdf_path)
+
+        assert len(images) == 3
+        last_call = mock_pdf2image.call_args
+        assert last_call.kwargs['first_page'] == 3
+        assert last_call.kwargs['last_page'] == 3
+
+    def test_pdf_to_base64_images_from_cache(self, tmp_path, pdf_path, mock_pdf2image):
+        """キャッシュ済みバイト列からBase64変換されるテスト"""
+        converter = ImageConverter(dpi=100, cache_dir=tmp_path / "cache")
+
+        encoded = converter.pdf_to_base64_images(pdf_path, optimize=False)
+        render_count = mock_pdf2image.call_count
+        encoded_again = converter.pdf_to_base64_images(pdf_path, optimize=False)
+
+        assert len(encoded) == 3
+        assert encoded == encoded_again
+        assert mock_pdf2image.call_count == render_count
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,74 @@
+"""
+レンダリングプロファイルモジュールのテスト
+"""
+
+import pytest
+import math
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import RenderProfile
+
+# A4縦（ポイント）
+A4 = (595, 842)
+
+
+class TestRenderProfile:
+    """RenderProfileクラスのテスト"""
+
+    def test_for_provider(self):
+        """プロバイダーごとの上限のテスト"""
+        anthropic = RenderProfile.for_provider("anthropic")
+
+        assert anthropic.max_side == 1568
+        assert anthropic.max_pixels == 1_150_000
+        assert RenderProfile.for_provider("openai").max_short_side == 768
+        assert RenderProfile.for_provider("azure") is None
+        assert RenderProfile.for_provider(None) is None
+
+    def test_page_dpi_anthropic(self):
+        """ピクセル数の上限に収まる解像度に下げるテスト"""
+        profile = RenderProfile.for_provider("anthropic")
+
+        dpi = profile.page_dpi(*A4, dpi=150)
+
+        assert dpi == 109
+        width, height = math.ceil(A4[0] * dpi / 72), math.ceil(A4[1] * dpi / 72)
+        assert width * height <= 1_150_000
+        # 1つ上の解像度では上限を超える
+        assert not profile.fits(math.ceil(A4[0] * 110 / 72), math.ceil(A4[1] * 110 / 72))
+
+    def test_page_dpi_openai(self):
+        """短辺の上限に収まる解像度に下げるテスト"""
+        profile = RenderProfile.for_provider("openai")
+
+        assert profile.page_dpi(*A4, dpi=150) == 92
+        # 横向きでも短辺で判定する
+        assert profile.page_dpi(A4[1], A4[0], dpi=150) == 92
+
+    def test_page_dpi_within_limit(self):
+        """上限に収まるページは指定の解像度のままのテスト"""
+        profile = RenderProfile.for_provider("gemini")
+
+        assert profile.page_dpi(*A4, dpi=150) == 150
+        assert profile.page_dpi(*A4, dpi=300) == 262
+
+    def test_limit_dpis(self):
+        """ページごとの解像度の制限テスト（ページサイズがないページは制限しない）"""
+        profile = RenderProfile("test", max_side=720)
+
+        limited = profile.limit_dpis([150, 150, 150], [(720, 720), (360, 360)])
+
+        assert limited == [72, 144, 150]
+
+    def test_cache_tag(self):
+        """上限が異なるプロファイルはキャッシュの設定文字列が異なるテスト"""
+        assert RenderProfile.for_provider("openai").cache_tag != RenderProfile.for_provider("anthropic").cache_tag
+        assert RenderProfile("a", max_side=10).cache_tag == RenderProfile("a", max_side=10).cache_tag
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
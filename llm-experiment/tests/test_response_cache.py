@@ -0,0 +1,219 @@
+"""
+レスポンスキャッシュモジュールのテスト
+"""
+
+import pytest
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api_clients import BaseLLMClient, RateLimiterRegistry, ResponseCache
+
+
+class TestResponseCache:
+    """ResponseCacheクラスのテスト"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """一時ディレクトリを使用したキャッシュを返す"""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        yield cache
+        cache.close()
+
+    def test_put_and_get(self, cache):
+        """保存と取得のテスト"""
+        cache.put(
+            "key-1", "gpt-4o", {"rent": 100000},
+            {'input_tokens': 1200, 'output_tokens': 300},
+            raw_response='{"rent": 100000}',
+            response_time=2.5
+        )
+
+        cached = cache.get("key-1")
+
+        assert cached['extracted_data'] == {"rent": 100000}
+        assert cached['raw_response'] == '{"rent": 100000}'
+        assert cached['tokens'] == {'input_tokens': 1200, 'output_tokens': 300}
+        assert cached['response_time'] == 2.5
+        assert cache.get("key-2") is None
+
+        stats = cache.get_statistics()
+        assert stats['hit_count'] == 1
+        assert stats['miss_count'] == 1
+        assert stats['entry_count'] == 1
+
+    def test_make_key_components(self):
+        """キーの各要素が変わるとキーが変わるテスト"""
+        base = ResponseCache.make_key("gpt-4o", "hash", "prompt", {"type": "object"}, {'dpi': 150})
+
+        assert base == ResponseCache.make_key("gpt-4o", "hash", "prompt", {"type": "object"}, {'dpi': 150})
+        assert base != ResponseCache.make_key("gpt-4o-mini", "hash", "prompt", {"type": "object"}, {'dpi': 150})
+        assert base != ResponseCache.make_key("gpt-4o", "other", "prompt", {"type": "object"}, {'dpi': 150})
+        assert base != ResponseCache.make_key("gpt-4o", "hash", "prompt2", {"type": "object"}, {'dpi': 150})
+        assert base != ResponseCache.make_key("gpt-4o", "hash", "prompt", {"type": "array"}, {'dpi': 150})
+        assert base != ResponseCache.make_key("gpt-4o", "hash", "prompt", {"type": "object"}, {'dpi': 200})
+
+    def test_ttl_expiration(self, tmp_path):
+        """有効期限切れのエントリは取得されないテスト"""
+        cache = ResponseCache(tmp_path / "responses.sqlite3", ttl_hours=1)
+        cache.put("key-1", "gpt-4o", {}, {'input_tokens': 1, 'output_tokens': 1})
+
+        with patch('time.time', return_value=time.time() + 7200):
+            assert cache.get("key-1") is None
+
+        assert cache.get_statistics()['entry_count'] == 0
+        cache.close()
+
+    def test_size_eviction(self, tmp_path):
+        """サイズ上限を超えた場合に最終アクセスが古いエントリから削除されるテスト"""
+        cache = ResponseCache(tmp_path / "responses.sqlite3", max_size_mb=2500 / 1024 / 1024)
+        data = {"text": "x" * 1000}
+        tokens = {'input_tokens': 1, 'output_tokens': 1}
+
+        now = time.time()
+        with patch('time.time', return_value=now - 20):
+            cache.put("key-1", "gpt-4o", data, tokens)
+        with patch('time.time', return_value=now - 10):
+            cache.put("key-2", "gpt-4o", data, tokens)
+        cache.get("key-1")
+        cache.put("key-3", "gpt-4o", data, tokens)
+
+        assert cache.get("key-1") is not None
+        assert cache.get("key-2") is None
+        assert cache.get("key-3") is not None
+        cache.close()
+
+    def test_total_size_tracked(self, cache):
+        """合計サイズが保存・上書き・削除のたびに差分で更新されるテスト"""
+        tokens = {'input_tokens': 1, 'output_tokens': 1}
+        cache.put("key-1", "gpt-4o", {"text": "x" * 100}, tokens)
+        cache.put("key-2", "gpt-4o", {"text": "x" * 200}, tokens, raw_response="y" * 50)
+        cache.put("key-1", "gpt-4o", {"text": "x" * 300}, tokens)
+
+        with cache._lock:
+            assert cache._total_size == cache._get_total_size()
+
+        cache.clear()
+        assert cache.get_statistics()['total_size_mb'] == 0
+
+    def test_evict_runs_periodically(self, tmp_path):
+        """上限を超えない間は、期限切れの削除を一定間隔でのみ行うテスト"""
+        cache = ResponseCache(tmp_path / "responses.sqlite3", ttl_hours=1)
+        tokens = {'input_tokens': 1, 'output_tokens': 1}
+
+        with patch.object(cache, 'evict', wraps=cache.evict) as mock_evict:
+            for i in range(5):
+                cache.put(f"key-{i}", "gpt-4o", {}, tokens)
+            assert mock_evict.call_count == 1
+
+            with patch('time.time', return_value=time.time() + ResponseCache.EVICT_INTERVAL_SECONDS):
+                cache.put("key-5", "gpt-4o", {}, tokens)
+            assert mock_evict.call_count == 2
+
+        cache.close()
+
+    def test_persistence(self, tmp_path):
+        """別インスタンス（再実行）でもキャッシュが使用されるテスト"""
+        db_path = tmp_path / "responses.sqlite3"
+        cache = ResponseCache(db_path)
+        cache.put("key-1", "gpt-4o", {"rent": 1}, {'input_tokens': 1, 'output_tokens': 1})
+        cache.close()
+
+        reopened = ResponseCache(db_path)
+        assert reopened.get("key-1")['extracted_data'] == {"rent": 1}
+        reopened.close()
+
+    def test_clear(self, cache):
+        """キャッシュクリアのテスト"""
+        cache.put("key-1", "gpt-4o", {}, {'input_tokens': 1, 'output_tokens': 1})
+        cache.clear()
+
+        assert cache.get("key-1") is None
+
+
+class TestClientResponseCache:
+    """クライアントのレスポンスキャッシュ連携のテスト"""
+
+    class CountingClient(BaseLLMClient):
+        """呼び出し回数を数えるクライアント"""
+
+        provider = "openai"
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.call_count = 0
+
+        def extract_data_from_pdf(self, pdf_path, system_prompt, schema):
+            self.call_count += 1
+            self._record_token_usage(1000, 200)
+            return {
+                'extracted_data': {'rent': 100000},
+                'success': True,
+                'error_message': None,
+                'raw_response': '{"rent": 100000}'
+            }
+
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        """ダミーPDFを作成"""
+        path = tmp_path / "contract.pdf"
+        path.write_bytes(b'%PDF-1.4 dummy')
+        return str(path)
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """キャッシュを設定したクライアントを返す"""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        yield self.CountingClient(
+            "test_key", "gpt-4o",
+            rate_limiter=RateLimiterRegistry(),
+            response_cache=cache
+        )
+        cache.close()
+
+    def test_cached_extraction(self, client, pdf_path):
+        """2回目はAPIを呼ばずにキャッシュが使用されるテスト"""
+        first = client.extract_data_from_pdf_cached(pdf_path, "prompt", {})
+        second = client.extract_data_from_pdf_cached(pdf_path, "prompt", {})
+
+        assert client.call_count == 1
+        assert not first['cached']
+        assert second['cached']
+        assert second['extracted_data'] == first['extracted_data']
+        assert second['raw_response'] == '{"rent": 100000}'
+        assert client.get_token_usage() == {'input_tokens': 1000, 'output_tokens': 200}
+
+    def test_prompt_change_misses(self, client, pdf_path):
+        """プロンプトが変わった場合は再度APIを呼ぶテスト"""
+        client.extract_data_from_pdf_cached(pdf_path, "prompt", {})
+        client.extract_data_from_pdf_cached(pdf_path, "prompt v2", {})
+
+        assert client.call_count == 2
+
+    def test_failure_not_cached(self, client, pdf_path):
+        """失敗した結果はキャッシュされないテスト"""
+        failure = {'extracted_data': None, 'success': False, 'error_message': 'error'}
+
+        with patch.object(client, 'extract_data_from_pdf', return_value=failure) as mock_extract:
+            client.extract_data_from_pdf_cached(pdf_path, "prompt", {})
+            client.extract_data_from_pdf_cached(pdf_path, "prompt", {})
+
+        assert mock_extract.call_count == 2
+
+    def test_cached_extraction_async(self, client, pdf_path):
+        """非同期版でもキャッシュが使用されるテスト"""
+        client.extract_data_from_pdf_cached(pdf_path, "prompt", {})
+
+        result = asyncio.run(client.extract_data_from_pdf_cached_async(pdf_path, "prompt", {}))
+
+        assert result['cached']
+        assert client.call_count == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -112,6 +112,35 @@ class TestResultVisualizer:
         assert Path(output_path).exists()
         assert Path(output_path).suffix == '.png'
 
+    def test_load_metrics_dispatch(self, visualizer, tmp_path):
+        """拡張子に応じてメトリクスが読み込まれるテスト"""
+        import pandas as pd
+
+        df = pd.DataFrame({'model': ['model1', 'model2'], 'f1_score': [0.8, 0.9]})
+        csv_path = tmp_path / "metrics.csv"
+        df.to_csv(csv_path, index=False)
+
+        loaded = visualizer.load_metrics(str(csv_path), columns=['f1_score'])
+        assert list(loaded.columns) == ['f1_score']
+        assert list(loaded['f1_score']) == [0.8, 0.9]
+
+    def test_load_metrics_parquet(self, visualizer, tmp_path):
+        """Parquetを列指定で読み込み、複数ファイルを結合するテスト"""
+        pytest.importorskip('pyarrow')
+        import pandas as pd
+
+        paths = []
+        for i in range(2):
+            path = tmp_path / f"metrics_{i}.parquet"
+            pd.DataFrame({'model': [f'model{i}'], 'f1_score': [0.5 + i / 10]}).to_parquet(path)
+            paths.append(str(path))
+
+        df = visualizer.load_metrics_parquet(paths, columns=['model'])
+        assert list(df.columns) == ['model']
+        assert list(df['model']) == ['model0', 'model1']
+
+        assert len(visualizer.load_metrics(paths[0])) == 1
+
     def test_generate_all_visualizations(self, visualizer, sample_summary):
         """すべての可視化生成テスト"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
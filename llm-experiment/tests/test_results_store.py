@@ -0,0 +1,122 @@
+"""
+結果ストアモジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import ExperimentLogger, ResultsStore
+
+
+def make_logger(log_dir, session_id, f1_scores):
+    """モデルごとのF1スコアでログを記録したロガーを返す"""
+    logger = ExperimentLogger(log_dir=log_dir, session_id=session_id)
+    logger.session_start = logger.session_start.replace(
+        year=2025, month=1, day=int(session_id[-2:])
+    )
+
+    for model, f1_score in f1_scores.items():
+        for pdf_name in ("pdf1", "pdf2"):
+            metrics = {"field_accuracy": f1_score, "f1_score": f1_score,
+                       "exact_match": False, "schema_valid": True}
+            logger.log_response(model, pdf_name, 2.0, {"input_tokens": 1000, "output_tokens": 500}, True)
+            logger.log_evaluation(model, pdf_name, metrics, 10.0)
+
+    return logger
+
+
+class TestResultsStore:
+    """ResultsStoreクラスのテスト"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """一時ディレクトリを使用したストアを返す"""
+        store = ResultsStore(tmp_path / "results.sqlite3")
+        yield store
+        store.close()
+
+    def _ingest(self, store, tmp_path, session_id, f1_scores):
+        """ロガーの結果を取り込む"""
+        logger = make_logger(tmp_path / session_id, session_id, f1_scores)
+        return store.ingest_session(logger.generate_summary_report(), logger.iter_metrics())
+
+    def test_ingest_session(self, store, tmp_path):
+        """サマリーと評価結果が取り込まれるテスト"""
+        count = self._ingest(store, tmp_path, "session_01", {"gpt-4o": 0.9, "claude": 0.8})
+
+        assert count == 4
+        assert list(store.list_sessions()['session_id']) == ["session_01"]
+
+        history = store.get_pdf_history("pdf1")
+        assert len(history) == 2
+        assert list(history['total_tokens']) == [1500, 1500]
+
+    def test_reingest_replaces(self, store, tmp_path):
+        """同じセッションを取り込み直すと置き換えられるテスト"""
+        self._ingest(store, tmp_path, "session_01", {"gpt-4o": 0.9})
+        self._ingest(store, tmp_path, "session_01", {"gpt-4o": 0.7})
+
+        trend = store.get_model_trend("gpt-4o")
+        assert len(trend) == 1
+        assert trend['avg_f1_score'][0] == pytest.approx(0.7)
+        assert len(store.get_pdf_history("pdf1")) == 1
+
+    def test_model_trend_and_regressions(self, store, tmp_path):
+        """セッションをまたいだ推移と劣化の検出テスト"""
+        self._ingest(store, tmp_path, "session_01", {"gpt-4o": 0.90, "claude": 0.80})
+        self._ingest(store, tmp_path, "session_02", {"gpt-4o": 0.85, "claude": 0.85})
+        self._ingest(store, tmp_path, "session_03", {"gpt-4o": 0.86, "claude": 0.70})
+
+        trend = store.get_model_trend("gpt-4o")
+        assert list(trend['session_id']) == ["session_01", "session_02", "session_03"]
+        assert len(store.get_model_trend(since="2025-01-02")) == 4
+
+        regressions = store.find_regressions('avg_f1_score', threshold=0.02)
+        assert list(zip(regressions['model'], regressions['session_id'])) == [
+            ("claude", "session_03"),
+            ("gpt-4o", "session_02")
+        ]
+        assert regressions['change'][0] == pytest.approx(-0.15)
+
+        with pytest.raises(ValueError):
+            store.find_regressions('unknown')
+
+    def test_field_accuracy(self, store, tmp_path):
+        """フィールドごとの正答率のテスト"""
+        store.register_session("session_01", "2025-01-01T00:00:00")
+        store.add_field_results("session_01", "gpt-4o", "pdf1", {"rent": "correct", "tenant.name": "incorrect"})
+        store.add_field_results("session_01", "gpt-4o", "pdf2", {"rent": "correct", "tenant.name": "correct"})
+
+        accuracy = store.get_field_accuracy("gpt-4o").set_index('field_path')
+        assert accuracy.loc['rent', 'accuracy'] == 1.0
+        assert accuracy.loc['tenant.name', 'accuracy'] == 0.5
+        assert accuracy.loc['tenant.name', 'total'] == 2
+
+        by_session = store.get_field_accuracy(by_session=True)
+        assert set(by_session['session_id']) == {"session_01"}
+
+    def test_ingest_directory(self, store, tmp_path):
+        """結果ディレクトリのファイルが取り込まれ、取り込み済みは飛ばされるテスト"""
+        logger = make_logger(tmp_path / "logs", "session_01", {"gpt-4o": 0.9})
+        results_dir = tmp_path / "results"
+        logger.save_to_csv(results_dir / "metrics_session_01.csv")
+        logger.save_summary_report(results_dir / "summary_session_01.json")
+
+        # 実行中に登録しただけのセッションは取り込み済みとみなさない
+        store.register_session("session_01", "2025-01-01T00:00:00")
+
+        assert store.ingest_directory(results_dir) == ["session_01"]
+        assert store.ingest_directory(results_dir) == []
+
+        history = store.get_pdf_history("pdf2")
+        assert len(history) == 1
+        assert history['exact_match'][0] == 0
+        assert list(history['input_tokens']) == [1000]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,269 @@
+"""
+リトライポリシーモジュールのテスト
+"""
+
+import pytest
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api_clients import RetryPolicy, RetryBudget
+
+
+class FakeResponse:
+    """SDK例外が持つレスポンスの代替"""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeAPIError(Exception):
+    """ステータスコードとレスポンスを持つSDK例外の代替"""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(status_code, headers)
+
+
+class RateLimitError(Exception):
+    """SDKのレート制限例外（クラス名で判定される）"""
+    pass
+
+
+class AuthenticationError(Exception):
+    """SDKの認証例外（クラス名で判定される）"""
+    pass
+
+
+class TestRetryPolicy:
+    """RetryPolicyクラスのテスト"""
+
+    @pytest.mark.parametrize('status_code', [408, 429, 500, 502, 503, 529])
+    def test_retryable_status(self, status_code):
+        """一時的なエラーのステータスはリトライ可能のテスト"""
+        assert RetryPolicy().is_retryable(FakeAPIError(status_code))
+
+    @pytest.mark.parametrize('status_code', [400, 401, 403, 404, 422])
+    def test_fatal_status(self, status_code):
+        """認証・リクエスト不備のステータスはリトライ不可のテスト"""
+        assert not RetryPolicy().is_retryable(FakeAPIError(status_code))
+
+    def test_classify_by_error_name(self):
+        """SDK例外のクラス名で判定されるテスト"""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(RateLimitError("rate limited"))
+        assert not policy.is_retryable(AuthenticationError("invalid key"))
+
+    def test_classify_builtin_errors(self):
+        """組み込み例外の判定テスト"""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(TimeoutError())
+        assert policy.is_retryable(ConnectionError())
+        assert policy.is_retryable(Exception("unknown"))
+        assert not policy.is_retryable(ValueError("schema"))
+        assert not policy.is_retryable(FileNotFoundError())
+
+    def test_is_throttled(self):
+        """レート制限・過負荷で受け付けられなかったエラーの判定テスト"""
+        policy = RetryPolicy()
+
+        assert policy.is_throttled(FakeAPIError(429))
+        assert policy.is_throttled(FakeAPIError(529))
+        assert policy.is_throttled(RateLimitError("rate limited"))
+        assert not policy.is_throttled(FakeAPIError(503))
+        assert not policy.is_throttled(TimeoutError())
+
+    def test_retry_after_seconds(self):
+        """Retry-Afterヘッダー（秒数）の取得テスト"""
+        error = FakeAPIError(429, {'Retry-After': '12'})
+        assert RetryPolicy().get_retry_after(error) == 12.0
+
+    def test_retry_after_ms(self):
+        """retry-after-msヘッダーが優先されるテスト"""
+        error = FakeAPIError(429, {'retry-after-ms': '1500', 'retry-after': '2'})
+        assert RetryPolicy().get_retry_after(error) == 1.5
+
+    def test_ratelimit_reset_headers(self):
+        """x-ratelimit-reset-*ヘッダーのうち長い方が使用されるテスト"""
+        error = FakeAPIError(429, {
+            'x-ratelimit-reset-requests': '1s',
+            'x-ratelimit-reset-tokens': '6m0s'
+        })
+        assert RetryPolicy().get_retry_after(error) == 360.0
+
+    def test_retry_after_missing(self):
+        """ヘッダーがない場合はNoneのテスト"""
+        assert RetryPolicy().get_retry_after(FakeAPIError(503)) is None
+        assert RetryPolicy().get_retry_after(Exception()) is None
+
+    def test_backoff_within_bounds(self):
+        """ジッター付き待機時間が範囲内に収まるテスト"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+
+        previous = None
+        for _ in range(50):
+            delay = policy.compute_backoff(previous)
+            assert 1.0 <= delay <= 10.0
+            previous = delay
+
+    @patch('time.sleep')
+    def test_execute_uses_retry_after(self, mock_sleep):
+        """Retry-Afterの時間だけ待機してリトライするテスト"""
+        policy = RetryPolicy(max_attempts=3, base_delay=1.0)
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                raise FakeAPIError(429, {'retry-after': '7'})
+            return "ok"
+
+        assert policy.execute(func) == "ok"
+        assert mock_sleep.call_count == 1
+        assert 7.0 <= mock_sleep.call_args[0][0] <= 7.1
+
+    @patch('time.sleep')
+    def test_retry_after_over_limit_not_retried(self, mock_sleep):
+        """上限を超える待機時間（日次クォータなど）が指定された場合はリトライしないテスト"""
+        calls = []
+
+        def func():
+            calls.append(1)
+            raise FakeAPIError(429, {'retry-after': '86400'})
+
+        with pytest.raises(FakeAPIError):
+            RetryPolicy(max_attempts=3, max_retry_after=600).execute(func)
+
+        assert len(calls) == 1
+        mock_sleep.assert_not_called()
+
+    def test_retry_after_wait_clamped(self):
+        """待機時間はmax_retry_afterを超えないテスト"""
+        policy = RetryPolicy(max_retry_after=7.0)
+
+        assert policy.get_wait_time(FakeAPIError(429, {'retry-after': '7'})) <= 7.0
+        with pytest.raises(ValueError):
+            RetryPolicy(max_retry_after=-1)
+
+    @patch('time.sleep')
+    def test_execute_fatal_not_retried(self, mock_sleep):
+        """リトライ不可能なエラーは即座に送出されるテスト"""
+        calls = []
+
+        def func():
+            calls.append(1)
+            raise FakeAPIError(401)
+
+        with pytest.raises(FakeAPIError):
+            RetryPolicy(max_attempts=5).execute(func)
+
+        assert len(calls) == 1
+        mock_sleep.assert_not_called()
+
+    def test_execute_async(self):
+        """非同期版でリトライ可能なエラーがリトライされるテスト"""
+        policy = RetryPolicy(max_attempts=3)
+        calls = []
+
+        async def func():
+            calls.append(1)
+            if len(calls) < 3:
+                raise FakeAPIError(503)
+            return "ok"
+
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            assert asyncio.run(policy.execute_async(func)) == "ok"
+
+        assert len(calls) == 3
+        assert mock_sleep.call_count == 2
+
+    def test_execute_async_fatal_not_retried(self):
+        """非同期版でリトライ不可能なエラーは即座に送出されるテスト"""
+        calls = []
+
+        async def func():
+            calls.append(1)
+            raise FakeAPIError(403)
+
+        with pytest.raises(FakeAPIError):
+            asyncio.run(RetryPolicy(max_attempts=5).execute_async(func))
+
+        assert len(calls) == 1
+
+    def test_invalid_settings(self):
+        """不正な設定でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=5.0, max_delay=1.0)
+
+
+class TestRetryBudget:
+    """RetryBudgetクラスのテスト"""
+
+    def test_max_retries(self):
+        """リトライ回数の上限テスト"""
+        budget = RetryBudget(max_retries=2)
+
+        assert budget.try_consume(1.0)
+        assert budget.try_consume(1.0)
+        assert not budget.try_consume(1.0)
+        assert budget.get_statistics()['used_retries'] == 2
+
+    def test_max_wait_seconds(self):
+        """待機時間の上限テスト"""
+        budget = RetryBudget(max_wait_seconds=5.0)
+
+        assert budget.try_consume(3.0)
+        assert not budget.try_consume(3.0)
+        assert budget.try_consume(2.0)
+
+    @patch('time.sleep')
+    def test_shared_between_policies(self, mock_sleep):
+        """複数のポリシーで予算が共有されるテスト"""
+        budget = RetryBudget(max_retries=3)
+        policies = [RetryPolicy(max_attempts=10, budget=budget) for _ in range(2)]
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise TimeoutError("timeout")
+
+        for policy in policies:
+            with pytest.raises(TimeoutError):
+                policy.execute(failing)
+
+        # 初回2回 + 予算内のリトライ3回
+        assert len(calls) == 5
+        assert mock_sleep.call_count == 3
+
+    def test_thread_safety(self):
+        """複数スレッドから消費しても上限を超えないテスト"""
+        budget = RetryBudget(max_retries=100)
+        consumed = []
+
+        def worker():
+            for _ in range(50):
+                if budget.try_consume(0.0):
+                    consumed.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(consumed) == 100
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
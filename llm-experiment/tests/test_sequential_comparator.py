@@ -0,0 +1,109 @@
+"""
+逐次比較モジュールのテスト
+"""
+
+import pytest
+import random
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.evaluators import SequentialComparator
+
+
+def feed(comparator, accuracies, pdf_count, seed=0):
+    """モデルごとの正答率を中心にばらつかせた評価結果をPDF順に記録する"""
+    rng = random.Random(seed)
+    for i in range(pdf_count):
+        pdf_name = f"contract_{i:03d}"
+        for model, accuracy in accuracies.items():
+            if comparator.is_stopped(model):
+                continue
+            value = min(max(accuracy + rng.uniform(-0.1, 0.1), 0.0), 1.0)
+            comparator.record(model, pdf_name, {'field_accuracy': value, 'f1_score': value})
+
+
+class TestSequentialComparator:
+    """SequentialComparatorクラスのテスト"""
+
+    def test_stops_clearly_worse_model(self):
+        """首位より明らかに劣るモデルを打ち切るテスト"""
+        comparator = SequentialComparator(["gpt-4o", "gemini-2.5-flash", "weak-model"], margin=0.05)
+
+        feed(comparator, {"gpt-4o": 0.9, "gemini-2.5-flash": 0.88, "weak-model": 0.5}, pdf_count=100)
+
+        status = comparator.get_status()
+        assert comparator.is_stopped("weak-model")
+        assert status["weak-model"]['stopped_by'] in ("gpt-4o", "gemini-2.5-flash")
+        assert status["weak-model"]['upper_bound'] < -0.05
+        # 打ち切った時点以降のPDFは記録されない
+        assert status["weak-model"]['samples'] < 30
+        assert status["gpt-4o"]['samples'] == 100
+        # 差がマージンより小さいモデルは打ち切らない
+        assert not comparator.is_stopped("gemini-2.5-flash")
+        assert comparator.get_leader() == "gpt-4o"
+
+    def test_no_stop_before_min_samples(self):
+        """共通のPDF数がmin_samplesに達するまでは打ち切らないテスト"""
+        comparator = SequentialComparator(["a", "b"], min_samples=10)
+
+        for i in range(9):
+            stopped = comparator.record("a", f"p{i}", {'field_accuracy': 1.0})
+            stopped += comparator.record("b", f"p{i}", {'field_accuracy': 0.0})
+            assert stopped == []
+
+        assert comparator.record("b", "p9", {'field_accuracy': 0.0}) == []
+        assert comparator.record("a", "p9", {'field_accuracy': 1.0}) == ["b"]
+
+    def test_equal_models_not_stopped(self):
+        """同等のモデルは多数のPDFでも打ち切らないテスト"""
+        for seed in range(5):
+            comparator = SequentialComparator(["a", "b", "c"], margin=0.0)
+            feed(comparator, {"a": 0.8, "b": 0.8, "c": 0.8}, pdf_count=200, seed=seed)
+
+            assert not any(status['stopped'] for status in comparator.get_status().values())
+
+    def test_confidence_radius_shrinks(self):
+        """信頼区間の半径がPDF数とともに小さくなるテスト"""
+        comparator = SequentialComparator(["a", "b"])
+
+        radii = [comparator.confidence_radius(n, 0.04) for n in (10, 50, 200, 1000)]
+
+        assert radii == sorted(radii, reverse=True)
+        assert comparator.confidence_radius(50, 0.0) == 0.0
+
+    def test_uses_selected_metric(self):
+        """指定した評価指標で比較するテスト"""
+        comparator = SequentialComparator(["a", "b"], metric="f1_score", min_samples=2)
+
+        for i in range(20):
+            comparator.record("a", f"p{i}", {'field_accuracy': 0.0, 'f1_score': 1.0})
+            comparator.record("b", f"p{i}", {'field_accuracy': 1.0, 'f1_score': 0.0})
+
+        assert comparator.is_stopped("b")
+        assert not comparator.is_stopped("a")
+
+    def test_ignores_unknown_model_and_missing_metric(self):
+        """比較対象外のモデル・評価指標がない結果を無視するテスト"""
+        comparator = SequentialComparator(["a", "b"])
+
+        assert comparator.record("c", "p0", {'field_accuracy': 1.0}) == []
+        assert comparator.record("a", "p0", {}) == []
+        assert comparator.get_leader() is None
+
+    def test_invalid_settings(self):
+        """不正な設定でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            SequentialComparator(["a", "b"], metric="exact_match")
+        with pytest.raises(ValueError):
+            SequentialComparator(["a", "b"], margin=-0.1)
+        with pytest.raises(ValueError):
+            SequentialComparator(["a", "b"], alpha=1.0)
+        with pytest.raises(ValueError):
+            SequentialComparator(["a", "b"], min_samples=1)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,203 @@
+"""
+ステージ計測モジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+import threading
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import ExperimentLogger, LatencyHistogram, StageTimer, TaskJournal
+from src.utils.stage_timer import get_current_timer, record_span
+
+
+class TestLatencyHistogram:
+    """LatencyHistogramクラスのテスト"""
+
+    def test_percentiles_within_relative_error(self):
+        """パーセンタイルがバケット幅の相対誤差内に収まるテスト"""
+        histogram = LatencyHistogram(growth=1.1)
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+
+        assert histogram.count == 1000
+        for p, expected in ((50, 0.5), (90, 0.9), (99, 0.99)):
+            assert histogram.percentile(p) == pytest.approx(expected, rel=0.06)
+        assert histogram.percentile(100) <= histogram.max == 1.0
+
+    def test_empty(self):
+        """記録がない場合のテスト"""
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(50) is None
+        assert histogram.summary() == {
+            'count': 0, 'mean': 0.0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0
+        }
+
+    def test_single_value(self):
+        """1件のみの場合は実測値が返るテスト"""
+        histogram = LatencyHistogram()
+        histogram.record(0.25)
+
+        assert histogram.percentile(50) == 0.25
+        assert histogram.percentile(99) == 0.25
+
+    def test_merge(self):
+        """ヒストグラムの結合のテスト"""
+        a = LatencyHistogram()
+        b = LatencyHistogram()
+        for value in (0.1, 0.2):
+            a.record(value)
+        for value in (0.3, 4.0):
+            b.record(value)
+
+        a.merge(b)
+
+        assert a.count == 4
+        assert a.min == 0.1
+        assert a.max == 4.0
+        assert a.summary()['mean'] == pytest.approx(4.6 / 4)
+
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram(growth=1.5))
+
+    def test_invalid_settings(self):
+        """不正な設定でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            LatencyHistogram(min_value=0)
+        with pytest.raises(ValueError):
+            LatencyHistogram(growth=1.0)
+
+
+class TestStageTimer:
+    """StageTimerクラスのテスト"""
+
+    def test_span_accumulates(self):
+        """同じステージの計測値が合計されるテスト"""
+        timer = StageTimer()
+        timer.add("encode", 0.1)
+        timer.add("encode", 0.2)
+        with timer.span("network"):
+            pass
+
+        durations = timer.get_durations()
+        assert durations["encode"] == pytest.approx(0.3)
+        assert durations["network"] >= 0
+
+    def test_record_span_without_timer(self):
+        """タイマーが有効でない場合は何も記録しないテスト"""
+        assert get_current_timer() is None
+        with record_span("validate"):
+            pass
+
+    def test_record_span_with_activate(self):
+        """activate()の範囲内のみ記録されるテスト"""
+        timer = StageTimer()
+        with timer.activate():
+            assert get_current_timer() is timer
+            with record_span("validate"):
+                pass
+
+        with record_span("rasterize"):
+            pass
+
+        assert get_current_timer() is None
+        assert set(timer.get_durations()) == {"validate"}
+
+    def test_span_recorded_on_exception(self):
+        """例外が発生しても計測値が記録されるテスト"""
+        timer = StageTimer()
+        with timer.activate():
+            with pytest.raises(ValueError):
+                with record_span("parse"):
+                    raise ValueError("error")
+
+        assert "parse" in timer.get_durations()
+
+    def test_threads_are_isolated(self):
+        """スレッドごとに別のタイマーに記録されるテスト"""
+        timers = [StageTimer() for _ in range(4)]
+        barrier = threading.Barrier(len(timers))
+
+        def run(timer, stage):
+            with timer.activate():
+                barrier.wait()
+                with record_span(stage):
+                    pass
+
+        threads = [
+            threading.Thread(target=run, args=(timer, f"stage_{i}"))
+            for i, timer in enumerate(timers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i, timer in enumerate(timers):
+            assert set(timer.get_durations()) == {f"stage_{i}"}
+
+
+class TestExperimentLoggerStageLatency:
+    """ExperimentLoggerのステージ所要時間の集計のテスト"""
+
+    def _log_tasks(self, logger):
+        """2モデル分のタスクを記録する"""
+        for i in range(10):
+            pdf_name = f"contract_{i:03d}"
+            for model, network in (("gpt-4o", 2.0), ("gemini-1.5-pro", 1.0)):
+                logger.log_response(model, pdf_name, network, {'input_tokens': 100, 'output_tokens': 50})
+                logger.log_evaluation(model, pdf_name, {'field_accuracy': 0.9, 'f1_score': 0.8})
+                logger.log_stage_times(model, pdf_name, {
+                    'network': network,
+                    'rasterize': 0.5 if i < 9 else 5.0,
+                    'validate': 0.01
+                })
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_summary_includes_percentiles(self, tmp_path, stream):
+        """サマリーにモデルごとのステージ別パーセンタイルが含まれるテスト"""
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", stream=stream)
+        self._log_tasks(logger)
+
+        summary = logger.generate_summary_report()
+        latency = summary['models']['gpt-4o']['stage_latency']
+
+        # 処理順に並ぶ
+        assert list(latency) == ["validate", "rasterize", "network"]
+        assert latency['network']['count'] == 10
+        assert latency['network']['p50'] == pytest.approx(2.0)
+        assert latency['rasterize']['p50'] == pytest.approx(0.5, rel=0.06)
+        assert latency['rasterize']['p99'] == pytest.approx(5.0, rel=0.06)
+        assert summary['models']['gemini-1.5-pro']['stage_latency']['network']['p90'] == pytest.approx(1.0)
+        logger.close()
+
+    def test_empty_stage_times_ignored(self, tmp_path):
+        """所要時間がない場合は記録しないテスト"""
+        logger = ExperimentLogger(log_dir=tmp_path / "logs")
+        logger.log_evaluation("gpt-4o", "contract_001", {'field_accuracy': 0.9, 'f1_score': 0.8})
+        logger.log_stage_times("gpt-4o", "contract_001", {})
+
+        assert 'stage_latency' not in logger.generate_summary_report()['models']['gpt-4o']
+
+    def test_restore_from_journal(self, tmp_path):
+        """ジャーナルから再開した場合もステージ所要時間が復元されるテスト"""
+        journal = TaskJournal(tmp_path / "journal.jsonl")
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", journal=journal)
+        logger.log_stage_times("gpt-4o", "contract_001", {'network': 1.5})
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_COMPLETED)
+        journal.close()
+
+        resumed_journal = TaskJournal(tmp_path / "journal.jsonl")
+        resumed = ExperimentLogger(log_dir=tmp_path / "logs")
+        resumed.restore_from_journal(resumed_journal)
+
+        assert resumed.get_stage_latency("gpt-4o")['network']['p50'] == pytest.approx(1.5)
+        resumed_journal.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,196 @@
+"""
+タスクジャーナルモジュールのテスト
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import ExperimentLogger, TaskJournal
+
+
+class TestTaskJournal:
+    """TaskJournalクラスのテスト"""
+
+    @pytest.fixture
+    def journal(self, tmp_path):
+        """一時ディレクトリを使用したジャーナルを返す"""
+        journal = TaskJournal(TaskJournal.get_path(tmp_path, "20250101_000000"))
+        yield journal
+        journal.close()
+
+    def test_record_and_load(self, journal):
+        """記録した内容が読み込めるテスト"""
+        journal.record_session("20250101_000000", "2025-01-01T00:00:00")
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_RUNNING)
+        journal.record_log("request", {'model': "gpt-4o", 'pdf_name': "contract_001"})
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_COMPLETED)
+
+        loaded = journal.load()
+
+        assert loaded['session']['session_id'] == "20250101_000000"
+        assert loaded['states'] == {("contract_001", "gpt-4o"): TaskJournal.STATE_COMPLETED}
+        assert loaded['logs'] == [("request", {'model': "gpt-4o", 'pdf_name': "contract_001"})]
+
+    def test_completed_tasks(self, journal):
+        """最後の状態が完了のタスクのみ完了済みになるテスト"""
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_RUNNING)
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_COMPLETED)
+        journal.record_state("contract_002", "gpt-4o", TaskJournal.STATE_RUNNING)
+        journal.record_state("contract_003", "gpt-4o", TaskJournal.STATE_FAILED)
+
+        assert journal.get_completed_tasks() == {("contract_001", "gpt-4o")}
+
+    def test_truncated_line_ignored(self, journal):
+        """停止時に書きかけだった行は無視されるテスト"""
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_COMPLETED)
+        journal.close()
+
+        with open(journal.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "state", "pdf_na')
+
+        reopened = TaskJournal(journal.journal_path)
+        assert reopened.get_completed_tasks() == {("contract_001", "gpt-4o")}
+        reopened.close()
+
+    def test_truncated_line_repaired_on_reopen(self, journal):
+        """書きかけの行が切り詰められ、再開後のレコードが失われないテスト"""
+        journal.record_state("a.pdf", "gpt-4o", TaskJournal.STATE_COMPLETED)
+        journal.close()
+
+        with open(journal.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "state", "pdf_name": "x.pdf", "mod')
+
+        reopened = TaskJournal(journal.journal_path)
+        reopened.record_state("b.pdf", "gpt-4o", TaskJournal.STATE_COMPLETED)
+
+        assert reopened.get_completed_tasks() == {("a.pdf", "gpt-4o"), ("b.pdf", "gpt-4o")}
+        assert all(line.endswith('}') for line in journal.journal_path.read_text(encoding='utf-8').splitlines())
+        reopened.close()
+
+    def test_truncated_only_line_repaired(self, tmp_path):
+        """改行のない書きかけの行だけのファイルは空に切り詰められるテスト"""
+        path = tmp_path / "journal.jsonl"
+        path.write_text('{"type": "sess', encoding='utf-8')
+
+        journal = TaskJournal(path)
+        journal.record_state("a.pdf", "gpt-4o", TaskJournal.STATE_COMPLETED)
+
+        assert journal.get_completed_tasks() == {("a.pdf", "gpt-4o")}
+        assert len(path.read_text(encoding='utf-8').splitlines()) == 1
+        journal.close()
+
+    def test_invalid_state(self, journal):
+        """不明な状態・ログの種類でエラーになるテスト"""
+        with pytest.raises(ValueError):
+            journal.record_state("contract_001", "gpt-4o", "unknown")
+        with pytest.raises(ValueError):
+            journal.record_log("unknown", {})
+
+
+class TestExperimentLoggerJournal:
+    """ExperimentLoggerのジャーナル連携のテスト"""
+
+    def test_logs_written_to_journal(self, tmp_path):
+        """ログがジャーナルに追記されるテスト"""
+        journal = TaskJournal(tmp_path / "journal.jsonl")
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", journal=journal)
+
+        logger.log_request("gpt-4o", "contract_001")
+        logger.log_response("gpt-4o", "contract_001", 1.5, {'input_tokens': 100, 'output_tokens': 50})
+        logger.log_evaluation("gpt-4o", "contract_001", {'field_accuracy': 0.9, 'f1_score': 0.8}, cost=1.2)
+        logger.log_error("gpt-4o", "contract_001", ValueError("error"))
+
+        kinds = [kind for kind, _ in journal.load()['logs']]
+        assert kinds == ["request", "response", "evaluation", "error"]
+        journal.close()
+
+    def test_restore_from_journal(self, tmp_path):
+        """完了済みのタスクのログのみ復元されるテスト"""
+        journal = TaskJournal(tmp_path / "journal.jsonl")
+        journal.record_session("20250101_000000", "2025-01-01T00:00:00")
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", journal=journal)
+
+        tokens = {'input_tokens': 100, 'output_tokens': 50}
+        for pdf_name in ("contract_001", "contract_002"):
+            journal.record_state(pdf_name, "gpt-4o", TaskJournal.STATE_RUNNING)
+            logger.log_request("gpt-4o", pdf_name)
+            logger.log_response("gpt-4o", pdf_name, 1.5, tokens)
+        # contract_002は完了前に停止した
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_COMPLETED)
+        journal.close()
+
+        resumed_journal = TaskJournal(tmp_path / "journal.jsonl")
+        resumed = ExperimentLogger(
+            log_dir=tmp_path / "logs",
+            session_id="20250101_000000"
+        )
+        completed = resumed.restore_from_journal(resumed_journal)
+
+        assert completed == {("contract_001", "gpt-4o")}
+        assert resumed.session_id == "20250101_000000"
+        assert resumed.session_start.isoformat() == "2025-01-01T00:00:00"
+        assert [log['pdf_name'] for log in resumed.request_logs] == ["contract_001"]
+        assert [log['pdf_name'] for log in resumed.response_logs] == ["contract_001"]
+        resumed_journal.close()
+
+    def test_restore_only_completed_attempt(self, tmp_path):
+        """失敗後に再開して完了したタスクは、完了した試行のログのみ復元されるテスト"""
+        journal = TaskJournal(tmp_path / "journal.jsonl")
+        journal.record_session("20250101_000000", "2025-01-01T00:00:00")
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", journal=journal)
+
+        # 1回目のセッション: 失敗
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_RUNNING)
+        logger.log_request("gpt-4o", "contract_001")
+        logger.log_response("gpt-4o", "contract_001", 1.0, {}, success=False, error_message="timeout")
+        logger.log_error("gpt-4o", "contract_001", TimeoutError("timeout"))
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_FAILED)
+
+        # 再開後: 完了
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_RUNNING)
+        logger.log_request("gpt-4o", "contract_001")
+        logger.log_response("gpt-4o", "contract_001", 2.0, {'input_tokens': 100, 'output_tokens': 50})
+        logger.log_evaluation("gpt-4o", "contract_001", {'field_accuracy': 0.9, 'f1_score': 0.8}, cost=1.2)
+        journal.record_state("contract_001", "gpt-4o", TaskJournal.STATE_COMPLETED)
+        journal.close()
+
+        resumed_journal = TaskJournal(tmp_path / "journal.jsonl")
+        resumed = ExperimentLogger(log_dir=tmp_path / "logs", session_id="20250101_000000")
+        resumed.restore_from_journal(resumed_journal)
+
+        assert len(resumed.request_logs) == 1
+        assert [log['success'] for log in resumed.response_logs] == [True]
+        assert resumed.error_logs == []
+        assert len(resumed.evaluation_logs) == 1
+        resumed_journal.close()
+
+    def test_restored_evaluations_kept_when_streaming(self, tmp_path):
+        """ストリーミングモードでも復元した評価ログが保持されるテスト（再開時の逐次比較用）"""
+        journal = TaskJournal(tmp_path / "journal.jsonl")
+        journal.record_session("20250101_000000", "2025-01-01T00:00:00")
+        logger = ExperimentLogger(log_dir=tmp_path / "logs", journal=journal)
+
+        for model, accuracy in (("gpt-4o", 0.9), ("gpt-4o-mini", 0.5)):
+            journal.record_state("contract_001", model, TaskJournal.STATE_RUNNING)
+            logger.log_evaluation(model, "contract_001", {'field_accuracy': accuracy, 'f1_score': accuracy})
+            journal.record_state("contract_001", model, TaskJournal.STATE_COMPLETED)
+        journal.close()
+
+        resumed_journal = TaskJournal(tmp_path / "journal.jsonl")
+        resumed = ExperimentLogger(log_dir=tmp_path / "logs", session_id="20250101_000000", stream=True)
+        resumed.restore_from_journal(resumed_journal)
+
+        assert resumed.evaluation_logs == []
+        assert [(log['model'], log['field_accuracy']) for log in resumed.restored_evaluations] == [
+            ("gpt-4o", 0.9), ("gpt-4o-mini", 0.5)
+        ]
+        resumed.close()
+        resumed_journal.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,124 @@
+"""
+タスクスケジューラモジュールのテスト
+"""
+
+import pytest
+import threading
+import time
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import TaskScheduler, ScheduledTask
+
+
+class TestTaskScheduler:
+    """TaskSchedulerクラスのテスト"""
+
+    def test_scheduler_initialization(self):
+        """スケジューラの初期化テスト"""
+        scheduler = TaskScheduler(max_workers=4, model_concurrency={'model-a': 2})
+        assert scheduler.max_workers == 4
+        assert scheduler.get_model_limit('model-a') == 2
+        assert scheduler.get_model_limit('model-b') == 4
+
+    def test_invalid_worker_count(self):
+        """不正なワーカー数のテスト"""
+        with pytest.raises(ValueError):
+            TaskScheduler(max_workers=0)
+
+        with pytest.raises(ValueError):
+            TaskScheduler(max_workers=2, model_concurrency={'model-a': 0})
+
+    def test_sequential_run(self):
+        """逐次実行のテスト"""
+        scheduler = TaskScheduler(max_workers=1)
+        tasks = [ScheduledTask('model-a', lambda x: x * 2, i) for i in range(5)]
+
+        results = [result for _, result, _ in scheduler.run(tasks)]
+        assert results == [0, 2, 4, 6, 8]
+
+    def test_results_in_submission_order(self):
+        """並行実行時も投入順に結果が返るテスト"""
+        def slow_task(index):
+            # 後に投入したタスクほど早く終わる
+            time.sleep(0.01 * (5 - index))
+            return index
+
+        scheduler = TaskScheduler(max_workers=5)
+        tasks = [ScheduledTask('model-a', slow_task, i) for i in range(5)]
+
+        results = [result for _, result, _ in scheduler.run(tasks)]
+        assert results == [0, 1, 2, 3, 4]
+
+    def test_model_concurrency_limit(self):
+        """モデル別の同時実行数制限のテスト"""
+        lock = threading.Lock()
+        running = {'model-a': 0, 'model-b': 0}
+        peak = {'model-a': 0, 'model-b': 0}
+
+        def tracked_task(model):
+            with lock:
+                running[model] += 1
+                peak[model] = max(peak[model], running[model])
+            time.sleep(0.02)
+            with lock:
+                running[model] -= 1
+            return model
+
+        scheduler = TaskScheduler(max_workers=4, model_concurrency={'model-a': 1})
+        tasks = [
+            ScheduledTask(model, tracked_task, model)
+            for _ in range(4)
+            for model in ('model-a', 'model-b')
+        ]
+
+        results = [result for _, result, _ in scheduler.run(tasks)]
+        assert results == ['model-a', 'model-b'] * 4
+        assert peak['model-a'] == 1
+        assert peak['model-b'] > 1
+
+    def test_task_exception_is_returned(self):
+        """タスクの例外が結果として返るテスト"""
+        def failing_task():
+            raise RuntimeError("API Error")
+
+        scheduler = TaskScheduler(max_workers=2)
+        tasks = [
+            ScheduledTask('model-a', failing_task),
+            ScheduledTask('model-a', lambda: "ok")
+        ]
+
+        results = list(scheduler.run(tasks))
+        assert results[0][1] is None
+        assert isinstance(results[0][2], RuntimeError)
+        assert results[1][1] == "ok"
+        assert results[1][2] is None
+
+    def test_close_waits_for_running_tasks(self):
+        """反復を途中でやめた場合、実行中のタスクの終了を待ち、未投入のタスクは実行しないテスト"""
+        finished = []
+
+        def slow_task(index):
+            time.sleep(0.1)
+            finished.append(index)
+            return index
+
+        scheduler = TaskScheduler(max_workers=2)
+        tasks = [ScheduledTask('model-a', slow_task, i) for i in range(10)]
+
+        results = scheduler.run(tasks)
+        next(results)
+        results.close()
+
+        # close()から戻った時点で実行中だったタスクは終わっており、以降は何も実行されない
+        count = len(finished)
+        time.sleep(0.3)
+        assert len(finished) == count
+        assert count < len(tasks)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])